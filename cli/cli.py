@@ -1,15 +1,24 @@
 import argparse
+from functools import partial
 
-from config.constants import Bridge
+from config.constants import DECODE_NUM_PROCESSES, RPCS_CONFIG_TTL, Bridge
+from extractor.async_evm_extractor import AsyncEvmExtractor
+from extractor.async_solana_extractor import AsyncSolanaExtractor
+from extractor.decode_pool import decode_pool
 from extractor.evm_extractor import EvmExtractor
+from extractor.extraction_scheduler import ExtractionScheduler
 from extractor.solana_extractor import SolanaExtractor
 from generator.generator import Generator
-from repository.database import create_tables
+from repository.database import create_tables, migrate_indexes
+from repository.query_benchmark import benchmark_queries
 from rpcs import generate_rpc_configs
+from rpcs.endpoint_scheduler import endpoint_scheduler
+from rpcs.http_session_pool import http_session_pool
 from utils.utils import (
     CliColor,
     CustomException,
     build_log_message_2,
+    build_log_message_generator,
     get_block_by_timestamp,
     get_enum_instance,
     load_module,
@@ -27,9 +36,18 @@ class Cli:
 
         Cli.load_db_models(bridge)
 
-        for idx, blockchain in enumerate(blockchains):
-            generate_rpc_configs(blockchain)
+        # the RPC configurations of all blockchains are generated before any extraction starts,
+        # since blockchains are extracted concurrently
+        generate_rpc_configs(
+            blockchains, ttl=0 if getattr(args, "refresh_rpcs", False) else RPCS_CONFIG_TTL
+        )
+
+        scheduler = ExtractionScheduler(bridge)
 
+        async_engine = getattr(args, "async_engine", False)
+        resume = getattr(args, "resume", False)
+
+        for idx, blockchain in enumerate(blockchains):
             if blockchain == "solana":
                 solana_ranges = {}
                 for item in args.solana_range:
@@ -39,26 +57,88 @@ class Cli:
                         "end_signature": end_sig,
                     }
 
-                Cli.extract_solana_data(
-                    idx,
-                    bridge,
+                scheduler.add_job(
                     blockchain,
-                    solana_ranges,
-                    blockchains,
+                    partial(
+                        Cli.extract_solana_data,
+                        idx,
+                        bridge,
+                        blockchain,
+                        solana_ranges,
+                        blockchains,
+                        async_engine,
+                        resume,
+                    ),
                 )
             else:
                 start_block = get_block_by_timestamp(args.start_ts, blockchain)
                 end_block = get_block_by_timestamp(args.end_ts, blockchain)
-                Cli.extract_evm_data(
-                    idx,
-                    bridge,
+                scheduler.add_job(
                     blockchain,
-                    start_block,
-                    end_block,
-                    blockchains,
+                    partial(
+                        Cli.extract_evm_data,
+                        idx,
+                        bridge,
+                        blockchain,
+                        start_block,
+                        end_block,
+                        blockchains,
+                        async_engine,
+                        resume,
+                    ),
                 )
 
-    def extract_evm_data(idx, bridge, blockchain, start_block, end_block, blockchains):
+        if getattr(args, "decode_processes", None) is not None:
+            decode_pool.num_processes = args.decode_processes
+
+        # post-processing runs once, after every blockchain has finished
+        try:
+            scheduler.run()
+        finally:
+            decode_pool.shutdown()
+
+        if getattr(args, "rpc_stats", False):
+            Cli.log_rpc_stats(bridge)
+
+    def log_rpc_stats(bridge):
+        """Logs the number of requests, connections opened and health of each RPC endpoint."""
+        for stat in http_session_pool.get_stats():
+            log_to_cli(
+                build_log_message_generator(
+                    bridge,
+                    (
+                        f"RPC stats for {stat['endpoint']}: {stat['requests']} requests, "
+                        f"{stat['connections']} connections opened, "
+                        f"{stat['reuse_rate']:.2%} connection reuse rate."
+                    ),
+                ),
+                CliColor.SUCCESS,
+            )
+
+        for stat in endpoint_scheduler.get_stats():
+            log_to_cli(
+                build_log_message_generator(
+                    bridge,
+                    (
+                        f"RPC health for {http_session_pool.get_endpoint(stat['endpoint'])}: "
+                        f"{stat['requests']} requests, {stat['latency']:.3f}s average latency, "
+                        f"{stat['error_rate']:.2%} error rate, {stat['rate_limited']} rate limited"
+                        f"{' (circuit open)' if stat['open'] else ''}."
+                    ),
+                ),
+                CliColor.SUCCESS,
+            )
+
+    def extract_evm_data(
+        idx,
+        bridge,
+        blockchain,
+        start_block,
+        end_block,
+        blockchains,
+        async_engine=False,
+        resume=False,
+    ):
         log_to_cli(
             build_log_message_2(
                 start_block,
@@ -79,7 +159,8 @@ class Cli:
                     "Loading contracts and ABIs...",
                 )
             )
-            extractor = EvmExtractor(bridge, blockchain, blockchains)
+            extractor_class = AsyncEvmExtractor if async_engine else EvmExtractor
+            extractor = extractor_class(bridge, blockchain, blockchains, resume)
 
         except Exception as e:
             log_to_cli(
@@ -92,21 +173,25 @@ class Cli:
                 ),
                 CliColor.ERROR,
             )
-            return
+            return None
 
         extractor.extract_data(
             start_block,
             end_block,
         )
 
-        if idx == len(blockchains) - 1:
-            extractor.post_processing()
+        return extractor
 
-    def extract_solana_data(idx, bridge, blockchain, signature_ranges, blockchains):
-        extractor = SolanaExtractor(bridge, blockchain, blockchains)
+    def extract_solana_data(
+        idx, bridge, blockchain, signature_ranges, blockchains, async_engine=False, resume=False
+    ):
+        extractor_class = AsyncSolanaExtractor if async_engine else SolanaExtractor
+        extractor = extractor_class(bridge, blockchain, blockchains, resume)
 
         extractor.extract_data(signature_ranges)
 
+        return extractor
+
     def generate_data(args):
         bridge = get_enum_instance(Bridge, args.bridge)
 
@@ -114,7 +199,53 @@ class Cli:
 
         generator = Generator(bridge)
 
-        generator.generate_data()
+        generator.generate_data(getattr(args, "since", False))
+
+    def migrate_db(args):
+        bridge = get_enum_instance(Bridge, args.bridge)
+
+        Cli.load_db_models(bridge)
+
+        if args.benchmark:
+            generator = Generator(bridge).generator
+            timings_before = benchmark_queries(bridge.value, generator)
+
+        try:
+            created_indexes = migrate_indexes(bridge, args.dedupe)
+        except CustomException as e:
+            log_to_cli(build_log_message_generator(bridge, e.message), CliColor.ERROR)
+            return
+
+        log_to_cli(
+            build_log_message_generator(
+                bridge,
+                f"Created {len(created_indexes)} indexes: {', '.join(created_indexes) or '-'}.",
+            ),
+            CliColor.SUCCESS,
+        )
+
+        if args.benchmark:
+            timings_after = benchmark_queries(bridge.value, generator)
+            Cli.log_query_timings(bridge, timings_before, timings_after)
+
+    def log_query_timings(bridge, timings_before: dict, timings_after: dict):
+        """Logs the time of each benchmarked query before and after the migration."""
+        for query, time_before in timings_before.items():
+            time_after = timings_after.get(query)
+            if time_after is None:
+                continue
+
+            log_to_cli(
+                build_log_message_generator(
+                    bridge,
+                    (
+                        f"{query}: {time_before * 1000:.2f}ms before, "
+                        f"{time_after * 1000:.2f}ms after "
+                        f"({time_before / max(time_after, 1e-9):.1f}x)."
+                    ),
+                ),
+                CliColor.SUCCESS,
+            )
 
     def cli():
         parser = argparse.ArgumentParser(description="Cross-chain Data Extraction Tool")
@@ -178,6 +309,39 @@ class Cli:
                             "Must be program:start_signature:end_signature"
                         )
 
+        extract_parser.add_argument(
+            "--rpc-stats",
+            action="store_true",
+            help="Report the requests, connection reuse rate and health of each RPC endpoint",
+        )
+
+        extract_parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Skip the block (and signature) ranges completed by previous extractions",
+        )
+
+        extract_parser.add_argument(
+            "--refresh-rpcs",
+            action="store_true",
+            help="Probe the RPCs again, even if the RPC configurations were generated recently",
+        )
+
+        extract_parser.add_argument(
+            "--async-engine",
+            action="store_true",
+            help="Extract with one asyncio event loop per blockchain instead of worker threads",
+        )
+
+        extract_parser.add_argument(
+            "--decode-processes",
+            type=int,
+            help=(
+                "Number of worker processes decoding the logs of EVM blockchains (0 decodes them "
+                f"in the extractor threads). Default: {DECODE_NUM_PROCESSES}"
+            ),
+        )
+
         extract_parser.set_defaults(validate_solana_args=validate_solana_args)
 
         extract_parser.set_defaults(func=Cli.extract_data)
@@ -192,8 +356,42 @@ class Cli:
             required=True,
             help="Name of the bridge",
         )
+        generate_parser.add_argument(
+            "--since",
+            action="store_true",
+            help=(
+                "Only match the events extracted since the last generation, keeping the "
+                "cross-chain transactions already generated"
+            ),
+        )
         generate_parser.set_defaults(func=Cli.generate_data)
 
+        # Migrate action
+        migrate_parser = subparsers.add_parser(
+            "migrate", help="Create the indexes and unique keys missing from existing tables"
+        )
+        migrate_parser.add_argument(
+            "--bridge",
+            choices=[bridge.value for bridge in Bridge],
+            required=True,
+            help="Name of the bridge",
+        )
+        migrate_parser.add_argument(
+            "--benchmark",
+            action="store_true",
+            help="Time the event_exists and matching queries before and after the migration",
+        )
+        migrate_parser.add_argument(
+            "--dedupe",
+            action="store_true",
+            help=(
+                "Delete the rows duplicated under the key of a new unique index (keeping the "
+                "first one written). Without it, duplicates are only reported and the migration "
+                "is aborted"
+            ),
+        )
+        migrate_parser.set_defaults(func=Cli.migrate_db)
+
         args = parser.parse_args()
         if args.action:
             args.func(args)
@@ -1,3 +1,4 @@
+import os
 from enum import Enum
 
 
@@ -69,7 +70,7 @@ BLOCKCHAIN_IDS = {
         "name": "ronin",
         "native_token": "AXS",
     },
-    "5eykt4UsFv8P8NJdTREpY1vzqKqZKvdpKuc147dw2N9d": { # genesis hash for Solana
+    "5eykt4UsFv8P8NJdTREpY1vzqKqZKvdpKuc147dw2N9d": {  # genesis hash for Solana
         "name": "solana",
         "native_token": "SOL",
     },
@@ -91,6 +92,20 @@ TOKEN_PRICING_SUPPORTED_BLOCKCHAINS = {
     "gnosis": "gnosis",
 }
 
+# Token metadata and prices are fetched from Alchemy by at most ALCHEMY_MAX_WORKERS threads at a
+# time, and all requests together are spaced out to at most ALCHEMY_RATE_LIMIT per second (the
+# throughput allowed to the API key).
+ALCHEMY_MAX_WORKERS = 8
+ALCHEMY_RATE_LIMIT = 10
+
+# Token metadata and daily prices fetched from Alchemy are persisted to a local SQLite file shared
+# across runs and bridges, such that they are never fetched twice. Tokens and days Alchemy has no
+# data for are tried again after TOKEN_INFO_NEGATIVE_TTL seconds (e.g., the price of a day that
+# was not over yet). Set the file to None to keep the cache in memory only.
+TOKEN_INFO_CACHE_FILE = ".cache/token_info.sqlite"
+
+TOKEN_INFO_NEGATIVE_TTL = 86400
+
 
 # Mapping of bridges to their respective RPC methods
 # The majority of bridges work fine using the 'eth_getTransactionReceipt' RPC method to
@@ -119,3 +134,135 @@ BRIDGE_NEEDS_TRANSACTION_BY_HASH_RPC_METHOD = {
 RPCS_CONFIG_FILE = "config/rpcs_config.yaml"
 
 MAX_NUM_THREADS_EXTRACTOR = 10
+
+# Maximum number of JSON-RPC calls packed into a single batch request (e.g., when fetching the
+# receipts and blocks of all transactions found in a block range). Public RPC providers cap the
+# size of batch requests differently, so the default can be overridden for each blockchain,
+# either here or with a `batch_size` entry in the blockchain section of the RPCs config file.
+DEFAULT_RPC_BATCH_SIZE = 50
+
+# e.g., {"ronin": 10}
+RPC_BATCH_SIZE_PER_BLOCKCHAIN = {}
+
+# Maximum number of keep-alive connections kept open to each RPC endpoint. Each extractor
+# launches twice as many threads as RPCs available (capped by MAX_NUM_THREADS_EXTRACTOR), so the
+# pool is sized to let every thread reuse its own connection.
+HTTP_POOL_SIZE = MAX_NUM_THREADS_EXTRACTOR * 2
+
+# Whether to ask RPC endpoints for gzip-compressed responses (decoded transparently). Large
+# responses (e.g., eth_getLogs or full blocks) are much smaller compressed, at some CPU cost.
+HTTP_GZIP_RESPONSES = True
+
+# Block timestamps are cached in memory (up to BLOCK_TIMESTAMP_CACHE_SIZE blocks, least recently
+# used first out) and persisted to a local SQLite file, such that re-runs and other bridges over
+# the same block ranges do not fetch them again. Set the file to None to disable persistence.
+BLOCK_TIMESTAMP_CACHE_SIZE = 100_000
+
+BLOCK_TIMESTAMP_CACHE_FILE = ".cache/block_timestamps.sqlite"
+
+# When enabled, the logs of all contracts of a bridge in a blockchain are fetched with a single
+# eth_getLogs sweep over the block range (filtering by the list of contract addresses and the
+# union of their topics), instead of one sweep per contract. Logs are then split by the address
+# that emitted them, and each contract's logs are decoded and handled as before.
+MULTI_CONTRACT_LOGS_QUERY = True
+
+# The block ranges requested with eth_getLogs adapt to the density of each contract: a range is
+# halved whenever the RPC rejects it for returning too many results (or too large a response),
+# and doubled after a range returns fewer than BLOCK_RANGE_SPARSE_NUM_LOGS logs. The best size
+# for each (blockchain, contract) is remembered between runs in BLOCK_RANGE_SIZES_FILE.
+BLOCK_RANGE_INITIAL_SIZE = 1000
+
+BLOCK_RANGE_MAX_SIZE = 100_000
+
+BLOCK_RANGE_SPARSE_NUM_LOGS = 100
+
+BLOCK_RANGE_SIZES_FILE = ".cache/block_range_sizes.json"
+
+# Blockchains are extracted concurrently. Requests to the RPCs of each blockchain are bounded by
+# the workers its extractor starts, and requests to all blockchains together (by worker threads
+# and event loops alike) are capped by MAX_CONCURRENT_RPC_REQUESTS. Event loops waiting for the
+# cap check it again every REQUEST_LIMITER_POLL_INTERVAL seconds.
+MAX_CONCURRENT_RPC_REQUESTS = 100
+
+REQUEST_LIMITER_POLL_INTERVAL = 0.01
+
+# With the asyncio extraction engine (extract --async-engine), all requests of a blockchain run
+# in a single event loop, and each RPC endpoint serves at most ASYNC_MAX_REQUESTS_PER_ENDPOINT
+# requests at the same time.
+ASYNC_MAX_REQUESTS_PER_ENDPOINT = 50
+
+# RPC endpoints are chosen by their health rather than in round-robin: each request goes to a
+# random healthy endpoint with probability proportional to its capacity, estimated from its
+# exponentially weighted moving average (EWMA) latency and error rate. The first requests to an
+# endpoint assume RPC_INITIAL_LATENCY seconds.
+RPC_LATENCY_EWMA_ALPHA = 0.2
+
+RPC_INITIAL_LATENCY = 0.5
+
+# After RPC_CIRCUIT_BREAKER_FAILURES consecutive failures (or a single 429 response), an endpoint
+# is left out for RPC_CIRCUIT_BREAKER_COOLDOWN seconds. The cooldown doubles every time the
+# endpoint fails again right after it, up to RPC_CIRCUIT_BREAKER_MAX_COOLDOWN seconds.
+RPC_CIRCUIT_BREAKER_FAILURES = 3
+
+RPC_CIRCUIT_BREAKER_COOLDOWN = 5
+
+RPC_CIRCUIT_BREAKER_MAX_COOLDOWN = 300
+
+# Maximum number of requests per second sent to each RPC endpoint, unless set for the endpoint
+# with a `rate_limits` entry (a mapping of RPC URL to requests per second) in the blockchain
+# section of the RPCs config file. None means no limit.
+DEFAULT_RPC_RATE_LIMIT = None
+
+RPCS_BASE_CONFIG_FILE = "config/rpcs_base_config.yaml"
+
+# Before extracting, the RPCs of each blockchain in RPCS_BASE_CONFIG_FILE are probed concurrently
+# (at most RPC_PROBE_MAX_WORKERS at a time, each given RPC_PROBE_TIMEOUT seconds), and those
+# answering are written to RPCS_CONFIG_FILE ranked by latency. The probe of a blockchain is
+# reused for RPCS_CONFIG_TTL seconds, unless the base config file changes (or with
+# extract --refresh-rpcs).
+RPC_PROBE_MAX_WORKERS = 32
+
+RPC_PROBE_TIMEOUT = 10
+
+RPCS_CONFIG_TTL = 6 * 60 * 60
+
+# Transaction existence checks are answered in memory whenever possible: hashes known to be
+# stored are remembered for the whole run, and, with TRANSACTION_BLOOM_FILTER, a Bloom filter of
+# the hashes already stored for the blockchain and block window is loaded before extracting, so
+# that the DB is only asked about hashes the filter may contain (a false positive rate of about
+# TRANSACTION_BLOOM_FILTER_ERROR_RATE).
+TRANSACTION_BLOOM_FILTER = True
+
+TRANSACTION_BLOOM_FILTER_ERROR_RATE = 0.01
+
+# Number of stored events looked up again with event_exists, per repository, by
+# migrate --benchmark; the median of their query times is reported.
+QUERY_BENCHMARK_SAMPLE_SIZE = 20
+
+# Database connection pool. Extraction workers only hold a connection while writing the events
+# and transactions of a range (see Extractor.unit_of_work), never while waiting for the RPCs, so
+# a pool smaller than the number of worker threads of all blockchains extracted at the same time
+# is enough. Threads wait up to DB_POOL_TIMEOUT seconds for a connection to be released. The
+# Postgres server must accept DB_POOL_SIZE + DB_MAX_OVERFLOW connections per running extraction
+# (max_connections).
+DB_POOL_SIZE = MAX_NUM_THREADS_EXTRACTOR * 2
+
+DB_MAX_OVERFLOW = 40
+
+DB_POOL_TIMEOUT = 300
+
+# Number of worker processes decoding the logs of EVM extractions. ABI decoding is CPU-bound and
+# holds the GIL, so it runs apart from the threads making the RPC requests; 0 decodes the logs in
+# the extractor threads instead.
+DECODE_NUM_PROCESSES = min(4, max(0, (os.cpu_count() or 1) - 1))
+
+# Maximum number of logs sent to a decoder process at once
+DECODE_BATCH_SIZE = 500
+
+# Solana signatures are split into ranges of this size as they are paged from the RPC, and each
+# range is processed (and checkpointed) at once by a worker thread
+SOLANA_SIGNATURE_RANGE_SIZE = 100
+
+# Maximum number of signature ranges waiting to be processed. Pagination pauses while the queue
+# is full, so signatures are not all held in memory when the workers fall behind.
+SOLANA_SIGNATURE_QUEUE_SIZE = 100
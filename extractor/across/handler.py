@@ -2,7 +2,7 @@ from typing import Any, Dict, List
 
 from config.constants import Bridge
 from extractor.across.constants import BRIDGE_CONFIG
-from extractor.base_handler import BaseHandler
+from extractor.base_handler import BaseHandler, EventHandler
 from repository.across.repository import (
     AcrossBlockchainTransactionRepository,
     AcrossFilledV3RelayRepository,
@@ -11,12 +11,28 @@ from repository.across.repository import (
 )
 from repository.database import DBSession
 from rpcs.evm_rpc_client import EvmRPCClient
-from utils.utils import CustomException, convert_bin_to_hex, log_error
+from utils.utils import CustomException, convert_bin_to_hex
 
 
 class AcrossHandler(BaseHandler):
     CLASS_NAME = "AcrossHandler"
 
+    # map of the topic of each event to its handler method, and the repository it writes to
+    EVENT_HANDLERS = {
+        # V3FundsDeposited
+        "0xa123dc29aebf7d0c3322c8eeb5b999e859f39937950ed31056532713d0de396f": EventHandler(
+            "handle_v3_funds_deposited", "across_v3_funds_deposited_repo"
+        ),
+        # FilledV3Relay
+        "0x571749edf1d5c9599318cdbc4e28a6475d65e87fd3b2ddbe1e9a8d5e7a0f0ff7": EventHandler(
+            "handle_filled_v3_relay", "across_filled_v3_relay_repo"
+        ),
+        # ExecutedRelayerRefundRoot
+        "0xf8bd640004bcec1b89657020f561d0b070cbdf662d0b158db9dccb0a8301bfab": EventHandler(
+            "handle_relayer_refund", "across_relayer_refund_repo"
+        ),
+    }
+
     def __init__(self, rpc_client: EvmRPCClient, blockchains: list) -> None:
         super().__init__(rpc_client, blockchains)
         self.bridge = Bridge.ACROSS
@@ -37,7 +53,7 @@ class AcrossHandler(BaseHandler):
     def handle_transactions(self, transactions: List[Dict[str, Any]]) -> None:
         func_name = "handle_transactions"
         try:
-            self.blockchain_transaction_repo.create_all(transactions)
+            self.blockchain_transaction_repo.copy_all(transactions)
         except Exception as e:
             raise CustomException(
                 self.CLASS_NAME,
@@ -65,47 +81,6 @@ class AcrossHandler(BaseHandler):
                 f"Error reading transaction from database: {e}",
             ) from e
 
-    def handle_events(
-        self,
-        blockchain: str,
-        start_block: int,
-        end_block: int,
-        contract: str,
-        topics: List[str],
-        events: List[Dict[str, Any]],
-    ) -> List[Dict[str, Any]]:
-        included_events = []
-
-        for event in events:
-            try:
-                if (
-                    event["topic"]
-                    == "0xa123dc29aebf7d0c3322c8eeb5b999e859f39937950ed31056532713d0de396f"
-                ):  # V3FundsDeposited
-                    event = self.handle_v3_funds_deposited(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x571749edf1d5c9599318cdbc4e28a6475d65e87fd3b2ddbe1e9a8d5e7a0f0ff7"
-                ):  # FilledV3Relay
-                    event = self.handle_filled_v3_relay(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0xf8bd640004bcec1b89657020f561d0b070cbdf662d0b158db9dccb0a8301bfab"
-                ):  # ExecutedRelayerRefundRoot
-                    event = self.handle_relayer_refund(blockchain, event)
-
-                if event:
-                    included_events.append(event)
-
-            except CustomException as e:
-                request_desc = (
-                    f"Error processing request: {blockchain}, {start_block}, "
-                    f"{end_block}, {contract}, {topics}.\n{e}"
-                )
-                log_error(self.bridge, request_desc)
-
-        return included_events
-
     def handle_v3_funds_deposited(self, blockchain, event):
         func_name = "v3_funds_deposited"
 
@@ -115,10 +90,8 @@ class AcrossHandler(BaseHandler):
             return None
 
         try:
-            if self.across_v3_funds_deposited_repo.event_exists(event["depositId"]):
-                return None
-
-            self.across_v3_funds_deposited_repo.create(
+            self.stage(
+                self.across_v3_funds_deposited_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -135,7 +108,7 @@ class AcrossHandler(BaseHandler):
                     "recipient": event["recipient"],
                     "exclusive_relayer": event["exclusiveRelayer"],
                     "message": event["message"],
-                }
+                },
             )
             return event
         except Exception as e:
@@ -155,10 +128,8 @@ class AcrossHandler(BaseHandler):
             return None
 
         try:
-            if self.across_filled_v3_relay_repo.event_exists(event["depositId"]):
-                return None
-
-            self.across_filled_v3_relay_repo.create(
+            self.stage(
+                self.across_filled_v3_relay_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -184,7 +155,7 @@ class AcrossHandler(BaseHandler):
                         event["relayExecutionInfo"]["updatedOutputAmount"]
                     ),
                     "fill_type": event["relayExecutionInfo"]["fillType"],
-                }
+                },
             )
 
             return event
@@ -200,16 +171,8 @@ class AcrossHandler(BaseHandler):
 
         for i in range(len(event["refundAmounts"])):
             try:
-                if self.across_relayer_refund_repo.event_exists(
-                    event["transaction_hash"],
-                    str(event["amountToReturn"]),
-                    str(event["refundAmounts"][i]),
-                    event["l2TokenAddress"],
-                    event["refundAddresses"][i],
-                ):
-                    continue
-
-                self.across_relayer_refund_repo.create(
+                self.stage(
+                    self.across_relayer_refund_repo,
                     {
                         "blockchain": blockchain,
                         "transaction_hash": event["transaction_hash"],
@@ -219,7 +182,7 @@ class AcrossHandler(BaseHandler):
                         "l2_token_address": event["l2TokenAddress"],
                         "refund_address": event["refundAddresses"][i],
                         "caller": event["caller"],
-                    }
+                    },
                 )
             except Exception as e:
                 raise CustomException(
@@ -0,0 +1,193 @@
+import asyncio
+import time
+
+from config.constants import ASYNC_MAX_REQUESTS_PER_ENDPOINT
+from extractor.block_range_planner import block_range_planner
+from extractor.evm_extractor import EvmExtractor
+from utils.utils import (
+    CliColor,
+    CustomException,
+    RPCResultLimitException,
+    build_log_message,
+    log_to_cli,
+)
+
+
+class AsyncEvmExtractor(EvmExtractor):
+    """
+    EvmExtractor that runs all block ranges of a blockchain as coroutines in a single event loop,
+    instead of one thread per range. Concurrency is bounded by a semaphore per RPC endpoint, so
+    there are as many requests in flight as the endpoints allow rather than as threads exist.
+    Decoding and repository calls are blocking, and are run in worker threads.
+    """
+
+    CLASS_NAME = "AsyncEvmExtractor"
+
+    async def work_async(
+        self,
+        contracts: list,
+        topics: list,
+        start_block: int,
+        end_block: int,
+    ):
+        """Asyncio version of `work`."""
+        cursor = start_block
+
+        while cursor <= end_block:
+            range_size = block_range_planner.get_range_size(self.blockchain, contracts)
+            to_block = min(cursor + range_size - 1, end_block)
+
+            try:
+                logs = await self.rpc_client.get_logs_emitted_by_contract_async(
+                    self.blockchain,
+                    contracts[0] if len(contracts) == 1 else contracts,
+                    topics,
+                    cursor,
+                    to_block,
+                )
+            except RPCResultLimitException as e:
+                if to_block > cursor:
+                    block_range_planner.on_result_limit(
+                        self.blockchain, contracts, to_block - cursor + 1
+                    )
+                    continue
+
+                # a single block cannot be split any further
+                request_desc = (
+                    f"Error processing request: {self.blockchain}, {cursor}, {to_block}, "
+                    f"{contracts}, {topics}. Error: {e}"
+                )
+                self.log_range_error(request_desc)
+                cursor = to_block + 1
+                continue
+
+            block_range_planner.on_success(
+                self.blockchain, contracts, to_block - cursor + 1, len(logs)
+            )
+
+            if len(logs) > 0:
+                await self.process_logs_async(contracts, topics, cursor, to_block, logs)
+
+            cursor = to_block + 1
+
+    async def process_logs_async(
+        self,
+        contracts: list,
+        topics: list,
+        start_block: int,
+        end_block: int,
+        logs: list,
+    ):
+        """Asyncio version of `process_logs`."""
+        # as with worker threads, a session is only held while the range is written, not while
+        # waiting for the RPCs
+        pending_txs, events = await asyncio.to_thread(
+            self.handle_logs,
+            contracts,
+            topics,
+            start_block,
+            end_block,
+            logs,
+        )
+
+        try:
+            fetched_txs = await self.rpc_client.process_transactions_async(
+                self.blockchain, pending_txs
+            )
+        except CustomException as e:
+            request_desc = (
+                f"Error processing request: {self.blockchain}, {start_block}, {end_block}, "
+                f"{contracts}, {topics}. Error: {e}"
+            )
+            self.log_range_error(request_desc)
+            fetched_txs = {}
+
+        await asyncio.to_thread(
+            self.run_in_unit_of_work,
+            self.store_range,
+            contracts,
+            topics,
+            start_block,
+            end_block,
+            events,
+            fetched_txs,
+        )
+
+    async def work_segment(self, contracts: list, topics: list, start_block: int, end_block: int):
+        try:
+            errors = self.start_range()
+
+            await self.work_async(contracts, topics, start_block, end_block)
+
+            if len(errors) == 0:
+                await asyncio.to_thread(
+                    self.checkpoint_block_range, contracts, start_block, end_block
+                )
+        except CustomException as e:
+            request_desc = (
+                f"Error processing request: {self.bridge}, {self.blockchain}, {start_block}, "
+                f"{end_block}, {contracts}, {topics}. Error: {e}"
+            )
+            self.log_range_error(request_desc)
+
+    async def extract_data_async(self, start_block: int, end_block: int):
+        bridge_blockchain_pairs = self.handler.get_bridge_contracts_and_topics(
+            self.bridge, self.blockchain
+        )
+
+        await asyncio.to_thread(self.load_transaction_filter, start_block, end_block)
+
+        try:
+            for contracts, topics in self.group_contracts_and_topics(bridge_blockchain_pairs):
+                start_time = time.time()
+
+                pending_ranges = await asyncio.to_thread(
+                    self.get_pending_ranges, contracts, start_block, end_block
+                )
+
+                # enough segments to keep every endpoint of the blockchain busy
+                block_ranges = self.divide_pending_ranges(
+                    pending_ranges,
+                    self.rpc_client.rpc_sizes[self.blockchain] * ASYNC_MAX_REQUESTS_PER_ENDPOINT,
+                )
+
+                log_to_cli(
+                    build_log_message(
+                        start_block,
+                        end_block,
+                        self.describe_contracts(contracts),
+                        self.bridge,
+                        self.blockchain,
+                        f"Launching {len(block_ranges)} coroutines to process block ranges...",
+                    )
+                )
+
+                await asyncio.gather(
+                    *[
+                        self.work_segment(contracts, topics, start, end)
+                        for start, end in block_ranges
+                    ]
+                )
+
+                block_range_planner.save()
+
+                log_to_cli(
+                    build_log_message(
+                        start_block,
+                        end_block,
+                        self.describe_contracts(contracts),
+                        self.bridge,
+                        self.blockchain,
+                        (
+                            f"Finished processing logs and transactions. Time taken: "
+                            f"{time.time() - start_time} seconds."
+                        ),
+                    ),
+                    CliColor.SUCCESS,
+                )
+        finally:
+            await self.rpc_client.close_async()
+
+    def extract_data(self, start_block: int, end_block: int):
+        """Main extraction logic, running one event loop for the blockchain."""
+        asyncio.run(self.extract_data_async(start_block, end_block))
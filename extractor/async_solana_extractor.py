@@ -0,0 +1,149 @@
+import asyncio
+import time
+
+from config.constants import ASYNC_MAX_REQUESTS_PER_ENDPOINT, SOLANA_SIGNATURE_QUEUE_SIZE
+from extractor.solana_extractor import SolanaExtractor
+from utils.utils import (
+    CliColor,
+    CustomException,
+    build_log_message_solana,
+    log_to_cli,
+)
+
+
+class AsyncSolanaExtractor(SolanaExtractor):
+    """
+    SolanaExtractor that parses the transactions of each signature range as coroutines in a
+    single event loop, bounded by a semaphore per endpoint. Repository calls are blocking, and
+    are run in worker threads.
+    """
+
+    CLASS_NAME = "AsyncSolanaExtractor"
+
+    async def parse_signature_async(self, signature: str):
+        try:
+            return await self.rpc_client.parseTransactionByHash_async(signature)
+        except Exception as e:
+            request_desc = (
+                f"Error processing transaction: {self.bridge}, {self.blockchain}, "
+                f"{signature}. Error: {e}"
+            )
+            self.log_range_error(request_desc)
+            return None
+
+    async def work_async(self, program_id: str, signatures: list):
+        """Asyncio version of `work`."""
+        errors = self.start_range()
+
+        log_to_cli(
+            build_log_message_solana(
+                signatures[0],
+                signatures[-1],
+                self.bridge,
+                "Processing logs and transactions...",
+            )
+        )
+
+        decoded_txs = await asyncio.gather(
+            *[self.parse_signature_async(signature) for signature in signatures]
+        )
+        decoded_instructions = [decoded_tx for decoded_tx in decoded_txs if decoded_tx]
+
+        try:
+            await asyncio.to_thread(
+                self.run_in_unit_of_work,
+                self.handle_decoded_transactions,
+                signatures,
+                decoded_instructions,
+            )
+        except CustomException as e:
+            request_desc = (
+                f"Error processing request: {self.bridge}, {self.blockchain}, {program_id}, "
+                f"{signatures[0]}, {signatures[-1]}. Error: {e}"
+            )
+            self.log_range_error(request_desc)
+
+        if len(errors) == 0:
+            await asyncio.to_thread(self.checkpoint_signature_range, program_id, signatures)
+
+    async def extract_data_async(self, signature_ranges: dict):
+        await asyncio.to_thread(self.load_transaction_filter)
+
+        try:
+            for idx, program_id in enumerate(self.solana_program_ids):
+                start_signature = signature_ranges[program_id]["start_signature"]
+                end_signature = signature_ranges[program_id]["end_signature"]
+
+                log_to_cli(
+                    build_log_message_solana(
+                        start_signature,
+                        end_signature,
+                        self.bridge,
+                        (
+                            f"Retrieving all signatures for program {program_id} "
+                            f"({idx + 1}/{len(self.solana_program_ids)})."
+                        ),
+                    )
+                )
+
+                start_time = time.time()
+
+                # each range is handed to the handler at once, so ranges stay small enough to
+                # have requests of several ranges in flight
+                range_builder = await asyncio.to_thread(
+                    self.create_signature_range_builder, program_id, ASYNC_MAX_REQUESTS_PER_ENDPOINT
+                )
+
+                # ranges are processed as the signatures are paged, and pagination waits while
+                # too many ranges are in flight
+                in_flight = set()
+
+                async for page in self.rpc_client.iter_signatures_for_address_async(
+                    program_id, start_signature, end_signature
+                ):
+                    for signatures in range_builder.add(page):
+                        if len(in_flight) >= SOLANA_SIGNATURE_QUEUE_SIZE:
+                            done, in_flight = await asyncio.wait(
+                                in_flight, return_when=asyncio.FIRST_COMPLETED
+                            )
+                            for task in done:
+                                task.result()
+
+                        in_flight.add(asyncio.create_task(self.work_async(program_id, signatures)))
+
+                for signatures in range_builder.flush():
+                    in_flight.add(asyncio.create_task(self.work_async(program_id, signatures)))
+
+                if len(in_flight) > 0:
+                    await asyncio.gather(*in_flight)
+
+                if range_builder.num_signatures == 0:
+                    log_to_cli(
+                        build_log_message_solana(
+                            start_signature,
+                            end_signature,
+                            self.bridge,
+                            "No transaction signatures found in the specified range.",
+                        ),
+                        CliColor.ERROR,
+                    )
+                    continue
+
+                log_to_cli(
+                    build_log_message_solana(
+                        start_signature,
+                        end_signature,
+                        self.bridge,
+                        (
+                            f"Finished processing logs and transactions. Time taken: "
+                            f"{time.time() - start_time} seconds."
+                        ),
+                    ),
+                    CliColor.SUCCESS,
+                )
+        finally:
+            await self.rpc_client.close_async()
+
+    def extract_data(self, signature_ranges: dict):
+        """Main extraction logic, running one event loop for Solana."""
+        asyncio.run(self.extract_data_async(signature_ranges))
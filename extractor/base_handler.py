@@ -1,16 +1,33 @@
+import contextvars
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from contextlib import contextmanager
+from typing import Any, Dict, List, NamedTuple
 
 from annotated_types import T
 
 from config.constants import BLOCKCHAIN_IDS
+from repository.base import BaseRepository
 from rpcs.evm_rpc_client import EvmRPCClient
-from utils.utils import CustomException, convert_bin_to_hex
+from utils.utils import CustomException, convert_bin_to_hex, log_error
+
+# rows created by the event handlers while handling the events of a block range (in the current
+# thread or task), keyed by repository, which are written in bulk once all events are handled
+staged_rows = contextvars.ContextVar("staged_rows", default=None)
+
+
+class EventHandler(NamedTuple):
+    """The handler method of the events with a given topic, and the repository it writes to."""
+
+    method: str
+    repo: str
 
 
 class BaseHandler(ABC):
     CLASS_NAME = "BaseHandler"
 
+    # map of the topic of each event to its handler method, and the repository it writes to
+    EVENT_HANDLERS: Dict[str, EventHandler] = {}
+
     def __init__(self, rpc_client: EvmRPCClient, blockchains: List[str]):
         self.rpc_client = rpc_client
         self.bind_db_to_repos()
@@ -25,7 +42,6 @@ class BaseHandler(ABC):
         """
         raise NotImplementedError("This method should be implemented in subclasses.")
 
-    @abstractmethod
     def handle_events(
         self,
         blockchain: str,
@@ -33,9 +49,70 @@ class BaseHandler(ABC):
         end_block: int,
         contract: str,
         topics: List[str],
-        event: List[Dict[str, Any]],
+        events: List[Dict[str, Any]],
     ) -> List[Dict[str, Any]]:
-        pass
+        """
+        Handles the decoded events of a contract, grouped by topic such that the handler of each
+        topic is only looked up once. Returns the events that were included, whether or not they
+        were already stored (the unique keys of the tables skip those), such that the
+        transactions of all of them are checked.
+        """
+        included_events = []
+
+        for topic, topic_events in self.group_events_by_topic(events).items():
+            event_handler = self.EVENT_HANDLERS.get(topic)
+
+            if event_handler is None:
+                continue
+
+            handle_event = getattr(self, event_handler.method)
+
+            for event in topic_events:
+                try:
+                    event = handle_event(blockchain, event)
+
+                    if event:
+                        included_events.append(event)
+
+                except CustomException as e:
+                    request_desc = (
+                        f"Error processing request: {blockchain}, {start_block}, "
+                        f"{end_block}, {contract}, {topics}.\n{e}"
+                    )
+                    log_error(self.bridge, request_desc)
+
+        return included_events
+
+    @staticmethod
+    def group_events_by_topic(events: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Groups the events by topic, keeping the order of the events of each topic."""
+        events_by_topic = {}
+
+        for event in events:
+            events_by_topic.setdefault(event["topic"], []).append(event)
+
+        return events_by_topic
+
+    def get_event_model(self, topic: str) -> Any:
+        """Returns the model of the table where the events with the given topic are written."""
+        return getattr(self, self.EVENT_HANDLERS[topic].repo).model
+
+    def validate_topics(self, bridge: str, blockchain: str, pairs: List[Dict]) -> None:
+        """
+        Checks that every topic configured for the blockchain has a handler, as the events of
+        topics without one would be extracted and silently dropped.
+        """
+        missing_topics = [
+            topic
+            for pair in pairs
+            for topic in pair.get("topics", [])
+            if topic not in self.EVENT_HANDLERS
+        ]
+
+        if len(missing_topics) > 0:
+            raise ValueError(
+                f"Topics {missing_topics} of {blockchain} have no handler for bridge {bridge}."
+            )
 
     @abstractmethod
     def get_bridge_contracts_and_topics(
@@ -51,7 +128,10 @@ class BaseHandler(ABC):
         if blockchain not in config["blockchains"]:
             raise ValueError(f"Blockchain {blockchain} not supported for bridge {bridge}.")
 
-        return config["blockchains"][blockchain]
+        pairs = config["blockchains"][blockchain]
+        self.validate_topics(bridge, blockchain, pairs)
+
+        return pairs
 
     @abstractmethod
     def bind_db_to_repos(self) -> None:
@@ -62,10 +142,84 @@ class BaseHandler(ABC):
         """
         pass
 
+    def stage(self, repo: BaseRepository, row: Dict[str, Any]) -> None:
+        """
+        Creates a row with the repository. Within `bulk_writes`, the row is only staged, and
+        written with the other rows of the same model when the block range is done.
+        """
+        rows = staged_rows.get()
+
+        if rows is None:
+            repo.create(row)
+            return
+
+        # the same event may be handled twice within a block range (e.g., logged twice by a
+        # transaction), in which case we only write it once; rows are keyed by their values (as
+        # reprs, since some values are not hashable) to find duplicates in constant time
+        key = tuple(sorted((column, repr(value)) for column, value in row.items()))
+        rows.setdefault(repo, {}).setdefault(key, row)
+
+    @contextmanager
+    def staging(self):
+        """
+        Stages the rows created by the event handlers while in the context, yielding them (by
+        repository, keyed by their values) to be written later with `write_staged_rows`.
+        """
+        rows = {}
+        token = staged_rows.set(rows)
+        try:
+            yield rows
+        finally:
+            staged_rows.reset(token)
+
+    @contextmanager
+    def bulk_writes(self):
+        """
+        Stages the rows created by the event handlers while in the context, and writes them on
+        exit with a single INSERT ... ON CONFLICT DO NOTHING statement per model.
+        """
+        with self.staging() as rows:
+            yield
+
+        self.write_staged_rows(rows)
+
+    def write_staged_rows(self, rows: Dict[BaseRepository, Dict[tuple, Dict[str, Any]]]) -> int:
+        """
+        Writes the staged rows of each repository, skipping those already stored (as decided by
+        the unique keys of their tables, rather than by querying each row first). Returns the
+        number of rows that were new.
+        """
+        func_name = "write_staged_rows"
+        errors = []
+        num_new_rows = 0
+
+        for repo, repo_rows in rows.items():
+            repo_rows = list(repo_rows.values())
+
+            try:
+                num_new_rows += len(repo.upsert_all(repo_rows))
+            except Exception:
+                # if there is an error while writing the rows in batch, we write them one by one
+                # to avoid the entire batch failing
+                for row in repo_rows:
+                    try:
+                        num_new_rows += len(repo.upsert_all([row]))
+                    except Exception as e:
+                        errors.append(e)
+
+        if len(errors) > 0:
+            raise CustomException(
+                self.CLASS_NAME,
+                func_name,
+                f"Error writing {len(errors)} rows to database: {errors[0]}",
+            )
+
+        return num_new_rows
+
     def handle_transactions(self, transactions: List[Dict[str, Any]]) -> None:
         func_name = "handle_transactions"
         try:
-            self.blockchain_transaction_repo.create_all(transactions)
+            self.blockchain_transaction_repo.copy_all(transactions)
         except Exception as e:
             raise CustomException(
                 self.CLASS_NAME,
@@ -0,0 +1,97 @@
+import json
+import os
+import threading
+
+from config.constants import (
+    BLOCK_RANGE_INITIAL_SIZE,
+    BLOCK_RANGE_MAX_SIZE,
+    BLOCK_RANGE_SIZES_FILE,
+    BLOCK_RANGE_SPARSE_NUM_LOGS,
+)
+
+
+class BlockRangePlanner:
+    """
+    Thread-safe planner of the block range sizes requested with eth_getLogs, for each blockchain
+    and contract (or group of contracts). Sizes are halved when the RPC rejects a range for
+    returning too many results, and doubled when a range is sparse.
+
+    Attributes:
+        sizes_file (str): Path of the JSON file where sizes are persisted, or None.
+        initial_size (int): Size used for contracts without a remembered size.
+        max_size (int): Maximum size of a block range.
+        sparse_num_logs (int): Ranges returning fewer logs than this are considered sparse.
+        sizes (dict): Mapping of "blockchain:contract" to its current block range size.
+    """
+
+    def __init__(
+        self,
+        sizes_file: str = BLOCK_RANGE_SIZES_FILE,
+        initial_size: int = BLOCK_RANGE_INITIAL_SIZE,
+        max_size: int = BLOCK_RANGE_MAX_SIZE,
+        sparse_num_logs: int = BLOCK_RANGE_SPARSE_NUM_LOGS,
+    ):
+        self.sizes_file = sizes_file
+        self.initial_size = initial_size
+        self.max_size = max_size
+        self.sparse_num_logs = sparse_num_logs
+        self.sizes = None
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def to_key(blockchain: str, contracts: list) -> str:
+        return f"{blockchain}:{','.join(sorted(contract.lower() for contract in contracts))}"
+
+    def _load(self) -> dict:
+        # the file is only read on first use, and always accessed under the lock
+        if self.sizes is None:
+            self.sizes = {}
+            if self.sizes_file and os.path.exists(self.sizes_file):
+                with open(self.sizes_file, "r") as f:
+                    self.sizes = json.load(f)
+
+        return self.sizes
+
+    def get_range_size(self, blockchain: str, contracts: list) -> int:
+        with self.lock:
+            return self._load().get(self.to_key(blockchain, contracts), self.initial_size)
+
+    def on_result_limit(self, blockchain: str, contracts: list, range_size: int) -> int:
+        """Halves the size after a range of `range_size` blocks was rejected by the RPC."""
+        key = self.to_key(blockchain, contracts)
+
+        with self.lock:
+            sizes = self._load()
+            sizes[key] = max(1, min(sizes.get(key, self.initial_size), range_size // 2))
+            return sizes[key]
+
+    def on_success(self, blockchain: str, contracts: list, range_size: int, num_logs: int) -> int:
+        """Doubles the size after a range of `range_size` blocks returned only a few logs."""
+        key = self.to_key(blockchain, contracts)
+
+        with self.lock:
+            sizes = self._load()
+            current_size = sizes.get(key, self.initial_size)
+
+            # only grow if the range was not already cut short (e.g., at the end of the segment)
+            if num_logs < self.sparse_num_logs and range_size >= current_size:
+                sizes[key] = min(self.max_size, current_size * 2)
+
+            return sizes.get(key, current_size)
+
+    def save(self) -> None:
+        if not self.sizes_file:
+            return
+
+        with self.lock:
+            sizes = self._load()
+
+            if os.path.dirname(self.sizes_file):
+                os.makedirs(os.path.dirname(self.sizes_file), exist_ok=True)
+
+            with open(self.sizes_file, "w") as f:
+                json.dump(sizes, f, indent=2, sort_keys=True)
+
+
+# we keep a single planner for the whole process, such that all extractors share its file
+block_range_planner = BlockRangePlanner()
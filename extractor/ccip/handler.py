@@ -1,7 +1,7 @@
 from typing import Any, Dict, List
 
 from config.constants import Bridge
-from extractor.base_handler import BaseHandler
+from extractor.base_handler import BaseHandler, EventHandler
 from extractor.ccip.constants import BRIDGE_CONFIG
 from repository.ccip.repository import (
     CCIPBlockchainTransactionRepository,
@@ -16,6 +16,18 @@ from utils.utils import CustomException, log_error, unpad_address
 class CcipHandler(BaseHandler):
     CLASS_NAME = "CcipHandler"
 
+    # map of the topic of each event to its handler method, and the repository it writes to
+    EVENT_HANDLERS = {
+        # CCIPSendRequested
+        "0xd0c3c799bf9e2639de44391e7f524d229b2b55f5b1ea94b2bf7da42f7243dddd": EventHandler(
+            "handle_send_requested", "ccip_send_requested_repo"
+        ),
+        # MessageReceived
+        "0xd4f851956a5d67c3997d1c9205045fef79bae2947fdee7e9e2641abc7391ef65": EventHandler(
+            "handle_execution_state_changed", "ccip_execution_state_changed_repo"
+        ),
+    }
+
     def __init__(self, rpc_client: EvmRPCClient, blockchains: list) -> None:
         super().__init__(rpc_client, blockchains)
         self.bridge = Bridge.CCIP
@@ -35,7 +47,7 @@ class CcipHandler(BaseHandler):
     def handle_transactions(self, transactions: List[Dict[str, Any]]) -> None:
         func_name = "handle_transactions"
         try:
-            self.blockchain_transaction_repo.create_all(transactions)
+            self.blockchain_transaction_repo.copy_all(transactions)
         except Exception as e:
             raise CustomException(
                 self.CLASS_NAME,
@@ -63,51 +75,12 @@ class CcipHandler(BaseHandler):
                 f"Error reading transaction from database: {e}",
             ) from e
 
-    def handle_events(
-        self,
-        blockchain: str,
-        start_block: int,
-        end_block: int,
-        contract: str,
-        topics: List[str],
-        events: List[Dict[str, Any]],
-    ) -> List[Dict[str, Any]]:
-        included_events = []
-
-        for event in events:
-            try:
-                if (
-                    event["topic"]
-                    == "0xd0c3c799bf9e2639de44391e7f524d229b2b55f5b1ea94b2bf7da42f7243dddd"
-                ):  # CCIPSendRequested
-                    event = self.handle_send_requested(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0xd4f851956a5d67c3997d1c9205045fef79bae2947fdee7e9e2641abc7391ef65"
-                ):  # MessageReceived
-                    event = self.handle_execution_state_changed(blockchain, event)
-
-                if event:
-                    included_events.append(event)
-
-            except CustomException as e:
-                request_desc = (
-                    f"Error processing request: {blockchain}, {start_block}, "
-                    f"{end_block}, {contract}, {topics}.\n{e}"
-                )
-                log_error(self.bridge, request_desc)
-
-        return included_events
-
     def handle_send_requested(self, blockchain, event):
         func_name = "handle_send_requested"
 
         message = event["message"]
 
         try:
-            if self.ccip_send_requested_repo.event_exists(message["messageId"]):
-                return None
-
             if message["data"] != "":
                 return None
 
@@ -124,7 +97,8 @@ class CcipHandler(BaseHandler):
 
                 output_token = unpad_address(message["sourceTokenData"][0][512:576])
 
-            self.ccip_send_requested_repo.create(
+            self.stage(
+                self.ccip_send_requested_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -140,7 +114,7 @@ class CcipHandler(BaseHandler):
                     "amount": amount,
                     "output_token": output_token,
                     "message_id": message["messageId"],
-                }
+                },
             )
             return event
         except Exception as e:
@@ -154,10 +128,8 @@ class CcipHandler(BaseHandler):
         func_name = "handle_execution_state_changed"
 
         try:
-            if self.ccip_execution_state_changed_repo.event_exists(event["messageId"]):
-                return None
-
-            self.ccip_execution_state_changed_repo.create(
+            self.stage(
+                self.ccip_execution_state_changed_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -165,7 +137,7 @@ class CcipHandler(BaseHandler):
                     "message_id": event["messageId"],
                     "state": event["state"],
                     "return_data": event["returnData"],
-                }
+                },
             )
 
             return event
@@ -1,7 +1,7 @@
 from typing import Any, Dict, List
 
 from config.constants import Bridge
-from extractor.base_handler import BaseHandler
+from extractor.base_handler import BaseHandler, EventHandler
 from extractor.cctp.constants import BRIDGE_CONFIG
 from extractor.cctp.utils.MessageBodyDecoder import MessageBodyDecoder
 from repository.cctp.repository import (
@@ -11,7 +11,7 @@ from repository.cctp.repository import (
 )
 from repository.database import DBSession
 from rpcs.evm_rpc_client import EvmRPCClient
-from utils.utils import CustomException, log_error, unpad_address
+from utils.utils import CustomException, unpad_address
 
 from .constants import BLOCKCHAIN_IDS
 
@@ -19,6 +19,18 @@ from .constants import BLOCKCHAIN_IDS
 class CctpHandler(BaseHandler):
     CLASS_NAME = "CctpHandler"
 
+    # map of the topic of each event to its handler method, and the repository it writes to
+    EVENT_HANDLERS = {
+        # DepositForBurn
+        "0x2fa9ca894982930190727e75500a97d8dc500233a5065e0f3126c48fbe0343c0": EventHandler(
+            "handle_deposit_for_burn", "cctp_deposit_for_burn_repo"
+        ),
+        # MessageReceived
+        "0x58200b4c34ae05ee816d710053fff3fb75af4395915d3d2a771b24aa10e3cc5d": EventHandler(
+            "handle_message_received", "cctp_message_received_repo"
+        ),
+    }
+
     def __init__(self, rpc_client: EvmRPCClient, blockchains: list) -> None:
         super().__init__(rpc_client, blockchains)
         self.bridge = Bridge.CCTP
@@ -38,7 +50,7 @@ class CctpHandler(BaseHandler):
     def handle_transactions(self, transactions: List[Dict[str, Any]]) -> None:
         func_name = "handle_transactions"
         try:
-            self.blockchain_transaction_repo.create_all(transactions)
+            self.blockchain_transaction_repo.copy_all(transactions)
         except Exception as e:
             raise CustomException(
                 self.CLASS_NAME,
@@ -66,42 +78,6 @@ class CctpHandler(BaseHandler):
                 f"Error reading transaction from database: {e}",
             ) from e
 
-    def handle_events(
-        self,
-        blockchain: str,
-        start_block: int,
-        end_block: int,
-        contract: str,
-        topics: List[str],
-        events: List[Dict[str, Any]],
-    ) -> List[Dict[str, Any]]:
-        included_events = []
-
-        for event in events:
-            try:
-                if (
-                    event["topic"]
-                    == "0x2fa9ca894982930190727e75500a97d8dc500233a5065e0f3126c48fbe0343c0"
-                ):  # DepositForBurn
-                    event = self.handle_deposit_for_burn(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x58200b4c34ae05ee816d710053fff3fb75af4395915d3d2a771b24aa10e3cc5d"
-                ):  # MessageReceived
-                    event = self.handle_message_received(blockchain, event)
-
-                if event:
-                    included_events.append(event)
-
-            except CustomException as e:
-                request_desc = (
-                    f"Error processing request: {blockchain}, {start_block}, "
-                    f"{end_block}, {contract}, {topics}.\n{e}"
-                )
-                log_error(self.bridge, request_desc)
-
-        return included_events
-
     def handle_deposit_for_burn(self, blockchain, event):
         func_name = "handle_deposit_for_burn"
 
@@ -111,12 +87,8 @@ class CctpHandler(BaseHandler):
             return None
 
         try:
-            if self.cctp_deposit_for_burn_repo.event_exists(
-                event["nonce"], blockchain, destination_chain
-            ):
-                return None
-
-            self.cctp_deposit_for_burn_repo.create(
+            self.stage(
+                self.cctp_deposit_for_burn_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -126,7 +98,7 @@ class CctpHandler(BaseHandler):
                     "recipient": unpad_address(event["mintRecipient"]),
                     "dst_blockchain": destination_chain,
                     "amount": event["amount"],
-                }
+                },
             )
             return event
         except Exception as e:
@@ -152,12 +124,8 @@ class CctpHandler(BaseHandler):
         message_body = MessageBodyDecoder.decode(event["messageBody"])
 
         try:
-            if self.cctp_message_received_repo.event_exists(
-                event["nonce"], src_blockchain, blockchain
-            ):
-                return None
-
-            self.cctp_message_received_repo.create(
+            self.stage(
+                self.cctp_message_received_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -167,7 +135,7 @@ class CctpHandler(BaseHandler):
                     "depositor": message_body["depositor"],
                     "recipient": message_body["recipient"],
                     "amount": int(message_body["amount"], 16),
-                }
+                },
             )
 
             return event
@@ -0,0 +1,83 @@
+import re
+from functools import lru_cache
+from typing import List, Tuple
+
+import numpy as np
+from eth_abi.grammar import BasicType, parse
+from eth_utils import to_checksum_address
+
+from utils.utils import convert_bin_to_hex
+
+# fixed-width types decoded with NumPy: address, bool, uint<M> and bytes<M>
+NATIVE_TYPE_PATTERN = re.compile(r"^(address|bool|uint(\d*)|bytes([1-9]\d*))$")
+
+
+@lru_cache(maxsize=100_000)
+def checksum_address(address: str) -> str:
+    # the same addresses (e.g., tokens, routers) show up in most logs of a batch
+    return to_checksum_address(address)
+
+
+def is_native_type(type_str: str) -> bool:
+    return NATIVE_TYPE_PATTERN.match(type_str) is not None
+
+
+def is_single_word_type(type_str: str) -> bool:
+    """
+    Returns whether the type takes a single 32-byte word in the head of the encoded data, i.e.,
+    it is dynamic (the word is an offset to its data) or a static non-array basic type.
+    """
+    try:
+        abi_type = parse(type_str)
+    except Exception:
+        return False
+
+    return abi_type.is_dynamic or (isinstance(abi_type, BasicType) and not abi_type.arrlist)
+
+
+def decode_words(words: np.ndarray, type_str: str) -> Tuple[List, np.ndarray]:
+    """
+    Decodes a column of 32-byte words (an array of shape (rows, 32)) of a native type, with the
+    same values as eth_abi followed by the decoder normalizations (i.e., checksummed addresses and
+    bytes in hex). Returns the values, and a mask of the rows with valid padding.
+    """
+    match = NATIVE_TYPE_PATTERN.match(type_str)
+    num_rows = len(words)
+
+    if match.group(1) == "address":
+        size = 20
+    elif match.group(1) == "bool":
+        size = 1
+    elif match.group(1).startswith("uint"):
+        size = int(match.group(2) or 256) // 8
+    else:
+        size = int(match.group(3))
+
+    # values are right-aligned in their word, except for fixed-size byte arrays
+    if match.group(3) is None:
+        padding, data = words[:, : 32 - size], words[:, 32 - size :]
+    else:
+        data, padding = words[:, :size], words[:, size:]
+
+    valid = ~padding.any(axis=1)
+    data = np.ascontiguousarray(data)
+
+    if match.group(1) == "address":
+        hex_data = data.tobytes().hex()
+        values = [checksum_address("0x" + hex_data[i * 40 : (i + 1) * 40]) for i in range(num_rows)]
+    elif match.group(1) == "bool":
+        valid &= data[:, 0] <= 1
+        values = (data[:, 0] == 1).tolist()
+    elif match.group(3) is not None:
+        raw = data.tobytes()
+        values = [convert_bin_to_hex(raw[i * size : (i + 1) * size]) for i in range(num_rows)]
+    elif size <= 8:
+        # integers of up to 64 bits are read at once as big-endian uint64
+        padded = np.zeros((num_rows, 8), dtype=np.uint8)
+        padded[:, 8 - size :] = data
+        values = padded.view(">u8").ravel().tolist()
+    else:
+        raw = data.tobytes()
+        values = [int.from_bytes(raw[i * size : (i + 1) * size], "big") for i in range(num_rows)]
+
+    return values, valid
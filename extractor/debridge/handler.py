@@ -1,7 +1,7 @@
 from typing import Any, Dict, List
 
 from config.constants import Bridge
-from extractor.base_handler import BaseHandler
+from extractor.base_handler import BaseHandler, EventHandler
 from extractor.debridge.constants import BLOCKCHAIN_IDS, BRIDGE_CONFIG, SOLANA_PROGRAM_ADDRESSES
 from extractor.mayan.handler import MayanHandler
 from repository.database import DBSession
@@ -32,6 +32,22 @@ from utils.utils import (
 class DebridgeHandler(BaseHandler):
     CLASS_NAME = "DebridgeHandler"
 
+    # map of the topic of each event to its handler method, and the repository it writes to
+    EVENT_HANDLERS = {
+        # CreatedOrder
+        "0xfc8703fd57380f9dd234a89dce51333782d49c5902f307b02f03e014d18fe471": EventHandler(
+            "handle_created_order", "created_order_repo"
+        ),
+        # FulfilledOrder
+        "0xd281ee92bab1446041582480d2c0a9dc91f855386bb27ea295faac1e992f7fe4": EventHandler(
+            "handle_fulfilled_order", "fulfilled_order_repo"
+        ),
+        # ClaimedUnlock
+        "0x33fff3d864e92b6e1ef9e830196fc019c946104ea621b833aaebd3c3e84b2f6f": EventHandler(
+            "handle_claimed_unlock", "claimed_unlock_repo"
+        ),
+    }
+
     def __init__(self, rpc_client: EvmRPCClient, blockchains: list) -> None:
         super().__init__(rpc_client, blockchains)
         self.bridge = Bridge.DEBRIDGE
@@ -58,7 +74,7 @@ class DebridgeHandler(BaseHandler):
     def handle_transactions(self, transactions: List[Dict[str, Any]]) -> None:
         func_name = "handle_transactions"
         try:
-            self.blockchain_transaction_repo.create_all(transactions)
+            self.blockchain_transaction_repo.copy_all(transactions)
         except Exception as e:
             raise CustomException(
                 self.CLASS_NAME,
@@ -86,46 +102,6 @@ class DebridgeHandler(BaseHandler):
                 f"Error reading transaction from database: {e}",
             ) from e
 
-    def handle_events(
-        self,
-        blockchain: str,
-        start_block: int,
-        end_block: int,
-        contract: str,
-        topics: List[str],
-        events: List[Dict[str, Any]],
-    ) -> List[Dict[str, Any]]:
-        included_events = []
-        for event in events:
-            try:
-                if (
-                    event["topic"]
-                    == "0xfc8703fd57380f9dd234a89dce51333782d49c5902f307b02f03e014d18fe471"
-                ):  # CreatedOrder
-                    event = self.handle_created_order(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0xd281ee92bab1446041582480d2c0a9dc91f855386bb27ea295faac1e992f7fe4"
-                ):  # FulfilledOrder
-                    event = self.handle_fulfilled_order(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x33fff3d864e92b6e1ef9e830196fc019c946104ea621b833aaebd3c3e84b2f6f"
-                ):  # ClaimedUnlock
-                    event = self.handle_claimed_unlock(blockchain, event)
-
-                if event:
-                    included_events.append(event)
-
-            except CustomException as e:
-                request_desc = (
-                    f"Error processing request: {blockchain}, {start_block}, "
-                    f"{end_block}, {contract}, {topics}.\n{e}"
-                )
-                log_error(self.bridge, request_desc)
-
-        return included_events
-
     def handle_created_order(self, blockchain, event):
         func_name = "handle_created_order"
 
@@ -140,10 +116,8 @@ class DebridgeHandler(BaseHandler):
             return None
 
         try:
-            if self.created_order_repo.event_exists(obj[0]):
-                return None
-
-            self.created_order_repo.create(
+            self.stage(
+                self.created_order_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -169,7 +143,7 @@ class DebridgeHandler(BaseHandler):
                     "_metadata": event.get("metadata"),
                     "original_token": None,
                     "original_amount": None,
-                }
+                },
             )
             return event
         except Exception as e:
@@ -193,10 +167,8 @@ class DebridgeHandler(BaseHandler):
             return None
 
         try:
-            if self.fulfilled_order_repo.event_exists(event["orderId"]):
-                return None
-
-            self.fulfilled_order_repo.create(
+            self.stage(
+                self.fulfilled_order_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -218,7 +190,7 @@ class DebridgeHandler(BaseHandler):
                     "sender": unpad_address(event["sender"]),
                     "unlock_authority": unpad_address(event["unlockAuthority"]),
                     "taker": None,
-                }
+                },
             )
             return event
         except Exception as e:
@@ -232,10 +204,8 @@ class DebridgeHandler(BaseHandler):
         func_name = "handle_claimed_unlock"
 
         try:
-            if self.claimed_unlock_repo.event_exists(event["orderId"]):
-                return None
-
-            self.claimed_unlock_repo.create(
+            self.stage(
+                self.claimed_unlock_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -244,7 +214,7 @@ class DebridgeHandler(BaseHandler):
                     "give_amount": event["giveAmount"],
                     "give_token_address": unpad_address(event["giveTokenAddress"]),
                     "fee": None,
-                }
+                },
             )
             return event
         except Exception as e:
@@ -363,9 +333,6 @@ class DebridgeHandler(BaseHandler):
         order_args = instruction["args"]["order_args"]
 
         try:
-            if self.created_order_repo.event_exists(int(instruction["args"]["nonce"], 16)):
-                return False
-
             dst_chain_id = int.from_bytes(order_args["take"]["chain_id"], byteorder="big")
             dst_blockchain = self.convert_id_to_blockchain_name(dst_chain_id)
 
@@ -404,7 +371,8 @@ class DebridgeHandler(BaseHandler):
 
             fee_amount = int(fee_transfer_instruction["args"]["lamports"], 16)
 
-            self.created_order_repo.create(
+            self.stage(
+                self.created_order_repo,
                 {
                     "blockchain": "solana",
                     "transaction_hash": signature,
@@ -444,7 +412,7 @@ class DebridgeHandler(BaseHandler):
                     "_metadata": bytes(instruction["args"]["metadata"]["data"]).hex(),
                     "original_token": original_src_token,
                     "original_amount": original_src_amount,
-                }
+                },
             )
 
             return True
@@ -470,13 +438,11 @@ class DebridgeHandler(BaseHandler):
         try:
             order_id = bytes(instruction["args"]["order_id"]).hex()
 
-            if self.claimed_unlock_repo.event_exists(order_id):
-                return False
-
             fee_amount = int(fee_transfer_instruction["args"]["amount"], 16)
             refund_amount = int(refund_transfer_instruction["args"]["amount"], 16)
 
-            self.claimed_unlock_repo.create(
+            self.stage(
+                self.claimed_unlock_repo,
                 {
                     "blockchain": "solana",
                     "transaction_hash": signature,
@@ -485,7 +451,7 @@ class DebridgeHandler(BaseHandler):
                     "give_amount": refund_amount,
                     "give_token_address": account_data["token_mint"],
                     "fee": fee_amount,
-                }
+                },
             )
 
             return True
@@ -504,9 +470,6 @@ class DebridgeHandler(BaseHandler):
         try:
             order_id = bytes(instruction["args"]["order_id"]).hex()
 
-            if self.fulfilled_order_repo.event_exists(order_id):
-                return False
-
             src_chain_id = int.from_bytes(
                 instruction["args"]["unvalidated_order"]["give"]["chain_id"], byteorder="big"
             )
@@ -517,7 +480,8 @@ class DebridgeHandler(BaseHandler):
 
             unvalidated_order = instruction["args"]["unvalidated_order"]
 
-            self.fulfilled_order_repo.create(
+            self.stage(
+                self.fulfilled_order_repo,
                 {
                     "blockchain": "solana",
                     "transaction_hash": signature,
@@ -567,7 +531,7 @@ class DebridgeHandler(BaseHandler):
                     "sender": None,
                     "unlock_authority": instruction["args"]["unlock_authority"],
                     "taker": account_data["taker"],
-                }
+                },
             )
 
             return True
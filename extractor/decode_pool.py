@@ -0,0 +1,122 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List
+
+from config.constants import DECODE_BATCH_SIZE, DECODE_NUM_PROCESSES, Bridge
+from extractor.decoder import BridgeDecoder
+from utils.utils import CustomException
+
+# the decoder of each worker process, with the contracts and ABIs of its bridge
+worker_decoder = None
+
+
+def init_worker(bridge: Bridge, rpc_url: str) -> None:
+    """Loads the contract registry of the bridge once, when the worker process starts."""
+    global worker_decoder
+    worker_decoder = BridgeDecoder(bridge, rpc_url)
+
+
+def decode_logs(contract: str, blockchain: str, logs: List[dict]) -> List[dict]:
+    return worker_decoder.decode_logs(contract, blockchain, logs)
+
+
+class DecodePool:
+    """
+    Pool of worker processes decoding batches of logs, such that CPU-bound ABI decoding does not
+    contend for the GIL with the threads making the RPC requests. Each bridge gets its own pool,
+    started on first use and kept until `shutdown`.
+
+    Attributes:
+        num_processes (int): Number of worker processes per bridge, or 0 to decode in the caller.
+        batch_size (int): Maximum number of logs sent to a worker at once.
+        executors (dict): Mapping of bridge to its process pool.
+    """
+
+    CLASS_NAME = "DecodePool"
+
+    def __init__(
+        self, num_processes: int = DECODE_NUM_PROCESSES, batch_size: int = DECODE_BATCH_SIZE
+    ):
+        self.num_processes = num_processes
+        self.batch_size = batch_size
+        self.executors = {}
+        self.lock = threading.Lock()
+
+    def get_executor(self, decoder: BridgeDecoder) -> ProcessPoolExecutor:
+        bridge = decoder.bridge
+
+        with self.lock:
+            if bridge not in self.executors:
+                # workers are spawned rather than forked, since the parent process runs threads
+                # holding locks and database connections
+                self.executors[bridge] = ProcessPoolExecutor(
+                    max_workers=self.num_processes,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=init_worker,
+                    initargs=(bridge, decoder.w3.provider.endpoint_uri),
+                )
+
+            return self.executors[bridge]
+
+    def decode(
+        self, decoder: BridgeDecoder, blockchain: str, logs_by_contract: dict
+    ) -> Iterator[tuple]:
+        """
+        Decodes the logs of each contract, yielding (contract, decoded logs) in the order of
+        `logs_by_contract` and skipping contracts without logs. The batches of all contracts are
+        submitted at once, so the caller can handle the logs of a contract while those of the
+        next ones are still being decoded.
+        """
+        func_name = "decode"
+
+        logs_by_contract = {
+            contract: logs for contract, logs in logs_by_contract.items() if len(logs) > 0
+        }
+
+        if self.num_processes == 0:
+            for contract, logs in logs_by_contract.items():
+                yield contract, decoder.decode_logs(contract, blockchain, logs)
+            return
+
+        executor = self.get_executor(decoder)
+
+        futures = {
+            contract: [
+                executor.submit(
+                    decode_logs, contract, blockchain, logs[offset : offset + self.batch_size]
+                )
+                for offset in range(0, len(logs), self.batch_size)
+            ]
+            for contract, logs in logs_by_contract.items()
+        }
+
+        try:
+            for contract, contract_futures in futures.items():
+                try:
+                    decoded_logs = [log for future in contract_futures for log in future.result()]
+                except CustomException:
+                    raise
+                except Exception as e:
+                    # e.g., a worker process died
+                    raise CustomException(
+                        self.CLASS_NAME, func_name, f"Error decoding logs of {contract}: {e}"
+                    ) from e
+
+                yield contract, decoded_logs
+        finally:
+            # the batches still pending are not needed if the caller stopped early
+            for contract_futures in futures.values():
+                for future in contract_futures:
+                    future.cancel()
+
+    def shutdown(self) -> None:
+        with self.lock:
+            for executor in self.executors.values():
+                executor.shutdown(cancel_futures=True)
+
+            self.executors = {}
+
+
+# we keep a single pool for the whole process, such that all extractors of a bridge share it
+decode_pool = DecodePool()
@@ -1,7 +1,8 @@
 import os
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, NamedTuple
 
-from eth_typing import HexStr
+import numpy as np
+from eth_abi.decoding import HeadTailDecoder, TupleDecoder
 from eth_utils import event_abi_to_log_topic
 from hexbytes import HexBytes
 from web3 import Web3
@@ -11,6 +12,7 @@ from web3.contract import Contract
 
 from config.constants import Bridge
 from extractor.base_decoder import BaseDecoder
+from extractor.column_decoder import decode_words, is_native_type, is_single_word_type
 from utils.utils import (
     CustomException,
     convert_bin_to_hex,
@@ -20,6 +22,19 @@ from utils.utils import (
 )
 
 
+class DecodePlan(NamedTuple):
+    """
+    How the logs of an event of a contract are decoded: either with the custom decoder of the
+    bridge, or with the generic decoder, i.e., the ordered input names and types of the event and
+    their eth_abi decoder.
+    """
+
+    custom: bool
+    names: List[str] = None
+    types: List[str] = None
+    decoder: TupleDecoder = None
+
+
 class BridgeDecoder:
     CLASS_NAME = "BridgeDecoder"
 
@@ -30,7 +45,10 @@ class BridgeDecoder:
         self.contracts_abi = {}
         self.event_abis = {}
         self.sign_abis = {}
-        self.ordered_input_types_and_names = {}
+        # decode plans keyed by (contract, selector), which are computed on the first log of each
+        # event of a contract, so the cache only grows with the number of events in the ABIs
+        self.decode_plans = {}
+        self.custom_decoder = None
 
         self.load_contracts_and_abis(bridge)
 
@@ -66,6 +84,13 @@ class BridgeDecoder:
                 self.CLASS_NAME, func_name, f"Bridge {bridge_name} not supported"
             ) from e
 
+    def get_custom_decoder(self) -> BaseDecoder:
+        """Returns the custom decoder of the bridge, which is only loaded once."""
+        if self.custom_decoder is None:
+            self.custom_decoder = self.load_bridge_decoder(self.bridge)
+
+        return self.custom_decoder
+
     def register_contract(self, contract_addr: str, blockchain: str, contract_abi: str):
         func_name = "register_contract"
         try:
@@ -92,17 +117,47 @@ class BridgeDecoder:
         are too complex and fail the decoding process, we relay to the individual decoders
         for each bridge.
         """
-        try:
-            data = [t[2:] for t in result["topics"]]
-            data += [result["data"][2:]]
-            data = "0x" + "".join(data)
+        selector = HexBytes(result["topics"][0])
+        plan = self.get_decode_plan(contract, selector)
 
-            return self.decode_event_input(contract, data)
-        except Exception:
-            self.custom_decoder = self.load_bridge_decoder(self.bridge)
-            decoded_log = self.custom_decoder.decode_event(contract, result)
-            decoded_log = self.convert_bytes_to_hex(decoded_log)
-            return decoded_log
+        if not plan.custom:
+            try:
+                data = [t[2:] for t in result["topics"][1:]]
+                data += [result["data"][2:]]
+
+                return self.decode_event_input(contract, plan, bytes.fromhex("".join(data)))
+            except (CustomException, ValueError):
+                # some logs fail to decode with the types in the ABI (or are not even valid hex),
+                # which the custom decoders know how to handle
+                pass
+
+        decoded_log = self.get_custom_decoder().decode_event(contract, result)
+        decoded_log = self.convert_bytes_to_hex(decoded_log)
+        return decoded_log
+
+    def get_decode_plan(self, contract: Contract, selector: HexBytes) -> DecodePlan:
+        """
+        Returns the decode plan of the event with the given selector in the contract. The
+        generic decoder applies if the event is in the ABI of the contract and eth_abi supports
+        all its (ordered) input types; otherwise, the custom decoder of the bridge is used.
+        """
+        key = (contract, selector)
+
+        if key not in self.decode_plans:
+            try:
+                func_abi = self._get_event_abi_by_selector(contract, selector)
+                [names, types] = self.get_abi_input_types_custom(func_abi)
+
+                registry = contract.w3.codec._registry
+                decoder = TupleDecoder(
+                    decoders=[registry.get_decoder(type_str, strict=True) for type_str in types]
+                )
+
+                self.decode_plans[key] = DecodePlan(False, names, types, decoder)
+            except Exception:
+                self.decode_plans[key] = DecodePlan(True)
+
+        return self.decode_plans[key]
 
     def convert_bytes_to_hex(self, data: Any) -> Any:
         if isinstance(data, dict):
@@ -115,29 +170,25 @@ class BridgeDecoder:
             return data
 
     def decode_event_input(
-        self, contract: Contract, event_data: Union[HexStr, str]
+        self, contract: Contract, plan: DecodePlan, params: bytes
     ) -> Dict[str, Any]:
+        """Decodes the indexed topics and data of a log (without the selector) with the plan."""
         func_name = "decode_event_input"
 
         try:
-            data = HexBytes(event_data)
-            selector, params = data[:32], data[32:]
-
-            func_abi = self._get_event_abi_by_selector(contract, selector)
-            [names, types] = self.get_abi_input_types_custom(func_abi, selector)
-            decoded = contract.w3.codec.decode(types, params)
+            decoded = plan.decoder(contract.w3.codec.stream_class(params))
 
             # convert all fields from binary to hex
             decoded = self.convert_bytes_to_hex(decoded)
 
-            normalized = map_abi_data(BASE_RETURN_NORMALIZERS, types, decoded)
+            normalized = map_abi_data(BASE_RETURN_NORMALIZERS, plan.types, decoded)
 
-            return dict(zip(names, normalized))
+            return dict(zip(plan.names, normalized))
         except Exception as e:
             raise CustomException(
                 self.CLASS_NAME,
                 func_name,
-                f"Error decoding event input in contract: {contract}; and data: {event_data}; {e}",
+                f"Error decoding event input in contract: {contract}; and data: {params}; {e}",
             ) from e
 
     def _get_event_abi_by_selector(self, contract: Contract, selector: HexBytes) -> Dict[str, Any]:
@@ -162,7 +213,158 @@ class BridgeDecoder:
 
         return event
 
-    def get_abi_input_types_custom(self, abi_element, selector):
+    def decode_logs(self, contract_addr: str, blockchain: str, logs: List[dict]) -> List[dict]:
+        """
+        Decodes the logs of a contract, along with the data the handlers need to store them. The
+        logs are returned grouped by topic.
+        """
+        decoded_logs = []
+
+        for columns in self.decode_batch(contract_addr, blockchain, logs).values():
+            decoded_logs += [dict(zip(columns.keys(), row)) for row in zip(*columns.values())]
+
+        return decoded_logs
+
+    def decode_batch(
+        self, contract_addr: str, blockchain: str, logs: List[dict]
+    ) -> Dict[str, Dict[str, list]]:
+        """
+        Decodes the logs of a contract in batches of the same event. Fixed-width fields of the
+        events decoded with the generic decoder are read with NumPy for all logs at once, and
+        only dynamic fields are decoded with eth_abi for each log. Logs that need the custom
+        decoder are decoded one by one.
+
+        Returns the decoded logs as columns (i.e., a list of values for each event field, along
+        with their transaction_hash, block_number, contract_address and topic) keyed by topic.
+        """
+        if (contract_addr, blockchain) not in self.contracts.keys():
+            raise CustomException(
+                self.CLASS_NAME,
+                "decode_batch",
+                f"Contract {contract_addr} not found in contracts list.",
+            )
+
+        contract = self.contracts[(contract_addr, blockchain)]
+
+        logs_by_topic = {}
+        for log in logs:
+            logs_by_topic.setdefault(log["topics"][0], []).append(log)
+
+        batches = {}
+
+        for topic, topic_logs in logs_by_topic.items():
+            plan = self.get_decode_plan(contract, HexBytes(topic))
+
+            if plan.custom:
+                decoded_logs, columns, failed_logs = [], {}, topic_logs
+            else:
+                decoded_logs, columns, failed_logs = self.decode_columns(contract, plan, topic_logs)
+
+            # the logs that could not be decoded at once go through the regular decoding
+            for log in failed_logs:
+                row = self.decode_log(contract, log)
+                for name in set(row.keys()) - set(columns.keys()):
+                    columns[name] = [None] * len(decoded_logs)
+                for name, values in columns.items():
+                    values.append(row.get(name))
+                decoded_logs.append(log)
+
+            columns["transaction_hash"] = [log["transactionHash"] for log in decoded_logs]
+            columns["block_number"] = [log["blockNumber"] for log in decoded_logs]
+            columns["contract_address"] = [contract_addr] * len(decoded_logs)
+            columns["topic"] = [topic] * len(decoded_logs)
+            batches[topic] = columns
+
+        return batches
+
+    def decode_columns(self, contract: Contract, plan: DecodePlan, logs: List[dict]) -> tuple:
+        """
+        Decodes the logs of an event with the generic plan, field by field. Returns the decoded
+        logs, their columns, and the logs that could not be decoded (e.g., with invalid padding
+        or data), in which case the event fields are left empty.
+        """
+        if not all(is_single_word_type(type_str) for type_str in plan.types):
+            return [], {}, logs
+
+        head_size = 32 * len(plan.types)
+        payloads = [self.get_payload(log) for log in logs]
+
+        # logs that are not valid hex or too short go through the regular decoding
+        failed_logs = [
+            log
+            for log, payload in zip(logs, payloads)
+            if payload is None or len(payload) < head_size
+        ]
+        logs = [
+            log
+            for log, payload in zip(logs, payloads)
+            if payload is not None and len(payload) >= head_size
+        ]
+        payloads = [
+            payload for payload in payloads if payload is not None and len(payload) >= head_size
+        ]
+
+        if len(logs) == 0:
+            return [], {}, failed_logs
+
+        # the heads of all logs in a contiguous buffer, with one 32-byte word per field
+        heads = np.frombuffer(b"".join(p[:head_size] for p in payloads), dtype=np.uint8)
+        heads = heads.reshape(len(payloads), len(plan.types), 32)
+
+        valid = np.ones(len(payloads), dtype=bool)
+        columns = {}
+
+        for index, (name, type_str) in enumerate(zip(plan.names, plan.types)):
+            if is_native_type(type_str):
+                columns[name], valid_values = decode_words(heads[:, index, :], type_str)
+                valid &= valid_values
+            else:
+                columns[name] = self.decode_field(contract, payloads, index, type_str, valid)
+
+        decoded_logs = [log for log, is_valid in zip(logs, valid) if is_valid]
+        failed_logs += [log for log, is_valid in zip(logs, valid) if not is_valid]
+        columns = {
+            name: [value for value, is_valid in zip(values, valid) if is_valid]
+            for name, values in columns.items()
+        }
+
+        return decoded_logs, columns, failed_logs
+
+    @staticmethod
+    def get_payload(log: dict):
+        """Returns the indexed topics and data of a log as bytes, or None if they are not hex."""
+        try:
+            return bytes.fromhex("".join(t[2:] for t in log["topics"][1:]) + log["data"][2:])
+        except ValueError:
+            return None
+
+    def decode_field(
+        self, contract: Contract, payloads: List[bytes], index: int, type_str: str, valid
+    ) -> list:
+        """
+        Decodes the field at the given index of each payload with eth_abi, following the offset
+        in its head word if the field is dynamic. Payloads that fail to decode are marked as not
+        valid.
+        """
+        registry = contract.w3.codec._registry
+        decoder = registry.get_decoder(type_str, strict=True)
+        if decoder.is_dynamic:
+            decoder = HeadTailDecoder(tail_decoder=decoder)
+
+        values = []
+        for row, payload in enumerate(payloads):
+            try:
+                stream = contract.w3.codec.stream_class(payload)
+                stream.seek(32 * index)
+                value = self.convert_bytes_to_hex(decoder(stream))
+                values.append(map_abi_data(BASE_RETURN_NORMALIZERS, [type_str], [value])[0])
+            except Exception:
+                valid[row] = False
+                values.append(None)
+
+        return values
+
+    def get_abi_input_types_custom(self, abi_element):
         """
         Extracts and orders the input names and types from an ABI element, ensuring that indexed
         and non-indexed inputs are separated and ordered correctly -- i.e., consistent with the
@@ -185,9 +387,6 @@ class BridgeDecoder:
               types.
         """
 
-        if self.ordered_input_types_and_names.get(selector):
-            return self.ordered_input_types_and_names[selector]
-
         inputs = abi_element["inputs"]
 
         ordered_inputs = [input for input in inputs if input["indexed"]] + [
@@ -251,9 +450,4 @@ class BridgeDecoder:
             ):
                 ordered_input_types[i] = "bytes32"
 
-        self.ordered_input_types_and_names[selector] = [
-            ordered_input_names,
-            ordered_input_types,
-        ]
-
         return [ordered_input_names, ordered_input_types]
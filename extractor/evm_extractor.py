@@ -1,13 +1,17 @@
 import threading
 import time
 
-from config.constants import Bridge
+from config.constants import MULTI_CONTRACT_LOGS_QUERY, Bridge
+from extractor.block_range_planner import block_range_planner
+from extractor.decode_pool import decode_pool
 from extractor.decoder import BridgeDecoder
 from extractor.extractor import Extractor
+from repository.base import on_commit
 from rpcs.evm_rpc_client import EvmRPCClient
 from utils.utils import (
     CliColor,
     CustomException,
+    RPCResultLimitException,
     build_log_message,
     log_error,
     log_to_cli,
@@ -17,76 +21,235 @@ from utils.utils import (
 class EvmExtractor(Extractor):
     CLASS_NAME = "EvmExtractor"
 
-    def __init__(self, bridge: Bridge, blockchain: str, blockchains: list):
+    def __init__(self, bridge: Bridge, blockchain: str, blockchains: list, resume: bool = False):
         self.rpc_client = EvmRPCClient(bridge)
         # fetch a random rpc to initialize the decoder for the bridge
         self.decoder = BridgeDecoder(bridge, self.rpc_client.get_random_rpc(blockchain))
 
-        super().__init__(bridge, blockchain, blockchains)
+        super().__init__(bridge, blockchain, blockchains, resume)
+
+        # map of lowercase contract address to the contract (as configured) and its topics
+        self.contracts_topics = {}
 
     def worker(self):
         """Worker function for threads to process block ranges."""
         while not self.task_queue.empty():
             try:
-                contract, topics, start_block, end_block = self.task_queue.get()
+                contracts, topics, start_block, end_block = self.task_queue.get()
+
+                errors = self.start_range()
 
                 self.work(
-                    contract,
+                    contracts,
                     topics,
                     start_block,
                     end_block,
                 )
+
+                if len(errors) == 0:
+                    self.checkpoint_block_range(contracts, start_block, end_block)
             except CustomException as e:
                 request_desc = (
                     f"Error processing request: {self.bridge}, {self.blockchain}, {start_block}, "
-                    f"{end_block}, {contract}, {topics}. Error: {e}"
+                    f"{end_block}, {contracts}, {topics}. Error: {e}"
                 )
-                log_error(self.bridge, request_desc)
+                self.log_range_error(request_desc)
             finally:
                 self.task_queue.task_done()
 
+    def checkpoint_block_range(self, contracts: list, start_block: int, end_block: int):
+        try:
+            self.checkpoint_repo.record_block_range(
+                self.bridge.value, self.blockchain, contracts, start_block, end_block
+            )
+        except Exception as e:
+            log_error(
+                self.bridge,
+                f"Error checkpointing {self.blockchain}, {start_block}, {end_block}, "
+                f"{contracts}. Error: {e}",
+            )
+
+    def get_pending_ranges(self, contracts: list, start_block: int, end_block: int) -> list:
+        """
+        Returns the block ranges left to extract for the contracts. Without resume, that is the
+        whole range; otherwise, the sub-ranges not checkpointed for at least one of the contracts,
+        since contracts are swept together.
+        """
+        if not self.resume:
+            return [(start_block, end_block)]
+
+        missing_ranges = []
+        for contract in contracts:
+            completed_ranges = self.checkpoint_repo.get_completed_block_ranges(
+                self.bridge.value, self.blockchain, contract
+            )
+            missing_ranges += self.get_missing_ranges(start_block, end_block, completed_ranges)
+
+        # merge the ranges missing for each contract
+        pending_ranges = []
+        for start, end in sorted(missing_ranges):
+            if pending_ranges and start <= pending_ranges[-1][1] + 1:
+                pending_ranges[-1] = (pending_ranges[-1][0], max(pending_ranges[-1][1], end))
+            else:
+                pending_ranges.append((start, end))
+
+        return pending_ranges
+
+    @staticmethod
+    def describe_contracts(contracts: list) -> str:
+        return contracts[0] if len(contracts) == 1 else f"{len(contracts)} contracts"
+
+    def split_logs_by_contract(self, contracts: list, logs: list) -> dict:
+        """
+        Splits the logs by the contract that emitted them, keeping only the logs whose topic is
+        configured for that contract. Contracts are kept in the order given.
+        """
+        logs_by_contract = {contract: [] for contract in contracts}
+
+        for log in logs:
+            contract, contract_topics = self.contracts_topics.get(
+                log["address"].lower(), (None, [])
+            )
+
+            if contract in logs_by_contract and log["topics"][0] in contract_topics:
+                logs_by_contract[contract].append(log)
+
+        return logs_by_contract
+
     def work(
         self,
-        contract: str,
+        contracts: list,
         topics: list,
         start_block: int,
         end_block: int,
     ):
+        """
+        Walks the block range in sub-ranges sized by the block range planner, which halves them
+        whenever the RPC rejects a sub-range for having too many results and grows them again
+        while sub-ranges are sparse.
+        """
+        cursor = start_block
+
+        while cursor <= end_block:
+            range_size = block_range_planner.get_range_size(self.blockchain, contracts)
+            to_block = min(cursor + range_size - 1, end_block)
+
+            try:
+                logs = self.rpc_client.get_logs_emitted_by_contract(
+                    self.blockchain,
+                    contracts[0] if len(contracts) == 1 else contracts,
+                    topics,
+                    cursor,
+                    to_block,
+                )
+            except RPCResultLimitException as e:
+                if to_block > cursor:
+                    block_range_planner.on_result_limit(
+                        self.blockchain, contracts, to_block - cursor + 1
+                    )
+                    continue
+
+                # a single block cannot be split any further
+                request_desc = (
+                    f"Error processing request: {self.blockchain}, {cursor}, {to_block}, "
+                    f"{contracts}, {topics}. Error: {e}"
+                )
+                self.log_range_error(request_desc)
+                cursor = to_block + 1
+                continue
+
+            block_range_planner.on_success(
+                self.blockchain, contracts, to_block - cursor + 1, len(logs)
+            )
+
+            if len(logs) > 0:
+                self.process_logs(contracts, topics, cursor, to_block, logs)
+
+            cursor = to_block + 1
+
+    def process_logs(
+        self,
+        contracts: list,
+        topics: list,
+        start_block: int,
+        end_block: int,
+        logs: list,
+    ):
+        # the events of the range are staged in memory and its transactions fetched from the RPCs
+        # before a database connection is taken, to write both in a single unit of work; a range
+        # that fails half-way is not checkpointed, and the transactions of all its events (stored
+        # or not) are checked again when it is extracted again
+        pending_txs, events = self.handle_logs(contracts, topics, start_block, end_block, logs)
+
+        # fetch the receipts and blocks of all transactions in the block range in batch requests
+        try:
+            fetched_txs = self.rpc_client.process_transactions(self.blockchain, pending_txs)
+        except CustomException as e:
+            request_desc = (
+                f"Error processing request: {self.blockchain}, {start_block}, {end_block}, "
+                f"{contracts}, {topics}. Error: {e}"
+            )
+            self.log_range_error(request_desc)
+            fetched_txs = {}
+
+        with self.unit_of_work():
+            self.store_range(contracts, topics, start_block, end_block, events, fetched_txs)
+
+    def handle_logs(
+        self,
+        contracts: list,
+        topics: list,
+        start_block: int,
+        end_block: int,
+        logs: list,
+    ) -> tuple:
+        """
+        Decodes the logs of each contract and invokes the bridge handler, which stages the rows
+        of the events without writing them. Returns the transactions (and the block they were
+        included in) to fetch from the RPC, keyed by hash, and the staged rows.
+        """
         log_to_cli(
             build_log_message(
                 start_block,
                 end_block,
-                contract,
+                self.describe_contracts(contracts),
                 self.bridge,
                 self.blockchain,
-                "Processing logs and transactions...",
+                f"Processing {len(logs)} logs and transactions...",
             )
         )
 
-        logs = self.rpc_client.get_logs_emitted_by_contract(
-            self.blockchain, contract, topics, start_block, end_block
-        )
+        included_logs = []
+        events = {}
 
-        if len(logs) == 0:
-            return
+        try:
+            # the rows created by the handler for all contracts are written in bulk by store_range
+            with self.handler.staging() as staged_events:
+                logs_by_contract = self.split_logs_by_contract(contracts, logs)
 
-        decoded_logs = []
-        txs = {}
+                # the logs are decoded in worker processes, and handed to the handler one
+                # contract at a time as they are ready
+                for contract, decoded_logs in decode_pool.decode(
+                    self.decoder, self.blockchain, logs_by_contract
+                ):
+                    included_logs += self.handler.handle_events(
+                        self.blockchain,
+                        start_block,
+                        end_block,
+                        contract,
+                        self.contracts_topics[contract.lower()][1],
+                        decoded_logs,
+                    )
 
-        for log in logs:
-            decoded_log = self.decoder.decode(contract, self.blockchain, log)
-
-            # we take the decoded log and append more data to it, such that the handler can insert
-            #  in the right DB table
-            decoded_log["transaction_hash"] = log["transactionHash"]
-            decoded_log["block_number"] = log["blockNumber"]
-            decoded_log["contract_address"] = contract
-            decoded_log["topic"] = log["topics"][0]
-            decoded_logs.append(decoded_log)
-
-        included_logs = self.handler.handle_events(
-            self.blockchain, start_block, end_block, contract, topics, decoded_logs
-        )
+            events = staged_events
+        except CustomException as e:
+            request_desc = (
+                f"Error processing request: {self.blockchain}, {start_block}, {end_block}, "
+                f"{contracts}, {topics}. Error: {e}"
+            )
+            self.log_range_error(request_desc)
+
+        pending_txs = {}
 
         for log in included_logs:
             tx_hash = log["transaction_hash"]
@@ -94,15 +257,71 @@ class EvmExtractor(Extractor):
             # to avoid processing the same transaction multiple times we ignore if already in the
             #  repository
             try:
-                if self.handler.does_transaction_exist_by_hash(tx_hash):
+                if tx_hash in pending_txs or self.transaction_exists(tx_hash):
                     continue
 
-                tx, block = self.rpc_client.process_transaction(
-                    self.blockchain, log["transaction_hash"], log["block_number"]
+                pending_txs[tx_hash] = log["block_number"]
+
+            except CustomException as e:
+                request_desc = (
+                    f"Error processing request: {self.blockchain}, {start_block}, {end_block}, "
+                    f"{contracts}, {topics}. Error: {e}"
                 )
+                self.log_range_error(request_desc)
 
-                if tx is None or block is None:
-                    raise Exception(tx_hash)
+        return pending_txs, events
+
+    def store_range(
+        self,
+        contracts: list,
+        topics: list,
+        start_block: int,
+        end_block: int,
+        events: dict,
+        fetched_txs: dict,
+    ):
+        """Writes the events staged by `handle_logs` and the fetched transactions of a range."""
+        try:
+            num_new_events = self.handler.write_staged_rows(events)
+            on_commit(
+                log_to_cli,
+                build_log_message(
+                    start_block,
+                    end_block,
+                    self.describe_contracts(contracts),
+                    self.bridge,
+                    self.blockchain,
+                    f"Stored {num_new_events} new events.",
+                ),
+            )
+        except CustomException as e:
+            request_desc = (
+                f"Error processing request: {self.blockchain}, {start_block}, {end_block}, "
+                f"{contracts}, {topics}. Error: {e}"
+            )
+            self.log_range_error(request_desc)
+
+        self.store_transactions(contracts, topics, start_block, end_block, fetched_txs)
+
+    def store_transactions(
+        self,
+        contracts: list,
+        topics: list,
+        start_block: int,
+        end_block: int,
+        fetched_txs: dict,
+    ):
+        """Writes the fetched transactions, given as a mapping of hash to (receipt, block)."""
+        txs = {}
+
+        for tx_hash, (tx, block) in fetched_txs.items():
+            try:
+                if not tx or not block:
+                    raise CustomException(
+                        self.CLASS_NAME,
+                        "store_transactions",
+                        f"Transaction or block not found: {tx_hash}",
+                    )
 
                 txs[tx_hash] = self.handler.create_transaction_object(
                     self.blockchain, tx, block["timestamp"]
@@ -111,25 +330,68 @@ class EvmExtractor(Extractor):
             except CustomException as e:
                 request_desc = (
                     f"Error processing request: {self.blockchain}, {start_block}, {end_block}, "
-                    f"{contract}, {topics}. Error: {e}"
+                    f"{contracts}, {topics}. Error: {e}"
                 )
-                log_error(self.bridge, request_desc)
+                self.log_range_error(request_desc)
 
         if len(txs) > 0:
             try:
                 self.handler.handle_transactions(txs.values())
+                on_commit(self.transaction_filter.add, list(txs.keys()))
             except CustomException:
                 # if there is an error while handling transactions in batch, we handle them one
                 # by one to avoid the entire batch failing
-                for tx in txs.values():
+                for tx_hash, tx in txs.items():
                     try:
                         self.handler.handle_transaction(tx)
+                        on_commit(self.transaction_filter.add, [tx_hash])
                     except CustomException as e:
                         request_desc = (
                             f"Error processing transaction: {self.blockchain}, "
                             f"{tx['transaction_hash']}. Error: {e}"
                         )
-                        log_error(self.bridge, request_desc)
+                        self.log_range_error(request_desc)
+
+    def group_contracts_and_topics(self, bridge_blockchain_pairs: list) -> list:
+        """
+        Returns the list of (contracts, topics) to sweep over the block range. With
+        MULTI_CONTRACT_LOGS_QUERY all contracts are fetched at once, filtering by the union of
+        their topics; otherwise each contract is swept on its own.
+        """
+        self.contracts_topics = {
+            contract.lower(): (contract, pair["topics"])
+            for pair in bridge_blockchain_pairs
+            for contract in pair["contracts"]
+        }
+
+        if not MULTI_CONTRACT_LOGS_QUERY:
+            return [
+                ([contract], pair["topics"])
+                for pair in bridge_blockchain_pairs
+                for contract in pair["contracts"]
+            ]
+
+        contracts = [contract for contract, _ in self.contracts_topics.values()]
+        topics = list(
+            dict.fromkeys(topic for pair in bridge_blockchain_pairs for topic in pair["topics"])
+        )
+
+        return [(contracts, topics)]
+
+    def divide_pending_ranges(self, pending_ranges: list, num_segments: int) -> list:
+        """
+        Divides the pending block ranges into about `num_segments` segments. Each segment is then
+        walked in sub-ranges sized by the block range planner, so segments only need to be small
+        enough to balance the load between threads (or coroutines).
+        """
+        num_blocks = sum(end - start for start, end in pending_ranges)
+        chunk_size = max(1, (num_blocks + num_segments - 1) // num_segments)
+
+        block_ranges = []
+        for start, end in pending_ranges:
+            block_ranges += self.divide_range(start, end - 1, chunk_size) or [(start, end)]
+
+        return block_ranges
 
     def extract_data(self, start_block: int, end_block: int):
         """Main extraction logic."""
@@ -139,64 +401,64 @@ class EvmExtractor(Extractor):
             self.bridge, self.blockchain
         )
 
-        for pair in bridge_blockchain_pairs:
-            for contract in pair["contracts"]:
-                threads = []
+        self.load_transaction_filter(start_block, end_block)
 
-                start_time = time.time()
-                topics = pair["topics"]
+        for contracts, topics in self.group_contracts_and_topics(bridge_blockchain_pairs):
+            threads = []
 
-                num_threads = self.rpc_client.max_threads_per_blockchain(self.blockchain) * 2
+            start_time = time.time()
 
-                chunk_size = max(
-                    1, min((end_block - start_block + num_threads - 1) // num_threads, 1000)
-                )
+            num_threads = self.rpc_client.max_threads_per_blockchain(self.blockchain) * 2
 
-                block_ranges = self.divide_range(start_block, end_block - 1, chunk_size)
+            block_ranges = self.divide_pending_ranges(
+                self.get_pending_ranges(contracts, start_block, end_block), num_threads * 4
+            )
 
-                # Populate the task queue
-                for start, end in block_ranges:
-                    self.task_queue.put((contract, topics, start, end))
+            # Populate the task queue
+            for start, end in block_ranges:
+                self.task_queue.put((contracts, topics, start, end))
 
-                # Create and start threads
-                log_to_cli(
-                    build_log_message(
-                        start_block,
-                        end_block,
-                        contract,
-                        self.bridge,
-                        self.blockchain,
-                        (
-                            f"Launching {num_threads} threads to process {len(block_ranges)} block "
-                            f"ranges...",
-                        ),
-                    )
+            # Create and start threads
+            log_to_cli(
+                build_log_message(
+                    start_block,
+                    end_block,
+                    self.describe_contracts(contracts),
+                    self.bridge,
+                    self.blockchain,
+                    (
+                        f"Launching {num_threads} threads to process {len(block_ranges)} block "
+                        f"ranges...",
+                    ),
                 )
-                for i in range(num_threads):
-                    thread = threading.Thread(target=self.worker, name=f"thread_id_{i}")
-                    thread.start()
-                    threads.append(thread)
+            )
+            for i in range(num_threads):
+                thread = threading.Thread(target=self.worker, name=f"thread_id_{i}")
+                thread.start()
+                threads.append(thread)
 
-                # Wait for all threads to complete
-                self.task_queue.join()
-                for thread in threads:
-                    thread.join()
+            # Wait for all threads to complete
+            self.task_queue.join()
+            for thread in threads:
+                thread.join()
 
-                threads.clear()
+            threads.clear()
 
-                end_time = time.time()
+            block_range_planner.save()
 
-                log_to_cli(
-                    build_log_message(
-                        start_block,
-                        end_block,
-                        contract,
-                        self.bridge,
-                        self.blockchain,
-                        (
-                            f"Finished processing logs and transactions. Time taken: "
-                            f"{end_time - start_time} seconds.",
-                        ),
+            end_time = time.time()
+
+            log_to_cli(
+                build_log_message(
+                    start_block,
+                    end_block,
+                    self.describe_contracts(contracts),
+                    self.bridge,
+                    self.blockchain,
+                    (
+                        f"Finished processing logs and transactions. Time taken: "
+                        f"{end_time - start_time} seconds.",
                     ),
-                    CliColor.SUCCESS,
-                )
+                ),
+                CliColor.SUCCESS,
+            )
@@ -0,0 +1,71 @@
+import concurrent.futures
+import time
+from typing import Callable
+
+from config.constants import Bridge
+from extractor.extractor import Extractor
+from utils.utils import (
+    CliColor,
+    build_log_message_generator,
+    log_error,
+    log_to_cli,
+)
+
+
+class ExtractionScheduler:
+    """
+    Runs the extraction jobs of several blockchains at the same time. Blockchains use disjoint
+    RPC endpoints, so their extractions are independent; requests are capped per blockchain and
+    overall by the RPC clients' request limiter. Post-processing, which works over the data of
+    all blockchains, runs once after every job has finished.
+
+    Attributes:
+        bridge (Bridge): The bridge being extracted.
+        jobs (list): List of (blockchain, job) tuples, where each job runs the extraction of a
+            blockchain and returns its extractor (or None if it could not be created).
+    """
+
+    CLASS_NAME = "ExtractionScheduler"
+
+    def __init__(self, bridge: Bridge):
+        self.bridge = bridge
+        self.jobs = []
+
+    def add_job(self, blockchain: str, job: Callable[[], Extractor]) -> None:
+        self.jobs.append((blockchain, job))
+
+    def run(self) -> None:
+        if len(self.jobs) == 0:
+            return
+
+        start_time = time.time()
+        extractors = {}
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(self.jobs), thread_name_prefix="blockchain"
+        ) as executor:
+            futures = {executor.submit(job): blockchain for blockchain, job in self.jobs}
+
+            for future in concurrent.futures.as_completed(futures):
+                blockchain = futures[future]
+                try:
+                    extractors[blockchain] = future.result()
+                except Exception as e:
+                    log_error(self.bridge, f"Error extracting data from {blockchain}: {e}")
+
+        log_to_cli(
+            build_log_message_generator(
+                self.bridge,
+                (
+                    f"Finished extracting data from {len(self.jobs)} blockchains. Time taken: "
+                    f"{time.time() - start_time} seconds."
+                ),
+            ),
+            CliColor.SUCCESS,
+        )
+
+        # run post-processing once, with the extractor of the last blockchain that succeeded
+        for blockchain, _ in reversed(self.jobs):
+            if extractors.get(blockchain) is not None:
+                extractors[blockchain].post_processing()
+                break
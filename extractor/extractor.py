@@ -1,17 +1,29 @@
+import contextvars
 import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from queue import Queue
 from urllib.request import BaseHandler
 
-from config.constants import Bridge
+from config.constants import TRANSACTION_BLOOM_FILTER, Bridge
+from extractor.transaction_filter import TransactionFilter
+from repository.base import unit_of_work
+from repository.common.repository import ExtractionCheckpointRepository
+from repository.database import DBSession, SessionFactory
 from utils.utils import (
     CliColor,
     CustomException,
     build_log_message,
+    build_log_message_generator,
     load_module,
+    log_error,
     log_to_cli,
 )
 
+# errors logged while processing the current range (in the current thread or task), such that
+# only ranges processed without errors are checkpointed
+range_errors = contextvars.ContextVar("range_errors", default=None)
+
 
 class Extractor(ABC):
     """
@@ -29,6 +41,9 @@ class Extractor(ABC):
         rpc_client (RPCClient): Client for interacting with blockchain RPC endpoints.
         decoder (BridgeDecoder): Decoder for parsing logs specific to the bridge.
         handler (BaseHandler): Handler for processing and storing extracted data.
+        resume (bool): Whether to skip the ranges checkpointed by previous runs.
+        checkpoint_repo (ExtractionCheckpointRepository): Repository of the completed ranges.
+        transaction_filter (TransactionFilter): In-memory filter of the transactions stored.
 
     Methods:
         __init__(self, bridge: Bridge, blockchain: str):
@@ -41,9 +56,9 @@ class Extractor(ABC):
         divide_range(start_block: int, end_block: int, chunk_size: int = 1000):
             Divides a block range into smaller chunks for parallel processing.
 
-        work(self, contract: str, topics: list, start_block: int, end_block: int):
-            Processes logs and transactions for a given contract and block range, decodes logs, and
-            invokes the bridge handler.
+        work(self, contracts: list, topics: list, start_block: int, end_block: int):
+            Processes logs and transactions for the given contracts and block range, decodes logs,
+            and invokes the bridge handler for each contract.
 
         worker(self):
             Worker function for threads to process block ranges from the task queue.
@@ -55,12 +70,19 @@ class Extractor(ABC):
 
     CLASS_NAME = "Extractor"
 
-    def __init__(self, bridge: Bridge, blockchain: str, blockchains: list):
+    def __init__(self, bridge: Bridge, blockchain: str, blockchains: list, resume: bool = False):
         self.task_queue = Queue()
         self.threads = []
         self.blockchain = blockchain
         self.bridge = bridge
 
+        # with resume, ranges checkpointed by previous runs are skipped
+        self.resume = resume
+        self.checkpoint_repo = ExtractionCheckpointRepository(DBSession)
+
+        # transactions known to be stored, shared by all threads
+        self.transaction_filter = TransactionFilter()
+
         # load the bridge handler and initiate a DB session
         self.handler = self.load_handler(blockchains)
 
@@ -88,6 +110,103 @@ class Extractor(ABC):
             ranges.append((i, min(i + chunk_size, end_index + 1)))
         return ranges
 
+    @staticmethod
+    def get_missing_ranges(start_index: int, end_index: int, completed_ranges: list) -> list:
+        """
+        Returns the sub-ranges of [start_index, end_index] not covered by any of the completed
+        ranges. All ranges include both ends.
+        """
+        missing_ranges = []
+        cursor = start_index
+
+        for start, end in sorted(completed_ranges):
+            if end < cursor:
+                continue
+            if start > end_index:
+                break
+            if start > cursor:
+                missing_ranges.append((cursor, start - 1))
+            cursor = max(cursor, end + 1)
+
+        if cursor <= end_index:
+            missing_ranges.append((cursor, end_index))
+
+        return missing_ranges
+
+    def load_transaction_filter(self, start_block: int = None, end_block: int = None) -> None:
+        """
+        Loads the Bloom filter of the transaction filter with the hashes of the transactions
+        already stored for the blockchain within the block window.
+        """
+        if not TRANSACTION_BLOOM_FILTER:
+            return
+
+        start_time = time.time()
+        repo = self.handler.blockchain_transaction_repo
+
+        try:
+            num_hashes = repo.count_transactions(self.blockchain, start_block, end_block)
+            self.transaction_filter.load(
+                num_hashes, repo.get_transaction_hashes(self.blockchain, start_block, end_block)
+            )
+        except Exception as e:
+            # existence checks fall back to the DB
+            log_error(self.bridge, f"Error loading transaction filter for {self.blockchain}: {e}")
+            return
+
+        log_to_cli(
+            build_log_message_generator(
+                self.bridge,
+                (
+                    f"Loaded {num_hashes} stored transactions of {self.blockchain} into the "
+                    f"transaction filter. Time taken: {time.time() - start_time} seconds."
+                ),
+            )
+        )
+
+    def transaction_exists(self, transaction_hash: str) -> bool:
+        """Returns whether a transaction is stored, querying the DB only if needed."""
+        return self.transaction_filter.exists(
+            transaction_hash, self.handler.does_transaction_exist_by_hash
+        )
+
+    def log_range_error(self, request_desc: str) -> None:
+        """Logs an error while processing a range, which is then not checkpointed."""
+        log_error(self.bridge, request_desc)
+
+        errors = range_errors.get()
+        if errors is not None:
+            errors.append(request_desc)
+
+    def start_range(self) -> list:
+        """Starts tracking the errors of a range in the current thread (or task)."""
+        errors = []
+        range_errors.set(errors)
+        return errors
+
+    @contextmanager
+    def unit_of_work(self):
+        """
+        Runs the repository queries within the context in a single session and transaction,
+        rather than one per query, reporting a failed commit as a CustomException.
+        """
+        func_name = "unit_of_work"
+
+        try:
+            with unit_of_work(SessionFactory):
+                yield
+        except CustomException:
+            raise
+        except Exception as e:
+            raise CustomException(
+                self.CLASS_NAME, func_name, f"Error writing to database: {e}"
+            ) from e
+
+    def run_in_unit_of_work(self, func, *args):
+        """Calls `func` within a unit of work, e.g., from a worker thread of an event loop."""
+        with self.unit_of_work():
+            return func(*args)
+
     @abstractmethod
     def worker(self):
         pass
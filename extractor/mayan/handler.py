@@ -1,7 +1,7 @@
 from typing import Any, Dict, List
 
 from config.constants import Bridge
-from extractor.base_handler import BaseHandler
+from extractor.base_handler import BaseHandler, EventHandler
 from extractor.mayan.constants import (
     BLOCKCHAIN_IDS,
     BRIDGE_CONFIG,
@@ -42,6 +42,38 @@ from utils.utils import (
 class MayanHandler(BaseHandler):
     CLASS_NAME = "MayanHandler"
 
+    # map of the topic of each event to its handler method, and the repository it writes to
+    EVENT_HANDLERS = {
+        # SwapAndForwardedEth
+        "0x7cbff921ae1f3ea71284120d2aabde13587df067f2bb5c831ea6e35d7a9242ac": EventHandler(
+            "handle_swap_and_forwarded_eth", "swap_and_forwarded_repo"
+        ),
+        # SwapAndForwardedERC20
+        "0x23278f58875126c795a4072b98b5851fe9b21cea19895b02a6224fefbb1e3298": EventHandler(
+            "handle_swap_and_forwarded_erc20", "swap_and_forwarded_repo"
+        ),
+        # ForwardedEth
+        "0xb8543d214cab9591941648db8d40126a163bfd0db4a865678320b921e1398043": EventHandler(
+            "handle_forwarded_eth", "forwarded_repo"
+        ),
+        # ForwardedERC20
+        "0xbf150db6b4a14b084f7346b4bc300f552ce867afe55be27bce2d6b37e3307cda": EventHandler(
+            "handle_forwarded_erc20", "forwarded_repo"
+        ),
+        # OrderCreated
+        "0x918554b6bd6e2895ce6553de5de0e1a69db5289aa0e4fe193a0dcd1f14347477": EventHandler(
+            "handle_order_created", "order_created_repo"
+        ),
+        # OrderFulfilled
+        "0x6ec9b1b5a9f54d929394f18dac4ba1b1cc79823f2266c2d09cab8a3b4700b40b": EventHandler(
+            "handle_order_fulfilled", "order_fulfilled_repo"
+        ),
+        # OrderUnlocked
+        "0x4bdcff348c4d11383c487afb95f732f243d93fbfc478aa736a4981cf6a640911": EventHandler(
+            "handle_order_unlocked", "order_unlocked_repo"
+        ),
+    }
+
     def __init__(self, rpc_client: EvmRPCClient, blockchains: list) -> None:
         super().__init__(rpc_client, blockchains)
         self.bridge = Bridge.MAYAN
@@ -95,66 +127,6 @@ class MayanHandler(BaseHandler):
                 f"Error reading transaction from database: {e}",
             ) from e
 
-    def handle_events(
-        self,
-        blockchain: str,
-        start_block: int,
-        end_block: int,
-        contract: str,
-        topics: List[str],
-        events: List[Dict[str, Any]],
-    ) -> List[Dict[str, Any]]:
-        included_events = []
-        for event in events:
-            try:
-                if (
-                    event["topic"]
-                    == "0x7cbff921ae1f3ea71284120d2aabde13587df067f2bb5c831ea6e35d7a9242ac"
-                ):  # SwapAndForwardedEth
-                    event = self.handle_swap_and_forwarded_eth(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x23278f58875126c795a4072b98b5851fe9b21cea19895b02a6224fefbb1e3298"
-                ):  # SwapAndForwardedERC20
-                    event = self.handle_swap_and_forwarded_erc20(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0xb8543d214cab9591941648db8d40126a163bfd0db4a865678320b921e1398043"
-                ):  # ForwardedEth
-                    event = self.handle_forwarded_eth(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0xbf150db6b4a14b084f7346b4bc300f552ce867afe55be27bce2d6b37e3307cda"
-                ):  # ForwardedERC20
-                    event = self.handle_forwarded_erc20(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x918554b6bd6e2895ce6553de5de0e1a69db5289aa0e4fe193a0dcd1f14347477"
-                ):  # OrderCreated
-                    event = self.handle_order_created(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x6ec9b1b5a9f54d929394f18dac4ba1b1cc79823f2266c2d09cab8a3b4700b40b"
-                ):  # OrderFulfilled
-                    event = self.handle_order_fulfilled(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x4bdcff348c4d11383c487afb95f732f243d93fbfc478aa736a4981cf6a640911"
-                ):  # OrderUnlocked
-                    event = self.handle_order_unlocked(blockchain, event)
-
-                if event:
-                    included_events.append(event)
-
-            except CustomException as e:
-                request_desc = (
-                    f"Error processing request: {blockchain}, {start_block}, "
-                    f"{end_block}, {contract}, {topics}.\n{e}"
-                )
-                log_error(self.bridge, request_desc)
-
-        return included_events
-
     def handle_swap_and_forwarded_eth(self, blockchain, event):
         func_name = "handle_swap_and_forwarded_eth"
 
@@ -185,9 +157,6 @@ class MayanHandler(BaseHandler):
         func_name = "handle_swap_and_forwarded"
 
         try:
-            if self.swap_and_forwarded_repo.event_exists(event["transaction_hash"]):
-                return None
-
             # Only interested in events from the Mayan Swift protocol (other alternatives
             # are WH Swap Bridge and Mayan MCTP, currently not supported)
             if event["mayanProtocol"] != "0xC38e4e6A15593f908255214653d3D947CA1c2338":
@@ -215,7 +184,8 @@ class MayanHandler(BaseHandler):
             if not dst_chain:
                 return None
 
-            self.swap_and_forwarded_repo.create(
+            self.stage(
+                self.swap_and_forwarded_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -238,7 +208,7 @@ class MayanHandler(BaseHandler):
                     "referrer_bps": decoded_payload["referrerBps"],
                     "auction_mode": decoded_payload["auctionMode"],
                     "random": decoded_payload["random"],
-                }
+                },
             )
             return event
         except Exception as e:
@@ -278,9 +248,6 @@ class MayanHandler(BaseHandler):
         func_name = "handle_forwarded"
 
         try:
-            if self.forwarded_repo.event_exists(event["transaction_hash"]):
-                return None
-
             # Only interested in events from the Mayan Swift protocol (other alternatives
             # are WH Swap Bridge and Mayan MCTP, currently not supported)
             if event["mayanProtocol"] != "0xC38e4e6A15593f908255214653d3D947CA1c2338":
@@ -308,7 +275,8 @@ class MayanHandler(BaseHandler):
             if not dst_chain:
                 return None
 
-            self.forwarded_repo.create(
+            self.stage(
+                self.forwarded_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -328,7 +296,7 @@ class MayanHandler(BaseHandler):
                     "referrer_bps": decoded_payload["referrerBps"],
                     "auction_mode": decoded_payload["auctionMode"],
                     "random": decoded_payload["random"],
-                }
+                },
             )
             return event
         except Exception as e:
@@ -342,15 +310,13 @@ class MayanHandler(BaseHandler):
         func_name = "handle_order_created"
 
         try:
-            if self.order_created_repo.event_exists(event["key"]):
-                return None
-
-            self.order_created_repo.create(
+            self.stage(
+                self.order_created_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
                     "key": event["key"],
-                }
+                },
             )
             return event
         except Exception as e:
@@ -364,10 +330,8 @@ class MayanHandler(BaseHandler):
         func_name = "handle_order_fulfilled"
 
         try:
-            if self.order_fulfilled_repo.event_exists(event["key"]):
-                return None
-
-            self.order_fulfilled_repo.create(
+            self.stage(
+                self.order_fulfilled_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -376,7 +340,7 @@ class MayanHandler(BaseHandler):
                     "net_amount": event["netAmount"],
                     "middle_dst_token": None,
                     "middle_dst_amount": None,
-                }
+                },
             )
             return event
         except Exception as e:
@@ -390,15 +354,13 @@ class MayanHandler(BaseHandler):
         func_name = "handle_order_unlocked"
 
         try:
-            if self.order_unlocked_repo.event_exists(event["key"]):
-                return None
-
-            self.order_unlocked_repo.create(
+            self.stage(
+                self.order_unlocked_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
                     "key": event["key"],
-                }
+                },
             )
             return event
         except Exception as e:
@@ -567,9 +529,6 @@ class MayanHandler(BaseHandler):
                 params=params,
             )
 
-            if self.init_order_repo.event_exists(order_hash):
-                return None
-
             dst_chain = self.convert_id_to_blockchain_name(
                 id=params["chainDest"],
                 blockchain_ids=BLOCKCHAIN_IDS,
@@ -607,7 +566,8 @@ class MayanHandler(BaseHandler):
                 middle_src_amount = None
                 middle_src_token = None
 
-            self.init_order_repo.create(
+            self.stage(
+                self.init_order_repo,
                 {
                     "order_hash": order_hash,
                     "signature": signature,
@@ -640,7 +600,7 @@ class MayanHandler(BaseHandler):
                     "original_src_token": original_src_token,
                     "original_src_amount": original_src_amount,
                     "amm": amm,
-                }
+                },
             )
 
             return True
@@ -660,9 +620,6 @@ class MayanHandler(BaseHandler):
         account_data = self.extract_accounts_from_instruction(instruction)
 
         try:
-            if self.unlock_repo.event_exists(account_data["stateFromAcc"]):
-                return None
-
             if transfer_instruction["name"] != "transfer":
                 raise CustomException(
                     self.CLASS_NAME,
@@ -672,7 +629,8 @@ class MayanHandler(BaseHandler):
 
             amount = int(transfer_instruction["args"]["amount"], 16)
 
-            self.unlock_repo.create(
+            self.stage(
+                self.unlock_repo,
                 {
                     "signature": signature,
                     "vaa_unlock": account_data["vaaUnlock"],
@@ -684,7 +642,7 @@ class MayanHandler(BaseHandler):
                     "token_program": account_data["tokenProgram"],
                     "system_program": account_data["systemProgram"],
                     "amount": amount,
-                }
+                },
             )
 
             return True
@@ -710,9 +668,6 @@ class MayanHandler(BaseHandler):
         addr_unlocker = convert_32_byte_array_to_solana_address(instruction["args"]["addrUnlocker"])
 
         try:
-            if self.fulfill_repo.event_exists(signature):
-                return None
-
             if swap_event:
                 middle_dst_token = swap_event["args"]["input_mint"]
                 middle_dst_amount = int(swap_event["args"]["input_amount"], 16)
@@ -740,7 +695,8 @@ class MayanHandler(BaseHandler):
 
                 final_amount = amount_in
 
-            self.fulfill_repo.create(
+            self.stage(
+                self.fulfill_repo,
                 {
                     "signature": signature,
                     "state": account_data["state"],
@@ -754,7 +710,7 @@ class MayanHandler(BaseHandler):
                     "middle_dst_token": middle_dst_token,
                     "middle_dst_amount": middle_dst_amount,
                     "amm": amm,
-                }
+                },
             )
 
             return True
@@ -772,10 +728,8 @@ class MayanHandler(BaseHandler):
         account_data = self.extract_accounts_from_instruction(instruction)
 
         try:
-            if self.settle_repo.event_exists(signature):
-                return None
-
-            self.settle_repo.create(
+            self.stage(
+                self.settle_repo,
                 {
                     "signature": signature,
                     "state": account_data["state"],
@@ -791,7 +745,7 @@ class MayanHandler(BaseHandler):
                     "token_program": account_data.get("tokenProgram"),
                     "system_program": account_data.get("systemProgram"),
                     "associated_token_program": account_data.get("associatedTokenProgram"),
-                }
+                },
             )
 
             return True
@@ -809,18 +763,16 @@ class MayanHandler(BaseHandler):
         account_data = self.extract_accounts_from_instruction(instruction)
 
         try:
-            if self.set_auction_winner_repo.event_exists(signature):
-                return None
-
             expected_winner = instruction["args"]["expectedWinner"]
 
-            self.set_auction_winner_repo.create(
+            self.stage(
+                self.set_auction_winner_repo,
                 {
                     "signature": signature,
                     "state": account_data["state"],
                     "auction": account_data["auction"],
                     "expected_winner": expected_winner,
-                }
+                },
             )
 
             return True
@@ -847,9 +799,6 @@ class MayanHandler(BaseHandler):
                 params=params,
             )
 
-            if self.register_order_repo.event_exists(order_hash):
-                return None
-
             src_chain = self.convert_id_to_blockchain_name(
                 id=params["chainSource"],
                 blockchain_ids=BLOCKCHAIN_IDS,
@@ -863,7 +812,8 @@ class MayanHandler(BaseHandler):
             if not src_chain or not dst_chain:
                 return None
 
-            self.register_order_repo.create(
+            self.stage(
+                self.register_order_repo,
                 {
                     "order_hash": order_hash,
                     "signature": signature,
@@ -886,7 +836,7 @@ class MayanHandler(BaseHandler):
                     "fee_rate_mayan": params["feeRateMayan"],
                     "auction_mode": params["auctionMode"],
                     "key_rnd": bytes(params["keyRnd"]).hex(),
-                }
+                },
             )
 
             return True
@@ -955,7 +905,8 @@ class MayanHandler(BaseHandler):
             if self.auction_bid_repo.event_exists(signature):
                 return None
 
-            self.auction_bid_repo.create(
+            self.stage(
+                self.auction_bid_repo,
                 {
                     "order_hash": order_hash,
                     "signature": signature,
@@ -980,7 +931,7 @@ class MayanHandler(BaseHandler):
                     "auction_mode": params["auctionMode"],
                     "key_rnd": bytes(params["keyRnd"]).hex(),
                     "amount_bid": int(instruction["args"]["amountBid"], 16),
-                }
+                },
             )
 
             return True
@@ -998,15 +949,13 @@ class MayanHandler(BaseHandler):
         account_data = self.extract_accounts_from_instruction(instruction)
 
         try:
-            if self.auction_close_repo.event_exists(account_data["auction"]):
-                return None
-
-            self.auction_close_repo.create(
+            self.stage(
+                self.auction_close_repo,
                 {
                     "signature": signature,
                     "auction": account_data["auction"],
                     "initializer": account_data["initializer"],
-                }
+                },
             )
 
             return True
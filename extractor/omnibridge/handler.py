@@ -3,7 +3,7 @@ from typing import Any, Dict, List
 from eth_utils import keccak
 
 from config.constants import Bridge
-from extractor.base_handler import BaseHandler
+from extractor.base_handler import BaseHandler, EventHandler
 from extractor.omnibridge.constants import BRIDGE_CONFIG
 from repository.database import DBSession
 from repository.omnibridge.repository import (
@@ -18,12 +18,57 @@ from repository.omnibridge.repository import (
     OmnibridgeUserRequestForSignatureRepository,
 )
 from rpcs.evm_rpc_client import EvmRPCClient
-from utils.utils import CustomException, log_error
+from utils.utils import CustomException
 
 
 class OmnibridgeHandler(BaseHandler):
     CLASS_NAME = "OmnibridgeHandler"
 
+    # map of the topic of each event to its handler method, and the repository it writes to
+    EVENT_HANDLERS = {
+        # TokensBridgingInitiated
+        "0x59a9a8027b9c87b961e254899821c9a276b5efc35d1f7409ea4f291470f1629a": EventHandler(
+            "handle_tokens_bridging_initiated", "tokens_bridging_initiated_repo"
+        ),
+        # TokensBridged
+        "0x9afd47907e25028cdaca89d193518c302bbb128617d5a992c5abd45815526593": EventHandler(
+            "handle_tokens_bridged", "tokens_bridged_repo"
+        ),
+        # UserRequestForAffirmation (address recipient, uint256 value)
+        "0x1d491a427d1f8cc0d447496f300fac39f7306122481d8e663451eb268274146b": EventHandler(
+            "handle_user_request_for_affirmation", "user_request_for_affirmation_repo"
+        ),
+        # UserRequestForAffirmation (index_topic_1 bytes32 messageId, bytes encodedData)
+        "0x482515ce3d9494a37ce83f18b72b363449458435fafdd7a53ddea7460fe01b58": EventHandler(
+            "handle_user_request_for_affirmation", "user_request_for_affirmation_repo"
+        ),
+        # RelayedMessage
+        "0x4ab7d581336d92edbea22636a613e8e76c99ac7f91137c1523db38dbfb3bf329": EventHandler(
+            "handle_relayed_message", "relayed_message_repo"
+        ),
+        # UserRequestForSignature (address recipient, uint256 value)
+        "0x127650bcfb0ba017401abe4931453a405140a8fd36fece67bae2db174d3fdd63": EventHandler(
+            "handle_user_request_for_signature", "user_request_for_signature_repo"
+        ),
+        # UserRequestForSignature (index_topic_1 bytes32 messageId, bytes encodedData)
+        "0x520d2afde79cbd5db58755ac9480f81bc658e5c517fcae7365a3d832590b0183": EventHandler(
+            "handle_user_request_for_signature", "user_request_for_signature_repo"
+        ),
+        # SignedForUserRequest
+        "0xbf06885f40778f5ccfb64497d3f92ce568ddaedb7e2fb4487f72690418cf8e4c": EventHandler(
+            "handle_signed_for_user_request", "signed_for_user_request_repo"
+        ),
+        # SignedForAffirmation (index_topic_1 address signer, bytes32 messageHash), which has the
+        # same topic as SignedForAffirmation (index_topic_1 address signer, bytes32 transactionHash)
+        "0x5df9cc3eb93d8a9a481857a3b70a8ca966e6b80b25cf0ee2cce180ec5afa80a1": EventHandler(
+            "handle_signed_for_affirmation", "signed_for_affirmation_repo"
+        ),
+        # AffirmationCompleted
+        "0x6fc115a803b8703117d9a3956c5a15401cb42401f91630f015eb6b043fa76253": EventHandler(
+            "handle_affirmation_completed", "affirmation_completed_repo"
+        ),
+    }
+
     def __init__(self, rpc_client: EvmRPCClient, blockchains: list) -> None:
         super().__init__(rpc_client, blockchains)
         self.bridge = Bridge.OMNIBRIDGE
@@ -53,7 +98,7 @@ class OmnibridgeHandler(BaseHandler):
     def handle_transactions(self, transactions: List[Dict[str, Any]]) -> None:
         func_name = "handle_transactions"
         try:
-            self.blockchain_transaction_repo.create_all(transactions)
+            self.blockchain_transaction_repo.copy_all(transactions)
         except Exception as e:
             raise CustomException(
                 self.CLASS_NAME,
@@ -81,91 +126,12 @@ class OmnibridgeHandler(BaseHandler):
                 f"Error reading transaction from database: {e}",
             ) from e
 
-    def handle_events(
-        self,
-        blockchain: str,
-        start_block: int,
-        end_block: int,
-        contract: str,
-        topics: List[str],
-        events: List[Dict[str, Any]],
-    ) -> List[Dict[str, Any]]:
-        included_events = []
-        for event in events:
-            try:
-                if (
-                    event["topic"]
-                    == "0x59a9a8027b9c87b961e254899821c9a276b5efc35d1f7409ea4f291470f1629a"
-                ):  # TokensBridgingInitiated
-                    event = self.handle_tokens_bridging_initiated(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x9afd47907e25028cdaca89d193518c302bbb128617d5a992c5abd45815526593"
-                ):  # TokensBridged
-                    event = self.handle_tokens_bridged(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x1d491a427d1f8cc0d447496f300fac39f7306122481d8e663451eb268274146b"
-                ):  # UserRequestForAffirmation (address recipient, uint256 value)
-                    event = self.handle_user_request_for_affirmation(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x482515ce3d9494a37ce83f18b72b363449458435fafdd7a53ddea7460fe01b58"
-                ):  # UserRequestForAffirmation (index_topic_1 bytes32 messageId, bytes encodedData)
-                    event = self.handle_user_request_for_affirmation(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x4ab7d581336d92edbea22636a613e8e76c99ac7f91137c1523db38dbfb3bf329"
-                ):  # RelayedMessage
-                    event = self.handle_relayed_message(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x127650bcfb0ba017401abe4931453a405140a8fd36fece67bae2db174d3fdd63"
-                ):  # UserRequestForSignature (address recipient, uint256 value)
-                    event = self.handle_user_request_for_signature(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x520d2afde79cbd5db58755ac9480f81bc658e5c517fcae7365a3d832590b0183"
-                ):  # UserRequestForSignature (index_topic_1 bytes32 messageId, bytes encodedData)
-                    event = self.handle_user_request_for_signature(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0xbf06885f40778f5ccfb64497d3f92ce568ddaedb7e2fb4487f72690418cf8e4c"
-                ):  # SignedForUserRequest
-                    event = self.handle_signed_for_user_request(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x5df9cc3eb93d8a9a481857a3b70a8ca966e6b80b25cf0ee2cce180ec5afa80a1"
-                ):  # SignedForAffirmation (index_topic_1 address signer, bytes32 messageHash)
-                    event = self.handle_signed_for_affirmation(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x5df9cc3eb93d8a9a481857a3b70a8ca966e6b80b25cf0ee2cce180ec5afa80a1"
-                ):  # SignedForAffirmation (index_topic_1 address signer, bytes32 transactionHash)
-                    event = self.handle_signed_for_affirmation(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x6fc115a803b8703117d9a3956c5a15401cb42401f91630f015eb6b043fa76253"
-                ):  # AffirmationCompleted
-                    event = self.handle_affirmation_completed(blockchain, event)
-
-                if event:
-                    included_events.append(event)
-
-            except CustomException as e:
-                request_desc = (
-                    f"Error processing request: {blockchain}, {start_block}, "
-                    f"{end_block}, {contract}, {topics}.\n{e}"
-                )
-                log_error(self.bridge, request_desc)
-
-        return included_events
-
     def handle_tokens_bridging_initiated(self, blockchain, event):
         func_name = "handle_tokens_bridging_initiated"
 
         try:
-            self.tokens_bridging_initiated_repo.create(
+            self.stage(
+                self.tokens_bridging_initiated_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -173,7 +139,7 @@ class OmnibridgeHandler(BaseHandler):
                     "sender": event["sender"],
                     "value": str(event["value"]),
                     "message_id": event["messageId"],
-                }
+                },
             )
             return event
         except Exception as e:
@@ -187,7 +153,8 @@ class OmnibridgeHandler(BaseHandler):
         func_name = "handle_tokens_bridged"
 
         try:
-            self.tokens_bridged_repo.create(
+            self.stage(
+                self.tokens_bridged_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -195,7 +162,7 @@ class OmnibridgeHandler(BaseHandler):
                     "recipient": event["recipient"],
                     "value": str(event["value"]),
                     "message_id": event["messageId"],
-                }
+                },
             )
             return event
         except Exception as e:
@@ -209,7 +176,8 @@ class OmnibridgeHandler(BaseHandler):
         func_name = "handle_user_request_for_affirmation"
 
         try:
-            self.user_request_for_affirmation_repo.create(
+            self.stage(
+                self.user_request_for_affirmation_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -217,7 +185,7 @@ class OmnibridgeHandler(BaseHandler):
                     "encoded_data": event["encodedData"] if "encodedData" in event else None,
                     "value": str(event["value"]) if "value" in event else None,
                     "recipient": event["recipient"] if "recipient" in event else None,
-                }
+                },
             )
             return event
         except Exception as e:
@@ -231,7 +199,8 @@ class OmnibridgeHandler(BaseHandler):
         func_name = "handle_user_request_for_signature"
 
         try:
-            self.user_request_for_signature_repo.create(
+            self.stage(
+                self.user_request_for_signature_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -242,7 +211,7 @@ class OmnibridgeHandler(BaseHandler):
                     else None,
                     "recipient": event["recipient"] if "recipient" in event else None,
                     "value": str(event["value"]) if "value" in event else None,
-                }
+                },
             )
             return event
         except Exception as e:
@@ -256,13 +225,14 @@ class OmnibridgeHandler(BaseHandler):
         func_name = "handle_signed_for_user_request"
 
         try:
-            self.signed_for_user_request_repo.create(
+            self.stage(
+                self.signed_for_user_request_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
                     "signer": event["signer"],
                     "message_hash": event["messageHash"],
-                }
+                },
             )
             return event
         except Exception as e:
@@ -276,7 +246,8 @@ class OmnibridgeHandler(BaseHandler):
         func_name = "handle_signed_for_affirmation"
 
         try:
-            self.signed_for_affirmation_repo.create(
+            self.stage(
+                self.signed_for_affirmation_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -285,7 +256,7 @@ class OmnibridgeHandler(BaseHandler):
                     "src_transaction_hash": event["transactionHash"]
                     if "transactionHash" in event
                     else None,
-                }
+                },
             )
             return event
         except Exception as e:
@@ -299,14 +270,15 @@ class OmnibridgeHandler(BaseHandler):
         func_name = "handle_affirmation_completed"
 
         try:
-            self.affirmation_completed_repo.create(
+            self.stage(
+                self.affirmation_completed_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
                     "recipient": event["recipient"],
                     "value": str(event["value"]),
                     "src_transaction_hash": "0x" + event["transactionHash"],
-                }
+                },
             )
             return event
         except Exception as e:
@@ -320,14 +292,15 @@ class OmnibridgeHandler(BaseHandler):
         func_name = "handle_relayed_message"
 
         try:
-            self.relayed_message_repo.create(
+            self.stage(
+                self.relayed_message_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
                     "recipient": event["recipient"],
                     "value": str(event["value"]),
                     "src_transaction_hash": "0x" + event["transactionHash"],
-                }
+                },
             )
             return event
         except Exception as e:
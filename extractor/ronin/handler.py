@@ -1,7 +1,7 @@
 from typing import Any, Dict, List
 
 from config.constants import Bridge
-from extractor.base_handler import BaseHandler
+from extractor.base_handler import BaseHandler, EventHandler
 from extractor.ronin.constants import BRIDGE_CONFIG
 from repository.database import DBSession
 from repository.ronin.repository import (
@@ -12,12 +12,32 @@ from repository.ronin.repository import (
     RoninWithdrawalRequestedRepository,
 )
 from rpcs.evm_rpc_client import EvmRPCClient
-from utils.utils import CustomException, log_error
+from utils.utils import CustomException
 
 
 class RoninHandler(BaseHandler):
     CLASS_NAME = "RoninHandler"
 
+    # map of the topic of each event to its handler method, and the repository it writes to
+    EVENT_HANDLERS = {
+        # DepositRequested
+        "0xd7b25068d9dc8d00765254cfb7f5070f98d263c8d68931d937c7362fa738048b": EventHandler(
+            "handle_deposit_requested", "deposit_requested_repo"
+        ),
+        # Deposited
+        "0x8d20d8121a34dded9035ff5b43e901c142824f7a22126392992c353c37890524": EventHandler(
+            "handle_tokens_deposited", "token_deposited_repo"
+        ),
+        # WithdrawalRequested
+        "0xf313c253a5be72c29d0deb2c8768a9543744ac03d6b3cafd50cc976f1c2632fc": EventHandler(
+            "handle_withdrawal_requested", "withdrawal_requested_repo"
+        ),
+        # Withdrew
+        "0x21e88e956aa3e086f6388e899965cef814688f99ad8bb29b08d396571016372d": EventHandler(
+            "handle_token_withdrew", "token_withdrew_repo"
+        ),
+    }
+
     def __init__(self, rpc_client: EvmRPCClient, blockchains: list) -> None:
         super().__init__(rpc_client, blockchains)
         self.bridge = Bridge.RONIN
@@ -39,7 +59,7 @@ class RoninHandler(BaseHandler):
     def handle_transactions(self, transactions: List[Dict[str, Any]]) -> None:
         func_name = "handle_transactions"
         try:
-            self.blockchain_transaction_repo.create_all(transactions)
+            self.blockchain_transaction_repo.copy_all(transactions)
         except Exception as e:
             raise CustomException(
                 self.CLASS_NAME,
@@ -67,51 +87,6 @@ class RoninHandler(BaseHandler):
                 f"Error reading transaction from database: {e}",
             ) from e
 
-    def handle_events(
-        self,
-        blockchain: str,
-        start_block: int,
-        end_block: int,
-        contract: str,
-        topics: List[str],
-        events: List[Dict[str, Any]],
-    ) -> List[Dict[str, Any]]:
-        included_events = []
-        for event in events:
-            try:
-                if (
-                    event["topic"]
-                    == "0xd7b25068d9dc8d00765254cfb7f5070f98d263c8d68931d937c7362fa738048b"
-                ):  # DepositRequested
-                    event = self.handle_deposit_requested(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x8d20d8121a34dded9035ff5b43e901c142824f7a22126392992c353c37890524"
-                ):  # Deposited
-                    event = self.handle_tokens_deposited(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0xf313c253a5be72c29d0deb2c8768a9543744ac03d6b3cafd50cc976f1c2632fc"
-                ):  # WithdrawalRequested
-                    event = self.handle_withdrawal_requested(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x21e88e956aa3e086f6388e899965cef814688f99ad8bb29b08d396571016372d"
-                ):  # Withdrew
-                    event = self.handle_token_withdrew(blockchain, event)
-
-                if event:
-                    included_events.append(event)
-
-            except CustomException as e:
-                request_desc = (
-                    f"Error processing request: {blockchain}, {start_block}, "
-                    f"{end_block}, {contract}, {topics}.\n{e}"
-                )
-                log_error(self.bridge, request_desc)
-
-        return included_events
-
     def handle_deposit_requested(self, blockchain, event):
         func_name = "handle_deposit_requested"
 
@@ -120,13 +95,11 @@ class RoninHandler(BaseHandler):
                 event
             )
 
-            if self.deposit_requested_repo.event_exists(receipt["id"]):
-                return None
-
             if token_info["quantity"] == 0:
                 return None
 
-            self.deposit_requested_repo.create(
+            self.stage(
+                self.deposit_requested_repo,
                 {
                     "blockchain": "ethereum",
                     "transaction_hash": event["transaction_hash"],
@@ -139,7 +112,7 @@ class RoninHandler(BaseHandler):
                     "dst_blockchain": "ronin",
                     "token_standard": token_info["erc"],
                     "amount": token_info["quantity"],
-                }
+                },
             )
             return event
         except Exception as e:
@@ -157,13 +130,11 @@ class RoninHandler(BaseHandler):
                 event
             )
 
-            if self.token_deposited_repo.event_exists(receipt["id"]):
-                return None
-
             if token_info["quantity"] == 0:
                 return None
 
-            self.token_deposited_repo.create(
+            self.stage(
+                self.token_deposited_repo,
                 {
                     "blockchain": "ronin",
                     "transaction_hash": event["transaction_hash"],
@@ -176,7 +147,7 @@ class RoninHandler(BaseHandler):
                     "output_token": ronin_data["tokenAddr"],
                     "token_standard": token_info["erc"],
                     "amount": token_info["quantity"],
-                }
+                },
             )
 
             return event
@@ -195,13 +166,11 @@ class RoninHandler(BaseHandler):
                 event
             )
 
-            if self.withdrawal_requested_repo.event_exists(receipt["id"]):
-                return None
-
             if token_info["quantity"] == 0:
                 return None
 
-            self.withdrawal_requested_repo.create(
+            self.stage(
+                self.withdrawal_requested_repo,
                 {
                     "blockchain": "ronin",
                     "transaction_hash": event["transaction_hash"],
@@ -214,7 +183,7 @@ class RoninHandler(BaseHandler):
                     "output_token": mainchain_data["tokenAddr"],
                     "token_standard": token_info["erc"],
                     "amount": token_info["quantity"],
-                }
+                },
             )
 
             return event
@@ -233,13 +202,11 @@ class RoninHandler(BaseHandler):
                 event
             )
 
-            if self.token_withdrew_repo.event_exists(receipt["id"]):
-                return None
-
             if token_info["quantity"] == 0:
                 return None
 
-            self.token_withdrew_repo.create(
+            self.stage(
+                self.token_withdrew_repo,
                 {
                     "blockchain": "ethereum",
                     "transaction_hash": event["transaction_hash"],
@@ -252,7 +219,7 @@ class RoninHandler(BaseHandler):
                     "output_token": mainchain_data["tokenAddr"],
                     "token_standard": token_info["erc"],
                     "amount": token_info["quantity"],
-                }
+                },
             )
 
             return event
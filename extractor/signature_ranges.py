@@ -0,0 +1,67 @@
+class SignatureRangeBuilder:
+    """
+    Splits the signatures of a program into ranges of at most `range_size` signatures, as they
+    are paged from the RPC (from the newest to the oldest signature), such that ranges can be
+    processed before pagination is over. Signatures within completed ranges (e.g., checkpointed
+    by previous extractions) are left out.
+
+    Attributes:
+        range_size (int): Maximum number of signatures of a range.
+        completed_ranges (dict): Mapping of the first (newest) signature of each completed range
+            to the last (oldest) signatures of the ranges starting with it.
+        open_ranges (set): Last signatures of the completed ranges the signatures are within.
+        pending (list): Signatures not handed out in a range yet.
+        num_signatures (int): Number of signatures added, including those left out.
+    """
+
+    def __init__(self, range_size: int, completed_ranges: list = ()):
+        self.range_size = range_size
+        self.completed_ranges = {}
+        self.open_ranges = set()
+        self.pending = []
+        self.num_signatures = 0
+
+        for start_signature, end_signature in completed_ranges:
+            self.completed_ranges.setdefault(start_signature, set()).add(end_signature)
+
+    def is_completed(self, signature: str) -> bool:
+        completed = len(self.open_ranges) > 0
+
+        if signature in self.open_ranges:
+            self.open_ranges.remove(signature)
+            completed = True
+
+        if signature in self.completed_ranges:
+            # a completed range whose last signature is not paged (i.e., older than the oldest
+            # signature extracted) covers every signature up to the end
+            self.open_ranges |= self.completed_ranges[signature] - {signature}
+            completed = True
+
+        return completed
+
+    def add(self, signatures: list) -> list:
+        """Adds the next page of signatures, returning the ranges that are now full."""
+        ranges = []
+
+        for signature in signatures:
+            self.num_signatures += 1
+
+            if self.is_completed(signature):
+                # ranges do not span over completed signatures
+                ranges += self.flush()
+                continue
+
+            self.pending.append(signature)
+
+            if len(self.pending) == self.range_size:
+                ranges += self.flush()
+
+        return ranges
+
+    def flush(self) -> list:
+        """Returns the pending signatures as a range (if any), once there are no more to add."""
+        if len(self.pending) == 0:
+            return []
+
+        signature_range, self.pending = self.pending, []
+        return [signature_range]
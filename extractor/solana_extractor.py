@@ -1,9 +1,12 @@
 # import json
 import threading
 import time
+from queue import Queue
 
-from config.constants import Bridge
+from config.constants import SOLANA_SIGNATURE_QUEUE_SIZE, SOLANA_SIGNATURE_RANGE_SIZE, Bridge
 from extractor.extractor import Extractor
+from extractor.signature_ranges import SignatureRangeBuilder
+from repository.base import on_commit
 from rpcs.solana_rpc_client import SolanaRPCClient
 from utils.utils import (
     CliColor,
@@ -17,29 +20,71 @@ from utils.utils import (
 class SolanaExtractor(Extractor):
     CLASS_NAME = "SolanaExtractor"
 
-    def __init__(self, bridge: Bridge, blockchain: str, blockchains: list):
+    def __init__(self, bridge: Bridge, blockchain: str, blockchains: list, resume: bool = False):
         self.rpc_client = SolanaRPCClient(bridge)
 
-        super().__init__(bridge, blockchain, blockchains)
+        super().__init__(bridge, blockchain, blockchains, resume)
 
         self.solana_program_ids = self.handler.get_solana_bridge_program_ids()
 
     def worker(self):
-        """Worker function for threads to process block ranges."""
-        while not self.task_queue.empty():
+        """
+        Worker function for threads to process signature ranges, until they take a None task
+        from the queue.
+        """
+        while True:
+            task = self.task_queue.get()
+
+            if task is None:
+                self.task_queue.task_done()
+                break
+
+            program_id, signatures = task
+
             try:
-                program_id, signatures = self.task_queue.get()
+                errors = self.start_range()
 
                 self.work(signatures)
+
+                if len(errors) == 0:
+                    self.checkpoint_signature_range(program_id, signatures)
             except CustomException as e:
                 request_desc = (
                     f"Error processing request: {self.bridge}, {self.blockchain}, {program_id}, "
                     f"{signatures[0]}, {signatures[-1]}, {program_id}. Error: {e}"
                 )
-                log_error(self.bridge, request_desc)
+                self.log_range_error(request_desc)
             finally:
                 self.task_queue.task_done()
 
+    def checkpoint_signature_range(self, program_id: str, signatures: list):
+        try:
+            self.checkpoint_repo.record_signature_range(
+                self.bridge.value, program_id, signatures[0], signatures[-1]
+            )
+        except Exception as e:
+            log_error(
+                self.bridge,
+                f"Error checkpointing {program_id}, {signatures[0]}, {signatures[-1]}. "
+                f"Error: {e}",
+            )
+
+    def create_signature_range_builder(
+        self, program_id: str, range_size: int = SOLANA_SIGNATURE_RANGE_SIZE
+    ) -> SignatureRangeBuilder:
+        """
+        Returns the builder of the signature ranges of the program. With resume, the signatures
+        within ranges checkpointed by previous runs are left out.
+        """
+        completed_ranges = []
+
+        if self.resume:
+            completed_ranges = self.checkpoint_repo.get_completed_signature_ranges(
+                self.bridge.value, program_id
+            )
+
+        return SignatureRangeBuilder(range_size, completed_ranges)
+
     def work(
         self,
         signatures: list,
@@ -68,18 +113,37 @@ class SolanaExtractor(Extractor):
                     f"Error processing transaction: {self.bridge}, {self.blockchain}, "
                     f"{signature}. Error: {e}"
                 )
-                log_error(self.bridge, request_desc)
+                self.log_range_error(request_desc)
 
-        included_txs = self.handler.handle_solana_events(
-            self.blockchain, start_signature, end_signature, decoded_instructions
-        )
+        # a database connection is only held while the range is written, not while its
+        # transactions are fetched from the RPCs
+        with self.unit_of_work():
+            self.handle_decoded_transactions(signatures, decoded_instructions)
+
+    def handle_decoded_transactions(self, signatures: list, decoded_instructions: list):
+        """Invokes the bridge handler with the decoded transactions and stores them."""
+        start_signature = signatures[0]
+        end_signature = signatures[-1]
+
+        included_txs = []
+
+        try:
+            # the rows created by the handler are written in bulk at the end
+            with self.handler.bulk_writes():
+                included_txs = self.handler.handle_solana_events(
+                    self.blockchain, start_signature, end_signature, decoded_instructions
+                )
+        except CustomException as e:
+            request_desc = (
+                f"Error processing request: {self.bridge}, {self.blockchain}, "
+                f"{start_signature}, {end_signature}. Error: {e}"
+            )
+            self.log_range_error(request_desc)
 
         transactions = []
 
         for decoded_tx in included_txs:
-            if self.handler.does_transaction_exist_by_hash(
-                decoded_tx["transaction"]["transaction"]["signatures"][0]
-            ):
+            if self.transaction_exists(decoded_tx["transaction"]["transaction"]["signatures"][0]):
                 continue
 
             transactions.append(
@@ -92,10 +156,14 @@ class SolanaExtractor(Extractor):
 
         if len(transactions) > 0:
             self.handler.handle_transactions(transactions)
+            on_commit(self.transaction_filter.add, [tx["transaction_hash"] for tx in transactions])
 
     def extract_data(self, signature_ranges: dict):
         """Main extraction logic."""
 
+        # signature ranges do not map to a block window, so all solana transactions are loaded
+        self.load_transaction_filter()
+
         for idx, program_id in enumerate(self.solana_program_ids):
             start_signature = signature_ranges[program_id]["start_signature"]
             end_signature = signature_ranges[program_id]["end_signature"]
@@ -112,70 +180,62 @@ class SolanaExtractor(Extractor):
                 )
             )
 
-            all_signatures = self.rpc_client.get_all_signatures_for_address(
-                program_id, start_signature, end_signature
-            )
-
-            # if we already have signatures fetched, we can skip fetching them again
-            # all_signatures = []
-            # with open("extractor/db_out.txt", "r") as f:
-            #     # each line is a tx_hash / signature
-            #     for line in f:
-            #         tx_hash = line.strip()
-            #         if tx_hash:
-            #             all_signatures.append(tx_hash)
-
-            all_signatures = list(map(lambda x: x["signature"], all_signatures))
-
-            if not all_signatures:
-                log_to_cli(
-                    build_log_message_solana(
-                        start_signature,
-                        end_signature,
-                        program_id,
-                        self.blockchain,
-                        "No transaction signatures found in the specified range.",
-                    ),
-                    CliColor.ERROR,
-                )
-                return None
-
             start_time = time.time()
 
             # num_threads = self.rpc_client.max_threads_per_blockchain(self.blockchain) * 2
 
             num_threads = 15
 
-            # Ensure at least 1 per chunk, capped at 1000
-            chunk_size = max(1, min((len(all_signatures) + num_threads - 1) // num_threads, 1000))
-
-            block_ranges = self.divide_range(0, len(all_signatures) - 1, chunk_size)
-
-            # Populate the task queue
-            for start, end in block_ranges:
-                self.task_queue.put((program_id, all_signatures[start:end]))
+            # the workers process the signature ranges as they are paged, and the queue is bounded
+            # such that pagination does not run ahead of them
+            self.task_queue = Queue(maxsize=SOLANA_SIGNATURE_QUEUE_SIZE)
+            self.threads = [
+                threading.Thread(target=self.worker, name=f"thread_id_{i}")
+                for i in range(num_threads)
+            ]
 
             log_to_cli(
                 build_log_message_solana(
                     start_signature,
                     end_signature,
                     self.bridge,
-                    (
-                        f"Launching {num_threads} threads to process {len(block_ranges)} signature "
-                        f"ranges...",
-                    ),
+                    f"Launching {num_threads} threads to process signature ranges...",
                 )
             )
 
-            for i in range(num_threads):
-                thread = threading.Thread(target=self.worker, name=f"thread_id_{i}")
+            for thread in self.threads:
                 thread.start()
-                self.threads.append(thread)
 
-            # Wait for all threads to complete
-            self.task_queue.join()
-            for thread in self.threads:
-                thread.join()
+            range_builder = self.create_signature_range_builder(program_id)
+
+            try:
+                for page in self.rpc_client.iter_signatures_for_address(
+                    program_id, start_signature, end_signature
+                ):
+                    for signatures in range_builder.add(page):
+                        self.task_queue.put((program_id, signatures))
+
+                for signatures in range_builder.flush():
+                    self.task_queue.put((program_id, signatures))
+            finally:
+                # each worker stops once it takes a None task, after the ranges already queued
+                for _ in self.threads:
+                    self.task_queue.put(None)
+
+                for thread in self.threads:
+                    thread.join()
+
+            if range_builder.num_signatures == 0:
+                log_to_cli(
+                    build_log_message_solana(
+                        start_signature,
+                        end_signature,
+                        self.bridge,
+                        "No transaction signatures found in the specified range.",
+                    ),
+                    CliColor.ERROR,
+                )
+                continue
 
             end_time = time.time()
 
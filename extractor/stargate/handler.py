@@ -1,8 +1,7 @@
-import time
 from typing import Any, Dict, List
 
 from config.constants import Bridge
-from extractor.base_handler import BaseHandler
+from extractor.base_handler import BaseHandler, EventHandler
 from extractor.stargate.constants import BLOCKCHAIN_IDS, BRIDGE_CONFIG
 from extractor.stargate.utils.PacketDecoder import PacketDecoder
 from extractor.stargate.utils.PacketSentDecoder import PacketSentDecoder
@@ -32,12 +31,112 @@ from repository.stargate.repository import (
     StargateVerifierFeeRepository,
 )
 from rpcs.evm_rpc_client import EvmRPCClient
-from utils.utils import CustomException, log_error, unpad_address
+from utils.utils import CustomException, unpad_address
 
 
 class StargateHandler(BaseHandler):
     CLASS_NAME = "StargateHandler"
 
+    # map of the topic of each event to its handler method, and the repository it writes to
+    EVENT_HANDLERS = {
+        # PacketSent
+        "0x1ab700d4ced0c005b164c0f789fd09fcbb0156d4c2041b8a3bfbcd961cd1567f": EventHandler(
+            "handle_packet_sent", "packet_sent_repo"
+        ),
+        # Packet
+        "0xe9bded5f24a4168e4f3bf44e00298c993b22376aad8c58c7dda9718a54cbea82": EventHandler(
+            "handle_packet", "packet_repo"
+        ),
+        # PacketDelivered
+        "0x3cd5e48f9730b129dc7550f0fcea9c767b7be37837cd10e55eb35f734f4bca04": EventHandler(
+            "handle_packet_delivered", "packet_delivered_repo"
+        ),
+        # PacketVerified
+        "0x0d87345f3d1c929caba93e1c3821b54ff3512e12b66aa3cfe54b6bcbc17e59b4": EventHandler(
+            "handle_packet_verified", "packet_verified_repo"
+        ),
+        # PacketReceived
+        "0x2bd2d8a84b748439fd50d79a49502b4eb5faa25b864da6a9ab5c150704be9a4d": EventHandler(
+            "handle_packet_received", "packet_received_repo"
+        ),
+        # ExecutorFeePaid
+        "0x61ed099e74a97a1d7f8bb0952a88ca8b7b8ebd00c126ea04671f92a81213318a": EventHandler(
+            "handle_executor_fee_paid", "executor_fee_paid_repo"
+        ),
+        # UlnConfigSet
+        "0x82118522aa536ac0e96cc5c689407ae42b89d592aa133890a01f1509842f5081": EventHandler(
+            "handle_uln_config_set", "uln_config_set_repo"
+        ),
+        # PayloadVerified
+        "0x2cb0eed7538baeae4c6fde038c0fd0384d27de0dd55a228c65847bda6aa1ab56": EventHandler(
+            "handle_payload_verified", "payload_verified_repo"
+        ),
+        # DVNFeePaid
+        "0x07ea52d82345d6e838192107d8fd7123d9c2ec8e916cd0aad13fd2b60db24644": EventHandler(
+            "handle_dvn_fee_paid", "dvn_fee_paid_repo"
+        ),
+        # OFTSent
+        "0x85496b760a4b7f8d66384b9df21b381f5d1b1e79f229a47aaf4c232edc2fe59a": EventHandler(
+            "handle_oft_sent", "oft_sent_repo"
+        ),
+        # OFTReceived
+        "0xefed6d3500546b29533b128a29e3a94d70788727f0507505ac12eaf2e578fd9c": EventHandler(
+            "handle_oft_received", "oft_received_repo"
+        ),
+        # SendToChain BaseOFTV2
+        "0xd81fc9b8523134ed613870ed029d6170cbb73aa6a6bc311b9a642689fb9df59a": EventHandler(
+            "handle_oft_send_to_chain", "oft_send_to_chain_repo"
+        ),
+        # ReceiveFromChain BaseOFTV2
+        "0xbf551ec93859b170f9b2141bd9298bf3f64322c6f7beb2543a0cb669834118bf": EventHandler(
+            "handle_oft_receive_from_chain", "oft_receive_from_chain_repo"
+        ),
+        # SendToChain Stargate Token
+        "0x664e26797cde1146ddfcb9a5d3f4de61179f9c11b2698599bb09e686f442172b": EventHandler(
+            "handle_oft_send_to_chain_2", "oft_send_to_chain_repo"
+        ),
+        # ReceiveFromChain Stargate Token
+        "0x1e43690f7c7ebcc548b8e72d1ec2273acd54666f0330bef2eeb2268ee9f28988": EventHandler(
+            "handle_oft_receive_from_chain_2", "oft_receive_from_chain_repo"
+        ),
+        # ReceiveFromChain Stargate Token (Polygon)
+        "0x831bc68226f8d1f734ffcca73602efc4eca13711402ba1d2cc05ee17bb54f631": EventHandler(
+            "handle_oft_receive_from_chain_3", "oft_receive_from_chain_repo"
+        ),
+        # BusRode
+        "0x15955c5a4cc61b8fbb05301bce47fd31c0e6f935e1ab97fdac9b134c887bb074": EventHandler(
+            "handle_bus_rode", "bus_rode_repo"
+        ),
+        # BusDriven
+        "0x1623f9ea59bd6f214c9571a892da012fc23534aa5906bef4ae8c5d15ee7d2d6e": EventHandler(
+            "handle_bus_driven", "bus_driven_repo"
+        ),
+        # Swap
+        "0x34660fc8af304464529f48a778e03d03e4d34bcd5f9b6f0cfbf3cd238c642f7f": EventHandler(
+            "handle_swap", "swap_repo"
+        ),
+        # SwapRemote
+        "0xfb2b592367452f1c437675bed47f5e1e6c25188c17d7ba01a12eb030bc41ccef": EventHandler(
+            "handle_swap_remote", "swap_remote_repo"
+        ),
+        # VerifierFee
+        "0x87e46b0a6199bc734632187269a103c05714ee0adae5b28f30723955724f37ef": EventHandler(
+            "handle_verifier_fee", "verifier_fee_repo"
+        ),
+        # AssignJob
+        "0xdf21c415b78ed2552cc9971249e32a053abce6087a0ae0fbf3f78db5174a3493": EventHandler(
+            "handle_assign_job", "relayer_fee_repo"
+        ),
+        # ComposeSent
+        "0x3d52ff888d033fd3dd1d8057da59e850c91d91a72c41dfa445b247dfedeb6dc1": EventHandler(
+            "handle_compose_sent", "compose_sent_repo"
+        ),
+        # ComposeDelivered
+        "0x0036c98efcf9e6641dfbc9051f66f405253e8e0c2ab4a24dccda15595b7378c8": EventHandler(
+            "handle_compose_delivered", "compose_delivered_repo"
+        ),
+    }
+
     def __init__(self, rpc_client: EvmRPCClient, blockchains: list) -> None:
         super().__init__(rpc_client, blockchains)
         self.bridge = Bridge.STARGATE
@@ -77,7 +176,7 @@ class StargateHandler(BaseHandler):
         func_name = "handle_transactions"
 
         try:
-            self.blockchain_transaction_repo.create_all(transactions)
+            self.blockchain_transaction_repo.copy_all(transactions)
         except Exception as e:
             raise CustomException(
                 self.CLASS_NAME,
@@ -105,154 +204,6 @@ class StargateHandler(BaseHandler):
                 f"Error reading transaction from database: {e}",
             ) from e
 
-    def handle_events(
-        self,
-        blockchain: str,
-        start_block: int,
-        end_block: int,
-        contract: str,
-        topics: List[str],
-        events: List[Dict[str, Any]],
-    ) -> List[Dict[str, Any]]:
-        included_events = []
-
-        for event in events:
-            try:
-                start_ts = time.time()
-                if (
-                    event["topic"]
-                    == "0x1ab700d4ced0c005b164c0f789fd09fcbb0156d4c2041b8a3bfbcd961cd1567f"
-                ):  # PacketSent
-                    event = self.handle_packet_sent(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0xe9bded5f24a4168e4f3bf44e00298c993b22376aad8c58c7dda9718a54cbea82"
-                ):  # Packet
-                    event = self.handle_packet(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x3cd5e48f9730b129dc7550f0fcea9c767b7be37837cd10e55eb35f734f4bca04"
-                ):  # PacketDelivered
-                    event = self.handle_packet_delivered(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x0d87345f3d1c929caba93e1c3821b54ff3512e12b66aa3cfe54b6bcbc17e59b4"
-                ):  # PacketVerified
-                    event = self.handle_packet_verified(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x2bd2d8a84b748439fd50d79a49502b4eb5faa25b864da6a9ab5c150704be9a4d"
-                ):  # PacketReceived
-                    event = self.handle_packet_received(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x61ed099e74a97a1d7f8bb0952a88ca8b7b8ebd00c126ea04671f92a81213318a"
-                ):  # ExecutorFeePaid
-                    event = self.handle_executor_fee_paid(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x82118522aa536ac0e96cc5c689407ae42b89d592aa133890a01f1509842f5081"
-                ):  # UlnConfigSet
-                    event = self.handle_uln_config_set(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x2cb0eed7538baeae4c6fde038c0fd0384d27de0dd55a228c65847bda6aa1ab56"
-                ):  # PayloadVerified
-                    event = self.handle_payload_verified(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x07ea52d82345d6e838192107d8fd7123d9c2ec8e916cd0aad13fd2b60db24644"
-                ):  # DVNFeePaid
-                    event = self.handle_dvn_fee_paid(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x85496b760a4b7f8d66384b9df21b381f5d1b1e79f229a47aaf4c232edc2fe59a"
-                ):  # OFTSent
-                    event = self.handle_oft_sent(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0xefed6d3500546b29533b128a29e3a94d70788727f0507505ac12eaf2e578fd9c"
-                ):  # OFTReceived
-                    event = self.handle_oft_received(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0xd81fc9b8523134ed613870ed029d6170cbb73aa6a6bc311b9a642689fb9df59a"
-                ):  # SendToChain BaseOFTV2
-                    event = self.handle_oft_send_to_chain(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0xbf551ec93859b170f9b2141bd9298bf3f64322c6f7beb2543a0cb669834118bf"
-                ):  # ReceiveFromChain BaseOFTV2
-                    event = self.handle_oft_receive_from_chain(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x664e26797cde1146ddfcb9a5d3f4de61179f9c11b2698599bb09e686f442172b"
-                ):  # SendToChain Stargate Token
-                    event = self.handle_oft_send_to_chain_2(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x1e43690f7c7ebcc548b8e72d1ec2273acd54666f0330bef2eeb2268ee9f28988"
-                ):  # ReceiveFromChain Stargate Token
-                    event = self.handle_oft_receive_from_chain_2(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x831bc68226f8d1f734ffcca73602efc4eca13711402ba1d2cc05ee17bb54f631"
-                ):  # ReceiveFromChain Stargate Token (Polygon)
-                    event = self.handle_oft_receive_from_chain_3(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x15955c5a4cc61b8fbb05301bce47fd31c0e6f935e1ab97fdac9b134c887bb074"
-                ):  # BusRode
-                    event = self.handle_bus_rode(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x1623f9ea59bd6f214c9571a892da012fc23534aa5906bef4ae8c5d15ee7d2d6e"
-                ):  # BusDriven
-                    event = self.handle_bus_driven(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x34660fc8af304464529f48a778e03d03e4d34bcd5f9b6f0cfbf3cd238c642f7f"
-                ):  # Swap
-                    event = self.handle_swap(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0xfb2b592367452f1c437675bed47f5e1e6c25188c17d7ba01a12eb030bc41ccef"
-                ):  # SwapRemote
-                    event = self.handle_swap_remote(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x87e46b0a6199bc734632187269a103c05714ee0adae5b28f30723955724f37ef"
-                ):  # VerifierFee
-                    event = self.handle_verifier_fee(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0xdf21c415b78ed2552cc9971249e32a053abce6087a0ae0fbf3f78db5174a3493"
-                ):  # AssignJob
-                    event = self.handle_assign_job(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x3d52ff888d033fd3dd1d8057da59e850c91d91a72c41dfa445b247dfedeb6dc1"
-                ):  # ComposeSent
-                    event = self.handle_compose_sent(blockchain, event)
-                elif (
-                    event["topic"]
-                    == "0x0036c98efcf9e6641dfbc9051f66f405253e8e0c2ab4a24dccda15595b7378c8"
-                ):  # ComposeDelivered
-                    event = self.handle_compose_delivered(blockchain, event)
-                endd_ts = time.time()
-                if endd_ts - start_ts > 1:
-                    print(f"Time taken to process event: {endd_ts - start_ts}")
-                if event:
-                    included_events.append(event)
-
-            except CustomException as e:
-                request_desc = (
-                    f"Error processing request: {blockchain}, {start_block}, "
-                    f"{end_block}, {contract}, {topics}.\n{e}"
-                )
-                log_error(self.bridge, request_desc)
-        return included_events
-
     def handle_packet_sent(self, blockchain, event):
         func_name = "handle_packet_sent"
         """
@@ -274,10 +225,8 @@ class StargateHandler(BaseHandler):
             if src_blockchain is None or dst_blockchain is None:
                 return None
 
-            if self.packet_sent_repo.event_exists(decoded_event["guid"]):
-                return None
-
-            self.packet_sent_repo.create(
+            self.stage(
+                self.packet_sent_repo,
                 {
                     "guid": decoded_event["guid"],
                     "blockchain": blockchain,
@@ -289,7 +238,7 @@ class StargateHandler(BaseHandler):
                     "dst_blockchain": dst_blockchain,
                     "receiver": unpad_address(decoded_event["receiver"]),
                     "message": decoded_event["message"],
-                }
+                },
             )
             return event
         except Exception as e:
@@ -310,12 +259,8 @@ class StargateHandler(BaseHandler):
             if src_blockchain is None or dst_blockchain is None:
                 return None
 
-            if self.packet_repo.event_exists(
-                event["transaction_hash"], dst_blockchain, decoded_event["nonce"]
-            ):
-                return None
-
-            self.packet_repo.create(
+            self.stage(
+                self.packet_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -325,7 +270,7 @@ class StargateHandler(BaseHandler):
                     "dst_blockchain": dst_blockchain,
                     "dst_address": decoded_event["dstAddress"],
                     "payload": decoded_event["payload"],
-                }
+                },
             )
             return event
         except Exception as e:
@@ -346,12 +291,8 @@ class StargateHandler(BaseHandler):
             if src_blockchain is None:
                 return None
 
-            if self.packet_delivered_repo.event_exists(
-                event["transaction_hash"],
-            ):
-                return None
-
-            self.packet_delivered_repo.create(
+            self.stage(
+                self.packet_delivered_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -359,7 +300,7 @@ class StargateHandler(BaseHandler):
                     "sender": unpad_address(flattened_object["sender"]),
                     "nonce": flattened_object["nonce"],
                     "receiver": event["receiver"],
-                }
+                },
             )
             return event
         except Exception as e:
@@ -380,12 +321,8 @@ class StargateHandler(BaseHandler):
             if src_blockchain is None:
                 return None
 
-            if self.packet_verified_repo.event_exists(
-                event["transaction_hash"],
-            ):
-                return None
-
-            self.packet_verified_repo.create(
+            self.stage(
+                self.packet_verified_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -394,7 +331,7 @@ class StargateHandler(BaseHandler):
                     "nonce": flattened_object["nonce"],
                     "receiver": event["receiver"],
                     "payload_hash": event["payloadHash"],
-                }
+                },
             )
             return event
         except Exception as e:
@@ -413,12 +350,8 @@ class StargateHandler(BaseHandler):
             if src_blockchain is None:
                 return None
 
-            if self.packet_received_repo.event_exists(
-                event["transaction_hash"],
-            ):
-                return None
-
-            self.packet_received_repo.create(
+            self.stage(
+                self.packet_received_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -427,7 +360,7 @@ class StargateHandler(BaseHandler):
                     "dst_address": event["dstAddress"],
                     "nonce": event["nonce"],
                     "payload_hash": event["payloadHash"],
-                }
+                },
             )
             return event
         except Exception as e:
@@ -440,13 +373,14 @@ class StargateHandler(BaseHandler):
     def handle_executor_fee_paid(self, blockchain, event):
         func_name = "handle_executor_fee_paid"
         try:
-            self.executor_fee_paid_repo.create(
+            self.stage(
+                self.executor_fee_paid_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
                     "executor": event["executor"],
                     "fee": str(event["fee"]),
-                }
+                },
             )
             return event
         except Exception as e:
@@ -467,14 +401,8 @@ class StargateHandler(BaseHandler):
             if dst_blockchain is None:
                 return None
 
-            if self.uln_config_set_repo.event_exists(
-                event["transaction_hash"],
-                dst_blockchain,
-                event["oapp"],
-            ):
-                return None
-
-            self.uln_config_set_repo.create(
+            self.stage(
+                self.uln_config_set_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -486,7 +414,7 @@ class StargateHandler(BaseHandler):
                     "optional_dvn_threshold": flattened_object["optionalDVNThreshold"],
                     "required_dvns": str(flattened_object["requiredDVNs"]),
                     "optional_dvns": str(flattened_object["optionalDVNs"]),
-                }
+                },
             )
             return event
         except Exception as e:
@@ -500,12 +428,8 @@ class StargateHandler(BaseHandler):
         func_name = "handle_payload_verified"
 
         try:
-            if self.payload_verified_repo.event_exists(
-                event["transaction_hash"],
-            ):
-                return None
-
-            self.payload_verified_repo.create(
+            self.stage(
+                self.payload_verified_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -513,7 +437,7 @@ class StargateHandler(BaseHandler):
                     "header": event["header"],
                     "confirmations": str(event["confirmations"]),
                     "proof_hash": event["proofHash"],
-                }
+                },
             )
             return event
         except Exception as e:
@@ -530,12 +454,13 @@ class StargateHandler(BaseHandler):
         try:
             total_fees = sum(fees)
 
-            self.dvn_fee_paid_repo.create(
+            self.stage(
+                self.dvn_fee_paid_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
                     "fee": total_fees,
-                }
+                },
             )
             return event
         except Exception as e:
@@ -553,14 +478,8 @@ class StargateHandler(BaseHandler):
             if dst_blockchain is None:
                 return None
 
-            if self.oft_sent_repo.event_exists(
-                event["transaction_hash"],
-                event["guid"],
-                event["amountReceivedLD"],
-            ):
-                return None
-
-            self.oft_sent_repo.create(
+            self.stage(
+                self.oft_sent_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -570,7 +489,7 @@ class StargateHandler(BaseHandler):
                     "from_address": event["fromAddress"],
                     "amount_sent_ld": event["amountSentLD"],
                     "amount_received_ld": event["amountReceivedLD"],
-                }
+                },
             )
             return event
         except Exception as e:
@@ -588,7 +507,8 @@ class StargateHandler(BaseHandler):
             if src_blockchain is None:
                 return None
 
-            self.oft_received_repo.create(
+            self.stage(
+                self.oft_received_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -597,7 +517,7 @@ class StargateHandler(BaseHandler):
                     "src_blockchain": src_blockchain,
                     "to_address": event["toAddress"].lower(),
                     "amount_received_ld": str(event["amountReceivedLD"]),
-                }
+                },
             )
             return event
         except Exception as e:
@@ -616,10 +536,8 @@ class StargateHandler(BaseHandler):
             if dst_blockchain is None:
                 return None
 
-            if self.oft_send_to_chain_repo.event_exists(event["transaction_hash"], dst_blockchain):
-                return None
-
-            self.oft_send_to_chain_repo.create(
+            self.stage(
+                self.oft_send_to_chain_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -628,7 +546,7 @@ class StargateHandler(BaseHandler):
                     "from_address": event["_from"],
                     "to_address": unpad_address(event["_toAddress"]),
                     "amount": str(event["_amount"]),
-                }
+                },
             )
             return event
         except Exception as e:
@@ -647,10 +565,8 @@ class StargateHandler(BaseHandler):
             if dst_blockchain is None:
                 return None
 
-            if self.oft_send_to_chain_repo.event_exists(event["transaction_hash"], dst_blockchain):
-                return None
-
-            self.oft_send_to_chain_repo.create(
+            self.stage(
+                self.oft_send_to_chain_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -659,7 +575,7 @@ class StargateHandler(BaseHandler):
                     "from_address": None,
                     "to_address": unpad_address(event["to"]),
                     "amount": str(event["qty"]),
-                }
+                },
             )
             return event
         except Exception as e:
@@ -678,13 +594,8 @@ class StargateHandler(BaseHandler):
             if src_blockchain is None:
                 return None
 
-            if self.oft_receive_from_chain_repo.event_exists(
-                event["transaction_hash"],
-                src_blockchain,
-            ):
-                return None
-
-            self.oft_receive_from_chain_repo.create(
+            self.stage(
+                self.oft_receive_from_chain_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -693,7 +604,7 @@ class StargateHandler(BaseHandler):
                     "to_address": event["_to"],
                     "nonce": None,
                     "amount": str(event["_amount"]),
-                }
+                },
             )
             return event
         except Exception as e:
@@ -712,13 +623,8 @@ class StargateHandler(BaseHandler):
             if src_blockchain is None:
                 return None
 
-            if self.oft_receive_from_chain_repo.event_exists(
-                event["transaction_hash"],
-                src_blockchain,
-            ):
-                return None
-
-            self.oft_receive_from_chain_repo.create(
+            self.stage(
+                self.oft_receive_from_chain_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -727,7 +633,7 @@ class StargateHandler(BaseHandler):
                     "to_address": None,
                     "nonce": event["nonce"],
                     "amount": str(event["_amount"]),
-                }
+                },
             )
             return event
         except Exception as e:
@@ -746,13 +652,8 @@ class StargateHandler(BaseHandler):
             if src_blockchain is None:
                 return None
 
-            if self.oft_receive_from_chain_repo.event_exists(
-                event["transaction_hash"],
-                src_blockchain,
-            ):
-                return None
-
-            self.oft_receive_from_chain_repo.create(
+            self.stage(
+                self.oft_receive_from_chain_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -761,7 +662,7 @@ class StargateHandler(BaseHandler):
                     "to_address": None,
                     "nonce": event["nonce"],
                     "amount": str(event["qty"]),
-                }
+                },
             )
             return event
         except Exception as e:
@@ -779,13 +680,8 @@ class StargateHandler(BaseHandler):
             if dst_blockchain is None:
                 return None
 
-            if self.bus_rode_repo.event_exists(
-                event["transaction_hash"],
-                event["ticketId"],
-            ):
-                return
-
-            self.bus_rode_repo.create(
+            self.stage(
+                self.bus_rode_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -793,7 +689,7 @@ class StargateHandler(BaseHandler):
                     "ticket_id": event["ticketId"],
                     "fare": str(event["fare"]),
                     "passenger": self.extract_address_from_passenger(event["passenger"]),
-                }
+                },
             )
             return event
         except Exception as e:
@@ -811,12 +707,8 @@ class StargateHandler(BaseHandler):
             if dst_blockchain is None:
                 return None
 
-            if self.bus_driven_repo.event_exists(
-                event["guid"],
-            ):
-                return
-
-            self.bus_driven_repo.create(
+            self.stage(
+                self.bus_driven_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -824,7 +716,7 @@ class StargateHandler(BaseHandler):
                     "start_ticket_id": event["startTicketId"],
                     "num_passengers": event["numPassengers"],
                     "guid": event["guid"],
-                }
+                },
             )
             return event
         except Exception as e:
@@ -842,7 +734,8 @@ class StargateHandler(BaseHandler):
             if dst_blockchain is None:
                 return None
 
-            self.swap_repo.create(
+            self.stage(
+                self.swap_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -855,7 +748,7 @@ class StargateHandler(BaseHandler):
                     "eq_fee": str(event["eqFee"]),
                     "protocol_fee": str(event["protocolFee"]),
                     "lp_fee": str(event["lpFee"]),
-                }
+                },
             )
             return event
         except Exception as e:
@@ -868,12 +761,8 @@ class StargateHandler(BaseHandler):
     def handle_swap_remote(self, blockchain, event):
         func_name = "handle_swap_remote"
         try:
-            if self.swap_remote_repo.event_exists(
-                event["transaction_hash"],
-            ):
-                return
-
-            self.swap_remote_repo.create(
+            self.stage(
+                self.swap_remote_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -882,7 +771,7 @@ class StargateHandler(BaseHandler):
                     "amount_sd": str(event["amountSD"]),
                     "protocol_fee": str(event["protocolFee"]),
                     "dst_fee": str(event["dstFee"]),
-                }
+                },
             )
             return event
         except Exception as e:
@@ -896,12 +785,8 @@ class StargateHandler(BaseHandler):
         func_name = "handle_compose_sent"
 
         try:
-            if self.compose_sent_repo.event_exists(
-                event["guid"],
-            ):
-                return
-
-            self.compose_sent_repo.create(
+            self.stage(
+                self.compose_sent_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -910,7 +795,7 @@ class StargateHandler(BaseHandler):
                     "guid": event["guid"],
                     "index": event["index"],
                     "message": event["message"],
-                }
+                },
             )
             return event
         except Exception as e:
@@ -924,12 +809,8 @@ class StargateHandler(BaseHandler):
         func_name = "handle_compose_delivered"
 
         try:
-            if self.compose_delivered_repo.event_exists(
-                event["guid"],
-            ):
-                return
-
-            self.compose_delivered_repo.create(
+            self.stage(
+                self.compose_delivered_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
@@ -937,7 +818,7 @@ class StargateHandler(BaseHandler):
                     "to_address": event["to"],
                     "guid": event["guid"],
                     "index": event["index"],
-                }
+                },
             )
             return event
         except Exception as e:
@@ -950,12 +831,13 @@ class StargateHandler(BaseHandler):
     def handle_verifier_fee(self, blockchain, event):
         func_name = "handle_verifier_fee"
         try:
-            self.verifier_fee_repo.create(
+            self.stage(
+                self.verifier_fee_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
                     "fee": str(event["fee"]),
-                }
+                },
             )
             return event
         except Exception as e:
@@ -969,12 +851,13 @@ class StargateHandler(BaseHandler):
         func_name = "handle_assign_job"
 
         try:
-            self.relayer_fee_repo.create(
+            self.stage(
+                self.relayer_fee_repo,
                 {
                     "blockchain": blockchain,
                     "transaction_hash": event["transaction_hash"],
                     "fee": str(event["totalFee"]),
-                }
+                },
             )
             return event
         except Exception as e:
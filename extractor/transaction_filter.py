@@ -0,0 +1,89 @@
+import hashlib
+import math
+import threading
+
+from config.constants import TRANSACTION_BLOOM_FILTER_ERROR_RATE
+
+
+class BloomFilter:
+    """
+    Bloom filter of strings, sized for an expected number of items and false positive rate. It
+    never answers False for an item added, and answers True for an item not added with about the
+    given probability.
+
+    Attributes:
+        num_bits (int): Number of bits of the filter.
+        num_hashes (int): Number of bits set for each item.
+        bits (bytearray): The bits of the filter.
+    """
+
+    def __init__(self, num_items: int, error_rate: float = TRANSACTION_BLOOM_FILTER_ERROR_RATE):
+        num_items = max(1, num_items)
+        self.num_bits = max(8, math.ceil(-num_items * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / num_items * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, item: str):
+        # double hashing: the positions are h1 + i * h2, from a single 128-bit digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item)
+        )
+
+
+class TransactionFilter:
+    """
+    Thread-safe, in-memory filter of the transactions already stored, shared by all threads of an
+    extractor, which answers existence checks without querying the DB whenever possible.
+
+    Attributes:
+        seen (set): Hashes known to be stored, either by this run or by previous ones.
+        bloom_filter (BloomFilter): Filter of the hashes stored before this run (within the
+            blockchain and block window extracted), or None if not loaded.
+    """
+
+    def __init__(self):
+        self.seen = set()
+        self.bloom_filter = None
+        self.lock = threading.Lock()
+
+    def load(self, num_hashes: int, hashes) -> None:
+        """Loads the Bloom filter with the hashes already stored."""
+        bloom_filter = BloomFilter(num_hashes)
+        for transaction_hash in hashes:
+            bloom_filter.add(transaction_hash)
+
+        self.bloom_filter = bloom_filter
+
+    def add(self, transaction_hashes) -> None:
+        with self.lock:
+            self.seen.update(transaction_hashes)
+
+    def exists(self, transaction_hash: str, lookup) -> bool:
+        """
+        Returns whether the transaction is stored. Only hashes neither seen nor ruled out by the
+        Bloom filter are looked up with `lookup` (e.g., a DB query).
+        """
+        with self.lock:
+            if transaction_hash in self.seen:
+                return True
+
+        if self.bloom_filter is not None and transaction_hash not in self.bloom_filter:
+            return False
+
+        if lookup(transaction_hash):
+            self.add([transaction_hash])
+            return True
+
+        return False
@@ -4,7 +4,8 @@ from sqlalchemy import text
 
 from config.constants import Bridge
 from generator.base_generator import BaseGenerator
-from generator.common.price_generator import PriceGenerator
+from generator.common.price_generator import PriceGenerator, UsdValue
+from generator.common.token_info_planner import TokenInfoPlanner
 from repository.across.repository import (
     AcrossBlockchainTransactionRepository,
     AcrossCrossChainTransactionRepository,
@@ -55,7 +56,7 @@ class AcrossGenerator(BaseGenerator):
         try:
             self.match_token_transfers()
 
-            start_ts = int(self.transactions_repo.get_min_timestamp()) - 86400
+            start_ts = self.get_start_timestamp()
             end_ts = int(self.transactions_repo.get_max_timestamp()) + 86400
 
             # POPULATE TOKEN TABLES WITH NATIVE TOKEN INFO
@@ -74,44 +75,30 @@ class AcrossGenerator(BaseGenerator):
             PriceGenerator.calculate_cctx_usd_values(
                 self.bridge,
                 self.across_cross_chain_token_transfers_repo,
-                "across_cross_chain_transactions",
-                "input_amount",
-                "src_blockchain",
-                "src_contract_address",
-                "src_timestamp",
-                "input_amount_usd",
-            )
-            PriceGenerator.calculate_cctx_usd_values(
-                self.bridge,
-                self.across_cross_chain_token_transfers_repo,
-                "across_cross_chain_transactions",
-                "output_amount",
-                "dst_blockchain",
-                "dst_contract_address",
-                "src_timestamp",
-                "output_amount_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.across_cross_chain_token_transfers_repo,
-                "across_cross_chain_transactions",
-                "src_timestamp",
-                "src_blockchain",
-                "src_fee",
-                "src_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.across_cross_chain_token_transfers_repo,
-                "across_cross_chain_transactions",
-                "dst_timestamp",
-                "dst_blockchain",
-                "dst_fee",
-                "dst_fee_usd",
+                [
+                    UsdValue(
+                        "input_amount_usd",
+                        "input_amount",
+                        "src_blockchain",
+                        "src_timestamp",
+                        "src_contract_address",
+                    ),
+                    UsdValue(
+                        "output_amount_usd",
+                        "output_amount",
+                        "dst_blockchain",
+                        "src_timestamp",
+                        "dst_contract_address",
+                    ),
+                    UsdValue("src_fee_usd", "src_fee", "src_blockchain", "src_timestamp"),
+                    UsdValue("dst_fee_usd", "dst_fee", "dst_blockchain", "dst_timestamp"),
+                ],
             )
 
             self.fix_token_symbol_clashes()
 
+            self.save_high_water_marks()
+
         except Exception as e:
             exception = CustomException(
                 self.CLASS_NAME,
@@ -126,10 +113,11 @@ class AcrossGenerator(BaseGenerator):
         start_time = time.time()
         log_to_cli(build_log_message_generator(self.bridge, "Matching token transfers..."))
 
-        self.across_cross_chain_token_transfers_repo.empty_table()
+        self.empty_cross_chain_table(self.across_cross_chain_token_transfers_repo)
+        new_events = self.new_events_condition("src_tx", "dst_tx")
 
         query = text(
-            """
+            f"""
             INSERT INTO across_cross_chain_transactions (src_blockchain,
                 src_transaction_hash,
                 src_from_address,
@@ -193,7 +181,8 @@ class AcrossGenerator(BaseGenerator):
             JOIN across_filled_v3_relay fill ON fill.deposit_id = deposit.deposit_id AND fill.output_amount = deposit.output_amount
             JOIN across_blockchain_transactions dst_tx ON dst_tx.transaction_hash = fill.transaction_hash
             WHERE deposit.destination_chain = dst_tx.blockchain
-            AND fill.src_chain = src_tx.blockchain;
+            AND fill.src_chain = src_tx.blockchain
+            AND {new_events};
         """  # noqa: E501
         )
 
@@ -224,18 +213,15 @@ class AcrossGenerator(BaseGenerator):
         start_time = time.time()
         log_to_cli(build_log_message_generator(self.bridge, "Fetching token prices..."))
 
+        planner = TokenInfoPlanner(self.bridge, self.token_metadata_repo, self.token_price_repo)
         for cctx in cctxs:
-            self.price_generator.populate_token_info(
-                self.bridge,
-                self.token_metadata_repo,
-                self.token_price_repo,
+            planner.add_pair(
                 cctx.src_blockchain,
                 cctx.dst_blockchain,
                 cctx.src_contract_address,
                 cctx.dst_contract_address,
-                start_ts,
-                end_ts,
             )
+        planner.run(start_ts, end_ts)
 
         end_time = time.time()
         log_to_cli(
@@ -1,12 +1,23 @@
 from abc import ABC, abstractmethod
 
+from sqlalchemy.dialects.postgresql import insert
+
 from generator.common.price_generator import PriceGenerator
+from repository.common.repository import GenerationCheckpointRepository
+from repository.database import DBSession
+from utils.utils import build_log_message_generator, log_to_cli
 
 
 class BaseGenerator(ABC):
     def __init__(self) -> None:
         self.bind_db_to_repos()
         self.price_generator = PriceGenerator()
+        self.generation_checkpoint_repo = GenerationCheckpointRepository(DBSession)
+
+        # latest timestamp of each blockchain matched by the last generation, or None to
+        # rebuild the cross-chain tables from scratch
+        self.high_water_marks = None
+        self.next_high_water_marks = {}
 
     @abstractmethod
     def bind_db_to_repos(self) -> None:
@@ -19,3 +30,95 @@ class BaseGenerator(ABC):
     @abstractmethod
     def populate_token_info_tables(self, cctxs, start_ts, end_ts) -> None:
         pass
+
+    def generate(self, since: bool = False) -> None:
+        """
+        Generates the cross-chain data of the bridge. With `since`, only the events of
+        transactions newer than the high-water marks of the last generation are matched (and
+        priced), and added to the existing cross-chain tables.
+        """
+        self.high_water_marks = None
+
+        if since:
+            self.high_water_marks = (
+                self.generation_checkpoint_repo.get_high_water_marks(self.bridge.value) or None
+            )
+
+            if self.high_water_marks is None:
+                log_to_cli(
+                    build_log_message_generator(
+                        self.bridge, "No previous generation found, generating from scratch..."
+                    )
+                )
+
+        # marks are taken before matching, such that transactions written in the meantime are
+        # matched by the next generation
+        self.next_high_water_marks = self.transactions_repo.get_max_timestamps()
+
+        self.generate_cross_chain_data()
+
+    def save_high_water_marks(self) -> None:
+        """Records the high-water marks of a generation, once it completed without errors."""
+        self.generation_checkpoint_repo.set_high_water_marks(
+            self.bridge.value, self.next_high_water_marks
+        )
+
+    def empty_cross_chain_table(self, repo) -> None:
+        """Empties a cross-chain table before matching, unless generating incrementally."""
+        if self.high_water_marks is None:
+            repo.empty_table()
+
+    def new_events_condition(self, *tx_aliases: str) -> str:
+        """
+        Returns a SQL condition selecting the matches of which any transaction (given by the
+        aliases of the transactions tables in the query) is newer than the high-water mark of
+        its blockchain. Any other match was already found by the last generation, since all of
+        its transactions were there.
+        """
+        if self.high_water_marks is None:
+            return "TRUE"
+
+        cases = " ".join(
+            f"WHEN '{blockchain}' THEN {timestamp}"
+            for blockchain, timestamp in sorted(self.high_water_marks.items())
+        )
+
+        conditions = [
+            f"{alias}.timestamp > CASE {alias}.blockchain {cases} ELSE -1 END"
+            for alias in tx_aliases
+        ]
+
+        return f"({' OR '.join(conditions)})"
+
+    def insert_cctxs(self, repo, query) -> None:
+        """
+        Writes the matches of a query (a select whose labels are the columns of the cross-chain
+        table of `repo`) with a single INSERT ... SELECT, such that they never leave the
+        database. When generating incrementally, a match whose primary key was already stored
+        (e.g., a transfer refunded since the last generation) replaces the stored row.
+        """
+        columns = [column.name for column in query.selected_columns]
+        statement = insert(repo.model).from_select(columns, query)
+
+        if self.high_water_marks is not None:
+            primary_key = [column.name for column in repo.model.__table__.primary_key]
+            statement = statement.on_conflict_do_update(
+                index_elements=primary_key,
+                set_={
+                    column: statement.excluded[column]
+                    for column in columns
+                    if column not in primary_key
+                },
+            )
+
+        with repo.get_session() as session:
+            session.execute(statement)
+
+    def get_start_timestamp(self) -> int:
+        """Returns the first timestamp whose token prices are needed by the generation."""
+        start_ts = int(self.transactions_repo.get_min_timestamp())
+
+        if self.high_water_marks is not None:
+            start_ts = max(start_ts, min(self.high_water_marks.values()))
+
+        return start_ts - 86400
@@ -4,7 +4,8 @@ from sqlalchemy import text
 
 from config.constants import Bridge
 from generator.base_generator import BaseGenerator
-from generator.common.price_generator import PriceGenerator
+from generator.common.price_generator import PriceGenerator, UsdValue
+from generator.common.token_info_planner import TokenInfoPlanner
 from repository.ccip.repository import (
     CCIPBlockchainTransactionRepository,
     CCIPCrossChainTransactionsRepository,
@@ -50,7 +51,7 @@ class CcipGenerator(BaseGenerator):
         try:
             self.match_cctxs()
 
-            start_ts = int(self.transactions_repo.get_min_timestamp()) - 86400
+            start_ts = self.get_start_timestamp()
             end_ts = int(self.transactions_repo.get_max_timestamp()) + 86400
 
             # POPULATE TOKEN TABLES WITH NATIVE TOKEN INFO
@@ -69,41 +70,27 @@ class CcipGenerator(BaseGenerator):
             PriceGenerator.calculate_cctx_usd_values(
                 self.bridge,
                 self.cross_chain_transactions_repo,
-                "ccip_cross_chain_transactions",
-                "amount",
-                "src_blockchain",
-                "src_contract_address",
-                "src_timestamp",
-                "amount_usd",
-            )
-            PriceGenerator.calculate_cctx_usd_values(
-                self.bridge,
-                self.cross_chain_transactions_repo,
-                "ccip_cross_chain_transactions",
-                "fee_token_amount",
-                "src_blockchain",
-                "fee_token",
-                "src_timestamp",
-                "fee_token_amount_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.cross_chain_transactions_repo,
-                "ccip_cross_chain_transactions",
-                "src_timestamp",
-                "src_blockchain",
-                "src_fee",
-                "src_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.cross_chain_transactions_repo,
-                "ccip_cross_chain_transactions",
-                "dst_timestamp",
-                "dst_blockchain",
-                "dst_fee",
-                "dst_fee_usd",
+                [
+                    UsdValue(
+                        "amount_usd",
+                        "amount",
+                        "src_blockchain",
+                        "src_timestamp",
+                        "src_contract_address",
+                    ),
+                    UsdValue(
+                        "fee_token_amount_usd",
+                        "fee_token_amount",
+                        "src_blockchain",
+                        "src_timestamp",
+                        "fee_token",
+                    ),
+                    UsdValue("src_fee_usd", "src_fee", "src_blockchain", "src_timestamp"),
+                    UsdValue("dst_fee_usd", "dst_fee", "dst_blockchain", "dst_timestamp"),
+                ],
             )
+
+            self.save_high_water_marks()
         except Exception as e:
             exception = CustomException(
                 self.CLASS_NAME,
@@ -120,10 +107,11 @@ class CcipGenerator(BaseGenerator):
             build_log_message_generator(self.bridge, "Matching cross-chain token transfers...")
         )
 
-        self.cross_chain_transactions_repo.empty_table()
+        self.empty_cross_chain_table(self.cross_chain_transactions_repo)
+        new_events = self.new_events_condition("src_tx", "dst_tx")
 
         query = text(
-            """
+            f"""
             INSERT INTO ccip_cross_chain_transactions (
                 src_blockchain,
                 src_transaction_hash,
@@ -177,7 +165,8 @@ class CcipGenerator(BaseGenerator):
             JOIN ccip_blockchain_transactions src_tx ON deposit.transaction_hash = src_tx.transaction_hash
             JOIN ccip_execution_state_changed fill ON fill.message_id = deposit.message_id AND fill.sequence_number = deposit.sequence_number
             JOIN ccip_blockchain_transactions dst_tx ON dst_tx.transaction_hash = fill.transaction_hash
-            WHERE deposit.input_token is not NULL;
+            WHERE deposit.input_token is not NULL
+            AND {new_events};
         """  # noqa: E501
         )
 
@@ -208,18 +197,15 @@ class CcipGenerator(BaseGenerator):
         start_time = time.time()
         log_to_cli(build_log_message_generator(self.bridge, "Fetching token prices..."))
 
+        planner = TokenInfoPlanner(self.bridge, self.token_metadata_repo, self.token_price_repo)
         for cctx in cctxs:
-            self.price_generator.populate_token_info(
-                self.bridge,
-                self.token_metadata_repo,
-                self.token_price_repo,
+            planner.add_pair(
                 cctx.src_blockchain,
                 None,
                 cctx.src_contract_address,
                 None,
-                start_ts,
-                end_ts,
             )
+        planner.run(start_ts, end_ts)
 
         end_time = time.time()
         log_to_cli(
@@ -4,7 +4,8 @@ from sqlalchemy import text
 
 from config.constants import Bridge
 from generator.base_generator import BaseGenerator
-from generator.common.price_generator import PriceGenerator
+from generator.common.price_generator import PriceGenerator, UsdValue
+from generator.common.token_info_planner import TokenInfoPlanner
 from repository.cctp.repository import (
     CCTPBlockchainTransactionRepository,
     CctpCrossChainTransactionsRepository,
@@ -51,7 +52,7 @@ class CctpGenerator(BaseGenerator):
         try:
             self.match_token_transfers()
 
-            start_ts = int(self.transactions_repo.get_min_timestamp()) - 86400
+            start_ts = self.get_start_timestamp()
             end_ts = int(self.transactions_repo.get_max_timestamp()) + 86400
 
             # POPULATE TOKEN TABLES WITH NATIVE TOKEN INFO
@@ -70,32 +71,21 @@ class CctpGenerator(BaseGenerator):
             PriceGenerator.calculate_cctx_usd_values(
                 self.bridge,
                 self.cctp_cross_chain_token_transfers_repo,
-                "cctp_cross_chain_transactions",
-                "amount",
-                "src_blockchain",
-                "src_contract_address",
-                "src_timestamp",
-                "amount_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.cctp_cross_chain_token_transfers_repo,
-                "cctp_cross_chain_transactions",
-                "src_timestamp",
-                "src_blockchain",
-                "src_fee",
-                "src_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.cctp_cross_chain_token_transfers_repo,
-                "cctp_cross_chain_transactions",
-                "dst_timestamp",
-                "dst_blockchain",
-                "dst_fee",
-                "dst_fee_usd",
+                [
+                    UsdValue(
+                        "amount_usd",
+                        "amount",
+                        "src_blockchain",
+                        "src_timestamp",
+                        "src_contract_address",
+                    ),
+                    UsdValue("src_fee_usd", "src_fee", "src_blockchain", "src_timestamp"),
+                    UsdValue("dst_fee_usd", "dst_fee", "dst_blockchain", "dst_timestamp"),
+                ],
             )
 
+            self.save_high_water_marks()
+
         except Exception as e:
             exception = CustomException(
                 self.CLASS_NAME,
@@ -110,10 +100,11 @@ class CctpGenerator(BaseGenerator):
         start_time = time.time()
         log_to_cli(build_log_message_generator(self.bridge, "Matching token transfers..."))
 
-        self.cctp_cross_chain_token_transfers_repo.empty_table()
+        self.empty_cross_chain_table(self.cctp_cross_chain_token_transfers_repo)
+        new_events = self.new_events_condition("src_tx", "dst_tx")
 
         query = text(
-            """
+            f"""
             INSERT INTO cctp_cross_chain_transactions (
                 src_blockchain,
                 src_transaction_hash,
@@ -165,7 +156,8 @@ class CctpGenerator(BaseGenerator):
             AND deposit.burn_token = fill.input_token
             AND deposit.depositor = fill.depositor
             AND deposit.recipient = fill.recipient
-            AND deposit.burn_token = fill.input_token;
+            AND deposit.burn_token = fill.input_token
+            AND {new_events};
         """  # noqa: E501
         )
 
@@ -196,18 +188,15 @@ class CctpGenerator(BaseGenerator):
         start_time = time.time()
         log_to_cli(build_log_message_generator(self.bridge, "Fetching token prices..."))
 
+        planner = TokenInfoPlanner(self.bridge, self.token_metadata_repo, self.token_price_repo)
         for cctx in cctxs:
-            self.price_generator.populate_token_info(
-                self.bridge,
-                self.token_metadata_repo,
-                self.token_price_repo,
+            planner.add_pair(
                 cctx.src_blockchain if "src_blockchain" not in cctx else None,
                 None,
                 cctx.src_contract_address if "src_contract_address" not in cctx else None,
                 None,
-                start_ts,
-                end_ts,
             )
+        planner.run(start_ts, end_ts)
 
         end_time = time.time()
         log_to_cli(
@@ -1,5 +1,6 @@
 import time
 from datetime import datetime, timedelta
+from typing import NamedTuple
 
 from sqlalchemy import text
 
@@ -10,22 +11,36 @@ from repository.common.repository import (
     TokenPriceRepository,
 )
 from rpcs.alchemy_client import AlchemyClient
+from rpcs.token_info_cache import token_info_cache
 from utils.utils import (
     CliColor,
     CustomException,
     build_log_message_generator,
     get_blockchain_native_token_symbol,
-    log_error,
     log_to_cli,
 )
 
 
+class UsdValue(NamedTuple):
+    """
+    A USD column of a cross-chain table: the amount in `amount_field` of the token whose contract
+    is in `contract_address_field` (or of the native token of the blockchain, if None), at the
+    price of the token on the day of `timestamp_field`. Several values of the same USD column are
+    tried in order, until one of them has a price.
+    """
+
+    usd_field: str
+    amount_field: str
+    blockchain_field: str
+    timestamp_field: str
+    contract_address_field: str = None
+
+
 class PriceGenerator:
     CLASS_NAME = "PriceGenerator"
 
     def __init__(self):
-        self.pairs_tried_price = {}  # {blockchain: [token_contracts, ...]}
-        self.pairs_tried_metadata = {}  # {blockchain: [token_contracts, ...]}
+        self.tokens_tried_metadata = set()  # {(blockchain, token_contract), ...}
 
     def populate_native_tokens(
         self,
@@ -134,182 +149,6 @@ class PriceGenerator:
                 f"Error while populating native tokens: {str(e)}",
             ) from e
 
-    def populate_token_info(
-        self,
-        bridge: str,
-        token_metadata_repo: TokenMetadataRepository,
-        token_price_repo: TokenPriceRepository,
-        src_blockchain: str,
-        dst_blockchain: str,
-        input_token: str,
-        output_token: str,
-        start_ts: str,
-        end_ts: str,
-        # src_contract_address and dst_contract_address exist to store the contract being used in
-        # the bridge that is not the token itself (e.g. a liquidity pool based on the token)
-        src_contract_address: str = None,
-        dst_contract_address: str = None,
-    ):
-        try:
-            token_symbol = None
-            token_name = None
-
-            src_token_metadata = token_metadata_repo.get_token_metadata_by_contract_and_blockchain(
-                src_contract_address if src_contract_address is not None else input_token,
-                src_blockchain,
-            )
-            dst_token_metadata = token_metadata_repo.get_token_metadata_by_contract_and_blockchain(
-                dst_contract_address if dst_contract_address is not None else output_token,
-                dst_blockchain,
-            )
-
-            if input_token is None:
-                # in this case, there is no token recorded in the cctx, therefore we cannot fetch
-                # the token metadata
-                pass
-            else:
-                if src_token_metadata is None:
-                    metadata = self.fetch_and_store_token_metadata(
-                        bridge,
-                        token_metadata_repo,
-                        src_blockchain,
-                        input_token,
-                        src_contract_address,
-                    )
-
-                    if not (metadata is None or "symbol" not in metadata or "name" not in metadata):
-                        token_symbol = metadata["symbol"]
-                        token_name = metadata["name"]
-
-                elif dst_token_metadata is not None:
-                    token_symbol = src_token_metadata.symbol
-                    token_name = src_token_metadata.name
-
-                # check if we have already fetched the token prices for this symbol
-                if token_symbol is not None and token_name is not None:
-                    completed, dates = PriceGenerator.is_token_price_complete(
-                        token_price_repo, start_ts, end_ts, token_symbol, token_name
-                    )
-
-                    if not completed and not self.has_tried_price_fetching_for_contract(
-                        src_blockchain, input_token
-                    ):
-                        if dates is None:
-                            PriceGenerator.fetch_and_store_token_prices(
-                                bridge,
-                                token_price_repo,
-                                start_ts,
-                                end_ts,
-                                name=token_name,
-                                symbol=token_symbol,
-                                blockchain=src_blockchain,
-                                token_address=input_token,
-                            )
-                        else:
-                            for [_start_ts, _end_ts] in dates:
-                                PriceGenerator.fetch_and_store_token_prices(
-                                    bridge,
-                                    token_price_repo,
-                                    _start_ts,
-                                    _end_ts,
-                                    name=token_name,
-                                    symbol=token_symbol,
-                                    blockchain=src_blockchain,
-                                    token_address=input_token,
-                                )
-
-                        self.update_pairs_tried_price_fetching(src_blockchain, input_token)
-
-            if output_token is None:
-                # in this case, there is no token recorded in the cctx, therefore we cannot fetch
-                # the token metadata
-                pass
-            else:
-                if dst_token_metadata is None:
-                    metadata = self.fetch_and_store_token_metadata(
-                        bridge,
-                        token_metadata_repo,
-                        dst_blockchain,
-                        output_token,
-                        dst_contract_address,
-                    )
-                    if metadata is None or "symbol" not in metadata or "name" not in metadata:
-                        return
-
-                    token_symbol = metadata["symbol"]
-                    token_name = metadata["name"]
-                else:
-                    metadata = token_metadata_repo.get_token_metadata_by_contract_and_blockchain(
-                        output_token,
-                        dst_blockchain,
-                    )
-
-                    if metadata is None or not metadata.symbol or not metadata.name:
-                        return
-
-                    token_symbol = metadata.symbol
-                    token_name = metadata.name
-
-                if token_symbol is None or token_name is None:
-                    # if the token symbol or name is None, we cannot fetch the prices
-                    # for this token
-
-                    log_to_cli(
-                        build_log_message_generator(
-                            bridge,
-                            f"Token metadata for {input_token} ({src_blockchain}) or "
-                            f"{output_token} ({dst_blockchain}) is missing. "
-                            "Skipping price fetching.",
-                        ),
-                        CliColor.INFO,
-                    )
-                    return
-
-                # check if we have already fetched the token prices for this symbol
-                completed, dates = PriceGenerator.is_token_price_complete(
-                    token_price_repo, start_ts, end_ts, token_symbol, token_name
-                )
-
-                if not completed and not self.has_tried_price_fetching_for_contract(
-                    dst_blockchain, output_token
-                ):
-                    if dates is None:
-                        PriceGenerator.fetch_and_store_token_prices(
-                            bridge,
-                            token_price_repo,
-                            start_ts,
-                            end_ts,
-                            name=token_name,
-                            symbol=token_symbol,
-                            blockchain=dst_blockchain,
-                            token_address=output_token,
-                        )
-                    else:
-                        for [_start_ts, _end_ts] in dates:
-                            PriceGenerator.fetch_and_store_token_prices(
-                                bridge,
-                                token_price_repo,
-                                _start_ts,
-                                _end_ts,
-                                name=token_name,
-                                symbol=token_symbol,
-                                blockchain=dst_blockchain,
-                                token_address=output_token,
-                            )
-
-                    self.update_pairs_tried_price_fetching(dst_blockchain, output_token)
-        except Exception as e:
-            exception = CustomException(
-                self.CLASS_NAME,
-                "populate_token_info",
-                (
-                    f"Error while populating token info for {input_token} ({src_blockchain}) and "
-                    f"{output_token} ({dst_blockchain}): {str(e)}",
-                ),
-            )
-
-            log_error(bridge, exception)
-
     def fetch_and_store_token_metadata(
         self,
         bridge: str,
@@ -324,7 +163,7 @@ class PriceGenerator:
             if blockchain == "solana":
                 return None  # Alchemy does not support Solana
 
-            if self.has_tried_metadata_fetching_for_contract(blockchain, token_contract):
+            if (blockchain, token_contract) in self.tokens_tried_metadata:
                 return None
 
             log_to_cli(
@@ -335,18 +174,16 @@ class PriceGenerator:
                 CliColor.INFO,
             )
 
-            metadata = AlchemyClient.get_token_metadata(blockchain, token_contract)
+            metadata = PriceGenerator.fetch_token_metadata(blockchain, token_contract)
 
-            if metadata is None or "symbol" not in metadata or "name" not in metadata:
+            if metadata is None:
                 return None
 
-            metadata["symbol"] = metadata["symbol"].upper()
-
             token_metadata_repo.create(
                 {
                     "symbol": metadata["symbol"],
                     "name": metadata["name"],
-                    "decimals": metadata["decimals"] if metadata["decimals"] else 1,
+                    "decimals": metadata["decimals"],
                     "blockchain": blockchain,
                     "address": token_contract if contract_address is None else contract_address,
                 }
@@ -356,7 +193,30 @@ class PriceGenerator:
         except Exception:
             return None
         finally:
-            self.update_pairs_tried_metadata_fetching(blockchain, token_contract)
+            self.tokens_tried_metadata.add((blockchain, token_contract))
+
+    def fetch_token_metadata(blockchain: str, token_contract: str):
+        """
+        Returns the symbol (uppercase), name and decimals of a token, or None if Alchemy has no
+        metadata for it. The metadata is read from the token info cache, or fetched and cached.
+        """
+        cached, metadata = token_info_cache.get_metadata(blockchain, token_contract)
+
+        if not cached:
+            metadata = AlchemyClient.get_token_metadata(blockchain, token_contract)
+
+            if metadata is None or metadata.get("symbol") is None or "name" not in metadata:
+                metadata = None
+            else:
+                metadata = {
+                    "symbol": metadata["symbol"].upper(),
+                    "name": metadata["name"],
+                    "decimals": metadata["decimals"] if metadata.get("decimals") else 1,
+                }
+
+            token_info_cache.put_metadata(blockchain, token_contract, metadata)
+
+        return metadata
 
     def fetch_and_store_token_prices(
         bridge: str,
@@ -368,12 +228,79 @@ class PriceGenerator:
         blockchain: str = None,
         token_address: str = None,
     ):
+        rows = PriceGenerator.fetch_token_prices(
+            bridge, start_ts, end_ts, name, symbol, blockchain, token_address
+        )
+
+        if len(rows) > 0:
+            token_price_repo.create_all(rows)
+
+    def fetch_token_prices(
+        bridge: str,
+        start_ts: int,
+        end_ts: int,
+        name: str,
+        symbol: str = None,
+        blockchain: str = None,
+        token_address: str = None,
+    ) -> list:
+        """
+        Returns the daily prices of a token between two timestamps, as token_price rows. Days
+        found in the token info cache are not fetched again, and the days fetched are cached.
+        """
         if blockchain == "solana":
-            return None  # Alchemy does not support Solana
+            return []  # Alchemy does not support Solana
 
         if symbol is None or name is None:
-            return
+            return []
+
+        start_day = datetime.fromtimestamp(start_ts).date()
+        end_day = datetime.fromtimestamp(end_ts).date()
+        prices = token_info_cache.get_prices(symbol, name, start_day, end_day)
 
+        missing_days = [
+            start_day + timedelta(days=i)
+            for i in range((end_day - start_day).days + 1)
+            if start_day + timedelta(days=i) not in prices
+        ]
+
+        if len(missing_days) > 0:
+            # the days between the first and the last missing days are fetched at once
+            fetched_prices = PriceGenerator.request_token_prices(
+                bridge,
+                max(start_ts, int(time.mktime(missing_days[0].timetuple()))),
+                min(end_ts, int(time.mktime(missing_days[-1].timetuple())) + 86399),
+                symbol,
+                blockchain,
+                token_address,
+            )
+
+            if fetched_prices is not None:
+                # days without a price are cached as misses
+                missing_prices = {day: fetched_prices.get(day) for day in missing_days}
+                token_info_cache.put_prices(symbol, name, missing_prices)
+                prices.update(missing_prices)
+
+        return [
+            {
+                "symbol": symbol,
+                "name": name,
+                "date": day,
+                "price_usd": price_usd,
+            }
+            for day, price_usd in sorted(prices.items())
+            if price_usd is not None
+        ]
+
+    def request_token_prices(
+        bridge: str,
+        start_ts: int,
+        end_ts: int,
+        symbol: str,
+        blockchain: str = None,
+        token_address: str = None,
+    ) -> dict:
+        """Fetches the daily prices of a token by day, or returns None if the request failed."""
         log_to_cli(
             build_log_message_generator(
                 bridge,
@@ -383,23 +310,14 @@ class PriceGenerator:
         )
 
         if "usd" in symbol.lower() or "dai" in symbol.lower() or "frax" in symbol.lower():
-            rows = []
+            prices = {}
             current_ts = start_ts
             one_day = 86400  # seconds in a day
             while current_ts <= end_ts:
-                date = datetime.fromtimestamp(current_ts)
-                rows.append(
-                    {
-                        "symbol": symbol,
-                        "name": name,
-                        "date": date,
-                        "price_usd": 1.0,
-                    }
-                )
+                prices[datetime.fromtimestamp(current_ts).date()] = 1.0
                 current_ts += one_day
 
-            token_price_repo.create_all(rows)
-            return
+            return prices
 
         if blockchain is None and token_address is None:
             token_prices = AlchemyClient.get_token_prices_by_symbol_or_address(
@@ -410,84 +328,74 @@ class PriceGenerator:
                 bridge, start_ts, end_ts, blockchain=blockchain, token_address=token_address
             )
 
-        if token_prices is None or "data" not in token_prices:
-            return
+        if token_prices is None:
+            return None
 
-        rows = []
-        for pair in token_prices["data"]:
+        prices = {}
+        for pair in token_prices.get("data", []):
             date_struct = time.strptime(pair["timestamp"], "%Y-%m-%dT%H:%M:%SZ")
-            date = datetime.fromtimestamp(time.mktime(date_struct))
+            prices[datetime.fromtimestamp(time.mktime(date_struct)).date()] = pair["value"]
 
-            rows.append(
-                {
-                    "symbol": symbol,
-                    "name": name,
-                    "date": date,
-                    "price_usd": pair["value"],
-                }
-            )
-
-        token_price_repo.create_all(rows)
+        return prices
 
     def is_token_price_complete(
         token_price_repo: TokenPriceRepository, start_ts: str, end_ts: str, symbol: str, name: str
     ):
-        days_diff = (
-            datetime.fromtimestamp(end_ts).date() - datetime.fromtimestamp(start_ts).date()
-        ).days + 1  # inclusive of start and end dates
         db_data = token_price_repo.get_count_datapoints_for_symbol_and_name_between_dates(
             symbol, name, start_ts, end_ts
         )
 
         if db_data == 0 or db_data is None:
             return False, None
-        elif db_data == days_diff:
-            return True, None
-        else:
-            dates = []
-            min_date_stored = token_price_repo.get_min_date_for_symbol_and_name(symbol, name)
-            max_date_stored = token_price_repo.get_max_date_for_symbol_and_name(symbol, name)
 
-            # calculate difference between the start_ts (unix) and the min_date_stored (sql date)
-            start_ts_diff = min_date_stored - datetime.fromtimestamp(start_ts).date()
-            start_ts_diff = start_ts_diff.days
+        dates = PriceGenerator.get_missing_price_ranges(
+            start_ts,
+            end_ts,
+            db_data,
+            token_price_repo.get_min_date_for_symbol_and_name(symbol, name),
+            token_price_repo.get_max_date_for_symbol_and_name(symbol, name),
+        )
 
-            if start_ts_diff > 0:
-                dates.append([start_ts, int(time.mktime((min_date_stored).timetuple()))])
+        if dates == []:
+            return True, None
+        if dates == [[start_ts, end_ts]]:
+            return False, None
 
-            # calculate difference between the end_ts (unix) and the max_date_stored (sql date)
-            end_ts_diff = datetime.fromtimestamp(end_ts).date() - max_date_stored
-            end_ts_diff = end_ts_diff.days
+        return False, dates
 
-            if end_ts_diff > 0:
-                dates.append([int(time.mktime((max_date_stored).timetuple())), end_ts])
+    def get_missing_price_ranges(
+        start_ts: int, end_ts: int, count: int, min_date_stored, max_date_stored
+    ) -> list:
+        """
+        Returns the [start_ts, end_ts] ranges whose prices are missing, given the number of prices
+        stored between `start_ts` and `end_ts` and the first and last dates of all prices stored.
+        """
+        days_diff = (
+            datetime.fromtimestamp(end_ts).date() - datetime.fromtimestamp(start_ts).date()
+        ).days + 1  # inclusive of start and end dates
 
-            if dates == []:
-                return True, None
+        if not count:
+            return [[start_ts, end_ts]]
+        elif count == days_diff:
+            return []
 
-        return False, dates
+        dates = []
 
-    def update_pairs_tried_metadata_fetching(self, blockchain, contract):
-        if blockchain in self.pairs_tried_metadata:
-            self.pairs_tried_metadata[blockchain].append(contract)
-        else:
-            self.pairs_tried_metadata[blockchain] = [contract]
+        # calculate difference between the start_ts (unix) and the min_date_stored (sql date)
+        start_ts_diff = min_date_stored - datetime.fromtimestamp(start_ts).date()
+        start_ts_diff = start_ts_diff.days
 
-    def has_tried_metadata_fetching_for_contract(self, blockchain, contract):
-        if blockchain not in self.pairs_tried_metadata:
-            return False
-        return contract in self.pairs_tried_metadata[blockchain]
+        if start_ts_diff > 0:
+            dates.append([start_ts, int(time.mktime((min_date_stored).timetuple()))])
 
-    def update_pairs_tried_price_fetching(self, blockchain, contract):
-        if blockchain in self.pairs_tried_price:
-            self.pairs_tried_price[blockchain].append(contract)
-        else:
-            self.pairs_tried_price[blockchain] = [contract]
+        # calculate difference between the end_ts (unix) and the max_date_stored (sql date)
+        end_ts_diff = datetime.fromtimestamp(end_ts).date() - max_date_stored
+        end_ts_diff = end_ts_diff.days
+
+        if end_ts_diff > 0:
+            dates.append([int(time.mktime((max_date_stored).timetuple())), end_ts])
 
-    def has_tried_price_fetching_for_contract(self, blockchain, contract):
-        if blockchain not in self.pairs_tried_price:
-            return False
-        return contract in self.pairs_tried_price[blockchain]
+        return dates
 
     def create_null_token_prices(token_price_repo, start_ts, end_ts):
         """used to populate token prices for unmapped tokens with invalid symbols"""
@@ -516,114 +424,138 @@ class PriceGenerator:
 
         token_price_repo.create_all(rows)
 
-    def calculate_cctx_usd_values(
-        bridge: str,
-        cctx_repo,
-        table_name: str,
-        amount_field_name: str,
-        blockchain_field_name: str,
-        contract_address_field_name: str,
-        timestamp_field_name: str,
-        usd_value_field_name: str,
-    ):
-        func_name = "calculate_cctx_usd_values"
-
-        start_time = time.time()
-        log_to_cli(
-            build_log_message_generator(
-                bridge,
-                f"Calculating USD values for {amount_field_name} in {table_name}...",
-            ),
-            CliColor.INFO,
-        )
-
-        query = text(
-            f"""
-                UPDATE {table_name} cctx
-                SET {usd_value_field_name} = token_price.price_usd * cctx.{amount_field_name} / power(10, token_metadata.decimals)
-                FROM token_metadata
-                JOIN token_price
-                    ON token_metadata.symbol = token_price.symbol
-                WHERE lower(cctx.{contract_address_field_name}) = lower(token_metadata.address)
-                AND cctx.{blockchain_field_name} = token_metadata.blockchain
-                AND CAST(TO_TIMESTAMP(cctx.{timestamp_field_name}) AS DATE) = token_price.date;
-            """  # noqa: E501
-        )
+    def build_cctx_usd_values_query(table_name: str, primary_key: list, usd_values: list):
+        """
+        Builds the statement calculating the USD values of a cross-chain table in a single pass.
+        Prices are joined from lookups of the daily price and decimals of each token (by
+        blockchain, lowercase address and date) and of each native token (by blockchain and
+        date), which are built once for all columns. Columns valued by earlier generations are
+        left as they are, such that incremental generations only value the rows they added.
+        """
+        # a single join per distinct price (e.g., all fees paid in the native token of the source
+        # blockchain share the same price)
+        joins = {}
+        values = {}
+
+        for usd_value in usd_values:
+            join_key = (
+                usd_value.blockchain_field,
+                usd_value.timestamp_field,
+                usd_value.contract_address_field,
+            )
+            alias = joins.setdefault(join_key, f"price_{len(joins)}")
+            values.setdefault(usd_value.usd_field, []).append(
+                f"{alias}.price_usd * cctx.{usd_value.amount_field} / power(10, {alias}.decimals)"
+            )
 
-        try:
-            cctx_repo.execute(query)
+        lookups = []
+        if any(contract_address_field is not None for _, _, contract_address_field in joins):
+            lookups.append(
+                """
+                token_price_lookup AS MATERIALIZED (
+                    SELECT DISTINCT ON (token_metadata.blockchain, lower(token_metadata.address), token_price.date)
+                        token_metadata.blockchain,
+                        lower(token_metadata.address) AS address,
+                        token_price.date,
+                        token_price.price_usd,
+                        token_metadata.decimals
+                    FROM token_metadata
+                    JOIN token_price
+                        ON token_metadata.symbol = token_price.symbol
+                )"""  # noqa: E501
+            )
+        if any(contract_address_field is None for _, _, contract_address_field in joins):
+            lookups.append(
+                """
+                native_price_lookup AS MATERIALIZED (
+                    SELECT DISTINCT ON (token_metadata.blockchain, token_price.date)
+                        token_metadata.blockchain,
+                        token_price.date,
+                        token_price.price_usd,
+                        token_metadata.decimals
+                    FROM token_metadata
+                    JOIN token_price
+                        ON token_metadata.symbol = token_price.symbol
+                        AND token_metadata.name = token_price.name
+                    WHERE token_metadata.address = '0x0000000000000000000000000000000000000000'
+                )"""
+            )
 
-            total_value = cctx_repo.get_total_amount_usd_transacted()
+        price_joins = []
+        for (blockchain_field, timestamp_field, contract_address_field), alias in joins.items():
+            condition = (
+                f"{alias}.blockchain = cctx.{blockchain_field} "
+                f"AND {alias}.date = CAST(TO_TIMESTAMP(cctx.{timestamp_field}) AS DATE)"
+            )
 
-            formatted_total_value = "${:,.2f}".format(total_value) if total_value else "$0.00"
+            if contract_address_field is None:
+                price_joins.append(f"LEFT JOIN native_price_lookup {alias} ON {condition}")
+            else:
+                price_joins.append(
+                    f"LEFT JOIN token_price_lookup {alias} ON {condition} "
+                    f"AND {alias}.address = lower(cctx.{contract_address_field})"
+                )
 
-            end_time = time.time()
-            log_to_cli(
-                build_log_message_generator(
-                    bridge,
-                    (
-                        f"Calculated USD values for {table_name} in {end_time - start_time} seconds"
-                        f". Total value: {formatted_total_value}",
-                    ),
-                ),
-                CliColor.SUCCESS,
+        # in order of preference, e.g., the destination token and then the source token
+        usd_columns = [
+            f"COALESCE({', '.join(expressions)}) AS {usd_field}"
+            for usd_field, expressions in values.items()
+        ]
+        updates = [
+            f"{usd_field} = COALESCE(cctx.{usd_field}, usd_values.{usd_field})"
+            for usd_field in values
+        ]
+        columns = [f"cctx.{column}" for column in primary_key] + usd_columns
+        missing = [f"cctx.{usd_field} IS NULL" for usd_field in values]
+        same_row = [f"cctx.{column} = usd_values.{column}" for column in primary_key]
+
+        return f"""
+            WITH {", ".join(lookups)},
+            usd_values AS (
+                SELECT {", ".join(columns)}
+                FROM {table_name} cctx
+                {" ".join(price_joins)}
+                WHERE {" OR ".join(missing)}
             )
-        except Exception as e:
-            raise CustomException(
-                PriceGenerator.CLASS_NAME,
-                func_name,
-                f"Error processing USD values for {amount_field_name} in {table_name}. Error: {e}",
-            ) from e
+            UPDATE {table_name} cctx
+            SET {", ".join(updates)}
+            FROM usd_values
+            WHERE {" AND ".join(same_row)};
+        """
 
-    def calculate_cctx_native_usd_values(
-        bridge: str,
-        cctx_repo,
-        table_name: str,
-        timestamp_field_name: str,
-        blockchain_field_name: str,
-        fee_field_name: str,
-        usd_fee_field_name: str,
-    ):
-        func_name = "calculate_cctx_native_usd_values"
+    def calculate_cctx_usd_values(bridge: str, cctx_repo, usd_values: list):
+        func_name = "calculate_cctx_usd_values"
+
+        table = cctx_repo.model.__table__
+        table_name = table.name
 
         start_time = time.time()
         log_to_cli(
             build_log_message_generator(
                 bridge,
-                f"Calculating USD values for {fee_field_name} in {table_name}...",
+                f"Calculating USD values for {table_name}...",
             ),
             CliColor.INFO,
         )
 
         query = text(
-            f"""
-            UPDATE {table_name} cctx
-            SET {usd_fee_field_name} = token_price.price_usd * cctx.{fee_field_name} / power(10, token_metadata.decimals)
-            FROM token_metadata
-            JOIN token_price
-                ON token_metadata.symbol = token_price.symbol 
-                AND token_metadata.name = token_price.name
-            WHERE
-                token_metadata.address = '0x0000000000000000000000000000000000000000'
-                AND cctx.{blockchain_field_name} = token_metadata.blockchain
-                AND CAST(TO_TIMESTAMP(cctx.{timestamp_field_name}) AS DATE) = token_price.date;
-        """  # noqa: E501
+            PriceGenerator.build_cctx_usd_values_query(
+                table_name, [column.name for column in table.primary_key], usd_values
+            )
         )
 
         try:
             cctx_repo.execute(query)
 
             end_time = time.time()
-            log_to_cli(
-                build_log_message_generator(
-                    bridge,
-                    (
-                        f"Calculating USD values for {fee_field_name} in {table_name}... "
-                        f"Completed in {end_time - start_time} seconds.",
-                    ),
-                ),
-                CliColor.SUCCESS,
-            )
+            message = f"Calculated USD values for {table_name} in {end_time - start_time} seconds"
+
+            if any(usd_value.contract_address_field is not None for usd_value in usd_values):
+                total_value = cctx_repo.get_total_amount_usd_transacted()
+                formatted_total_value = "${:,.2f}".format(total_value) if total_value else "$0.00"
+                message += f". Total value: {formatted_total_value}"
+
+            log_to_cli(build_log_message_generator(bridge, message), CliColor.SUCCESS)
         except Exception as e:
             raise CustomException(
                 PriceGenerator.CLASS_NAME,
@@ -0,0 +1,198 @@
+import concurrent.futures
+from functools import partial
+
+from config.constants import ALCHEMY_MAX_WORKERS, Bridge
+from generator.common.price_generator import PriceGenerator
+from repository.common.repository import TokenMetadataRepository, TokenPriceRepository
+from utils.utils import (
+    CliColor,
+    CustomException,
+    build_log_message_generator,
+    log_error,
+    log_to_cli,
+)
+
+
+class TokenInfoPlanner:
+    """
+    Fetches the metadata and daily prices of the tokens of a bridge's cross-chain tables. Tokens
+    are collected first (from every table), such that each token's metadata and each (symbol,
+    name)'s prices are only fetched once. Stored metadata and prices are then loaded with a
+    single query each, whatever is missing is read from the token info cache or fetched
+    concurrently from Alchemy (under its rate limit, see AlchemyClient.post), and the results are
+    written in bulk.
+
+    Attributes:
+        bridge (Bridge): The bridge whose tokens are fetched.
+        tokens (dict): Mapping of (blockchain, address) to the token contract to fetch, where
+            the address is that of the contract used by the bridge (e.g., a liquidity pool
+            based on the token), if any, or else the token itself.
+    """
+
+    CLASS_NAME = "TokenInfoPlanner"
+
+    def __init__(
+        self,
+        bridge: Bridge,
+        token_metadata_repo: TokenMetadataRepository,
+        token_price_repo: TokenPriceRepository,
+    ):
+        self.bridge = bridge
+        self.token_metadata_repo = token_metadata_repo
+        self.token_price_repo = token_price_repo
+        self.tokens = {}
+
+    def add(self, blockchain: str, token: str, contract_address: str = None) -> None:
+        if blockchain is None or token is None:
+            # there is no token recorded in the cctx, therefore we cannot fetch its metadata
+            return
+
+        address = contract_address if contract_address is not None else token
+        self.tokens.setdefault((blockchain, address), token)
+
+    def add_pair(
+        self,
+        src_blockchain: str,
+        dst_blockchain: str,
+        input_token: str,
+        output_token: str,
+        src_contract_address: str = None,
+        dst_contract_address: str = None,
+    ) -> None:
+        self.add(src_blockchain, input_token, src_contract_address)
+        self.add(dst_blockchain, output_token, dst_contract_address)
+
+    def run(self, start_ts: int, end_ts: int) -> None:
+        symbols = self.populate_token_metadata()
+        self.populate_token_prices(symbols, start_ts, end_ts)
+
+    def run_concurrently(self, jobs: dict) -> dict:
+        """Runs jobs (a mapping of key to callable), returning the results of those succeeding."""
+        results = {}
+
+        if len(jobs) == 0:
+            return results
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=ALCHEMY_MAX_WORKERS, thread_name_prefix="alchemy"
+        ) as executor:
+            futures = {executor.submit(job): key for key, job in jobs.items()}
+
+            for future in concurrent.futures.as_completed(futures):
+                key = futures[future]
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    log_error(
+                        self.bridge,
+                        CustomException(
+                            self.CLASS_NAME,
+                            "run_concurrently",
+                            f"Error fetching token info for {key}: {e}",
+                        ),
+                    )
+
+        return results
+
+    def populate_token_metadata(self) -> dict:
+        """
+        Fetches the metadata of the tokens not stored yet. Returns the (symbol, name) of every
+        token whose metadata is known, by (blockchain, address).
+        """
+        symbols = {}
+        for metadata in self.token_metadata_repo.get_all():
+            symbols.setdefault(
+                (metadata.blockchain, metadata.address), (metadata.symbol, metadata.name)
+            )
+
+        jobs = {
+            (blockchain, address): partial(PriceGenerator.fetch_token_metadata, blockchain, token)
+            for (blockchain, address), token in self.tokens.items()
+            # Alchemy does not support Solana
+            if (blockchain, address) not in symbols and blockchain != "solana"
+        }
+
+        if len(jobs) > 0:
+            log_to_cli(
+                build_log_message_generator(
+                    self.bridge, f"Fetching metadata of {len(jobs)} tokens..."
+                ),
+                CliColor.INFO,
+            )
+
+        rows = []
+        for (blockchain, address), metadata in self.run_concurrently(jobs).items():
+            if metadata is None:
+                continue
+
+            rows.append({**metadata, "blockchain": blockchain, "address": address})
+            symbols[(blockchain, address)] = (metadata["symbol"], metadata["name"])
+
+        if len(rows) > 0:
+            self.token_metadata_repo.create_all(rows)
+
+        return symbols
+
+    def populate_token_prices(self, symbols: dict, start_ts: int, end_ts: int) -> None:
+        """Fetches the prices missing between two timestamps of the (symbol, name) of each token."""
+        # the prices of a (symbol, name) are fetched by the contract of its first token
+        tokens = {}
+        for (blockchain, address), token in self.tokens.items():
+            symbol, name = symbols.get((blockchain, address), (None, None))
+
+            # Alchemy does not support Solana
+            if symbol and name and blockchain != "solana":
+                tokens.setdefault((symbol, name), (blockchain, token))
+
+        if len(tokens) == 0:
+            return
+
+        coverage = self.token_price_repo.get_price_coverage(
+            list({symbol for symbol, _ in tokens}), start_ts, end_ts
+        )
+
+        jobs = {}
+        for (symbol, name), (blockchain, token) in tokens.items():
+            count, min_date, max_date = coverage.get((symbol, name), (0, None, None))
+
+            for _start_ts, _end_ts in PriceGenerator.get_missing_price_ranges(
+                start_ts, end_ts, count, min_date, max_date
+            ):
+                jobs[(symbol, name, _start_ts, _end_ts)] = partial(
+                    PriceGenerator.fetch_token_prices,
+                    self.bridge,
+                    _start_ts,
+                    _end_ts,
+                    name,
+                    symbol,
+                    blockchain,
+                    token,
+                )
+
+        if len(jobs) > 0:
+            log_to_cli(
+                build_log_message_generator(
+                    self.bridge, f"Fetching {len(jobs)} price ranges of {len(tokens)} tokens..."
+                ),
+                CliColor.INFO,
+            )
+
+        rows = [
+            row
+            for (symbol, name, _, _), prices in self.run_concurrently(jobs).items()
+            for row in prices
+            # prices read from the cache may include days already stored
+            if not self.is_stored(coverage.get((symbol, name)), row["date"])
+        ]
+
+        if len(rows) > 0:
+            self.token_price_repo.create_all(rows)
+
+    @staticmethod
+    def is_stored(coverage: tuple, day) -> bool:
+        """Whether the price of a day is stored, i.e., within the first and last stored dates."""
+        if coverage is None or not coverage[0]:
+            return False
+
+        _, min_date, max_date = coverage
+        return min_date <= day <= max_date
@@ -1,11 +1,12 @@
 import time
 
-from sqlalchemy import case, literal, text, update
+from sqlalchemy import case, literal, select, text, update
 from sqlalchemy.orm import aliased
 
 from config.constants import Bridge
 from generator.base_generator import BaseGenerator
-from generator.common.price_generator import PriceGenerator
+from generator.common.price_generator import PriceGenerator, UsdValue
+from generator.common.token_info_planner import TokenInfoPlanner
 from repository.common.models import TokenMetadata
 from repository.common.repository import (
     NativeTokenRepository,
@@ -64,7 +65,7 @@ class DebridgeGenerator(BaseGenerator):
             self.match_evm_to_all_cctxs()
             self.match_sol_to_evm_cctxs()
 
-            start_ts = int(self.transactions_repo.get_min_timestamp()) - 86400
+            start_ts = self.get_start_timestamp()
             end_ts = int(self.transactions_repo.get_max_timestamp()) + 86400
 
             ## POPULATE TOKEN TABLES WITH NATIVE TOKEN INFO
@@ -89,100 +90,61 @@ class DebridgeGenerator(BaseGenerator):
             PriceGenerator.calculate_cctx_usd_values(
                 self.bridge,
                 self.debridge_cross_chain_transactions_repo,
-                "debridge_cross_chain_transactions",
-                "input_amount",
-                "src_blockchain",
-                "src_contract_address",
-                "src_timestamp",
-                "input_amount_usd",
-            )
-            PriceGenerator.calculate_cctx_usd_values(
-                self.bridge,
-                self.debridge_cross_chain_transactions_repo,
-                "debridge_cross_chain_transactions",
-                "output_amount",
-                "dst_blockchain",
-                "dst_contract_address",
-                "dst_timestamp",
-                "output_amount_usd",
-            )
-            PriceGenerator.calculate_cctx_usd_values(
-                self.bridge,
-                self.debridge_cross_chain_transactions_repo,
-                "debridge_cross_chain_transactions",
-                "refund_amount",
-                "src_blockchain",
-                "src_contract_address",
-                "src_timestamp",
-                "refund_amount_usd",
-            )
-            PriceGenerator.calculate_cctx_usd_values(
-                self.bridge,
-                self.debridge_cross_chain_transactions_repo,
-                "debridge_cross_chain_transactions",
-                "middle_src_amount",
-                "src_blockchain",
-                "middle_src_token",
-                "src_timestamp",
-                "middle_src_amount_usd",
-            )
-            PriceGenerator.calculate_cctx_usd_values(
-                self.bridge,
-                self.debridge_cross_chain_transactions_repo,
-                "debridge_cross_chain_transactions",
-                "middle_dst_amount",
-                "dst_blockchain",
-                "middle_dst_token",
-                "dst_timestamp",
-                "middle_dst_amount_usd",
-            )
-            PriceGenerator.calculate_cctx_usd_values(
-                self.bridge,
-                self.debridge_cross_chain_transactions_repo,
-                "debridge_cross_chain_transactions",
-                "percent_fee",
-                "src_blockchain",
-                "middle_src_token",
-                "src_timestamp",
-                "percent_fee_usd",
+                [
+                    UsdValue(
+                        "input_amount_usd",
+                        "input_amount",
+                        "src_blockchain",
+                        "src_timestamp",
+                        "src_contract_address",
+                    ),
+                    UsdValue(
+                        "output_amount_usd",
+                        "output_amount",
+                        "dst_blockchain",
+                        "dst_timestamp",
+                        "dst_contract_address",
+                    ),
+                    UsdValue(
+                        "refund_amount_usd",
+                        "refund_amount",
+                        "src_blockchain",
+                        "src_timestamp",
+                        "src_contract_address",
+                    ),
+                    UsdValue(
+                        "middle_src_amount_usd",
+                        "middle_src_amount",
+                        "src_blockchain",
+                        "src_timestamp",
+                        "middle_src_token",
+                    ),
+                    UsdValue(
+                        "middle_dst_amount_usd",
+                        "middle_dst_amount",
+                        "dst_blockchain",
+                        "dst_timestamp",
+                        "middle_dst_token",
+                    ),
+                    UsdValue(
+                        "percent_fee_usd",
+                        "percent_fee",
+                        "src_blockchain",
+                        "src_timestamp",
+                        "middle_src_token",
+                    ),
+                    UsdValue("src_fee_usd", "src_fee", "src_blockchain", "src_timestamp"),
+                    UsdValue("dst_fee_usd", "dst_fee", "dst_blockchain", "dst_timestamp"),
+                    UsdValue(
+                        "refund_fee_usd", "refund_fee", "refund_blockchain", "refund_timestamp"
+                    ),
+                    UsdValue(
+                        "native_fix_fee_usd", "native_fix_fee", "src_blockchain", "src_timestamp"
+                    ),
+                ],
             )
 
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.debridge_cross_chain_transactions_repo,
-                "debridge_cross_chain_transactions",
-                "src_timestamp",
-                "src_blockchain",
-                "src_fee",
-                "src_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.debridge_cross_chain_transactions_repo,
-                "debridge_cross_chain_transactions",
-                "dst_timestamp",
-                "dst_blockchain",
-                "dst_fee",
-                "dst_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.debridge_cross_chain_transactions_repo,
-                "debridge_cross_chain_transactions",
-                "refund_timestamp",
-                "refund_blockchain",
-                "refund_fee",
-                "refund_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.debridge_cross_chain_transactions_repo,
-                "debridge_cross_chain_transactions",
-                "src_timestamp",
-                "src_blockchain",
-                "native_fix_fee",
-                "native_fix_fee_usd",
-            )
+            self.save_high_water_marks()
 
         except Exception as e:
             exception = CustomException(
@@ -202,99 +164,91 @@ class DebridgeGenerator(BaseGenerator):
             )
         )
 
-        self.debridge_cross_chain_transactions_repo.empty_table()
+        self.empty_cross_chain_table(self.debridge_cross_chain_transactions_repo)
 
         try:
-            results = []
-
-            SrcTx = aliased(DeBridgeBlockchainTransaction)
-            DstTx = aliased(DeBridgeBlockchainTransaction)
-            RefundTx = aliased(DeBridgeBlockchainTransaction)
-
-            with self.debridge_cross_chain_transactions_repo.get_session() as session:
-                # Merge CreatedOrder with BlockchainTransaction by transaction_hash
-                results = (
-                    session.query(
-                        SrcTx.blockchain.label("src_blockchain"),
-                        SrcTx.transaction_hash.label("src_transaction_hash"),
-                        SrcTx.from_address.label("src_from_address"),
-                        SrcTx.to_address.label("src_to_address"),
-                        SrcTx.fee.label("src_fee"),
-                        literal(None).label("src_fee_usd"),
-                        SrcTx.value.label("src_value"),
-                        SrcTx.timestamp.label("src_timestamp"),
-                        DstTx.blockchain.label("dst_blockchain"),
-                        DstTx.transaction_hash.label("dst_transaction_hash"),
-                        case(
-                            (DstTx.blockchain == "solana", DeBridgeFulfilledOrder.taker),  # noqa: E711 DO NOT REPLACE != WITH 'IS NOT'
-                            else_=DstTx.from_address,
-                        ).label("dst_from_address"),
-                        case(
-                            (
-                                DstTx.blockchain == "solana",
-                                "dst5MGcFPoBeREFAA5E3tU5ij8m5uVYwkzkSAbsLbNo",
-                            ),  # noqa: E711 DO NOT REPLACE != WITH 'IS NOT'
-                            else_=DstTx.to_address,
-                        ).label("dst_to_address"),
-                        DstTx.fee.label("dst_fee"),
-                        literal(None).label("dst_fee_usd"),
-                        DstTx.value.label("dst_value"),
-                        DstTx.timestamp.label("dst_timestamp"),
-                        RefundTx.blockchain.label("refund_blockchain"),
-                        RefundTx.transaction_hash.label("refund_transaction_hash"),
-                        RefundTx.from_address.label("refund_from_address"),
-                        RefundTx.to_address.label("refund_to_address"),
-                        RefundTx.fee.label("refund_fee"),
-                        literal(None).label("refund_fee_usd"),
-                        RefundTx.value.label("refund_value"),
-                        RefundTx.timestamp.label("refund_timestamp"),
-                        DeBridgeCreatedOrder.order_id.label("intent_id"),
-                        DeBridgeCreatedOrder.maker_src.label("depositor"),
-                        DeBridgeFulfilledOrder.receiver_dst.label("recipient"),
-                        DeBridgeFulfilledOrder.give_token_address.label("src_contract_address"),
-                        DeBridgeFulfilledOrder.take_token_address.label("dst_contract_address"),
-                        DeBridgeCreatedOrder.original_amount.label("input_amount"),
-                        literal(None).label("input_amount_usd"),
-                        DeBridgeCreatedOrder.give_token_address.label("middle_src_token"),
-                        DeBridgeCreatedOrder.give_amount.label("middle_src_amount"),
-                        literal(None).label("middle_src_amount_usd"),
-                        DeBridgeFulfilledOrder.middle_dst_token.label("middle_dst_token"),
-                        DeBridgeFulfilledOrder.middle_dst_amount.label("middle_dst_amount"),
-                        literal(None).label("middle_dst_amount_usd"),
-                        DeBridgeFulfilledOrder.take_amount.label("output_amount"),
-                        literal(None).label("output_amount_usd"),
-                        DeBridgeClaimedUnlock.give_amount.label("refund_amount"),
-                        literal(None).label("refund_amount_usd"),
-                        DeBridgeClaimedUnlock.give_token_address.label("refund_token"),
-                        DeBridgeCreatedOrder.native_fix_fee.label("native_fix_fee"),
-                        literal(None).label("native_fix_fee_usd"),
-                        DeBridgeCreatedOrder.percent_fee.label("percent_fee"),
-                        literal(None).label("percent_fee_usd"),
-                    )
-                    .join(SrcTx, DeBridgeCreatedOrder.transaction_hash == SrcTx.transaction_hash)
-                    .join(
-                        DeBridgeFulfilledOrder,
-                        DeBridgeCreatedOrder.order_id == DeBridgeFulfilledOrder.order_id,
-                    )
-                    .join(DstTx, DeBridgeFulfilledOrder.transaction_hash == DstTx.transaction_hash)
-                    .outerjoin(
-                        DeBridgeClaimedUnlock,
-                        DeBridgeCreatedOrder.order_id == DeBridgeClaimedUnlock.order_id,
-                    )
-                    .outerjoin(
-                        RefundTx,
-                        DeBridgeClaimedUnlock.transaction_hash == RefundTx.transaction_hash,
-                    )
-                    .filter(SrcTx.blockchain != "solana")
-                    .all()
+            SrcTx = aliased(DeBridgeBlockchainTransaction, name="src_tx")
+            DstTx = aliased(DeBridgeBlockchainTransaction, name="dst_tx")
+            RefundTx = aliased(DeBridgeBlockchainTransaction, name="refund_tx")
+
+            # Merge CreatedOrder with BlockchainTransaction by transaction_hash
+            query = (
+                select(
+                    SrcTx.blockchain.label("src_blockchain"),
+                    SrcTx.transaction_hash.label("src_transaction_hash"),
+                    SrcTx.from_address.label("src_from_address"),
+                    SrcTx.to_address.label("src_to_address"),
+                    SrcTx.fee.label("src_fee"),
+                    literal(None).label("src_fee_usd"),
+                    SrcTx.value.label("src_value"),
+                    SrcTx.timestamp.label("src_timestamp"),
+                    DstTx.blockchain.label("dst_blockchain"),
+                    DstTx.transaction_hash.label("dst_transaction_hash"),
+                    case(
+                        (DstTx.blockchain == "solana", DeBridgeFulfilledOrder.taker),  # noqa: E711 DO NOT REPLACE != WITH 'IS NOT'
+                        else_=DstTx.from_address,
+                    ).label("dst_from_address"),
+                    case(
+                        (
+                            DstTx.blockchain == "solana",
+                            "dst5MGcFPoBeREFAA5E3tU5ij8m5uVYwkzkSAbsLbNo",
+                        ),  # noqa: E711 DO NOT REPLACE != WITH 'IS NOT'
+                        else_=DstTx.to_address,
+                    ).label("dst_to_address"),
+                    DstTx.fee.label("dst_fee"),
+                    literal(None).label("dst_fee_usd"),
+                    DstTx.value.label("dst_value"),
+                    DstTx.timestamp.label("dst_timestamp"),
+                    RefundTx.blockchain.label("refund_blockchain"),
+                    RefundTx.transaction_hash.label("refund_transaction_hash"),
+                    RefundTx.from_address.label("refund_from_address"),
+                    RefundTx.to_address.label("refund_to_address"),
+                    RefundTx.fee.label("refund_fee"),
+                    literal(None).label("refund_fee_usd"),
+                    RefundTx.value.label("refund_value"),
+                    RefundTx.timestamp.label("refund_timestamp"),
+                    DeBridgeCreatedOrder.order_id.label("intent_id"),
+                    DeBridgeCreatedOrder.maker_src.label("depositor"),
+                    DeBridgeFulfilledOrder.receiver_dst.label("recipient"),
+                    DeBridgeFulfilledOrder.give_token_address.label("src_contract_address"),
+                    DeBridgeFulfilledOrder.take_token_address.label("dst_contract_address"),
+                    DeBridgeCreatedOrder.original_amount.label("input_amount"),
+                    literal(None).label("input_amount_usd"),
+                    DeBridgeCreatedOrder.give_token_address.label("middle_src_token"),
+                    DeBridgeCreatedOrder.give_amount.label("middle_src_amount"),
+                    literal(None).label("middle_src_amount_usd"),
+                    DeBridgeFulfilledOrder.middle_dst_token.label("middle_dst_token"),
+                    DeBridgeFulfilledOrder.middle_dst_amount.label("middle_dst_amount"),
+                    literal(None).label("middle_dst_amount_usd"),
+                    DeBridgeFulfilledOrder.take_amount.label("output_amount"),
+                    literal(None).label("output_amount_usd"),
+                    DeBridgeClaimedUnlock.give_amount.label("refund_amount"),
+                    literal(None).label("refund_amount_usd"),
+                    DeBridgeClaimedUnlock.give_token_address.label("refund_token"),
+                    DeBridgeCreatedOrder.native_fix_fee.label("native_fix_fee"),
+                    literal(None).label("native_fix_fee_usd"),
+                    DeBridgeCreatedOrder.percent_fee.label("percent_fee"),
+                    literal(None).label("percent_fee_usd"),
                 )
+                .join(SrcTx, DeBridgeCreatedOrder.transaction_hash == SrcTx.transaction_hash)
+                .join(
+                    DeBridgeFulfilledOrder,
+                    DeBridgeCreatedOrder.order_id == DeBridgeFulfilledOrder.order_id,
+                )
+                .join(DstTx, DeBridgeFulfilledOrder.transaction_hash == DstTx.transaction_hash)
+                .outerjoin(
+                    DeBridgeClaimedUnlock,
+                    DeBridgeCreatedOrder.order_id == DeBridgeClaimedUnlock.order_id,
+                )
+                .outerjoin(
+                    RefundTx,
+                    DeBridgeClaimedUnlock.transaction_hash == RefundTx.transaction_hash,
+                )
+                .filter(SrcTx.blockchain != "solana")
+                .filter(text(self.new_events_condition("src_tx", "dst_tx", "refund_tx")))
+            )
 
-                cctxs = []
-
-                for row in results:
-                    cctxs.append(row._asdict())
-
-                self.debridge_cross_chain_transactions_repo.create_all(cctxs)
+            self.insert_cctxs(self.debridge_cross_chain_transactions_repo, query)
 
             size = self.debridge_cross_chain_transactions_repo.get_number_of_records()
 
@@ -327,95 +281,85 @@ class DebridgeGenerator(BaseGenerator):
         )
 
         try:
-            results = []
-
-            SrcTx = aliased(DeBridgeBlockchainTransaction)
-            DstTx = aliased(DeBridgeBlockchainTransaction)
-            RefundTx = aliased(DeBridgeBlockchainTransaction)
-
-            with self.debridge_cross_chain_transactions_repo.get_session() as session:
-                results = (
-                    session.query(
-                        SrcTx.blockchain.label("src_blockchain"),
-                        SrcTx.transaction_hash.label("src_transaction_hash"),
-                        DeBridgeCreatedOrder.maker_src.label("src_from_address"),
-                        literal("src5qyZHqTqecJV4aY6Cb6zDZLMDzrDKKezs22MPHr4").label(
-                            "src_to_address"
+            SrcTx = aliased(DeBridgeBlockchainTransaction, name="src_tx")
+            DstTx = aliased(DeBridgeBlockchainTransaction, name="dst_tx")
+            RefundTx = aliased(DeBridgeBlockchainTransaction, name="refund_tx")
+
+            query = (
+                select(
+                    SrcTx.blockchain.label("src_blockchain"),
+                    SrcTx.transaction_hash.label("src_transaction_hash"),
+                    DeBridgeCreatedOrder.maker_src.label("src_from_address"),
+                    literal("src5qyZHqTqecJV4aY6Cb6zDZLMDzrDKKezs22MPHr4").label("src_to_address"),
+                    SrcTx.fee.label("src_fee"),
+                    literal(None).label("src_fee_usd"),
+                    SrcTx.value.label("src_value"),
+                    SrcTx.timestamp.label("src_timestamp"),
+                    DstTx.blockchain.label("dst_blockchain"),
+                    DstTx.transaction_hash.label("dst_transaction_hash"),
+                    DstTx.from_address.label("dst_from_address"),
+                    DstTx.to_address.label("dst_to_address"),
+                    DstTx.fee.label("dst_fee"),
+                    literal(None).label("dst_fee_usd"),
+                    DstTx.value.label("dst_value"),
+                    DstTx.timestamp.label("dst_timestamp"),
+                    RefundTx.blockchain.label("refund_blockchain"),
+                    RefundTx.transaction_hash.label("refund_transaction_hash"),
+                    RefundTx.from_address.label("refund_from_address"),
+                    RefundTx.to_address.label("refund_to_address"),
+                    RefundTx.fee.label("refund_fee"),
+                    literal(None).label("refund_fee_usd"),
+                    RefundTx.value.label("refund_value"),
+                    RefundTx.timestamp.label("refund_timestamp"),
+                    DeBridgeFulfilledOrder.order_id.label("intent_id"),
+                    DeBridgeCreatedOrder.maker_src.label("depositor"),
+                    DeBridgeCreatedOrder.receiver_dst.label("recipient"),
+                    DeBridgeCreatedOrder.give_token_address.label("src_contract_address"),
+                    DeBridgeCreatedOrder.take_token_address.label("dst_contract_address"),
+                    DeBridgeCreatedOrder.original_amount.label("input_amount"),
+                    literal(None).label("input_amount_usd"),
+                    DeBridgeCreatedOrder.give_token_address.label("middle_src_token"),
+                    DeBridgeCreatedOrder.give_amount.label("middle_src_amount"),
+                    literal(None).label("middle_src_amount_usd"),
+                    DeBridgeFulfilledOrder.middle_dst_token.label("middle_dst_token"),
+                    DeBridgeFulfilledOrder.middle_dst_amount.label("middle_dst_amount"),
+                    literal(None).label("middle_dst_amount_usd"),
+                    DeBridgeFulfilledOrder.take_amount.label("output_amount"),
+                    literal(None).label("output_amount_usd"),
+                    DeBridgeClaimedUnlock.give_amount.label("refund_amount"),
+                    literal(None).label("refund_amount_usd"),
+                    DeBridgeClaimedUnlock.give_token_address.label("refund_token"),
+                    DeBridgeCreatedOrder.native_fix_fee.label("native_fix_fee"),
+                    literal(None).label("native_fix_fee_usd"),
+                    case(
+                        (
+                            SrcTx.blockchain == "solana",
+                            literal(0),
                         ),
-                        SrcTx.fee.label("src_fee"),
-                        literal(None).label("src_fee_usd"),
-                        SrcTx.value.label("src_value"),
-                        SrcTx.timestamp.label("src_timestamp"),
-                        DstTx.blockchain.label("dst_blockchain"),
-                        DstTx.transaction_hash.label("dst_transaction_hash"),
-                        DstTx.from_address.label("dst_from_address"),
-                        DstTx.to_address.label("dst_to_address"),
-                        DstTx.fee.label("dst_fee"),
-                        literal(None).label("dst_fee_usd"),
-                        DstTx.value.label("dst_value"),
-                        DstTx.timestamp.label("dst_timestamp"),
-                        RefundTx.blockchain.label("refund_blockchain"),
-                        RefundTx.transaction_hash.label("refund_transaction_hash"),
-                        RefundTx.from_address.label("refund_from_address"),
-                        RefundTx.to_address.label("refund_to_address"),
-                        RefundTx.fee.label("refund_fee"),
-                        literal(None).label("refund_fee_usd"),
-                        RefundTx.value.label("refund_value"),
-                        RefundTx.timestamp.label("refund_timestamp"),
-                        DeBridgeFulfilledOrder.order_id.label("intent_id"),
-                        DeBridgeCreatedOrder.maker_src.label("depositor"),
-                        DeBridgeCreatedOrder.receiver_dst.label("recipient"),
-                        DeBridgeCreatedOrder.give_token_address.label("src_contract_address"),
-                        DeBridgeCreatedOrder.take_token_address.label("dst_contract_address"),
-                        DeBridgeCreatedOrder.original_amount.label("input_amount"),
-                        literal(None).label("input_amount_usd"),
-                        DeBridgeCreatedOrder.give_token_address.label("middle_src_token"),
-                        DeBridgeCreatedOrder.give_amount.label("middle_src_amount"),
-                        literal(None).label("middle_src_amount_usd"),
-                        DeBridgeFulfilledOrder.middle_dst_token.label("middle_dst_token"),
-                        DeBridgeFulfilledOrder.middle_dst_amount.label("middle_dst_amount"),
-                        literal(None).label("middle_dst_amount_usd"),
-                        DeBridgeFulfilledOrder.take_amount.label("output_amount"),
-                        literal(None).label("output_amount_usd"),
-                        DeBridgeClaimedUnlock.give_amount.label("refund_amount"),
-                        literal(None).label("refund_amount_usd"),
-                        DeBridgeClaimedUnlock.give_token_address.label("refund_token"),
-                        DeBridgeCreatedOrder.native_fix_fee.label("native_fix_fee"),
-                        literal(None).label("native_fix_fee_usd"),
-                        case(
-                            (
-                                SrcTx.blockchain == "solana",
-                                literal(0),
-                            ),
-                            else_=DeBridgeCreatedOrder.percent_fee,
-                        ).label("percent_fee"),
-                        literal(None).label("percent_fee_usd"),
-                    )
-                    .join(SrcTx, DeBridgeCreatedOrder.transaction_hash == SrcTx.transaction_hash)
-                    .join(
-                        DeBridgeFulfilledOrder,
-                        DeBridgeCreatedOrder.maker_order_nonce
-                        == DeBridgeFulfilledOrder.maker_order_nonce,
-                    )
-                    .join(DstTx, DeBridgeFulfilledOrder.transaction_hash == DstTx.transaction_hash)
-                    .outerjoin(
-                        DeBridgeClaimedUnlock,
-                        DeBridgeFulfilledOrder.order_id == DeBridgeClaimedUnlock.order_id,
-                    )
-                    .outerjoin(
-                        RefundTx,
-                        DeBridgeClaimedUnlock.transaction_hash == RefundTx.transaction_hash,
-                    )
-                    .filter(SrcTx.blockchain == "solana")
-                    .all()
+                        else_=DeBridgeCreatedOrder.percent_fee,
+                    ).label("percent_fee"),
+                    literal(None).label("percent_fee_usd"),
                 )
+                .join(SrcTx, DeBridgeCreatedOrder.transaction_hash == SrcTx.transaction_hash)
+                .join(
+                    DeBridgeFulfilledOrder,
+                    DeBridgeCreatedOrder.maker_order_nonce
+                    == DeBridgeFulfilledOrder.maker_order_nonce,
+                )
+                .join(DstTx, DeBridgeFulfilledOrder.transaction_hash == DstTx.transaction_hash)
+                .outerjoin(
+                    DeBridgeClaimedUnlock,
+                    DeBridgeFulfilledOrder.order_id == DeBridgeClaimedUnlock.order_id,
+                )
+                .outerjoin(
+                    RefundTx,
+                    DeBridgeClaimedUnlock.transaction_hash == RefundTx.transaction_hash,
+                )
+                .filter(SrcTx.blockchain == "solana")
+                .filter(text(self.new_events_condition("src_tx", "dst_tx", "refund_tx")))
+            )
 
-                cctxs = []
-
-                for row in results:
-                    cctxs.append(row._asdict())
-
-                self.debridge_cross_chain_transactions_repo.create_all(cctxs)
+            self.insert_cctxs(self.debridge_cross_chain_transactions_repo, query)
 
             size = self.debridge_cross_chain_transactions_repo.get_number_of_records()
 
@@ -489,18 +433,15 @@ class DebridgeGenerator(BaseGenerator):
         start_time = time.time()
         log_to_cli(build_log_message_generator(self.bridge, "Fetching token prices..."))
 
+        planner = TokenInfoPlanner(self.bridge, self.token_metadata_repo, self.token_price_repo)
         for cctx in cctxs:
-            self.price_generator.populate_token_info(
-                self.bridge,
-                self.token_metadata_repo,
-                self.token_price_repo,
+            planner.add_pair(
                 cctx.src_blockchain,
                 cctx.dst_blockchain,
                 cctx.src_contract_address,
                 cctx.dst_contract_address,
-                start_ts,
-                end_ts,
             )
+        planner.run(start_ts, end_ts)
 
         end_time = time.time()
         log_to_cli(
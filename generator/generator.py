@@ -25,7 +25,7 @@ class Generator:
                 self.CLASS_NAME, func_name, f"Bridge {bridge_name} not supported"
             ) from e
 
-    def generate_data(self):
+    def generate_data(self, since: bool = False):
         """Main generation logic."""
 
-        self.generator.generate_cross_chain_data()
+        self.generator.generate(since)
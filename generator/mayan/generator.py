@@ -1,11 +1,12 @@
 import time
 
-from sqlalchemy import case, func, literal, literal_column, update
+from sqlalchemy import case, func, literal, literal_column, select, text, union_all, update
 from sqlalchemy.orm import aliased
 
 from config.constants import Bridge
 from generator.base_generator import BaseGenerator
-from generator.common.price_generator import PriceGenerator
+from generator.common.price_generator import PriceGenerator, UsdValue
+from generator.common.token_info_planner import TokenInfoPlanner
 from repository.common.models import TokenMetadata
 from repository.common.repository import (
     NativeTokenRepository,
@@ -65,7 +66,7 @@ class MayanGenerator(BaseGenerator):
             self.match_evm_to_sol()
             self.match_evm_to_evm()
 
-            start_ts = int(self.transactions_repo.get_min_timestamp()) - 86400
+            start_ts = self.get_start_timestamp()
             end_ts = int(self.transactions_repo.get_max_timestamp()) + 86400
 
             # POPULATE TOKEN TABLES WITH NATIVE TOKEN INFO
@@ -88,94 +89,61 @@ class MayanGenerator(BaseGenerator):
             PriceGenerator.calculate_cctx_usd_values(
                 self.bridge,
                 self.cross_chain_transactions_repo,
-                "mayan_cross_chain_transactions",
-                "input_amount",
-                "src_blockchain",
-                "src_contract_address",
-                "src_timestamp",
-                "input_amount_usd",
-            )
-            PriceGenerator.calculate_cctx_usd_values(
-                self.bridge,
-                self.cross_chain_transactions_repo,
-                "mayan_cross_chain_transactions",
-                "output_amount",
-                "dst_blockchain",
-                "dst_contract_address",
-                "dst_timestamp",
-                "output_amount_usd",
-            )
-            PriceGenerator.calculate_cctx_usd_values(
-                self.bridge,
-                self.cross_chain_transactions_repo,
-                "mayan_cross_chain_transactions",
-                "refund_amount",
-                "src_blockchain",
-                "src_contract_address",
-                "src_timestamp",
-                "refund_amount_usd",
-            )
-            PriceGenerator.calculate_cctx_usd_values(
-                self.bridge,
-                self.cross_chain_transactions_repo,
-                "mayan_cross_chain_transactions",
-                "middle_src_amount",
-                "src_blockchain",
-                "middle_src_token",
-                "src_timestamp",
-                "middle_src_amount_usd",
-            )
-            PriceGenerator.calculate_cctx_usd_values(
-                self.bridge,
-                self.cross_chain_transactions_repo,
-                "mayan_cross_chain_transactions",
-                "middle_dst_amount",
-                "dst_blockchain",
-                "middle_dst_token",
-                "dst_timestamp",
-                "middle_dst_amount_usd",
-            )
-            PriceGenerator.calculate_cctx_usd_values(
-                self.bridge,
-                self.cross_chain_transactions_repo,
-                "mayan_cross_chain_transactions",
-                "percent_fee",
-                "dst_blockchain",
-                "dst_contract_address",
-                "dst_timestamp",
-                "percent_fee_usd",
-            )
-
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.cross_chain_transactions_repo,
-                "mayan_cross_chain_transactions",
-                "src_timestamp",
-                "src_blockchain",
-                "src_fee",
-                "src_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.cross_chain_transactions_repo,
-                "mayan_cross_chain_transactions",
-                "dst_timestamp",
-                "dst_blockchain",
-                "dst_fee",
-                "dst_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.cross_chain_transactions_repo,
-                "mayan_cross_chain_transactions",
-                "refund_timestamp",
-                "refund_blockchain",
-                "refund_fee",
-                "refund_fee_usd",
+                [
+                    UsdValue(
+                        "input_amount_usd",
+                        "input_amount",
+                        "src_blockchain",
+                        "src_timestamp",
+                        "src_contract_address",
+                    ),
+                    UsdValue(
+                        "output_amount_usd",
+                        "output_amount",
+                        "dst_blockchain",
+                        "dst_timestamp",
+                        "dst_contract_address",
+                    ),
+                    UsdValue(
+                        "refund_amount_usd",
+                        "refund_amount",
+                        "src_blockchain",
+                        "src_timestamp",
+                        "src_contract_address",
+                    ),
+                    UsdValue(
+                        "middle_src_amount_usd",
+                        "middle_src_amount",
+                        "src_blockchain",
+                        "src_timestamp",
+                        "middle_src_token",
+                    ),
+                    UsdValue(
+                        "middle_dst_amount_usd",
+                        "middle_dst_amount",
+                        "dst_blockchain",
+                        "dst_timestamp",
+                        "middle_dst_token",
+                    ),
+                    UsdValue(
+                        "percent_fee_usd",
+                        "percent_fee",
+                        "dst_blockchain",
+                        "dst_timestamp",
+                        "dst_contract_address",
+                    ),
+                    UsdValue("src_fee_usd", "src_fee", "src_blockchain", "src_timestamp"),
+                    UsdValue("dst_fee_usd", "dst_fee", "dst_blockchain", "dst_timestamp"),
+                    UsdValue(
+                        "refund_fee_usd", "refund_fee", "refund_blockchain", "refund_timestamp"
+                    ),
+                ],
             )
 
             self.fix_token_symbol_clashes()
 
+            self.save_high_water_marks()
+
         except Exception as e:
             exception = CustomException(
                 self.CLASS_NAME,
@@ -192,136 +160,75 @@ class MayanGenerator(BaseGenerator):
             build_log_message_generator(self.bridge, "Matching cross-chain SOL -> EVM transfers...")
         )
 
-        self.cross_chain_transactions_repo.empty_table()
+        self.empty_cross_chain_table(self.cross_chain_transactions_repo)
 
         try:
-            results = []
-
             auction_data = self.get_auction_data()
 
-            SrcTx = aliased(MayanBlockchainTransaction)
-            DstTx = aliased(MayanBlockchainTransaction)
-            RefundTx = aliased(MayanBlockchainTransaction)
-
-            with self.cross_chain_transactions_repo.get_session() as session:
-                results = (
-                    session.query(
-                        MayanInitOrder.trader.label("src_from_address"),
-                        MayanInitOrder.trader.label("depositor"),
-                        MayanInitOrder.addr_dest.label("recipient"),
-                        MayanInitOrder.order_hash.label("order_hash"),
-                        MayanInitOrder.token_out.label("token_out"),
-                        MayanInitOrder.original_src_token.label("original_src_token"),
-                        MayanInitOrder.original_src_amount.label("original_src_amount"),
-                        MayanInitOrder.middle_src_token.label("middle_src_token"),
-                        MayanInitOrder.middle_src_amount.label("middle_src_amount"),
-                        MayanOrderFulfilled.net_amount.label("output_amount"),
-                        MayanOrderFulfilled.middle_dst_token.label("middle_dst_token"),
-                        MayanOrderFulfilled.middle_dst_amount.label("middle_dst_amount"),
-                        MayanUnlock.signature.label("refund_transaction_hash"),
-                        MayanUnlock.driver_acc.label("refund_from_address"),
-                        MayanUnlock.amount.label("refund_amount"),
-                        MayanUnlock.mint_from.label("refund_token"),
-                        SrcTx.blockchain.label("src_blockchain"),
-                        SrcTx.transaction_hash.label("src_transaction_hash"),
-                        SrcTx.fee.label("src_fee"),
-                        SrcTx.value.label("src_value"),
-                        SrcTx.timestamp.label("src_timestamp"),
-                        DstTx.transaction_hash.label("dst_transaction_hash"),
-                        DstTx.blockchain.label("dst_blockchain"),
-                        DstTx.from_address.label("dst_from_address"),
-                        DstTx.to_address.label("dst_to_address"),
-                        DstTx.fee.label("dst_fee"),
-                        DstTx.value.label("dst_value"),
-                        DstTx.timestamp.label("dst_timestamp"),
-                        RefundTx.blockchain.label("refund_blockchain"),
-                        RefundTx.fee.label("refund_fee"),
-                        RefundTx.value.label("refund_value"),
-                        RefundTx.timestamp.label("refund_timestamp"),
-                        auction_data.c.auction_id.label("auction_id"),
-                        auction_data.c.auction_first_bid_timestamp.label(
-                            "auction_first_bid_timestamp"
-                        ),
-                        auction_data.c.auction_last_bid_timestamp.label(
-                            "auction_last_bid_timestamp"
-                        ),
-                        auction_data.c.auction_number_of_bids.label("auction_number_of_bids"),
-                        literal(0).label("native_fix_fee"),
-                        (
-                            MayanOrderFulfilled.net_amount * 0.000300090027 / (1 - 0.000300090027)
-                        ).label("percent_fee"),
-                    )
-                    .join(MayanOrderFulfilled, MayanInitOrder.order_hash == MayanOrderFulfilled.key)
-                    .join(SrcTx, SrcTx.transaction_hash == MayanInitOrder.signature)
-                    .join(DstTx, DstTx.transaction_hash == MayanOrderFulfilled.transaction_hash)
-                    .outerjoin(MayanUnlock, MayanInitOrder.state == MayanUnlock.state)
-                    .outerjoin(RefundTx, RefundTx.transaction_hash == MayanUnlock.signature)
-                    .outerjoin(
-                        auction_data,
-                        auction_data.c.order_hash == MayanInitOrder.order_hash,
-                    )
-                    .all()
+            SrcTx = aliased(MayanBlockchainTransaction, name="src_tx")
+            DstTx = aliased(MayanBlockchainTransaction, name="dst_tx")
+            RefundTx = aliased(MayanBlockchainTransaction, name="refund_tx")
+
+            query = (
+                select(
+                    SrcTx.blockchain.label("src_blockchain"),
+                    SrcTx.transaction_hash.label("src_transaction_hash"),
+                    MayanInitOrder.trader.label("src_from_address"),
+                    literal("BLZRi6frs4X4DNLw56V4EXai1b6QVESN1BhHBTYM9VcY").label("src_to_address"),
+                    SrcTx.fee.label("src_fee"),
+                    SrcTx.value.label("src_value"),
+                    SrcTx.timestamp.label("src_timestamp"),
+                    DstTx.blockchain.label("dst_blockchain"),
+                    DstTx.transaction_hash.label("dst_transaction_hash"),
+                    DstTx.from_address.label("dst_from_address"),
+                    DstTx.to_address.label("dst_to_address"),
+                    DstTx.fee.label("dst_fee"),
+                    DstTx.value.label("dst_value"),
+                    DstTx.timestamp.label("dst_timestamp"),
+                    RefundTx.blockchain.label("refund_blockchain"),
+                    MayanUnlock.signature.label("refund_transaction_hash"),
+                    MayanUnlock.driver_acc.label("refund_from_address"),
+                    literal("9w1D9okTM8xNE7Ntb7LpaAaoLc6LfU9nHFs2h2KTpX1H").label(
+                        "refund_to_address"
+                    ),
+                    RefundTx.fee.label("refund_fee"),
+                    RefundTx.value.label("refund_value"),
+                    RefundTx.timestamp.label("refund_timestamp"),
+                    MayanInitOrder.order_hash.label("intent_id"),
+                    MayanInitOrder.trader.label("depositor"),
+                    MayanInitOrder.addr_dest.label("recipient"),
+                    MayanInitOrder.original_src_token.label("src_contract_address"),
+                    MayanInitOrder.token_out.label("dst_contract_address"),
+                    MayanInitOrder.original_src_amount.label("input_amount"),
+                    MayanInitOrder.middle_src_token.label("middle_src_token"),
+                    MayanInitOrder.middle_src_amount.label("middle_src_amount"),
+                    MayanOrderFulfilled.middle_dst_token.label("middle_dst_token"),
+                    MayanOrderFulfilled.middle_dst_amount.label("middle_dst_amount"),
+                    MayanOrderFulfilled.net_amount.label("output_amount"),
+                    MayanUnlock.amount.label("refund_amount"),
+                    MayanUnlock.mint_from.label("refund_token"),
+                    auction_data.c.auction_id.label("auction_id"),
+                    auction_data.c.auction_first_bid_timestamp.label("auction_first_bid_timestamp"),
+                    auction_data.c.auction_last_bid_timestamp.label("auction_last_bid_timestamp"),
+                    auction_data.c.auction_number_of_bids.label("auction_number_of_bids"),
+                    literal(0).label("native_fix_fee"),
+                    (MayanOrderFulfilled.net_amount * 0.000300090027 / (1 - 0.000300090027)).label(
+                        "percent_fee"
+                    ),
                 )
-
-            cctxs = []
-
-            for row in results:
-                cctxs.append(
-                    MayanCrossChainTransaction(
-                        src_blockchain=row.src_blockchain,
-                        src_transaction_hash=row.src_transaction_hash,
-                        src_from_address=row.src_from_address,
-                        src_to_address="BLZRi6frs4X4DNLw56V4EXai1b6QVESN1BhHBTYM9VcY",
-                        src_fee=row.src_fee,
-                        src_value=row.src_value,
-                        src_fee_usd=None,
-                        src_timestamp=row.src_timestamp,
-                        dst_blockchain=row.dst_blockchain,
-                        dst_transaction_hash=row.dst_transaction_hash,
-                        dst_from_address=row.dst_from_address,
-                        dst_to_address=row.dst_to_address,
-                        dst_fee=row.dst_fee,
-                        dst_value=row.dst_value,
-                        dst_fee_usd=None,
-                        dst_timestamp=row.dst_timestamp,
-                        refund_blockchain=row.refund_blockchain,
-                        refund_transaction_hash=row.refund_transaction_hash,
-                        refund_from_address=row.refund_from_address,
-                        refund_to_address="9w1D9okTM8xNE7Ntb7LpaAaoLc6LfU9nHFs2h2KTpX1H",
-                        refund_fee=row.refund_fee,
-                        refund_value=row.refund_value,
-                        refund_fee_usd=None,
-                        refund_timestamp=row.refund_timestamp,
-                        intent_id=row.order_hash,
-                        depositor=row.depositor,
-                        recipient=row.recipient,
-                        src_contract_address=row.original_src_token,
-                        dst_contract_address=row.token_out,
-                        input_amount=row.original_src_amount,
-                        input_amount_usd=None,
-                        middle_src_token=row.middle_src_token,
-                        middle_src_amount=row.middle_src_amount,
-                        middle_src_amount_usd=None,
-                        middle_dst_token=row.middle_dst_token,
-                        middle_dst_amount=row.middle_dst_amount,
-                        middle_dst_amount_usd=None,
-                        output_amount=row.output_amount,
-                        output_amount_usd=None,
-                        refund_amount=row.refund_amount,
-                        refund_amount_usd=None,
-                        refund_token=row.refund_token,
-                        auction_id=row.auction_id,
-                        auction_first_bid_timestamp=row.auction_first_bid_timestamp,
-                        auction_last_bid_timestamp=row.auction_last_bid_timestamp,
-                        auction_number_of_bids=row.auction_number_of_bids,
-                        native_fix_fee=row.native_fix_fee,
-                        native_fix_fee_usd=None,
-                        percent_fee=row.percent_fee,
-                        percent_fee_usd=None,
-                    )
+                .join(MayanOrderFulfilled, MayanInitOrder.order_hash == MayanOrderFulfilled.key)
+                .join(SrcTx, SrcTx.transaction_hash == MayanInitOrder.signature)
+                .join(DstTx, DstTx.transaction_hash == MayanOrderFulfilled.transaction_hash)
+                .outerjoin(MayanUnlock, MayanInitOrder.state == MayanUnlock.state)
+                .outerjoin(RefundTx, RefundTx.transaction_hash == MayanUnlock.signature)
+                .outerjoin(
+                    auction_data,
+                    auction_data.c.order_hash == MayanInitOrder.order_hash,
                 )
+                .filter(text(self.new_events_condition("src_tx", "dst_tx", "refund_tx")))
+            )
 
-            self.cross_chain_transactions_repo.create_all(cctxs)
+            self.insert_cctxs(self.cross_chain_transactions_repo, query)
 
             size = self.cross_chain_transactions_repo.get_number_of_records()
 
@@ -352,175 +259,114 @@ class MayanGenerator(BaseGenerator):
         )
 
         try:
-            results = []
-
             auction_data = self.get_auction_data()
 
-            SrcTx = aliased(MayanBlockchainTransaction)
-            DstTx = aliased(MayanBlockchainTransaction)
-            RefundTx = aliased(MayanBlockchainTransaction)
-
-            with self.cross_chain_transactions_repo.get_session() as session:
-                forwarded_query = session.query(
-                    MayanForwarded.blockchain.label("blockchain"),
-                    MayanForwarded.transaction_hash.label("transaction_hash"),
-                    MayanForwarded.trader.label("trader"),
-                    MayanForwarded.token.label("token"),
-                    MayanForwarded.token_out.label("token_out"),
-                    MayanForwarded.dst_addr.label("dst_addr"),
-                    MayanForwarded.amount.label("amount"),
-                    literal(None).label("middle_src_token"),
-                    literal(None).label("middle_src_amount"),
-                    literal_column("'forwarded'").label("entry_type"),
-                )
+            SrcTx = aliased(MayanBlockchainTransaction, name="src_tx")
+            DstTx = aliased(MayanBlockchainTransaction, name="dst_tx")
+            RefundTx = aliased(MayanBlockchainTransaction, name="refund_tx")
+
+            forwarded_query = select(
+                MayanForwarded.blockchain.label("blockchain"),
+                MayanForwarded.transaction_hash.label("transaction_hash"),
+                MayanForwarded.trader.label("trader"),
+                MayanForwarded.token.label("token"),
+                MayanForwarded.token_out.label("token_out"),
+                MayanForwarded.dst_addr.label("dst_addr"),
+                MayanForwarded.amount.label("amount"),
+                literal(None).label("middle_src_token"),
+                literal(None).label("middle_src_amount"),
+                literal_column("'forwarded'").label("entry_type"),
+            )
 
-                # Select swap_and_forwarded entries
-                swap_and_forwarded_query = session.query(
-                    MayanSwapAndForwarded.blockchain.label("blockchain"),
-                    MayanSwapAndForwarded.transaction_hash.label("transaction_hash"),
-                    MayanSwapAndForwarded.trader.label("trader"),
-                    MayanSwapAndForwarded.token_in.label("token"),
-                    MayanSwapAndForwarded.token_out.label("token_out"),
-                    MayanSwapAndForwarded.dst_addr.label("dst_addr"),
-                    MayanSwapAndForwarded.amount_in.label("amount"),
-                    MayanSwapAndForwarded.middle_token.label("middle_src_token"),
-                    MayanSwapAndForwarded.middle_amount.label("middle_src_amount"),
-                    literal_column("'swap_and_forwarded'").label("entry_type"),
-                )
+            # Select swap_and_forwarded entries
+            swap_and_forwarded_query = select(
+                MayanSwapAndForwarded.blockchain.label("blockchain"),
+                MayanSwapAndForwarded.transaction_hash.label("transaction_hash"),
+                MayanSwapAndForwarded.trader.label("trader"),
+                MayanSwapAndForwarded.token_in.label("token"),
+                MayanSwapAndForwarded.token_out.label("token_out"),
+                MayanSwapAndForwarded.dst_addr.label("dst_addr"),
+                MayanSwapAndForwarded.amount_in.label("amount"),
+                MayanSwapAndForwarded.middle_token.label("middle_src_token"),
+                MayanSwapAndForwarded.middle_amount.label("middle_src_amount"),
+                literal_column("'swap_and_forwarded'").label("entry_type"),
+            )
 
-                # Create a union of both
-                forward_union = forwarded_query.union_all(swap_and_forwarded_query).subquery()
-                Fwd = aliased(forward_union)
-
-                results = (
-                    session.query(
-                        Fwd.c.blockchain.label("src_blockchain"),
-                        Fwd.c.transaction_hash.label("src_transaction_hash"),
-                        SrcTx.from_address.label("src_from_address"),
-                        SrcTx.to_address.label("src_to_address"),
-                        SrcTx.fee.label("src_fee"),
-                        SrcTx.value.label("src_value"),
-                        SrcTx.timestamp.label("src_timestamp"),
-                        MayanFulfillOrder.signature.label("dst_transaction_hash"),
-                        MayanFulfillOrder.driver.label("dst_from_address"),
-                        MayanFulfillOrder.dest.label("dst_to_address"),
-                        MayanFulfillOrder.middle_dst_token.label("middle_dst_token"),
-                        MayanFulfillOrder.middle_dst_amount.label("middle_dst_amount"),
-                        DstTx.fee.label("dst_fee"),
-                        DstTx.value.label("dst_value"),
-                        DstTx.timestamp.label("dst_timestamp"),
-                        RefundTx.blockchain.label("refund_blockchain"),
-                        RefundTx.transaction_hash.label("refund_transaction_hash"),
-                        RefundTx.from_address.label("refund_from_address"),
-                        RefundTx.to_address.label("refund_to_address"),
-                        RefundTx.fee.label("refund_fee"),
-                        RefundTx.value.label("refund_value"),
-                        RefundTx.timestamp.label("refund_timestamp"),
-                        MayanOrderCreated.key.label("intent_id"),
-                        Fwd.c.trader.label("depositor"),
-                        MayanRegisterOrder.addr_dest.label("recipient"),
-                        Fwd.c.token.label("src_contract_address"),
-                        MayanRegisterOrder.token_out.label("dst_contract_address"),
-                        case(
-                            (Fwd.c.amount != None, Fwd.c.amount),  # noqa: E711 DO NOT REPLACE != WITH 'IS NOT'
-                            else_=SrcTx.value,
-                        ).label("input_amount"),
-                        MayanFulfillOrder.amount.label("output_amount"),
-                        auction_data.c.auction_id.label("auction_id"),
-                        auction_data.c.auction_first_bid_timestamp.label(
-                            "auction_first_bid_timestamp"
-                        ),
-                        auction_data.c.auction_last_bid_timestamp.label(
-                            "auction_last_bid_timestamp"
-                        ),
-                        auction_data.c.auction_number_of_bids.label("auction_number_of_bids"),
-                        Fwd.c.middle_src_token.label("middle_src_token"),
-                        Fwd.c.middle_src_amount.label("middle_src_amount"),
-                        literal(0).label("native_fix_fee"),
-                        literal(0).label("percent_fee"),
-                    )
-                    .join(
-                        MayanOrderCreated,
-                        MayanOrderCreated.transaction_hash == Fwd.c.transaction_hash,
-                    )
-                    .join(
-                        MayanRegisterOrder, MayanRegisterOrder.order_hash == MayanOrderCreated.key
-                    )
-                    .join(MayanFulfillOrder, MayanFulfillOrder.state == MayanRegisterOrder.state)
-                    .join(SrcTx, SrcTx.transaction_hash == Fwd.c.transaction_hash)
-                    .join(DstTx, DstTx.transaction_hash == MayanFulfillOrder.signature)
-                    .outerjoin(MayanOrderUnlocked, MayanOrderUnlocked.key == MayanOrderCreated.key)
-                    .outerjoin(
-                        RefundTx, RefundTx.transaction_hash == MayanOrderUnlocked.transaction_hash
-                    )
-                    .outerjoin(
-                        auction_data,
-                        auction_data.c.order_hash == MayanRegisterOrder.order_hash,
-                    )
-                )
+            # Create a union of both
+            Fwd = union_all(forwarded_query, swap_and_forwarded_query).subquery()
+
+            input_amount = case(
+                (Fwd.c.amount != None, Fwd.c.amount),  # noqa: E711 DO NOT REPLACE != WITH 'IS NOT'
+                else_=SrcTx.value,
+            )
 
-            cctxs = []
-
-            for row in results:
-                cctxs.append(
-                    MayanCrossChainTransaction(
-                        src_blockchain=row.src_blockchain,
-                        src_transaction_hash=row.src_transaction_hash,
-                        src_from_address=row.src_from_address,
-                        src_to_address=row.src_to_address,
-                        src_fee=row.src_fee,
-                        src_value=row.src_value,
-                        src_fee_usd=None,
-                        src_timestamp=row.src_timestamp,
-                        dst_blockchain="solana",
-                        dst_transaction_hash=row.dst_transaction_hash,
-                        dst_from_address=row.dst_from_address,
-                        dst_to_address=row.dst_to_address,
-                        dst_fee=row.dst_fee,
-                        dst_value=row.dst_value,
-                        dst_fee_usd=None,
-                        dst_timestamp=row.dst_timestamp,
-                        refund_blockchain=row.refund_blockchain,
-                        refund_transaction_hash=row.refund_transaction_hash,
-                        refund_from_address=row.refund_from_address,
-                        refund_to_address=row.refund_to_address,
-                        refund_fee=row.refund_fee,
-                        refund_value=row.refund_value,
-                        refund_fee_usd=None,
-                        refund_timestamp=row.refund_timestamp,
-                        intent_id=row.intent_id,
-                        depositor=row.depositor,
-                        recipient=row.recipient,
-                        src_contract_address=row.src_contract_address,
-                        dst_contract_address=row.dst_contract_address,
-                        input_amount=row.input_amount,
-                        input_amount_usd=None,
-                        middle_src_token=row.middle_src_token,
-                        middle_src_amount=row.middle_src_amount,
-                        middle_src_amount_usd=None,
-                        middle_dst_token=row.middle_dst_token,
-                        middle_dst_amount=row.middle_dst_amount,
-                        middle_dst_amount_usd=None,
-                        output_amount=row.output_amount,
-                        output_amount_usd=None,
-                        refund_amount=row.input_amount,  # in the case of usage of intermediary
-                        # protocols, the refund amount is a bit less than the input amount (because
-                        # of fees), but there is not way to get the exact refund amount unless we
-                        # parse internal transactions and match to the unlock events.
-                        refund_amount_usd=None,
-                        refund_token="0x0000000000000000000000000000000000000000",
-                        auction_id=row.auction_id,
-                        auction_first_bid_timestamp=row.auction_first_bid_timestamp,
-                        auction_last_bid_timestamp=row.auction_last_bid_timestamp,
-                        auction_number_of_bids=row.auction_number_of_bids,
-                        native_fix_fee=row.native_fix_fee,
-                        native_fix_fee_usd=None,
-                        percent_fee=row.percent_fee,
-                        percent_fee_usd=None,
-                    )
+            query = (
+                select(
+                    Fwd.c.blockchain.label("src_blockchain"),
+                    Fwd.c.transaction_hash.label("src_transaction_hash"),
+                    SrcTx.from_address.label("src_from_address"),
+                    SrcTx.to_address.label("src_to_address"),
+                    SrcTx.fee.label("src_fee"),
+                    SrcTx.value.label("src_value"),
+                    SrcTx.timestamp.label("src_timestamp"),
+                    literal("solana").label("dst_blockchain"),
+                    MayanFulfillOrder.signature.label("dst_transaction_hash"),
+                    MayanFulfillOrder.driver.label("dst_from_address"),
+                    MayanFulfillOrder.dest.label("dst_to_address"),
+                    DstTx.fee.label("dst_fee"),
+                    DstTx.value.label("dst_value"),
+                    DstTx.timestamp.label("dst_timestamp"),
+                    RefundTx.blockchain.label("refund_blockchain"),
+                    RefundTx.transaction_hash.label("refund_transaction_hash"),
+                    RefundTx.from_address.label("refund_from_address"),
+                    RefundTx.to_address.label("refund_to_address"),
+                    RefundTx.fee.label("refund_fee"),
+                    RefundTx.value.label("refund_value"),
+                    RefundTx.timestamp.label("refund_timestamp"),
+                    MayanOrderCreated.key.label("intent_id"),
+                    Fwd.c.trader.label("depositor"),
+                    MayanRegisterOrder.addr_dest.label("recipient"),
+                    Fwd.c.token.label("src_contract_address"),
+                    MayanRegisterOrder.token_out.label("dst_contract_address"),
+                    input_amount.label("input_amount"),
+                    Fwd.c.middle_src_token.label("middle_src_token"),
+                    Fwd.c.middle_src_amount.label("middle_src_amount"),
+                    MayanFulfillOrder.middle_dst_token.label("middle_dst_token"),
+                    MayanFulfillOrder.middle_dst_amount.label("middle_dst_amount"),
+                    MayanFulfillOrder.amount.label("output_amount"),
+                    # in the case of usage of intermediary protocols, the refund amount is a bit
+                    # less than the input amount (because of fees), but there is not way to get the
+                    # exact refund amount unless we parse internal transactions and match to the
+                    # unlock events.
+                    input_amount.label("refund_amount"),
+                    literal("0x0000000000000000000000000000000000000000").label("refund_token"),
+                    auction_data.c.auction_id.label("auction_id"),
+                    auction_data.c.auction_first_bid_timestamp.label("auction_first_bid_timestamp"),
+                    auction_data.c.auction_last_bid_timestamp.label("auction_last_bid_timestamp"),
+                    auction_data.c.auction_number_of_bids.label("auction_number_of_bids"),
+                    literal(0).label("native_fix_fee"),
+                    literal(0).label("percent_fee"),
+                )
+                .join(
+                    MayanOrderCreated,
+                    MayanOrderCreated.transaction_hash == Fwd.c.transaction_hash,
+                )
+                .join(MayanRegisterOrder, MayanRegisterOrder.order_hash == MayanOrderCreated.key)
+                .join(MayanFulfillOrder, MayanFulfillOrder.state == MayanRegisterOrder.state)
+                .join(SrcTx, SrcTx.transaction_hash == Fwd.c.transaction_hash)
+                .join(DstTx, DstTx.transaction_hash == MayanFulfillOrder.signature)
+                .outerjoin(MayanOrderUnlocked, MayanOrderUnlocked.key == MayanOrderCreated.key)
+                .outerjoin(
+                    RefundTx, RefundTx.transaction_hash == MayanOrderUnlocked.transaction_hash
                 )
+                .outerjoin(
+                    auction_data,
+                    auction_data.c.order_hash == MayanRegisterOrder.order_hash,
+                )
+                .filter(text(self.new_events_condition("src_tx", "dst_tx", "refund_tx")))
+            )
 
-            self.cross_chain_transactions_repo.create_all(cctxs)
+            self.insert_cctxs(self.cross_chain_transactions_repo, query)
 
             size = self.cross_chain_transactions_repo.get_number_of_records()
 
@@ -551,175 +397,109 @@ class MayanGenerator(BaseGenerator):
         )
 
         try:
-            results = []
-
             auction_data = self.get_auction_data()
 
-            SrcTx = aliased(MayanBlockchainTransaction)
-            DstTx = aliased(MayanBlockchainTransaction)
-            RefundTx = aliased(MayanBlockchainTransaction)
-
-            with self.cross_chain_transactions_repo.get_session() as session:
-                forwarded_query = session.query(
-                    MayanForwarded.blockchain.label("blockchain"),
-                    MayanForwarded.transaction_hash.label("transaction_hash"),
-                    MayanForwarded.trader.label("trader"),
-                    MayanForwarded.token.label("token"),
-                    MayanForwarded.token_out.label("token_out"),
-                    MayanForwarded.dst_addr.label("dst_addr"),
-                    MayanForwarded.amount.label("amount"),
-                    literal(None).label("middle_src_token"),
-                    literal(None).label("middle_src_amount"),
-                    literal_column("'forwarded'").label("entry_type"),
-                )
+            SrcTx = aliased(MayanBlockchainTransaction, name="src_tx")
+            DstTx = aliased(MayanBlockchainTransaction, name="dst_tx")
+            RefundTx = aliased(MayanBlockchainTransaction, name="refund_tx")
+
+            forwarded_query = select(
+                MayanForwarded.blockchain.label("blockchain"),
+                MayanForwarded.transaction_hash.label("transaction_hash"),
+                MayanForwarded.trader.label("trader"),
+                MayanForwarded.token.label("token"),
+                MayanForwarded.token_out.label("token_out"),
+                MayanForwarded.dst_addr.label("dst_addr"),
+                MayanForwarded.amount.label("amount"),
+                literal(None).label("middle_src_token"),
+                literal(None).label("middle_src_amount"),
+                literal_column("'forwarded'").label("entry_type"),
+            )
 
-                swap_and_forwarded_query = session.query(
-                    MayanSwapAndForwarded.blockchain.label("blockchain"),
-                    MayanSwapAndForwarded.transaction_hash.label("transaction_hash"),
-                    MayanSwapAndForwarded.trader.label("trader"),
-                    MayanSwapAndForwarded.token_in.label("token"),
-                    MayanSwapAndForwarded.token_out.label("token_out"),
-                    MayanSwapAndForwarded.dst_addr.label("dst_addr"),
-                    MayanSwapAndForwarded.amount_in.label("amount"),
-                    MayanSwapAndForwarded.middle_token.label("middle_src_token"),
-                    MayanSwapAndForwarded.middle_amount.label("middle_src_amount"),
-                    literal_column("'swap_and_forwarded'").label("entry_type"),
-                )
+            swap_and_forwarded_query = select(
+                MayanSwapAndForwarded.blockchain.label("blockchain"),
+                MayanSwapAndForwarded.transaction_hash.label("transaction_hash"),
+                MayanSwapAndForwarded.trader.label("trader"),
+                MayanSwapAndForwarded.token_in.label("token"),
+                MayanSwapAndForwarded.token_out.label("token_out"),
+                MayanSwapAndForwarded.dst_addr.label("dst_addr"),
+                MayanSwapAndForwarded.amount_in.label("amount"),
+                MayanSwapAndForwarded.middle_token.label("middle_src_token"),
+                MayanSwapAndForwarded.middle_amount.label("middle_src_amount"),
+                literal_column("'swap_and_forwarded'").label("entry_type"),
+            )
 
-                forward_union = forwarded_query.union_all(swap_and_forwarded_query).subquery()
-                Fwd = aliased(forward_union)
-
-                SrcTx = aliased(MayanBlockchainTransaction)
-                DstTx = aliased(MayanBlockchainTransaction)
-                RefundTx = aliased(MayanBlockchainTransaction)
-
-                results = (
-                    session.query(
-                        Fwd.c.blockchain.label("src_blockchain"),
-                        Fwd.c.transaction_hash.label("src_transaction_hash"),
-                        SrcTx.from_address.label("src_from_address"),
-                        SrcTx.to_address.label("src_to_address"),
-                        SrcTx.fee.label("src_fee"),
-                        SrcTx.value.label("src_value"),
-                        SrcTx.timestamp.label("src_timestamp"),
-                        MayanOrderFulfilled.transaction_hash.label("dst_transaction_hash"),
-                        MayanOrderFulfilled.blockchain.label("dst_blockchain"),
-                        MayanOrderFulfilled.net_amount.label("output_amount"),
-                        MayanOrderFulfilled.middle_dst_token.label("middle_dst_token"),
-                        MayanOrderFulfilled.middle_dst_amount.label("middle_dst_amount"),
-                        DstTx.from_address.label("dst_from_address"),
-                        DstTx.to_address.label("dst_to_address"),
-                        DstTx.fee.label("dst_fee"),
-                        DstTx.value.label("dst_value"),
-                        DstTx.timestamp.label("dst_timestamp"),
-                        MayanOrderUnlocked.blockchain.label("refund_blockchain"),
-                        MayanOrderUnlocked.transaction_hash.label("refund_transaction_hash"),
-                        RefundTx.from_address.label("refund_from_address"),
-                        RefundTx.to_address.label("refund_to_address"),
-                        RefundTx.fee.label("refund_fee"),
-                        RefundTx.value.label("refund_value"),
-                        RefundTx.timestamp.label("refund_timestamp"),
-                        MayanOrderCreated.key.label("intent_id"),
-                        Fwd.c.trader.label("depositor"),
-                        Fwd.c.dst_addr.label("recipient"),
-                        Fwd.c.token.label("src_contract_address"),
-                        Fwd.c.token_out.label("dst_contract_address"),
-                        Fwd.c.middle_src_token.label("middle_src_token"),
-                        Fwd.c.middle_src_amount.label("middle_src_amount"),
-                        case(
-                            (Fwd.c.amount != None, Fwd.c.amount),  # noqa: E711 DO NOT REPLACE != WITH 'IS NOT'
-                            else_=SrcTx.value,
-                        ).label("input_amount"),
-                        auction_data.c.auction_id.label("auction_id"),
-                        auction_data.c.auction_first_bid_timestamp.label(
-                            "auction_first_bid_timestamp"
-                        ),
-                        auction_data.c.auction_last_bid_timestamp.label(
-                            "auction_last_bid_timestamp"
-                        ),
-                        auction_data.c.auction_number_of_bids.label("auction_number_of_bids"),
-                        literal(0).label("native_fix_fee"),
-                        (
-                            MayanOrderFulfilled.net_amount * 0.000300090027 / (1 - 0.000300090027)
-                        ).label("percent_fee"),
-                    )
-                    .join(
-                        MayanOrderCreated,
-                        MayanOrderCreated.transaction_hash == Fwd.c.transaction_hash,
-                    )
-                    .join(MayanOrderFulfilled, MayanOrderFulfilled.key == MayanOrderCreated.key)
-                    .join(SrcTx, SrcTx.transaction_hash == Fwd.c.transaction_hash)
-                    .join(DstTx, DstTx.transaction_hash == MayanOrderFulfilled.transaction_hash)
-                    .outerjoin(MayanOrderUnlocked, MayanOrderCreated.key == MayanOrderUnlocked.key)
-                    .outerjoin(
-                        RefundTx, RefundTx.transaction_hash == MayanOrderUnlocked.transaction_hash
-                    )
-                    .outerjoin(
-                        auction_data,
-                        auction_data.c.order_hash == MayanOrderFulfilled.key,
-                    )
-                    .all()
-                )
+            Fwd = union_all(forwarded_query, swap_and_forwarded_query).subquery()
 
-            cctxs = []
-
-            for row in results:
-                cctxs.append(
-                    MayanCrossChainTransaction(
-                        src_blockchain=row.src_blockchain,
-                        src_transaction_hash=row.src_transaction_hash,
-                        src_from_address=row.src_from_address,
-                        src_to_address=row.src_to_address,
-                        src_fee=row.src_fee,
-                        src_value=row.src_value,
-                        src_fee_usd=None,
-                        src_timestamp=row.src_timestamp,
-                        dst_blockchain=row.dst_blockchain,
-                        dst_transaction_hash=row.dst_transaction_hash,
-                        dst_from_address=row.dst_from_address,
-                        dst_to_address=row.dst_to_address,
-                        dst_fee=row.dst_fee,
-                        dst_value=row.dst_value,
-                        dst_fee_usd=None,
-                        dst_timestamp=row.dst_timestamp,
-                        refund_blockchain=row.refund_blockchain,
-                        refund_transaction_hash=row.refund_transaction_hash,
-                        refund_from_address=row.refund_from_address,
-                        refund_to_address=row.refund_to_address,
-                        refund_fee=row.refund_fee,
-                        refund_value=row.refund_value,
-                        refund_fee_usd=None,
-                        refund_timestamp=row.refund_timestamp,
-                        intent_id=row.intent_id,
-                        depositor=row.depositor,
-                        recipient=row.recipient,
-                        src_contract_address=row.src_contract_address,
-                        dst_contract_address=row.dst_contract_address,
-                        input_amount=row.input_amount,
-                        input_amount_usd=None,
-                        middle_src_token=row.middle_src_token,
-                        middle_src_amount=row.middle_src_amount,
-                        middle_src_amount_usd=None,
-                        middle_dst_token=row.middle_dst_token,
-                        middle_dst_amount=row.middle_dst_amount,
-                        middle_dst_amount_usd=None,
-                        output_amount=row.output_amount,
-                        output_amount_usd=None,
-                        refund_amount=row.input_amount,
-                        refund_amount_usd=None,
-                        refund_token="0x0000000000000000000000000000000000000000",
-                        auction_id=row.auction_id,
-                        auction_first_bid_timestamp=row.auction_first_bid_timestamp,
-                        auction_last_bid_timestamp=row.auction_last_bid_timestamp,
-                        auction_number_of_bids=row.auction_number_of_bids,
-                        native_fix_fee=row.native_fix_fee,
-                        native_fix_fee_usd=None,
-                        percent_fee=row.percent_fee,
-                        percent_fee_usd=None,
-                    )
+            input_amount = case(
+                (Fwd.c.amount != None, Fwd.c.amount),  # noqa: E711 DO NOT REPLACE != WITH 'IS NOT'
+                else_=SrcTx.value,
+            )
+
+            query = (
+                select(
+                    Fwd.c.blockchain.label("src_blockchain"),
+                    Fwd.c.transaction_hash.label("src_transaction_hash"),
+                    SrcTx.from_address.label("src_from_address"),
+                    SrcTx.to_address.label("src_to_address"),
+                    SrcTx.fee.label("src_fee"),
+                    SrcTx.value.label("src_value"),
+                    SrcTx.timestamp.label("src_timestamp"),
+                    MayanOrderFulfilled.blockchain.label("dst_blockchain"),
+                    MayanOrderFulfilled.transaction_hash.label("dst_transaction_hash"),
+                    DstTx.from_address.label("dst_from_address"),
+                    DstTx.to_address.label("dst_to_address"),
+                    DstTx.fee.label("dst_fee"),
+                    DstTx.value.label("dst_value"),
+                    DstTx.timestamp.label("dst_timestamp"),
+                    MayanOrderUnlocked.blockchain.label("refund_blockchain"),
+                    MayanOrderUnlocked.transaction_hash.label("refund_transaction_hash"),
+                    RefundTx.from_address.label("refund_from_address"),
+                    RefundTx.to_address.label("refund_to_address"),
+                    RefundTx.fee.label("refund_fee"),
+                    RefundTx.value.label("refund_value"),
+                    RefundTx.timestamp.label("refund_timestamp"),
+                    MayanOrderCreated.key.label("intent_id"),
+                    Fwd.c.trader.label("depositor"),
+                    Fwd.c.dst_addr.label("recipient"),
+                    Fwd.c.token.label("src_contract_address"),
+                    Fwd.c.token_out.label("dst_contract_address"),
+                    input_amount.label("input_amount"),
+                    Fwd.c.middle_src_token.label("middle_src_token"),
+                    Fwd.c.middle_src_amount.label("middle_src_amount"),
+                    MayanOrderFulfilled.middle_dst_token.label("middle_dst_token"),
+                    MayanOrderFulfilled.middle_dst_amount.label("middle_dst_amount"),
+                    MayanOrderFulfilled.net_amount.label("output_amount"),
+                    input_amount.label("refund_amount"),
+                    literal("0x0000000000000000000000000000000000000000").label("refund_token"),
+                    auction_data.c.auction_id.label("auction_id"),
+                    auction_data.c.auction_first_bid_timestamp.label("auction_first_bid_timestamp"),
+                    auction_data.c.auction_last_bid_timestamp.label("auction_last_bid_timestamp"),
+                    auction_data.c.auction_number_of_bids.label("auction_number_of_bids"),
+                    literal(0).label("native_fix_fee"),
+                    (MayanOrderFulfilled.net_amount * 0.000300090027 / (1 - 0.000300090027)).label(
+                        "percent_fee"
+                    ),
+                )
+                .join(
+                    MayanOrderCreated,
+                    MayanOrderCreated.transaction_hash == Fwd.c.transaction_hash,
+                )
+                .join(MayanOrderFulfilled, MayanOrderFulfilled.key == MayanOrderCreated.key)
+                .join(SrcTx, SrcTx.transaction_hash == Fwd.c.transaction_hash)
+                .join(DstTx, DstTx.transaction_hash == MayanOrderFulfilled.transaction_hash)
+                .outerjoin(MayanOrderUnlocked, MayanOrderCreated.key == MayanOrderUnlocked.key)
+                .outerjoin(
+                    RefundTx, RefundTx.transaction_hash == MayanOrderUnlocked.transaction_hash
                 )
+                .outerjoin(
+                    auction_data,
+                    auction_data.c.order_hash == MayanOrderFulfilled.key,
+                )
+                .filter(text(self.new_events_condition("src_tx", "dst_tx", "refund_tx")))
+            )
 
-            self.cross_chain_transactions_repo.create_all(cctxs)
+            self.insert_cctxs(self.cross_chain_transactions_repo, query)
 
             size = self.cross_chain_transactions_repo.get_number_of_records()
 
@@ -748,25 +528,20 @@ class MayanGenerator(BaseGenerator):
         func_name = "get_auction_data"
 
         try:
-            results = []
-
-            with self.cross_chain_transactions_repo.get_session() as session:
-                bid_tx = aliased(MayanBlockchainTransaction)
-
-                return (
-                    session.query(
-                        MayanAuctionBid.auction_state.label("auction_id"),
-                        MayanAuctionBid.order_hash.label("order_hash"),
-                        func.min(bid_tx.timestamp).label("auction_first_bid_timestamp"),
-                        func.max(bid_tx.timestamp).label("auction_last_bid_timestamp"),
-                        func.count(bid_tx.transaction_hash).label("auction_number_of_bids"),
-                    )
-                    .join(bid_tx, MayanAuctionBid.signature == bid_tx.transaction_hash)
-                    .group_by(MayanAuctionBid.auction_state, MayanAuctionBid.order_hash)
-                    .subquery()
+            bid_tx = aliased(MayanBlockchainTransaction)
+
+            return (
+                select(
+                    MayanAuctionBid.auction_state.label("auction_id"),
+                    MayanAuctionBid.order_hash.label("order_hash"),
+                    func.min(bid_tx.timestamp).label("auction_first_bid_timestamp"),
+                    func.max(bid_tx.timestamp).label("auction_last_bid_timestamp"),
+                    func.count(bid_tx.transaction_hash).label("auction_number_of_bids"),
                 )
-
-            return results
+                .join(bid_tx, MayanAuctionBid.signature == bid_tx.transaction_hash)
+                .group_by(MayanAuctionBid.auction_state, MayanAuctionBid.order_hash)
+                .subquery()
+            )
 
         except Exception as e:
             raise CustomException(
@@ -777,18 +552,15 @@ class MayanGenerator(BaseGenerator):
         start_time = time.time()
         log_to_cli(build_log_message_generator(self.bridge, "Fetching token prices..."))
 
+        planner = TokenInfoPlanner(self.bridge, self.token_metadata_repo, self.token_price_repo)
         for cctx in cctxs:
-            self.price_generator.populate_token_info(
-                self.bridge,
-                self.token_metadata_repo,
-                self.token_price_repo,
+            planner.add_pair(
                 cctx.src_blockchain,
                 cctx.dst_blockchain,
                 cctx.src_contract_address,
                 cctx.dst_contract_address,
-                start_ts,
-                end_ts,
             )
+        planner.run(start_ts, end_ts)
 
         end_time = time.time()
         log_to_cli(
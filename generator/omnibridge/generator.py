@@ -4,7 +4,8 @@ from sqlalchemy import text
 
 from config.constants import Bridge
 from generator.base_generator import BaseGenerator
-from generator.common.price_generator import PriceGenerator
+from generator.common.price_generator import PriceGenerator, UsdValue
+from generator.common.token_info_planner import TokenInfoPlanner
 from repository.common.repository import (
     NativeTokenRepository,
     TokenMetadataRepository,
@@ -71,7 +72,7 @@ class OmnibridgeGenerator(BaseGenerator):
             self.match_omnibridge_cctxs()
             self.match_operator_cctxs()
 
-            start_ts = int(self.transactions_repo.get_min_timestamp()) - 86400
+            start_ts = self.get_start_timestamp()
             end_ts = int(self.transactions_repo.get_max_timestamp()) + 86400
 
             ## POPULATE TOKEN TABLES WITH NATIVE TOKEN INFO
@@ -89,55 +90,39 @@ class OmnibridgeGenerator(BaseGenerator):
 
             # a lot of token addresses in Gnosis are not being recognized by alchemy, so we fetch
             # from both the src and dst blockchains, to make sure we use the Ethereum contracts
+            # (amounts are valued with the dst token, or else with the src token)
             PriceGenerator.calculate_cctx_usd_values(
                 self.bridge,
                 self.xdai_cross_chain_transactions,
-                "omnibridge_cross_chain_transactions",
-                "amount",
-                "src_blockchain",
-                "src_contract_address",
-                "src_timestamp",
-                "amount_usd",
+                [
+                    UsdValue(
+                        "amount_usd",
+                        "amount",
+                        "dst_blockchain",
+                        "dst_timestamp",
+                        "dst_contract_address",
+                    ),
+                    UsdValue(
+                        "amount_usd",
+                        "amount",
+                        "src_blockchain",
+                        "src_timestamp",
+                        "src_contract_address",
+                    ),
+                    UsdValue("src_fee_usd", "src_fee", "src_blockchain", "src_timestamp"),
+                    UsdValue("dst_fee_usd", "dst_fee", "dst_blockchain", "dst_timestamp"),
+                ],
             )
             PriceGenerator.calculate_cctx_usd_values(
-                self.bridge,
-                self.xdai_cross_chain_transactions,
-                "omnibridge_cross_chain_transactions",
-                "amount",
-                "dst_blockchain",
-                "dst_contract_address",
-                "dst_timestamp",
-                "amount_usd",
-            )
-
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.xdai_cross_chain_transactions,
-                "omnibridge_cross_chain_transactions",
-                "src_timestamp",
-                "src_blockchain",
-                "src_fee",
-                "src_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.xdai_cross_chain_transactions,
-                "omnibridge_cross_chain_transactions",
-                "dst_timestamp",
-                "dst_blockchain",
-                "dst_fee",
-                "dst_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
                 self.bridge,
                 self.operator_transactions,
-                "omnibridge_operator_transactions",
-                "timestamp",
-                "blockchain",
-                "fee",
-                "fee_usd",
+                [
+                    UsdValue("fee_usd", "fee", "blockchain", "timestamp"),
+                ],
             )
 
+            self.save_high_water_marks()
+
         except Exception as e:
             exception = CustomException(
                 self.CLASS_NAME,
@@ -152,10 +137,11 @@ class OmnibridgeGenerator(BaseGenerator):
         start_time = time.time()
         log_to_cli(build_log_message_generator(self.bridge, "Matching xDAI token transfers..."))
 
-        self.xdai_cross_chain_transactions.empty_table()
+        self.empty_cross_chain_table(self.xdai_cross_chain_transactions)
+        new_events = self.new_events_condition("src_tx", "dst_tx")
 
         query_gnosis_to_ethereum = text(
-            """
+            f"""
             INSERT INTO omnibridge_cross_chain_transactions (
                 src_blockchain,
                 src_transaction_hash,
@@ -205,12 +191,13 @@ class OmnibridgeGenerator(BaseGenerator):
             JOIN omnibridge_blockchain_transaction src_tx ON src_tx.transaction_hash = deposit.transaction_hash
             JOIN omnibridge_relayed_message fill ON fill.recipient = deposit.recipient AND fill.value = deposit.value AND fill.src_transaction_hash = src_tx.transaction_hash
             JOIN omnibridge_blockchain_transaction dst_tx ON dst_tx.transaction_hash = fill.transaction_hash
-            WHERE deposit.value is not NULL AND deposit.recipient is not NULL;
+            WHERE deposit.value is not NULL AND deposit.recipient is not NULL
+            AND {new_events};
         """  # noqa: E501
         )
 
         query_ethereum_to_gnosis = text(
-            """
+            f"""
             INSERT INTO omnibridge_cross_chain_transactions (
                 src_blockchain,
                 src_transaction_hash,
@@ -260,7 +247,8 @@ class OmnibridgeGenerator(BaseGenerator):
             JOIN omnibridge_blockchain_transaction src_tx ON src_tx.transaction_hash = deposit.transaction_hash
             JOIN omnibridge_affirmation_completed fill ON fill.recipient = deposit.recipient AND fill.value = deposit.value AND fill.src_transaction_hash = src_tx.transaction_hash
             JOIN omnibridge_blockchain_transaction dst_tx ON dst_tx.transaction_hash = fill.transaction_hash
-            WHERE deposit.value is not NULL AND deposit.recipient is not NULL;
+            WHERE deposit.value is not NULL AND deposit.recipient is not NULL
+            AND {new_events};
         """  # noqa: E501
         )
 
@@ -296,8 +284,10 @@ class OmnibridgeGenerator(BaseGenerator):
             build_log_message_generator(self.bridge, "Matching Omnibridge token transfers...")
         )
 
+        new_events = self.new_events_condition("src_tx", "dst_tx")
+
         query_gnosis_to_ethereum = text(
-            """
+            f"""
             INSERT INTO omnibridge_cross_chain_transactions (
                 src_blockchain,
                 src_transaction_hash,
@@ -348,12 +338,13 @@ class OmnibridgeGenerator(BaseGenerator):
             JOIN omnibridge_blockchain_transaction src_tx ON src_tx.transaction_hash = deposit.transaction_hash
             JOIN omnibridge_tokens_bridged fill ON fill.message_id = deposit2.message_id AND fill.value = deposit2.value
             JOIN omnibridge_blockchain_transaction dst_tx ON dst_tx.transaction_hash = fill.transaction_hash
-            WHERE deposit.message_id is not NULL AND deposit.encoded_data is not NULL;
+            WHERE deposit.message_id is not NULL AND deposit.encoded_data is not NULL
+            AND {new_events};
         """  # noqa: E501
         )
 
         query_ethereum_to_gnosis = text(
-            """
+            f"""
             INSERT INTO omnibridge_cross_chain_transactions (
                 src_blockchain,
                 src_transaction_hash,
@@ -404,7 +395,8 @@ class OmnibridgeGenerator(BaseGenerator):
             JOIN omnibridge_blockchain_transaction src_tx ON src_tx.transaction_hash = deposit.transaction_hash
             JOIN omnibridge_tokens_bridged fill ON fill.message_id = deposit2.message_id AND fill.value = deposit2.value
             JOIN omnibridge_blockchain_transaction dst_tx ON dst_tx.transaction_hash = fill.transaction_hash
-            WHERE deposit.message_id is not NULL AND deposit.encoded_data is not NULL;
+            WHERE deposit.message_id is not NULL AND deposit.encoded_data is not NULL
+            AND {new_events};
         """  # noqa: E501
         )
 
@@ -441,10 +433,11 @@ class OmnibridgeGenerator(BaseGenerator):
             build_log_message_generator(self.bridge, "Matching Omnibridge token transfers...")
         )
 
-        self.operator_transactions.empty_table()
+        self.empty_cross_chain_table(self.operator_transactions)
+        new_events = self.new_events_condition("tx")
 
         query = text(
-            """
+            f"""
             INSERT INTO omnibridge_operator_transactions (
                 blockchain,
                 transaction_hash,
@@ -467,7 +460,8 @@ class OmnibridgeGenerator(BaseGenerator):
                 tx.timestamp,
                 tx.status
             FROM omnibridge_signed_for_user_request sig
-            JOIN omnibridge_blockchain_transaction tx ON tx.transaction_hash = sig.transaction_hash;
+            JOIN omnibridge_blockchain_transaction tx ON tx.transaction_hash = sig.transaction_hash
+            WHERE {new_events};
         """
         )
 
@@ -498,18 +492,15 @@ class OmnibridgeGenerator(BaseGenerator):
         start_time = time.time()
         log_to_cli(build_log_message_generator(self.bridge, "Fetching token prices..."))
 
+        planner = TokenInfoPlanner(self.bridge, self.token_metadata_repo, self.token_price_repo)
         for cctx in cctxs:
-            self.price_generator.populate_token_info(
-                self.bridge,
-                self.token_metadata_repo,
-                self.token_price_repo,
+            planner.add_pair(
                 cctx.src_blockchain,
                 cctx.dst_blockchain,
                 cctx.src_contract_address,
                 cctx.dst_contract_address,
-                start_ts,
-                end_ts,
             )
+        planner.run(start_ts, end_ts)
 
         end_time = time.time()
         log_to_cli(
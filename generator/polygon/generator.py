@@ -4,7 +4,8 @@ from sqlalchemy import text
 
 from config.constants import Bridge
 from generator.base_generator import BaseGenerator
-from generator.common.price_generator import PriceGenerator
+from generator.common.price_generator import PriceGenerator, UsdValue
+from generator.common.token_info_planner import TokenInfoPlanner
 from repository.common.repository import (
     NativeTokenRepository,
     TokenMetadataRepository,
@@ -56,7 +57,7 @@ class PolygonGenerator(BaseGenerator):
             self.pos_bridge_match_deposits()
             self.plasma_bridge_match_deposits()
 
-            start_ts = int(self.transactions_repo.get_min_timestamp()) - 86400
+            start_ts = self.get_start_timestamp()
             end_ts = int(self.transactions_repo.get_max_timestamp()) + 86400
 
             # POPULATE TOKEN TABLES WITH NATIVE TOKEN INFO
@@ -77,60 +78,36 @@ class PolygonGenerator(BaseGenerator):
             PriceGenerator.calculate_cctx_usd_values(
                 self.bridge,
                 self.pos_bridge_cross_chain_transactions_repo,
-                "polygon_cross_chain_transactions",
-                "amount",
-                "src_blockchain",
-                "src_contract_address",
-                "src_timestamp",
-                "amount_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.pos_bridge_cross_chain_transactions_repo,
-                "polygon_cross_chain_transactions",
-                "src_timestamp",
-                "src_blockchain",
-                "src_fee",
-                "src_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.pos_bridge_cross_chain_transactions_repo,
-                "polygon_cross_chain_transactions",
-                "dst_timestamp",
-                "dst_blockchain",
-                "dst_fee",
-                "dst_fee_usd",
+                [
+                    UsdValue(
+                        "amount_usd",
+                        "amount",
+                        "src_blockchain",
+                        "src_timestamp",
+                        "src_contract_address",
+                    ),
+                    UsdValue("src_fee_usd", "src_fee", "src_blockchain", "src_timestamp"),
+                    UsdValue("dst_fee_usd", "dst_fee", "dst_blockchain", "dst_timestamp"),
+                ],
             )
 
             PriceGenerator.calculate_cctx_usd_values(
                 self.bridge,
                 self.plasma_bridge_cross_chain_transactions_repo,
-                "polygon_plasma_cross_chain_transactions",
-                "amount",
-                "src_blockchain",
-                "src_contract_address",
-                "src_timestamp",
-                "amount_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.plasma_bridge_cross_chain_transactions_repo,
-                "polygon_plasma_cross_chain_transactions",
-                "src_timestamp",
-                "src_blockchain",
-                "src_fee",
-                "src_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.plasma_bridge_cross_chain_transactions_repo,
-                "polygon_plasma_cross_chain_transactions",
-                "dst_timestamp",
-                "dst_blockchain",
-                "dst_fee",
-                "dst_fee_usd",
+                [
+                    UsdValue(
+                        "amount_usd",
+                        "amount",
+                        "src_blockchain",
+                        "src_timestamp",
+                        "src_contract_address",
+                    ),
+                    UsdValue("src_fee_usd", "src_fee", "src_blockchain", "src_timestamp"),
+                    UsdValue("dst_fee_usd", "dst_fee", "dst_blockchain", "dst_timestamp"),
+                ],
             )
+
+            self.save_high_water_marks()
         except Exception as e:
             exception = CustomException(
                 self.CLASS_NAME,
@@ -149,10 +126,11 @@ class PolygonGenerator(BaseGenerator):
             )
         )
 
-        self.pos_bridge_cross_chain_transactions_repo.empty_table()
+        self.empty_cross_chain_table(self.pos_bridge_cross_chain_transactions_repo)
+        new_events = self.new_events_condition("src_tx", "dst_tx")
 
         query = text(
-            """
+            f"""
             INSERT INTO polygon_cross_chain_transactions (
                 src_blockchain,
                 src_transaction_hash,
@@ -200,7 +178,8 @@ class PolygonGenerator(BaseGenerator):
             JOIN polygon_state_synced deposit_state ON deposit_state.transaction_hash = deposit.transaction_hash
             JOIN polygon_blockchain_transactions src_tx ON deposit.transaction_hash = src_tx.transaction_hash
             JOIN polygon_state_committed fill ON fill.state_id = deposit_state.state_id
-            JOIN polygon_blockchain_transactions dst_tx ON dst_tx.transaction_hash = fill.transaction_hash;
+            JOIN polygon_blockchain_transactions dst_tx ON dst_tx.transaction_hash = fill.transaction_hash
+            WHERE {new_events};
         """  # noqa: E501
         )
 
@@ -237,10 +216,11 @@ class PolygonGenerator(BaseGenerator):
             )
         )
 
-        self.plasma_bridge_cross_chain_transactions_repo.empty_table()
+        self.empty_cross_chain_table(self.plasma_bridge_cross_chain_transactions_repo)
+        new_events = self.new_events_condition("src_tx", "dst_tx")
 
         query = text(
-            """
+            f"""
             INSERT INTO polygon_plasma_cross_chain_transactions (
                 src_blockchain,
                 src_transaction_hash,
@@ -294,6 +274,7 @@ class PolygonGenerator(BaseGenerator):
             AND deposit.amount = fill.amount
             AND fill.deposit_count = deposit.deposit_block_id
             AND deposit.token = fill.root_token
+            AND {new_events}
             UNION
             SELECT
                 src_tx.blockchain AS src_blockchain,
@@ -320,6 +301,7 @@ class PolygonGenerator(BaseGenerator):
             JOIN polygon_blockchain_transactions src_tx ON deposit.transaction_hash = src_tx.transaction_hash
             JOIN polygon_bridge_withdraw fill ON fill.token = deposit.token AND deposit.from_address = fill.user AND deposit.amount = fill.amount
             JOIN polygon_blockchain_transactions dst_tx ON dst_tx.transaction_hash = fill.transaction_hash
+            WHERE {new_events}
             );
         """  # noqa: E501
         )
@@ -351,18 +333,15 @@ class PolygonGenerator(BaseGenerator):
         start_time = time.time()
         log_to_cli(build_log_message_generator(self.bridge, "Fetching token prices..."))
 
+        planner = TokenInfoPlanner(self.bridge, self.token_metadata_repo, self.token_price_repo)
         for cctx in cctxs:
-            self.price_generator.populate_token_info(
-                self.bridge,
-                self.token_metadata_repo,
-                self.token_price_repo,
+            planner.add_pair(
                 cctx.src_blockchain,
                 None,
                 cctx.src_contract_address,
                 None,
-                start_ts,
-                end_ts,
             )
+        planner.run(start_ts, end_ts)
 
         end_time = time.time()
         log_to_cli(
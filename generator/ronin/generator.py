@@ -4,7 +4,8 @@ from sqlalchemy import text
 
 from config.constants import Bridge
 from generator.base_generator import BaseGenerator
-from generator.common.price_generator import PriceGenerator
+from generator.common.price_generator import PriceGenerator, UsdValue
+from generator.common.token_info_planner import TokenInfoPlanner
 from repository.common.repository import (
     NativeTokenRepository,
     TokenMetadataRepository,
@@ -55,7 +56,7 @@ class RoninGenerator(BaseGenerator):
         try:
             self.match_deposits()
 
-            start_ts = int(self.transactions_repo.get_min_timestamp()) - 86400
+            start_ts = self.get_start_timestamp()
             end_ts = int(self.transactions_repo.get_max_timestamp()) + 86400
 
             # POPULATE TOKEN TABLES WITH NATIVE TOKEN INFO
@@ -75,45 +76,32 @@ class RoninGenerator(BaseGenerator):
             cctxs = self.cross_chain_transactions_repo.get_unique_src_dst_contract_pairs()
             self.populate_token_info_tables(cctxs, start_ts, end_ts)
 
+            # amounts are valued with the destination token, or else with the source token
             PriceGenerator.calculate_cctx_usd_values(
                 self.bridge,
                 self.cross_chain_transactions_repo,
-                "ronin_cross_chain_transactions",
-                "amount",
-                "src_blockchain",
-                "src_contract_address",
-                "src_timestamp",
-                "amount_usd",
-            )
-            PriceGenerator.calculate_cctx_usd_values(
-                self.bridge,
-                self.cross_chain_transactions_repo,
-                "ronin_cross_chain_transactions",
-                "amount",
-                "dst_blockchain",
-                "dst_contract_address",
-                "dst_timestamp",
-                "amount_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.cross_chain_transactions_repo,
-                "ronin_cross_chain_transactions",
-                "src_timestamp",
-                "src_blockchain",
-                "src_fee",
-                "src_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.cross_chain_transactions_repo,
-                "ronin_cross_chain_transactions",
-                "dst_timestamp",
-                "dst_blockchain",
-                "dst_fee",
-                "dst_fee_usd",
+                [
+                    UsdValue(
+                        "amount_usd",
+                        "amount",
+                        "dst_blockchain",
+                        "dst_timestamp",
+                        "dst_contract_address",
+                    ),
+                    UsdValue(
+                        "amount_usd",
+                        "amount",
+                        "src_blockchain",
+                        "src_timestamp",
+                        "src_contract_address",
+                    ),
+                    UsdValue("src_fee_usd", "src_fee", "src_blockchain", "src_timestamp"),
+                    UsdValue("dst_fee_usd", "dst_fee", "dst_blockchain", "dst_timestamp"),
+                ],
             )
 
+            self.save_high_water_marks()
+
         except Exception as e:
             exception = CustomException(
                 self.CLASS_NAME,
@@ -130,10 +118,11 @@ class RoninGenerator(BaseGenerator):
             build_log_message_generator(self.bridge, "Matching cross-chain token transfers...")
         )
 
-        self.cross_chain_transactions_repo.empty_table()
+        self.empty_cross_chain_table(self.cross_chain_transactions_repo)
+        new_events = self.new_events_condition("src_tx", "dst_tx")
 
         query = text(
-            """
+            f"""
             INSERT INTO ronin_cross_chain_transactions (
                 src_blockchain,
                 src_transaction_hash,
@@ -188,6 +177,7 @@ class RoninGenerator(BaseGenerator):
             AND deposit.recipient = fill.recipient
             AND deposit.input_token = fill.input_token
             AND deposit.output_token = fill.output_token
+            AND {new_events}
             UNION
             SELECT
                 src_tx.blockchain,
@@ -220,7 +210,8 @@ class RoninGenerator(BaseGenerator):
             AND withdrawal.recipient = fill.recipient
             AND withdrawal.recipient = fill.recipient
             AND withdrawal.input_token = fill.input_token
-            AND withdrawal.output_token = fill.output_token);
+            AND withdrawal.output_token = fill.output_token
+            AND {new_events});
         """  # noqa: E501
         )
 
@@ -251,18 +242,15 @@ class RoninGenerator(BaseGenerator):
         start_time = time.time()
         log_to_cli(build_log_message_generator(self.bridge, "Fetching token prices..."))
 
+        planner = TokenInfoPlanner(self.bridge, self.token_metadata_repo, self.token_price_repo)
         for cctx in cctxs:
-            self.price_generator.populate_token_info(
-                self.bridge,
-                self.token_metadata_repo,
-                self.token_price_repo,
+            planner.add_pair(
                 cctx.src_blockchain,
                 cctx.dst_blockchain,
                 cctx.src_contract_address,
                 cctx.dst_contract_address,
-                start_ts,
-                end_ts,
             )
+        planner.run(start_ts, end_ts)
 
         end_time = time.time()
         log_to_cli(
@@ -5,7 +5,8 @@ from sqlalchemy import text
 from config.constants import Bridge
 from extractor.stargate.constants import STARGATE_OFT_TOKEN_MAPPING, STARGATE_POOL_TOKEN_MAPPING
 from generator.base_generator import BaseGenerator
-from generator.common.price_generator import PriceGenerator
+from generator.common.price_generator import PriceGenerator, UsdValue
+from generator.common.token_info_planner import TokenInfoPlanner
 from repository.common.repository import (
     NativeTokenRepository,
     TokenMetadataRepository,
@@ -59,7 +60,7 @@ class StargateGenerator(BaseGenerator):
             self.match_token_transfers()
             self.match_swap_events()
 
-            start_ts = int(self.transactions_repo.get_min_timestamp()) - 86400
+            start_ts = self.get_start_timestamp()
             end_ts = int(self.transactions_repo.get_max_timestamp()) + 86400
 
             ## POPULATE TOKEN TABLES WITH NATIVE TOKEN INFO
@@ -73,263 +74,114 @@ class StargateGenerator(BaseGenerator):
             )
 
             ## POPULATE TOKEN TABLES WITH CROSS CHAIN TRANSACTIONS INFO
-            cctxs = self.bus_cross_chain_transactions_repo.get_unique_src_dst_contract_pairs()
-            self.populate_token_info_liquidity_pools(cctxs, start_ts, end_ts)
-
-            cctxs = self.oft_cross_chain_transactions.get_unique_src_dst_contract_pairs()
-            self.populate_token_info_liquidity_pools(cctxs, start_ts, end_ts)
+            # the tokens of all cross-chain tables are fetched together
+            token_pairs = []
+            for repo in (
+                self.bus_cross_chain_transactions_repo,
+                self.oft_cross_chain_transactions,
+                self.cross_chain_swap_repo,
+            ):
+                token_pairs += self.get_token_pairs(
+                    repo.get_unique_src_dst_contract_pairs(), STARGATE_POOL_TOKEN_MAPPING
+                )
 
-            cctxs = self.cross_chain_token_transfers_repo.get_unique_src_dst_contract_pairs()
-            self.populate_token_info_cctxs(cctxs, start_ts, end_ts)
+            token_pairs += self.get_token_pairs(
+                self.cross_chain_token_transfers_repo.get_unique_src_dst_contract_pairs(),
+                STARGATE_OFT_TOKEN_MAPPING,
+            )
 
-            cctxs = self.cross_chain_swap_repo.get_unique_src_dst_contract_pairs()
-            self.populate_token_info_liquidity_pools(cctxs, start_ts, end_ts)
+            self.populate_token_info_tables(token_pairs, start_ts, end_ts)
 
             ## CALCULATE USD VALUES (AND POPULATE CORRESPONDING COLUMNS)
             # FOR CROSS CHAIN TRANSACTIONS (VALUE TRANSACTED AND FEES)
             PriceGenerator.calculate_cctx_usd_values(
                 self.bridge,
                 self.bus_cross_chain_transactions_repo,
-                "stargate_bus_cross_chain_transactions",
-                "amount_received_ld",
-                "src_blockchain",
-                "src_contract_address",
-                "user_timestamp",
-                "amount_received_ld_usd",
-            )
-            PriceGenerator.calculate_cctx_usd_values(
-                self.bridge,
-                self.bus_cross_chain_transactions_repo,
-                "stargate_bus_cross_chain_transactions",
-                "amount_sent_ld",
-                "src_blockchain",
-                "src_contract_address",
-                "user_timestamp",
-                "amount_sent_ld_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.bus_cross_chain_transactions_repo,
-                "stargate_bus_cross_chain_transactions",
-                "user_timestamp",
-                "src_blockchain",
-                "user_fee",
-                "user_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.bus_cross_chain_transactions_repo,
-                "stargate_bus_cross_chain_transactions",
-                "user_timestamp",
-                "src_blockchain",
-                "bus_fee",
-                "bus_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.bus_cross_chain_transactions_repo,
-                "stargate_bus_cross_chain_transactions",
-                "user_timestamp",
-                "src_blockchain",
-                "bus_fare",
-                "bus_fare_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.bus_cross_chain_transactions_repo,
-                "stargate_bus_cross_chain_transactions",
-                "user_timestamp",
-                "src_blockchain",
-                "executor_fee",
-                "executor_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.bus_cross_chain_transactions_repo,
-                "stargate_bus_cross_chain_transactions",
-                "user_timestamp",
-                "src_blockchain",
-                "dvn_fee",
-                "dvn_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.bus_cross_chain_transactions_repo,
-                "stargate_bus_cross_chain_transactions",
-                "dst_timestamp",
-                "dst_blockchain",
-                "dst_fee",
-                "dst_fee_usd",
+                [
+                    UsdValue(
+                        "amount_received_ld_usd",
+                        "amount_received_ld",
+                        "src_blockchain",
+                        "user_timestamp",
+                        "src_contract_address",
+                    ),
+                    UsdValue(
+                        "amount_sent_ld_usd",
+                        "amount_sent_ld",
+                        "src_blockchain",
+                        "user_timestamp",
+                        "src_contract_address",
+                    ),
+                    UsdValue("user_fee_usd", "user_fee", "src_blockchain", "user_timestamp"),
+                    UsdValue("bus_fee_usd", "bus_fee", "src_blockchain", "user_timestamp"),
+                    UsdValue("bus_fare_usd", "bus_fare", "src_blockchain", "user_timestamp"),
+                    UsdValue(
+                        "executor_fee_usd", "executor_fee", "src_blockchain", "user_timestamp"
+                    ),
+                    UsdValue("dvn_fee_usd", "dvn_fee", "src_blockchain", "user_timestamp"),
+                    UsdValue("dst_fee_usd", "dst_fee", "dst_blockchain", "dst_timestamp"),
+                ],
             )
 
             PriceGenerator.calculate_cctx_usd_values(
                 self.bridge,
                 self.oft_cross_chain_transactions,
-                "stargate_oft_cross_chain_transactions",
-                "amount",
-                "src_blockchain",
-                "src_contract_address",
-                "src_timestamp",
-                "amount_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.oft_cross_chain_transactions,
-                "stargate_oft_cross_chain_transactions",
-                "src_timestamp",
-                "src_blockchain",
-                "src_fee",
-                "src_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.oft_cross_chain_transactions,
-                "stargate_oft_cross_chain_transactions",
-                "src_timestamp",
-                "src_blockchain",
-                "executor_fee",
-                "executor_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.oft_cross_chain_transactions,
-                "stargate_oft_cross_chain_transactions",
-                "src_timestamp",
-                "src_blockchain",
-                "dvn_fee",
-                "dvn_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.oft_cross_chain_transactions,
-                "stargate_oft_cross_chain_transactions",
-                "dst_timestamp",
-                "dst_blockchain",
-                "dst_fee",
-                "dst_fee_usd",
+                [
+                    UsdValue(
+                        "amount_usd",
+                        "amount",
+                        "src_blockchain",
+                        "src_timestamp",
+                        "src_contract_address",
+                    ),
+                    UsdValue("src_fee_usd", "src_fee", "src_blockchain", "src_timestamp"),
+                    UsdValue("executor_fee_usd", "executor_fee", "src_blockchain", "src_timestamp"),
+                    UsdValue("dvn_fee_usd", "dvn_fee", "src_blockchain", "src_timestamp"),
+                    UsdValue("dst_fee_usd", "dst_fee", "dst_blockchain", "dst_timestamp"),
+                ],
             )
 
             PriceGenerator.calculate_cctx_usd_values(
                 self.bridge,
                 self.cross_chain_token_transfers_repo,
-                "stargate_cross_chain_token_transfers",
-                "amount",
-                "src_blockchain",
-                "src_contract_address",
-                "src_timestamp",
-                "amount_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.oft_cross_chain_transactions,
-                "stargate_cross_chain_token_transfers",
-                "src_timestamp",
-                "src_blockchain",
-                "src_fee",
-                "src_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.oft_cross_chain_transactions,
-                "stargate_cross_chain_token_transfers",
-                "src_timestamp",
-                "src_blockchain",
-                "verifier_fee",
-                "verifier_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.oft_cross_chain_transactions,
-                "stargate_cross_chain_token_transfers",
-                "src_timestamp",
-                "src_blockchain",
-                "relayer_fee",
-                "relayer_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.oft_cross_chain_transactions,
-                "stargate_cross_chain_token_transfers",
-                "dst_timestamp",
-                "dst_blockchain",
-                "dst_fee",
-                "dst_fee_usd",
+                [
+                    UsdValue(
+                        "amount_usd",
+                        "amount",
+                        "src_blockchain",
+                        "src_timestamp",
+                        "src_contract_address",
+                    ),
+                    UsdValue("src_fee_usd", "src_fee", "src_blockchain", "src_timestamp"),
+                    UsdValue("verifier_fee_usd", "verifier_fee", "src_blockchain", "src_timestamp"),
+                    UsdValue("relayer_fee_usd", "relayer_fee", "src_blockchain", "src_timestamp"),
+                    UsdValue("dst_fee_usd", "dst_fee", "dst_blockchain", "dst_timestamp"),
+                ],
             )
 
             PriceGenerator.calculate_cctx_usd_values(
                 self.bridge,
                 self.cross_chain_swap_repo,
-                "stargate_cross_chain_swaps",
-                "amount_sd",
-                "src_blockchain",
-                "src_contract_address",
-                "src_timestamp",
-                "amount_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.cross_chain_swap_repo,
-                "stargate_cross_chain_swaps",
-                "src_timestamp",
-                "src_blockchain",
-                "src_fee",
-                "src_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.cross_chain_swap_repo,
-                "stargate_cross_chain_swaps",
-                "dst_timestamp",
-                "dst_blockchain",
-                "dst_fee",
-                "dst_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.cross_chain_swap_repo,
-                "stargate_cross_chain_swaps",
-                "src_timestamp",
-                "src_blockchain",
-                "verifier_fee",
-                "verifier_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.cross_chain_swap_repo,
-                "stargate_cross_chain_swaps",
-                "src_timestamp",
-                "src_blockchain",
-                "relayer_fee",
-                "relayer_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.cross_chain_swap_repo,
-                "stargate_cross_chain_swaps",
-                "src_timestamp",
-                "src_blockchain",
-                "protocol_fee",
-                "protocol_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.cross_chain_swap_repo,
-                "stargate_cross_chain_swaps",
-                "src_timestamp",
-                "src_blockchain",
-                "eq_fee",
-                "eq_fee_usd",
-            )
-            PriceGenerator.calculate_cctx_native_usd_values(
-                self.bridge,
-                self.cross_chain_swap_repo,
-                "stargate_cross_chain_swaps",
-                "src_timestamp",
-                "src_blockchain",
-                "lp_fee",
-                "lp_fee_usd",
+                [
+                    UsdValue(
+                        "amount_usd",
+                        "amount_sd",
+                        "src_blockchain",
+                        "src_timestamp",
+                        "src_contract_address",
+                    ),
+                    UsdValue("src_fee_usd", "src_fee", "src_blockchain", "src_timestamp"),
+                    UsdValue("dst_fee_usd", "dst_fee", "dst_blockchain", "dst_timestamp"),
+                    UsdValue("verifier_fee_usd", "verifier_fee", "src_blockchain", "src_timestamp"),
+                    UsdValue("relayer_fee_usd", "relayer_fee", "src_blockchain", "src_timestamp"),
+                    UsdValue("protocol_fee_usd", "protocol_fee", "src_blockchain", "src_timestamp"),
+                    UsdValue("eq_fee_usd", "eq_fee", "src_blockchain", "src_timestamp"),
+                    UsdValue("lp_fee_usd", "lp_fee", "src_blockchain", "src_timestamp"),
+                ],
             )
 
+            self.save_high_water_marks()
+
         except Exception as e:
             exception = CustomException(
                 self.CLASS_NAME,
@@ -344,10 +196,11 @@ class StargateGenerator(BaseGenerator):
         start_time = time.time()
         log_to_cli(build_log_message_generator(self.bridge, "Matching token transfers..."))
 
-        self.cross_chain_token_transfers_repo.empty_table()
+        self.empty_cross_chain_table(self.cross_chain_token_transfers_repo)
+        new_events = self.new_events_condition("src_tx", "dst_tx")
 
         query = text(
-            """
+            f"""
             INSERT INTO stargate_cross_chain_token_transfers (
                 src_blockchain,
                 src_transaction_hash,
@@ -409,7 +262,8 @@ class StargateGenerator(BaseGenerator):
             JOIN stargate_oft_receive_from_chain oft_receive_from_chain ON oft_receive_from_chain.transaction_hash = packet_received.transaction_hash
             WHERE oft_receive_from_chain.amount = oft_send_to_chain.amount
             AND oft_send_to_chain.dst_blockchain = oft_receive_from_chain.blockchain
-            AND oft_send_to_chain.blockchain = src_tx.blockchain;
+            AND oft_send_to_chain.blockchain = src_tx.blockchain
+            AND {new_events};
         """  # noqa: E501
         )
 
@@ -442,10 +296,11 @@ class StargateGenerator(BaseGenerator):
         start_time = time.time()
         log_to_cli(build_log_message_generator(self.bridge, "Matching cross-chain swaps..."))
 
-        self.cross_chain_swap_repo.empty_table()
+        self.empty_cross_chain_table(self.cross_chain_swap_repo)
+        new_events = self.new_events_condition("src_tx", "dst_tx")
 
         query = text(
-            """
+            f"""
             INSERT INTO stargate_cross_chain_swap (
                 src_blockchain,
                 src_transaction_hash,
@@ -523,7 +378,8 @@ class StargateGenerator(BaseGenerator):
             JOIN stargate_swap_remote swap_remote ON swap_remote.transaction_hash = packet_received.transaction_hash
             WHERE swap_remote.amount_sd = swap.amount_sd
             AND swap.protocol_fee = swap_remote.protocol_fee
-            AND swap.eq_fee = swap_remote.dst_fee;
+            AND swap.eq_fee = swap_remote.dst_fee
+            AND {new_events};
         """  # noqa: E501
         )
 
@@ -556,10 +412,11 @@ class StargateGenerator(BaseGenerator):
         start_time = time.time()
         log_to_cli(build_log_message_generator(self.bridge, "Matching OFT token transfers..."))
 
-        self.oft_cross_chain_transactions.empty_table()
+        self.empty_cross_chain_table(self.oft_cross_chain_transactions)
+        new_events = self.new_events_condition("src_tx", "dst_tx")
 
         query = text(
-            """
+            f"""
             INSERT INTO stargate_oft_cross_chain_transactions (
                 src_blockchain,
                 src_transaction_hash,
@@ -618,7 +475,8 @@ class StargateGenerator(BaseGenerator):
             JOIN stargate_oft_received oft_received ON oft_received.guid = oft_sent.guid
             JOIN stargate_blockchain_transactions dst_tx ON dst_tx.transaction_hash = oft_received.transaction_hash
             WHERE oft_sent.dst_blockchain = oft_received.blockchain
-            AND oft_sent.blockchain = oft_received.src_blockchain;
+            AND oft_sent.blockchain = oft_received.src_blockchain
+            AND {new_events};
         """  # noqa: E501
         )
 
@@ -653,10 +511,11 @@ class StargateGenerator(BaseGenerator):
             build_log_message_generator(self.bridge, "Matching bus cross-chain transfers...")
         )
 
-        self.bus_cross_chain_transactions_repo.empty_table()
+        self.empty_cross_chain_table(self.bus_cross_chain_transactions_repo)
+        new_events = self.new_events_condition("user_tx", "bus_tx", "dst_tx")
 
         query = text(
-            """
+            f"""
             WITH bus_rode AS (
                 SELECT *, ROW_NUMBER() OVER (PARTITION BY transaction_hash) AS event_index
                 FROM stargate_bus_rode
@@ -757,7 +616,8 @@ class StargateGenerator(BaseGenerator):
             JOIN stargate_blockchain_transactions dst_tx ON dst_tx.transaction_hash = oft_received.transaction_hash
             WHERE bus_rode.blockchain = oft_sent.blockchain
             AND bus_rode.blockchain = bus_driven.blockchain
-            AND oft_sent.blockchain = bus_driven.blockchain;
+            AND oft_sent.blockchain = bus_driven.blockchain
+            AND {new_events};
         """  # noqa: E501
         )
 
@@ -784,78 +644,52 @@ class StargateGenerator(BaseGenerator):
                 f"Error processing bus transactions. Error: {e}",
             ) from e
 
-    def populate_token_info_liquidity_pools(self, cctxs, start_ts, end_ts):
-        for cctx in cctxs:
-            try:
-                input_token = STARGATE_POOL_TOKEN_MAPPING[cctx.src_blockchain][
-                    cctx.src_contract_address
-                ]
-                output_token = STARGATE_POOL_TOKEN_MAPPING[cctx.dst_blockchain][
-                    cctx.dst_contract_address
-                ]
-
-                self.price_generator.populate_token_info(
-                    self.bridge,
-                    self.token_metadata_repo,
-                    self.token_price_repo,
-                    cctx.src_blockchain,
-                    cctx.dst_blockchain,
-                    input_token,
-                    output_token,
-                    start_ts,
-                    end_ts,
-                    cctx.src_contract_address,
-                    cctx.dst_contract_address,
-                )
-            except Exception as e:
-                log_error(
-                    self.bridge,
-                    CustomException(
-                        self.CLASS_NAME,
-                        "populate_token_info_liquidity_pools",
-                        (
-                            f"Error populating token info for bus cross chain transactions."
-                            f"CCTX: {cctx} Error: {e}",
-                        ),
-                    ),
-                )
+    def get_token_pairs(self, cctxs, token_mapping: dict) -> list:
+        """
+        Maps the pairs of contracts (liquidity pools or OFTs) of a cross-chain table to their
+        tokens, with `token_mapping` (blockchain -> contract -> token).
+        """
+        token_pairs = []
 
-    def populate_token_info_cctxs(self, cctxs, start_ts, end_ts):
         for cctx in cctxs:
             try:
-                input_token = STARGATE_OFT_TOKEN_MAPPING[cctx.src_blockchain][
-                    cctx.src_contract_address
-                ]
-                output_token = STARGATE_OFT_TOKEN_MAPPING[cctx.dst_blockchain][
-                    cctx.dst_contract_address
-                ]
-
-                self.price_generator.populate_token_info(
-                    self.bridge,
-                    self.token_metadata_repo,
-                    self.token_price_repo,
-                    cctx.src_blockchain,
-                    cctx.dst_blockchain,
-                    input_token,
-                    output_token,
-                    start_ts,
-                    end_ts,
-                    cctx.src_contract_address
-                    if input_token != cctx.src_contract_address
-                    else input_token,
-                    cctx.dst_contract_address
-                    if output_token != cctx.dst_contract_address
-                    else output_token,
+                token_pairs.append(
+                    (
+                        cctx.src_blockchain,
+                        cctx.dst_blockchain,
+                        token_mapping[cctx.src_blockchain][cctx.src_contract_address],
+                        token_mapping[cctx.dst_blockchain][cctx.dst_contract_address],
+                        cctx.src_contract_address,
+                        cctx.dst_contract_address,
+                    )
                 )
             except Exception as e:
                 log_error(
                     self.bridge,
                     CustomException(
                         self.CLASS_NAME,
-                        "populate_token_info_cctxs",
-                        (
-                            f"Error populating token info for cross chain token transfers. "
-                            f"CCTX: {cctx} Error: {e}",
-                        ),
+                        "get_token_pairs",
+                        f"Error mapping the contracts of CCTX: {cctx} to tokens. Error: {e}",
                     ),
                 )
+
+        return token_pairs
+
+    def populate_token_info_tables(self, cctxs, start_ts, end_ts):
+        """`cctxs` are the token pairs of all cross-chain tables, as given by get_token_pairs."""
+        start_time = time.time()
+        log_to_cli(build_log_message_generator(self.bridge, "Fetching token prices..."))
+
+        planner = TokenInfoPlanner(self.bridge, self.token_metadata_repo, self.token_price_repo)
+        for token_pair in cctxs:
+            planner.add_pair(*token_pair)
+        planner.run(start_ts, end_ts)
+
+        end_time = time.time()
+        log_to_cli(
+            build_log_message_generator(
+                self.bridge,
+                f"Token prices fetched in {end_time - start_time} seconds.",
+            ),
+            CliColor.SUCCESS,
+        )
@@ -1,6 +1,7 @@
 from sqlalchemy import Index, func
 
 from repository.base import BaseRepository
+from repository.common.repository import BlockchainTransactionRepository
 
 from .models import (
     AcrossBlockchainTransaction,
@@ -63,7 +64,7 @@ class AcrossV3FundsDepositedRepository(BaseRepository):
             )
 
 
-class AcrossBlockchainTransactionRepository(BaseRepository):
+class AcrossBlockchainTransactionRepository(BlockchainTransactionRepository):
     def __init__(self, session_factory):
         super().__init__(AcrossBlockchainTransaction, session_factory)
 
@@ -136,6 +137,15 @@ class AcrossCrossChainTransactionRepository(BaseRepository):
 
 Index("ix_blockchain_transactions_tx_hash", AcrossBlockchainTransaction.transaction_hash)
 Index("ix_filled_v3_relay_tx_hash", AcrossFilledV3Relay.transaction_hash)
-Index("ix_filled_v3_relay_deposit_id", AcrossFilledV3Relay.deposit_id)
+Index("ix_filled_v3_relay_deposit_id", AcrossFilledV3Relay.deposit_id, unique=True)
 Index("ix_funds_deposited_tx_hash", AcrossV3FundsDeposited.transaction_hash)
-Index("ix_funds_deposited_deposit_id", AcrossV3FundsDeposited.deposit_id)
+Index("ix_funds_deposited_deposit_id", AcrossV3FundsDeposited.deposit_id, unique=True)
+Index(
+    "ix_relayer_refund_unique_key",
+    AcrossRelayerRefund.transaction_hash,
+    AcrossRelayerRefund.amount_to_return,
+    AcrossRelayerRefund.refund_amount,
+    AcrossRelayerRefund.l2_token_address,
+    AcrossRelayerRefund.refund_address,
+    unique=True,
+)
@@ -1,8 +1,58 @@
+import contextvars
 from abc import abstractmethod
 from contextlib import contextmanager
 
+from sqlalchemy.dialects.postgresql import insert
+
 from utils.utils import log_error
 
+# session of the unit of work running in the current thread or task, shared by the queries of
+# all repositories until the unit of work ends
+current_session = contextvars.ContextVar("current_session", default=None)
+
+
+@contextmanager
+def unit_of_work(session_factory):
+    """
+    Runs the queries of all repositories within the context in a single session and transaction,
+    committed on exit (or rolled back if the context raises). Each query runs in a savepoint, so
+    a failing query (e.g., a row violating a constraint) only undoes its own changes. A unit of
+    work started within another one joins it.
+    """
+    if current_session.get() is not None:
+        yield
+        return
+
+    session = session_factory()
+    session.expire_on_commit = False
+    session.info["on_commit"] = []
+    token = current_session.set(session)
+    try:
+        yield
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        current_session.reset(token)
+        session.close()
+
+    for callback, args in session.info["on_commit"]:
+        callback(*args)
+
+
+def on_commit(callback, *args) -> None:
+    """
+    Calls `callback` once the changes made so far are committed: at the end of the current unit
+    of work (never, if it is rolled back), or right away outside a unit of work.
+    """
+    session = current_session.get()
+
+    if session is None:
+        callback(*args)
+    else:
+        session.info["on_commit"].append((callback, args))
+
 
 class BaseRepository:
     def __init__(self, model, session_factory):
@@ -11,6 +61,21 @@ class BaseRepository:
 
     @contextmanager
     def get_session(self):
+        session = current_session.get()
+
+        if session is not None:
+            # within a unit of work, the query runs in a savepoint of its transaction, which is
+            # only committed when the unit of work ends
+            savepoint = session.begin_nested()
+            try:
+                yield session
+                savepoint.commit()
+            except Exception as e:
+                savepoint.rollback()
+                log_error(self.model.__name__, e)
+                raise e
+            return
+
         session = self._session_factory()
         session.expire_on_commit = False
         try:
@@ -66,6 +131,44 @@ class BaseRepository:
             session.flush()
             return objs
 
+    def get_key_columns(self) -> list:
+        """
+        Returns the columns identifying a record: those of the first unique index of the model
+        (its natural key), or else its primary key.
+        """
+        table = self.model.__table__
+
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            if index.unique:
+                return list(index.columns)
+
+        return list(table.primary_key.columns)
+
+    def upsert_all(self, objs_data: list) -> list:
+        """
+        Insert many records with a single INSERT ... ON CONFLICT DO NOTHING statement (split in
+        pages of rows by the driver), skipping records that violate a unique constraint, e.g.,
+        because they were already written. Returns the keys (see `get_key_columns`) of the
+        records inserted, i.e., of those that were not written yet.
+        """
+        if self.model is None:
+            raise ValueError("Model is not defined for this repository.")
+
+        if len(objs_data) == 0:
+            return []
+
+        # build the objects as `create` does, such that the model's constructor is applied
+        objs = [data if isinstance(data, self.model) else self.model(**data) for data in objs_data]
+        rows = [
+            {key: value for key, value in vars(obj).items() if not key.startswith("_")}
+            for obj in objs
+        ]
+
+        statement = insert(self.model).on_conflict_do_nothing().returning(*self.get_key_columns())
+
+        with self.get_session() as session:
+            return [tuple(key) for key in session.execute(statement, rows).all()]
+
     def execute(self, query):
         """
         Execute a raw SQL query or a SQLAlchemy text query.
@@ -1,6 +1,7 @@
 from sqlalchemy import Index, func
 
 from repository.base import BaseRepository
+from repository.common.repository import BlockchainTransactionRepository
 
 from .models import (
     CCIPBlockchainTransaction,
@@ -36,7 +37,7 @@ class CCIPExecutionStateChangedRepository(BaseRepository):
             )
 
 
-class CCIPBlockchainTransactionRepository(BaseRepository):
+class CCIPBlockchainTransactionRepository(BlockchainTransactionRepository):
     def __init__(self, session_factory):
         super().__init__(CCIPBlockchainTransaction, session_factory)
 
@@ -101,8 +102,8 @@ class CCIPCrossChainTransactionsRepository(BaseRepository):
             return session.query(func.sum(CCIPCrossChainTransactions.amount_usd)).scalar()
 
 
-Index("ccip_send_requested_message_id_idx", CCIPSendRequested.message_id)
+Index("ccip_send_requested_message_id_idx", CCIPSendRequested.message_id, unique=True)
 Index("ccip_send_requested_transaction_hash_idx", CCIPSendRequested.transaction_hash)
 
-Index("ccip_message_received_message_id_idx", CCIPExecutionStateChanged.message_id)
+Index("ccip_message_received_message_id_idx", CCIPExecutionStateChanged.message_id, unique=True)
 Index("ccip_message_received_transaction_hash_idx", CCIPExecutionStateChanged.transaction_hash)
@@ -1,6 +1,7 @@
 from sqlalchemy import Index, func
 
 from repository.base import BaseRepository
+from repository.common.repository import BlockchainTransactionRepository
 
 from .models import (
     CCTPBlockchainTransaction,
@@ -44,7 +45,7 @@ class CCTPMessageReceivedRepository(BaseRepository):
             )
 
 
-class CCTPBlockchainTransactionRepository(BaseRepository):
+class CCTPBlockchainTransactionRepository(BlockchainTransactionRepository):
     def __init__(self, session_factory):
         super().__init__(CCTPBlockchainTransaction, session_factory)
 
@@ -115,6 +116,7 @@ Index(
     CCTPDepositForBurn.nonce,
     CCTPDepositForBurn.dst_blockchain,
     CCTPDepositForBurn.blockchain,
+    unique=True,
 )
 Index("cctp_deposit_for_burn_transaction_hash_idx", CCTPDepositForBurn.transaction_hash)
 
@@ -124,5 +126,6 @@ Index(
     CCTPMessageReceived.nonce,
     CCTPMessageReceived.blockchain,
     CCTPMessageReceived.src_blockchain,
+    unique=True,
 )
 Index("cctp_message_received_transaction_hash_idx", CCTPMessageReceived.transaction_hash)
@@ -100,3 +100,73 @@ class BlockchainTransaction(Base):
         self.value = value
         self.input_data = input_data
         self.fee = fee
+
+
+class ExtractionCheckpoint(Base):
+    """
+    A range that was fully extracted for a contract (or Solana program) of a bridge, such that it
+    can be skipped when resuming an extraction. EVM ranges are given by block numbers (both
+    inclusive), and Solana ranges by their first and last signatures.
+    """
+
+    __tablename__ = "extraction_checkpoint"
+
+    id = Column(Integer, nullable=False, autoincrement=True, primary_key=True)
+    bridge = Column(String(20), nullable=False)
+    blockchain = Column(String(10), nullable=False)
+    contract = Column(String(88), nullable=False)
+    from_block = Column(BigInteger, nullable=True)
+    to_block = Column(BigInteger, nullable=True)
+    start_signature = Column(String(88), nullable=True)
+    end_signature = Column(String(88), nullable=True)
+
+    def __init__(
+        self,
+        bridge,
+        blockchain,
+        contract,
+        from_block=None,
+        to_block=None,
+        start_signature=None,
+        end_signature=None,
+    ):
+        self.bridge = bridge
+        self.blockchain = blockchain
+        self.contract = contract
+        self.from_block = from_block
+        self.to_block = to_block
+        self.start_signature = start_signature
+        self.end_signature = end_signature
+
+    def __repr__(self):
+        return (
+            f"<ExtractionCheckpoint(bridge={self.bridge}, blockchain={self.blockchain}, "
+            f"contract={self.contract}, from_block={self.from_block}, to_block={self.to_block}, "
+            f"start_signature={self.start_signature}, end_signature={self.end_signature})>"
+        )
+
+
+class GenerationCheckpoint(Base):
+    """
+    The high-water mark of the cross-chain generation of a bridge in a blockchain: the latest
+    timestamp of the bridge's transactions in the blockchain when the last generation started.
+    Incremental generations only match events of transactions newer than their high-water marks.
+    """
+
+    __tablename__ = "generation_checkpoint"
+
+    id = Column(Integer, nullable=False, autoincrement=True, primary_key=True)
+    bridge = Column(String(20), nullable=False)
+    blockchain = Column(String(10), nullable=False)
+    timestamp = Column(BigInteger, nullable=False)
+
+    def __init__(self, bridge, blockchain, timestamp):
+        self.bridge = bridge
+        self.blockchain = blockchain
+        self.timestamp = timestamp
+
+    def __repr__(self):
+        return (
+            f"<GenerationCheckpoint(bridge={self.bridge}, blockchain={self.blockchain}, "
+            f"timestamp={self.timestamp})>"
+        )
@@ -1,3 +1,4 @@
+import io
 from datetime import datetime
 
 from sqlalchemy import Index, func
@@ -5,12 +6,122 @@ from sqlalchemy import Index, func
 from repository.base import BaseRepository
 
 from .models import (
+    ExtractionCheckpoint,
+    GenerationCheckpoint,
     NativeToken,
     TokenMetadata,
     TokenPrice,
 )
 
 
+class BlockchainTransactionRepository(BaseRepository):
+    """
+    Base repository of the *_blockchain_transactions tables, which bulk-loads transactions with
+    PostgreSQL's COPY rather than through the ORM.
+    """
+
+    @staticmethod
+    def to_copy_value(value) -> str:
+        """Formats a value as a field of COPY's text format."""
+        if value is None:
+            return "\\N"
+
+        return (
+            str(value)
+            .replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+
+    def copy_all(self, objs_data) -> None:
+        """
+        Writes many transactions (given as dicts) by streaming them with COPY FROM STDIN into a
+        temporary staging table, and merging the staging table into the transactions table with
+        ON CONFLICT (transaction_hash) DO NOTHING, such that transactions already written are
+        skipped instead of failing the whole batch.
+        """
+        table = self.model.__table__
+        columns = [column.name for column in table.columns]
+        staging_table = f"{table.name}_staging"
+
+        buffer = io.StringIO()
+        num_rows = 0
+        for data in objs_data:
+            buffer.write("\t".join(self.to_copy_value(data.get(column)) for column in columns))
+            buffer.write("\n")
+            num_rows += 1
+
+        if num_rows == 0:
+            return
+
+        buffer.seek(0)
+        column_list = ", ".join(columns)
+
+        with self.get_session() as session:
+            cursor = session.connection().connection.cursor()
+            try:
+                # the staging table lives as long as the (pooled) connection, and is emptied
+                # every time the session commits
+                cursor.execute(
+                    f"CREATE TEMP TABLE IF NOT EXISTS {staging_table} "
+                    f"(LIKE {table.name} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+                )
+                cursor.copy_expert(f"COPY {staging_table} ({column_list}) FROM STDIN", buffer)
+                cursor.execute(
+                    f"INSERT INTO {table.name} ({column_list}) "
+                    f"SELECT {column_list} FROM {staging_table} "
+                    "ON CONFLICT (transaction_hash) DO NOTHING"
+                )
+                # within a unit of work, the session may only commit after further batches, so
+                # the staging table is emptied for the next batch right away
+                cursor.execute(f"TRUNCATE {staging_table}")
+            finally:
+                cursor.close()
+
+    def get_max_timestamps(self) -> dict:
+        """Returns the latest timestamp of the transactions of each blockchain."""
+        with self.get_session() as session:
+            return dict(
+                session.query(self.model.blockchain, func.max(self.model.timestamp))
+                .group_by(self.model.blockchain)
+                .all()
+            )
+
+    def filter_window(self, query, blockchain: str, start_block: int, end_block: int):
+        query = query.filter(self.model.blockchain == blockchain)
+
+        if start_block is not None:
+            query = query.filter(self.model.block_number >= start_block)
+        if end_block is not None:
+            query = query.filter(self.model.block_number <= end_block)
+
+        return query
+
+    def count_transactions(
+        self, blockchain: str, start_block: int = None, end_block: int = None
+    ) -> int:
+        with self.get_session() as session:
+            return self.filter_window(
+                session.query(func.count(self.model.transaction_hash)),
+                blockchain,
+                start_block,
+                end_block,
+            ).scalar()
+
+    def get_transaction_hashes(
+        self, blockchain: str, start_block: int = None, end_block: int = None
+    ):
+        """Yields the hashes of the transactions stored within a block window, in chunks."""
+        with self.get_session() as session:
+            query = self.filter_window(
+                session.query(self.model.transaction_hash), blockchain, start_block, end_block
+            )
+
+            for (transaction_hash,) in query.yield_per(10_000):
+                yield transaction_hash
+
+
 class TokenPriceRepository(BaseRepository):
     def __init__(self, session_factory):
         super().__init__(TokenPrice, session_factory)
@@ -65,6 +176,31 @@ class TokenPriceRepository(BaseRepository):
                 .scalar()
             )
 
+    def get_price_coverage(self, symbols: list, start_ts: str, end_ts: str) -> dict:
+        """
+        Returns the number of prices stored between two timestamps, and the first and last dates
+        of all prices stored, of every (symbol, name) of the given symbols, in a single query.
+        """
+        start_day = datetime.fromtimestamp(int(start_ts)).date()
+        end_day = datetime.fromtimestamp(int(end_ts)).date()
+
+        with self.get_session() as session:
+            return {
+                (symbol, name): (count, min_date, max_date)
+                for symbol, name, count, min_date, max_date in session.query(
+                    TokenPrice.symbol,
+                    TokenPrice.name,
+                    func.count(TokenPrice.id).filter(
+                        TokenPrice.date >= start_day, TokenPrice.date <= end_day
+                    ),
+                    func.min(TokenPrice.date),
+                    func.max(TokenPrice.date),
+                )
+                .filter(TokenPrice.symbol.in_(symbols))
+                .group_by(TokenPrice.symbol, TokenPrice.name)
+                .all()
+            }
+
 
 class TokenMetadataRepository(BaseRepository):
     def __init__(self, session_factory):
@@ -106,9 +242,109 @@ class NativeTokenRepository(BaseRepository):
             return session.query(NativeToken).filter(NativeToken.blockchain == blockchain).first()
 
 
+class ExtractionCheckpointRepository(BaseRepository):
+    def __init__(self, session_factory):
+        super().__init__(ExtractionCheckpoint, session_factory)
+
+    def record_block_range(
+        self, bridge: str, blockchain: str, contracts: list, from_block: int, to_block: int
+    ):
+        self.create_all(
+            [
+                ExtractionCheckpoint(bridge, blockchain, contract.lower(), from_block, to_block)
+                for contract in contracts
+            ]
+        )
+
+    def get_completed_block_ranges(self, bridge: str, blockchain: str, contract: str) -> list:
+        """Returns the (from_block, to_block) ranges completed for a contract, sorted."""
+        with self.get_session() as session:
+            return [
+                (from_block, to_block)
+                for from_block, to_block in session.query(
+                    ExtractionCheckpoint.from_block, ExtractionCheckpoint.to_block
+                )
+                .filter(
+                    ExtractionCheckpoint.bridge == bridge,
+                    ExtractionCheckpoint.blockchain == blockchain,
+                    ExtractionCheckpoint.contract == contract.lower(),
+                    ExtractionCheckpoint.from_block.isnot(None),
+                )
+                .order_by(ExtractionCheckpoint.from_block)
+                .all()
+            ]
+
+    def record_signature_range(
+        self, bridge: str, program_id: str, start_signature: str, end_signature: str
+    ):
+        self.create(
+            {
+                "bridge": bridge,
+                "blockchain": "solana",
+                "contract": program_id,
+                "start_signature": start_signature,
+                "end_signature": end_signature,
+            }
+        )
+
+    def get_completed_signature_ranges(self, bridge: str, program_id: str) -> list:
+        """Returns the (start_signature, end_signature) ranges completed for a program."""
+        with self.get_session() as session:
+            return (
+                session.query(
+                    ExtractionCheckpoint.start_signature, ExtractionCheckpoint.end_signature
+                )
+                .filter(
+                    ExtractionCheckpoint.bridge == bridge,
+                    ExtractionCheckpoint.blockchain == "solana",
+                    ExtractionCheckpoint.contract == program_id,
+                    ExtractionCheckpoint.start_signature.isnot(None),
+                )
+                .all()
+            )
+
+
+class GenerationCheckpointRepository(BaseRepository):
+    def __init__(self, session_factory):
+        super().__init__(GenerationCheckpoint, session_factory)
+
+    def get_high_water_marks(self, bridge: str) -> dict:
+        """Returns the high-water mark of each blockchain of the bridge's last generation."""
+        with self.get_session() as session:
+            return dict(
+                session.query(GenerationCheckpoint.blockchain, GenerationCheckpoint.timestamp)
+                .filter(GenerationCheckpoint.bridge == bridge)
+                .all()
+            )
+
+    def set_high_water_marks(self, bridge: str, high_water_marks: dict) -> None:
+        with self.get_session() as session:
+            session.query(GenerationCheckpoint).filter(
+                GenerationCheckpoint.bridge == bridge
+            ).delete()
+            session.add_all(
+                [
+                    GenerationCheckpoint(bridge, blockchain, timestamp)
+                    for blockchain, timestamp in high_water_marks.items()
+                ]
+            )
+
+
 Index("ix_token_price_symbol", TokenPrice.symbol)
 Index("ix_token_price_symbol_date", TokenPrice.symbol, TokenPrice.date)
 Index("ix_token_metadata_symbol", TokenMetadata.symbol)
 Index("ix_token_metadata_blockchain_address", TokenMetadata.address, TokenMetadata.blockchain)
 
 Index("ix_native_token_blockchain", NativeToken.symbol, NativeToken.blockchain)
+Index(
+    "ix_extraction_checkpoint_bridge_blockchain_contract",
+    ExtractionCheckpoint.bridge,
+    ExtractionCheckpoint.blockchain,
+    ExtractionCheckpoint.contract,
+)
+Index(
+    "ix_generation_checkpoint_bridge_blockchain",
+    GenerationCheckpoint.bridge,
+    GenerationCheckpoint.blockchain,
+    unique=True,
+)
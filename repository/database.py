@@ -1,9 +1,18 @@
 import os
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import declarative_base, scoped_session, sessionmaker
 from sqlalchemy_utils import create_database, database_exists
 
+from config.constants import DB_MAX_OVERFLOW, DB_POOL_SIZE, DB_POOL_TIMEOUT
+from utils.utils import (
+    CliColor,
+    CustomException,
+    build_log_message_generator,
+    log_error,
+    log_to_cli,
+)
+
 DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     print("DATABASE_URL environment variable is not set!")
@@ -12,8 +21,9 @@ if not DATABASE_URL:
 engine = create_engine(
     DATABASE_URL,
     echo=False,
-    pool_size=20,
-    max_overflow=10,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
     pool_pre_ping=True,
 )  # echo=False to disable SQL logs
 
@@ -36,3 +46,141 @@ def create_tables():
 
         print("Connected to ", DATABASE_URL)
     Base.metadata.create_all(engine)
+
+
+def get_duplicated_keys(connection, index) -> list:
+    """
+    Returns the keys of a unique index shared by several rows, with the number of rows sharing
+    each key.
+    """
+    table = index.table.name
+    columns = [column.name for column in index.columns]
+
+    # rows with a NULL in the key never clash in a unique index, so they are left alone
+    return connection.execute(
+        text(
+            f"SELECT {', '.join(columns)}, COUNT(*) FROM {table} "
+            f"WHERE {' AND '.join(f'{column} IS NOT NULL' for column in columns)} "
+            f"GROUP BY {', '.join(columns)} HAVING COUNT(*) > 1"
+        )
+    ).fetchall()
+
+
+def remove_duplicated_rows(connection, index) -> int:
+    """
+    Deletes the rows sharing the key of a unique index, keeping the first one written, such that
+    the index can be created. Returns the number of deleted rows.
+    """
+    table = index.table.name
+    columns = [column.name for column in index.columns]
+
+    result = connection.execute(
+        text(
+            f"DELETE FROM {table} WHERE ctid IN ("
+            f"SELECT ctid FROM (SELECT ctid, ROW_NUMBER() OVER "
+            f"(PARTITION BY {', '.join(columns)} ORDER BY ctid) AS row_number FROM {table} "
+            f"WHERE {' AND '.join(f'{column} IS NOT NULL' for column in columns)}) AS duplicated "
+            f"WHERE duplicated.row_number > 1)"
+        )
+    )
+
+    return result.rowcount
+
+
+def get_indexes_to_migrate() -> list:
+    """
+    Returns the indexes declared in the repositories that are missing from the existing tables
+    (or are now unique), with whether an index of the same name exists.
+    """
+    indexes = []
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+
+        existing_indexes = {
+            index["name"]: bool(index["unique"]) for index in inspector.get_indexes(table.name)
+        }
+
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            if existing_indexes.get(index.name) != bool(index.unique):
+                indexes.append((index, index.name in existing_indexes))
+
+    return indexes
+
+
+def migrate_indexes(bridge, dedupe: bool = False) -> list:
+    """
+    Brings the indexes of the existing tables in line with the indexes declared in the
+    repositories, since create_all only creates the indexes of new tables. Indexes that are
+    missing are created, and indexes that are now unique are recreated. Rows duplicated under the
+    key of a new unique index are only deleted (keeping the first one written) with `dedupe`;
+    otherwise they are reported, and the migration is aborted before changing anything. Returns
+    the names of the created indexes.
+    """
+    func_name = "migrate_indexes"
+    indexes = get_indexes_to_migrate()
+
+    duplicated_keys = {}
+    with engine.connect() as connection:
+        for index, _ in indexes:
+            if index.unique:
+                keys = get_duplicated_keys(connection, index)
+                if len(keys) > 0:
+                    duplicated_keys[index.name] = keys
+
+    for index, _ in indexes:
+        keys = duplicated_keys.get(index.name)
+        if keys is None:
+            continue
+
+        columns = ", ".join(column.name for column in index.columns)
+        num_rows = sum(key[-1] - 1 for key in keys)
+        action = "Deleting" if dedupe else "Found"
+
+        log_to_cli(
+            build_log_message_generator(
+                bridge,
+                (
+                    f"{action} {num_rows} duplicated rows of {index.table.name} under "
+                    f"{len(keys)} keys of {index.name} ({columns})."
+                ),
+            ),
+            CliColor.INFO if dedupe else CliColor.ERROR,
+        )
+        log_error(
+            bridge,
+            f"{action} duplicated rows of {index.table.name} with keys ({columns}, count): "
+            f"{[tuple(key) for key in keys]}",
+        )
+
+    if len(duplicated_keys) > 0 and not dedupe:
+        raise CustomException(
+            "database",
+            func_name,
+            (
+                f"Unique indexes {', '.join(duplicated_keys)} cannot be created over duplicated "
+                "rows. No changes were made; run migrate with --dedupe to delete the duplicates "
+                "(keeping the first row written of each key)."
+            ),
+        )
+
+    created_indexes = []
+
+    for index, exists in indexes:
+        # each index is migrated in its own transaction, such that a failure (e.g., because of a
+        # lock) does not undo the indexes that were already created
+        with engine.begin() as connection:
+            if exists:
+                index.drop(connection)
+
+            if index.name in duplicated_keys:
+                remove_duplicated_rows(connection, index)
+
+            index.create(connection)
+
+        created_indexes.append(index.name)
+
+    return created_indexes
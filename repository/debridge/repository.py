@@ -1,6 +1,7 @@
 from sqlalchemy import Index, func
 
 from repository.base import BaseRepository
+from repository.common.repository import BlockchainTransactionRepository
 
 from .models import (
     DeBridgeBlockchainTransaction,
@@ -11,7 +12,7 @@ from .models import (
 )
 
 
-class DeBridgeBlockchainTransactionRepository(BaseRepository):
+class DeBridgeBlockchainTransactionRepository(BlockchainTransactionRepository):
     def __init__(self, session_factory):
         super().__init__(DeBridgeBlockchainTransaction, session_factory)
 
@@ -137,4 +138,12 @@ class DeBridgeCrossChainTransactionsRepository(BaseRepository):
             ).scalar()
 
 
-Index("idx_debridge_created_order_maker_order_nonce", DeBridgeCreatedOrder.maker_order_nonce)
+Index(
+    "idx_debridge_created_order_maker_order_nonce",
+    DeBridgeCreatedOrder.maker_order_nonce,
+    unique=True,
+)
+Index("idx_debridge_created_order_order_id", DeBridgeCreatedOrder.order_id)
+Index("idx_debridge_created_order_transaction_hash", DeBridgeCreatedOrder.transaction_hash)
+Index("idx_debridge_fulfilled_order_maker_order_nonce", DeBridgeFulfilledOrder.maker_order_nonce)
+Index("idx_debridge_fulfilled_order_transaction_hash", DeBridgeFulfilledOrder.transaction_hash)
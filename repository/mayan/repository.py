@@ -1,6 +1,7 @@
-from sqlalchemy import func
+from sqlalchemy import Index, func
 
 from repository.base import BaseRepository
+from repository.common.repository import BlockchainTransactionRepository
 
 from .models import (
     MayanAuctionBid,
@@ -174,7 +175,7 @@ class MayanAuctionCloseRepository(BaseRepository):
             return session.query(self.model).filter(MayanAuctionClose.auction == auction).first()
 
 
-class MayanBlockchainTransactionRepository(BaseRepository):
+class MayanBlockchainTransactionRepository(BlockchainTransactionRepository):
     def __init__(self, session_factory):
         super().__init__(MayanBlockchainTransaction, session_factory)
 
@@ -243,3 +244,23 @@ class MayanCrossChainTransactionRepository(BaseRepository):
     def get_total_amount_usd_transacted(self):
         with self.get_session() as session:
             return session.query(func.sum(MayanCrossChainTransaction.input_amount_usd)).scalar()
+
+
+########## Indexes ##########
+
+Index(
+    "ix_mayan_swap_and_forwarded_transaction_hash",
+    MayanSwapAndForwarded.transaction_hash,
+    unique=True,
+)
+Index("ix_mayan_forwarded_transaction_hash", MayanForwarded.transaction_hash, unique=True)
+Index("ix_mayan_order_created_transaction_hash", MayanOrderCreated.transaction_hash)
+Index("ix_mayan_order_fulfilled_transaction_hash", MayanOrderFulfilled.transaction_hash)
+Index("ix_mayan_init_order_state", MayanInitOrder.state)
+Index("ix_mayan_unlock_state_from_acc", MayanUnlock.state_from_acc, unique=True)
+Index("ix_mayan_unlock_state", MayanUnlock.state)
+Index("ix_mayan_fulfill_order_signature", MayanFulfillOrder.signature, unique=True)
+Index("ix_mayan_fulfill_order_state", MayanFulfillOrder.state)
+Index("ix_mayan_settle_signature", MayanSettle.signature, unique=True)
+Index("ix_mayan_set_auction_winner_auction", MayanSetAuctionWinner.auction, unique=True)
+Index("ix_mayan_register_order_state", MayanRegisterOrder.state)
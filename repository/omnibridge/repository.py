@@ -1,6 +1,7 @@
-from sqlalchemy import func
+from sqlalchemy import Index, func
 
 from repository.base import BaseRepository
+from repository.common.repository import BlockchainTransactionRepository
 
 from .models import (
     OmnibridgeAffirmationCompleted,
@@ -17,7 +18,7 @@ from .models import (
 )
 
 
-class OmnibridgeBlockchainTransactionRepository(BaseRepository):
+class OmnibridgeBlockchainTransactionRepository(BlockchainTransactionRepository):
     def __init__(self, session_factory):
         super().__init__(OmnibridgeBlockchainTransaction, session_factory)
 
@@ -137,3 +138,32 @@ class OmnibridgeOperatorTransactionsRepository(BaseRepository):
     def empty_table(self):
         with self.get_session() as session:
             return session.query(OmnibridgeOperatorTransactions).delete()
+
+
+########## Indexes ##########
+
+Index(
+    "ix_omnibridge_tokens_bridging_initiated_message_id",
+    OmnibridgeTokensBridgingInitiated.message_id,
+)
+Index("ix_omnibridge_tokens_bridged_message_id", OmnibridgeTokensBridged.message_id)
+Index(
+    "ix_omnibridge_relayed_message_fill_key",
+    OmnibridgeRelayedMessage.src_transaction_hash,
+    OmnibridgeRelayedMessage.recipient,
+    OmnibridgeRelayedMessage.value,
+)
+Index(
+    "ix_omnibridge_affirmation_completed_fill_key",
+    OmnibridgeAffirmationCompleted.src_transaction_hash,
+    OmnibridgeAffirmationCompleted.recipient,
+    OmnibridgeAffirmationCompleted.value,
+)
+Index(
+    "ix_omnibridge_user_request_for_signature_message_id",
+    OmnibridgeUserRequestForSignature.message_id,
+)
+Index(
+    "ix_omnibridge_user_request_for_affirmation_message_id",
+    OmnibridgeUserRequestForAffirmation.message_id,
+)
@@ -1,6 +1,7 @@
 from sqlalchemy import Index, func
 
 from repository.base import BaseRepository
+from repository.common.repository import BlockchainTransactionRepository
 
 from .models import (
     PolygonBlockchainTransaction,
@@ -66,14 +67,13 @@ class PolygonExitedTokenRepository(BaseRepository):
     def __init__(self, session_factory):
         super().__init__(PolygonExitedToken, session_factory)
 
-    def event_exists(self, transaction_hash, exitor, deposit_receiver, root_token, amount):
+    def event_exists(self, transaction_hash, exitor, root_token, amount):
         with self.get_session() as session:
             return (
                 session.query(PolygonExitedToken)
                 .filter(
                     PolygonExitedToken.transaction_hash == transaction_hash,
                     PolygonExitedToken.exitor == exitor,
-                    PolygonExitedToken.deposit_receiver == deposit_receiver,
                     PolygonExitedToken.root_token == root_token,
                     PolygonExitedToken.amount == amount,
                 )
@@ -138,7 +138,7 @@ class PolygonTokenDepositedRepository(BaseRepository):
             )
 
 
-class PolygonBlockchainTransactionRepository(BaseRepository):
+class PolygonBlockchainTransactionRepository(BlockchainTransactionRepository):
     def __init__(self, session_factory):
         super().__init__(PolygonBlockchainTransaction, session_factory)
 
@@ -264,7 +264,11 @@ Index(
     PolygonExitedToken.root_token,
     PolygonExitedToken.amount,
 )
-Index("ix_polygon_new_deposit_block_deposit_block_id", PolygonNewDepositBlock.deposit_block_id)
+Index(
+    "ix_polygon_new_deposit_block_deposit_block_id",
+    PolygonNewDepositBlock.deposit_block_id,
+    unique=True,
+)
 Index(
     "ix_polygon_pol_withdraw_unique_key",
     PolygonPOLWithdraw.transaction_hash,
@@ -274,4 +278,12 @@ Index(
     PolygonPOLWithdraw.amount,
 )
 Index("ix_polygon_bridge_withdraw_exit_id", PolygonBridgeWithdraw.exit_id)
-Index("ix_polygon_token_deposited_deposit_count", PolygonTokenDeposited.deposit_count)
+Index("ix_polygon_token_deposited_deposit_count", PolygonTokenDeposited.deposit_count, unique=True)
+Index("ix_polygon_state_synced_transaction_hash", PolygonStateSynced.transaction_hash)
+Index("ix_polygon_token_deposited_transaction_hash", PolygonTokenDeposited.transaction_hash)
+Index(
+    "ix_polygon_bridge_withdraw_token_user_amount",
+    PolygonBridgeWithdraw.token,
+    PolygonBridgeWithdraw.user,
+    PolygonBridgeWithdraw.amount,
+)
@@ -0,0 +1,90 @@
+import inspect
+import statistics
+import time
+from contextlib import contextmanager
+
+from sqlalchemy import func
+
+from config.constants import QUERY_BENCHMARK_SAMPLE_SIZE
+from repository.database import DBSession, engine
+from utils.utils import load_module
+
+
+@contextmanager
+def rolled_back_session():
+    """
+    Binds the shared session to a transaction that is rolled back on exit, such that the
+    benchmarked queries (e.g., the matching of the generators, which rewrites the cross-chain
+    tables) leave the database untouched.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+
+    DBSession.remove()
+    DBSession.configure(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield
+    finally:
+        DBSession.remove()
+        DBSession.configure(bind=engine, join_transaction_mode="conservative_savepoint")
+        transaction.rollback()
+        connection.close()
+
+
+def get_event_repositories(bridge_name: str) -> dict:
+    """Returns the repositories of a bridge with an event_exists check, keyed by class name."""
+    module = load_module(f"repository.{bridge_name}.repository")
+
+    return {
+        name: repository_class(DBSession)
+        for name, repository_class in vars(module).items()
+        if isinstance(repository_class, type)
+        and name.endswith("Repository")
+        and "event_exists" in vars(repository_class)
+    }
+
+
+def time_event_exists(bridge_name: str, sample_size: int = QUERY_BENCHMARK_SAMPLE_SIZE) -> dict:
+    """
+    Looks up stored events again with each event_exists check, whose parameters are named after
+    the columns of the event. Returns the median query time of each check, in seconds.
+    """
+    timings = {}
+
+    for name, repository in get_event_repositories(bridge_name).items():
+        params = list(inspect.signature(repository.event_exists).parameters)
+
+        with repository.get_session() as session:
+            rows = session.query(repository.model).order_by(func.random()).limit(sample_size).all()
+
+        durations = []
+        for row in rows:
+            start_time = time.perf_counter()
+            repository.event_exists(*(getattr(row, param) for param in params))
+            durations.append(time.perf_counter() - start_time)
+
+        if durations:
+            timings[f"{name}.event_exists"] = statistics.median(durations)
+
+    return timings
+
+
+def time_matching(generator) -> dict:
+    """Runs each matching step of a bridge generator. Returns their times, in seconds."""
+    timings = {}
+
+    for name in dir(generator):
+        if "match" not in name or not callable(getattr(generator, name)):
+            continue
+
+        start_time = time.perf_counter()
+        getattr(generator, name)()
+        timings[f"{type(generator).__name__}.{name}"] = time.perf_counter() - start_time
+
+    return timings
+
+
+def benchmark_queries(bridge_name: str, generator) -> dict:
+    """Returns the times of the event_exists and matching queries of a bridge, in seconds."""
+    with rolled_back_session():
+        return {**time_event_exists(bridge_name), **time_matching(generator)}
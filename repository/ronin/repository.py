@@ -1,6 +1,7 @@
 from sqlalchemy import Index, func
 
 from repository.base import BaseRepository
+from repository.common.repository import BlockchainTransactionRepository
 
 from .models import (
     RoninBlockchainTransaction,
@@ -64,7 +65,7 @@ class RoninTokenWithdrewRepository(BaseRepository):
             )
 
 
-class RoninBlockchainTransactionRepository(BaseRepository):
+class RoninBlockchainTransactionRepository(BlockchainTransactionRepository):
     def __init__(self, session_factory):
         super().__init__(RoninBlockchainTransaction, session_factory)
 
@@ -133,7 +134,7 @@ class RoninCrossChainTransactionRepository(BaseRepository):
             return session.query(func.sum(RoninCrossChainTransaction.amount_usd)).scalar()
 
 
-Index("ix_deposit_requested_deposit_id", RoninDepositRequested.deposit_id)
-Index("ix_token_deposited_deposit_id", RoninTokenDeposited.deposit_id)
-Index("ix_withdrawal_requested_withdrawal_id", RoninWithdrawalRequested.withdrawal_id)
-Index("ix_token_withdrawn_withdrawal_id", RoninTokenWithdrew.withdrawal_id)
+Index("ix_deposit_requested_deposit_id", RoninDepositRequested.deposit_id, unique=True)
+Index("ix_token_deposited_deposit_id", RoninTokenDeposited.deposit_id, unique=True)
+Index("ix_withdrawal_requested_withdrawal_id", RoninWithdrawalRequested.withdrawal_id, unique=True)
+Index("ix_token_withdrawn_withdrawal_id", RoninTokenWithdrew.withdrawal_id, unique=True)
@@ -1,6 +1,7 @@
 from sqlalchemy import Index, func
 
 from repository.base import BaseRepository, CrossChainRepository
+from repository.common.repository import BlockchainTransactionRepository
 
 from .models import (
     StargateBlockchainTransaction,
@@ -382,7 +383,7 @@ class StargateRelayerFeeRepository(BaseRepository):
             )
 
 
-class StargateBlockchainTransactionRepository(BaseRepository):
+class StargateBlockchainTransactionRepository(BlockchainTransactionRepository):
     def __init__(self, session_factory):
         super().__init__(StargateBlockchainTransaction, session_factory)
 
@@ -588,35 +589,55 @@ Index(
     StargatePacket.transaction_hash,
     StargatePacket.dst_blockchain,
     StargatePacket.nonce,
+    unique=True,
 )
-Index("ix_packet_delivered_transaction_hash", StargatePacketDelivered.transaction_hash)
-Index("ix_payload_verified_transaction_hash", StargatePayloadVerified.transaction_hash)
-Index("ix_packet_verified_transaction_hash", StargatePacketVerified.transaction_hash)
-Index("ix_packet_received_transaction_hash", StargatePacketReceived.transaction_hash)
+Index("ix_packet_delivered_transaction_hash", StargatePacketDelivered.transaction_hash, unique=True)
+Index("ix_payload_verified_transaction_hash", StargatePayloadVerified.transaction_hash, unique=True)
+Index("ix_packet_verified_transaction_hash", StargatePacketVerified.transaction_hash, unique=True)
+Index("ix_packet_received_transaction_hash", StargatePacketReceived.transaction_hash, unique=True)
 Index(
     "ix_uln_config_set_transaction_hash",
     StargateUlnConfigSet.transaction_hash,
     StargateUlnConfigSet.dst_blockchain,
     StargateUlnConfigSet.oapp,
+    unique=True,
 )
 Index(
     "ix_oft_sent_transaction_hash",
     StargateOFTSent.transaction_hash,
     StargateOFTSent.guid,
     StargateOFTSent.amount_received_ld,
+    unique=True,
 )
 Index(
     "ix_oft_send_to_chain_transaction_hash",
     StargateOFTSendToChain.transaction_hash,
     StargateOFTSendToChain.dst_blockchain,
+    unique=True,
 )
 Index(
     "ix_oft_receive_from_chain_transaction_hash",
     StargateOFTReceiveFromChain.transaction_hash,
     StargateOFTReceiveFromChain.src_blockchain,
+    unique=True,
 )
-Index("ix_bus_rode_transaction_hash", StargateBusRode.transaction_hash, StargateBusRode.ticket_id)
-Index("ix_bus_driven_guid", StargateBusDriven.guid)
-Index("ix_swap_remote_transaction_hash", StargateSwapRemote.transaction_hash)
-Index("ix_compose_sent_guid", StargateComposeSent.guid)
-Index("ix_compose_delivered_guid", StargateComposeDelivered.guid)
+Index(
+    "ix_bus_rode_transaction_hash",
+    StargateBusRode.transaction_hash,
+    StargateBusRode.ticket_id,
+    unique=True,
+)
+Index("ix_bus_driven_guid", StargateBusDriven.guid, unique=True)
+Index("ix_swap_remote_transaction_hash", StargateSwapRemote.transaction_hash, unique=True)
+Index("ix_compose_sent_guid", StargateComposeSent.guid, unique=True)
+Index("ix_compose_delivered_guid", StargateComposeDelivered.guid, unique=True)
+Index("ix_oft_received_guid", StargateOFTReceived.guid)
+Index("ix_oft_received_transaction_hash", StargateOFTReceived.transaction_hash)
+Index(
+    "ix_packet_received_nonce_blockchains",
+    StargatePacketReceived.nonce,
+    StargatePacketReceived.blockchain,
+    StargatePacketReceived.src_blockchain,
+)
+Index("ix_verifier_fee_transaction_hash", StargateVerifierFee.transaction_hash)
+Index("ix_relayer_fee_transaction_hash", StargateRelayerFee.transaction_hash)
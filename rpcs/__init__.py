@@ -5,7 +5,8 @@ dummy (but valid) contract address, topics, and block range.
 
 Functions:
     test_rpcs(configs):
-        Tests the provided RPC endpoints and writes the valid configurations to 'configs.json'.
+        Tests the provided RPC endpoints concurrently and returns the valid configurations, with
+        the RPCs ranked by latency.
 
     __main__:
         Loads the base configurations from 'base_configs.json' and calls the test_rpcs function.
@@ -22,7 +23,7 @@ Function Details:
                 - rpcs (list): A list of RPC endpoint URLs.
 
         Returns:
-            None. Writes the valid configurations to 'configs.json'.
+            list: The valid configurations, with the RPCs ranked by latency.
 
         Raises:
             None. Catches and prints exceptions during RPC testing.
@@ -2,6 +2,9 @@ import time
 
 import requests
 
+from config.constants import ALCHEMY_RATE_LIMIT
+from rpcs.endpoint_scheduler import endpoint_scheduler
+from rpcs.http_session_pool import http_session_pool
 from utils.utils import (
     CustomException,
     convert_blockchain_into_alchemy_id,
@@ -9,10 +12,20 @@ from utils.utils import (
     log_error,
 )
 
+# the metadata and prices APIs of all blockchains share the rate limit of the API key
+ALCHEMY_API = "https://g.alchemy.com"
+endpoint_scheduler.set_rate_limit(ALCHEMY_API, ALCHEMY_RATE_LIMIT)
+
 
 class AlchemyClient:
     CLASS_NAME = "AlchemyClient"
 
+    @staticmethod
+    def post(url: str, payload: dict, headers: dict):
+        """Sends a request to Alchemy once the rate limit allows it, in a thread-safe manner."""
+        time.sleep(endpoint_scheduler.reserve(ALCHEMY_API))
+        return http_session_pool.post(url, json=payload, headers=headers)
+
     @staticmethod
     def get_token_metadata(blockchain: str, contract: str) -> dict:
         func_name = "get_token_metadata"
@@ -29,7 +42,7 @@ class AlchemyClient:
         }
         headers = {"accept": "application/json", "content-type": "application/json"}
 
-        response = requests.post(url, json=payload, headers=headers)
+        response = AlchemyClient.post(url, payload, headers)
 
         if response.status_code != 200:
             raise CustomException(
@@ -95,34 +108,34 @@ class AlchemyClient:
             "content-type": "application/json",
         }
 
-        response = requests.post(url, json=payload, headers=headers)
-
         for i in range(5):
+            response = None
             try:
-                response = requests.post(url, json=payload, headers=headers)
+                response = AlchemyClient.post(url, payload, headers)
                 response.raise_for_status()
                 return response.json() if response else {}
-            except requests.exceptions.RequestException:
+            except requests.exceptions.RequestException as e:
+                # without a response, the request failed before reaching Alchemy (e.g., timeout)
+                error = response.text if response is not None else str(e)
+
                 # if response.text contains "token not found" return {}
-                if "Token not found" in response.text:
+                if "Token not found" in error:
                     return {}
 
                 exception = CustomException(
                     AlchemyClient.CLASS_NAME,
                     func_name,
-                    (
-                        f"Fetching token price with payload: {payload} "
-                        f"failed with error: {response.text}",
-                    ),
+                    (f"Fetching token price with payload: {payload} failed with error: {error}",),
                 )
 
                 log_error(bridge, exception)
 
-                if "Your free app has exceeded its limit" in response.text:
-                    # If the error is due to rate limiting, return an empty dict
+                if "Your free app has exceeded its limit" in error:
+                    # If the error is due to rate limiting, give up on the prices (as a failed
+                    # request, such that they are not cached as missing)
                     # The tool will continue to run and fetch metadata for other tokens,
                     # as the rate limit is only for token price fetching
-                    return {}
+                    return None
 
                 if i < 4:
                     time.sleep(2**i)  # Exponential backoff
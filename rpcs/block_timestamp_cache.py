@@ -0,0 +1,122 @@
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+
+from config.constants import BLOCK_TIMESTAMP_CACHE_FILE, BLOCK_TIMESTAMP_CACHE_SIZE
+
+
+class BlockTimestampCache:
+    """
+    Thread-safe, size-bounded LRU cache of block timestamps, keyed by (blockchain, block number)
+    and backed by a local SQLite file shared across runs and bridges.
+
+    Attributes:
+        max_size (int): Maximum number of timestamps kept in memory.
+        db_file (str): Path of the SQLite file, or None to keep the cache in memory only.
+        cache (OrderedDict): In-memory timestamps, from least to most recently used.
+    """
+
+    def __init__(
+        self,
+        max_size: int = BLOCK_TIMESTAMP_CACHE_SIZE,
+        db_file: str = BLOCK_TIMESTAMP_CACHE_FILE,
+    ):
+        self.max_size = max_size
+        self.db_file = db_file
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+        self.connection = None
+
+    @staticmethod
+    def to_key(blockchain: str, block_number) -> tuple:
+        """Block numbers come either as hex strings (from the RPCs) or as integers."""
+        if isinstance(block_number, str):
+            block_number = int(block_number, 0)
+        return (blockchain, block_number)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        # the connection is only opened on first use, and always accessed under the lock
+        if self.connection is None:
+            if os.path.dirname(self.db_file):
+                os.makedirs(os.path.dirname(self.db_file), exist_ok=True)
+
+            self.connection = sqlite3.connect(self.db_file, check_same_thread=False)
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS block_timestamps ("
+                "blockchain TEXT NOT NULL, "
+                "block_number INTEGER NOT NULL, "
+                "timestamp INTEGER NOT NULL, "
+                "PRIMARY KEY (blockchain, block_number))"
+            )
+            self.connection.commit()
+
+        return self.connection
+
+    def _remember(self, key: tuple, timestamp: int) -> None:
+        self.cache[key] = timestamp
+        self.cache.move_to_end(key)
+
+        while len(self.cache) > self.max_size:
+            self.cache.popitem(last=False)
+
+    def get_many(self, blockchain: str, block_numbers: list) -> dict:
+        """
+        Returns the cached timestamps (as integers) of the given blocks, keyed by block number as
+        given. Blocks not found neither in memory nor in the SQLite file are left out.
+        """
+        timestamps = {}
+
+        with self.lock:
+            missing = {}
+            for block_number in block_numbers:
+                key = self.to_key(blockchain, block_number)
+                if key in self.cache:
+                    self.cache.move_to_end(key)
+                    timestamps[block_number] = self.cache[key]
+                else:
+                    missing[key[1]] = block_number
+
+            if missing and self.db_file:
+                connection = self._get_connection()
+                numbers = list(missing.keys())
+
+                # SQLite limits the number of variables in a single statement
+                for offset in range(0, len(numbers), 500):
+                    chunk = numbers[offset : offset + 500]
+                    rows = connection.execute(
+                        "SELECT block_number, timestamp FROM block_timestamps "
+                        f"WHERE blockchain = ? AND block_number IN ({','.join('?' * len(chunk))})",
+                        [blockchain, *chunk],
+                    ).fetchall()
+
+                    for number, timestamp in rows:
+                        self._remember((blockchain, number), timestamp)
+                        timestamps[missing[number]] = timestamp
+
+        return timestamps
+
+    def put_many(self, blockchain: str, timestamps: dict) -> None:
+        """Stores the timestamps (as integers) of many blocks, keyed by block number."""
+        if not timestamps:
+            return
+
+        with self.lock:
+            rows = []
+            for block_number, timestamp in timestamps.items():
+                key = self.to_key(blockchain, block_number)
+                self._remember(key, timestamp)
+                rows.append((blockchain, key[1], timestamp))
+
+            if self.db_file:
+                connection = self._get_connection()
+                connection.executemany(
+                    "INSERT OR IGNORE INTO block_timestamps (blockchain, block_number, timestamp) "
+                    "VALUES (?, ?, ?)",
+                    rows,
+                )
+                connection.commit()
+
+
+# we keep a single cache for the whole process, such that it is shared by all clients
+block_timestamp_cache = BlockTimestampCache()
@@ -0,0 +1,186 @@
+import random
+import threading
+import time
+
+from config.constants import (
+    DEFAULT_RPC_RATE_LIMIT,
+    RPC_CIRCUIT_BREAKER_COOLDOWN,
+    RPC_CIRCUIT_BREAKER_FAILURES,
+    RPC_CIRCUIT_BREAKER_MAX_COOLDOWN,
+    RPC_INITIAL_LATENCY,
+    RPC_LATENCY_EWMA_ALPHA,
+)
+
+
+class EndpointHealth:
+    """
+    Health of a single RPC endpoint.
+
+    Attributes:
+        latency (float): EWMA of the latency of its requests, in seconds.
+        error_rate (float): EWMA of the rate of failed requests.
+        requests (int): Number of requests whose outcome was recorded.
+        errors (int): Number of failed requests.
+        rate_limited (int): Number of requests rejected with a 429 response.
+        consecutive_failures (int): Number of failures since the last success.
+        cooldown (float): Duration of the next circuit-breaker timeout, in seconds.
+        open_until (float): Time until which the circuit breaker is open.
+        rate_limit (float): Maximum number of requests per second, or None.
+        next_slot (float): Earliest time at which the next request may be sent.
+    """
+
+    def __init__(self, rate_limit: float = DEFAULT_RPC_RATE_LIMIT):
+        self.latency = None
+        self.error_rate = 0.0
+        self.requests = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self.consecutive_failures = 0
+        self.cooldown = RPC_CIRCUIT_BREAKER_COOLDOWN
+        self.open_until = 0.0
+        self.rate_limit = rate_limit
+        self.next_slot = 0.0
+
+
+class EndpointScheduler:
+    """
+    Thread-safe scheduler of the RPC endpoints of each blockchain. It tracks the latency, error
+    rate and 429 responses of every endpoint, spreads requests over healthy endpoints in
+    proportion to their capacity, leaves failing endpoints out for a while (circuit breaker), and
+    spaces out the requests sent to endpoints with a rate limit.
+
+    Attributes:
+        alpha (float): Weight of the latest request in the moving averages.
+        max_failures (int): Consecutive failures that open the circuit breaker of an endpoint.
+        endpoints (dict): Mapping of RPC URL to its EndpointHealth.
+    """
+
+    def __init__(
+        self,
+        alpha: float = RPC_LATENCY_EWMA_ALPHA,
+        max_failures: int = RPC_CIRCUIT_BREAKER_FAILURES,
+    ):
+        self.alpha = alpha
+        self.max_failures = max_failures
+        self.endpoints = {}
+        self.lock = threading.Lock()
+
+    def _get_health(self, url: str) -> EndpointHealth:
+        if url not in self.endpoints:
+            self.endpoints[url] = EndpointHealth()
+        return self.endpoints[url]
+
+    def set_rate_limit(self, url: str, rate_limit: float) -> None:
+        with self.lock:
+            self._get_health(url).rate_limit = rate_limit
+
+    def set_initial_latency(self, url: str, latency: float) -> None:
+        """Sets the latency of an endpoint not requested yet, e.g., as measured when probed."""
+        with self.lock:
+            health = self._get_health(url)
+            if health.latency is None:
+                health.latency = latency
+
+    def get_weight(self, health: EndpointHealth) -> float:
+        """Capacity of an endpoint, i.e., the successful requests per second it can serve."""
+        latency = health.latency if health.latency is not None else RPC_INITIAL_LATENCY
+        return max(1 - health.error_rate, 0.01) / max(latency, 0.001)
+
+    def select(self, rpcs: list, exclude=()) -> str:
+        """
+        Returns the endpoint to send the next request to, out of `rpcs` and leaving out those in
+        `exclude`. Endpoints with an open circuit breaker are only returned if every endpoint is
+        open, in which case the one that closes first is returned.
+        """
+        candidates = [rpc for rpc in rpcs if rpc not in exclude] or list(rpcs)
+        now = time.monotonic()
+
+        with self.lock:
+            healths = [self._get_health(rpc) for rpc in candidates]
+            closed = [
+                (rpc, health)
+                for rpc, health in zip(candidates, healths, strict=True)
+                if health.open_until <= now
+            ]
+
+            if not closed:
+                return candidates[min(range(len(candidates)), key=lambda i: healths[i].open_until)]
+
+            weights = [self.get_weight(health) for _, health in closed]
+
+        return random.choices([rpc for rpc, _ in closed], weights=weights)[0]
+
+    def reserve(self, url: str) -> float:
+        """
+        Reserves a slot to send a request to the endpoint under its rate limit. Returns the number
+        of seconds to wait before sending the request.
+        """
+        with self.lock:
+            health = self._get_health(url)
+            if not health.rate_limit:
+                return 0.0
+
+            now = time.monotonic()
+            slot = max(now, health.next_slot)
+            health.next_slot = slot + 1 / health.rate_limit
+
+            return slot - now
+
+    def record_success(self, url: str, latency: float) -> None:
+        with self.lock:
+            health = self._get_health(url)
+            health.requests += 1
+            health.latency = (
+                latency
+                if health.latency is None
+                else (1 - self.alpha) * health.latency + self.alpha * latency
+            )
+            health.error_rate = (1 - self.alpha) * health.error_rate
+            health.consecutive_failures = 0
+            health.cooldown = RPC_CIRCUIT_BREAKER_COOLDOWN
+
+    def record_failure(self, url: str, latency: float, rate_limited: bool = False) -> None:
+        with self.lock:
+            health = self._get_health(url)
+            health.requests += 1
+            health.errors += 1
+            # timeouts and slow errors also count towards the latency of the endpoint
+            health.latency = (
+                latency
+                if health.latency is None
+                else (1 - self.alpha) * health.latency + self.alpha * latency
+            )
+            health.error_rate = (1 - self.alpha) * health.error_rate + self.alpha
+            health.consecutive_failures += 1
+
+            if rate_limited:
+                health.rate_limited += 1
+
+            if rate_limited or health.consecutive_failures >= self.max_failures:
+                health.open_until = time.monotonic() + health.cooldown
+                health.cooldown = min(health.cooldown * 2, RPC_CIRCUIT_BREAKER_MAX_COOLDOWN)
+                health.consecutive_failures = 0
+
+    def get_stats(self) -> list:
+        """Returns the latency, error rate and 429 responses of each endpoint."""
+        now = time.monotonic()
+
+        with self.lock:
+            stats = [
+                {
+                    "endpoint": url,
+                    "requests": health.requests,
+                    "latency": health.latency or 0.0,
+                    "error_rate": health.errors / health.requests if health.requests else 0.0,
+                    "rate_limited": health.rate_limited,
+                    "open": health.open_until > now,
+                }
+                for url, health in self.endpoints.items()
+            ]
+
+        return sorted(stats, key=lambda stat: stat["requests"], reverse=True)
+
+
+# we keep a single scheduler for the whole process, such that all clients share what they learn
+# about each endpoint
+endpoint_scheduler = EndpointScheduler()
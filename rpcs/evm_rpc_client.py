@@ -1,6 +1,7 @@
 from config.constants import (
     RPCS_CONFIG_FILE,
 )
+from rpcs.block_timestamp_cache import block_timestamp_cache
 from rpcs.rpc_client import RPCClient
 
 
@@ -13,11 +14,15 @@ class EvmRPCClient(RPCClient):
     def get_logs_emitted_by_contract(
         self,
         blockchain: str,
-        contract: str,
+        contract: str | list,
         topics: list,
         start_block: str,
         end_block: str,
     ) -> list:
+        """
+        Fetches the logs emitted in a block range by a contract, or by any of a list of contracts,
+        whose first topic is any of `topics`.
+        """
         method = "eth_getLogs"
         params = [
             {
@@ -33,49 +38,134 @@ class EvmRPCClient(RPCClient):
 
         return response["result"] if response else []
 
-    def process_transaction(self, blockchain: str, tx_hash: str, block_number: str) -> dict:
-        import concurrent.futures
-
-        if self.requires_transaction_by_hash_rpc_call:
-            method_tx = "eth_getTransactionByHash"
-            params_tx = [tx_hash]
-
-        method_receipt = "eth_getTransactionReceipt"
-        params_receipt = [tx_hash]
-
-        method_block = "eth_getBlockByNumber"
-        params_block = [block_number, True]
+    async def get_logs_emitted_by_contract_async(
+        self,
+        blockchain: str,
+        contract: str | list,
+        topics: list,
+        start_block: str,
+        end_block: str,
+    ) -> list:
+        """Asyncio version of `get_logs_emitted_by_contract`."""
+        method = "eth_getLogs"
+        params = [
+            {
+                "fromBlock": hex(start_block),
+                "toBlock": hex(end_block),
+                "topics": [topics],
+                "address": contract,
+            }
+        ]
 
-        rpc = self.get_next_rpc(blockchain)
+        response = await self.make_request_async(blockchain, method, params)
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            if self.requires_transaction_by_hash_rpc_call:
-                future_tx = executor.submit(
-                    self.make_request, rpc, blockchain, method_tx, params_tx
-                )
+        return response["result"] if response else []
 
-            future_receipt = executor.submit(
-                self.make_request, rpc, blockchain, method_receipt, params_receipt
-            )
-            future_block = executor.submit(
-                self.make_request, rpc, blockchain, method_block, params_block
-            )
+    def process_transaction(self, blockchain: str, tx_hash: str, block_number: str) -> dict:
+        return self.process_transactions(blockchain, {tx_hash: block_number})[tx_hash]
+
+    def process_transactions(self, blockchain: str, transactions: dict) -> dict:
+        """
+        Fetches the receipt (and, if required by the bridge, the transaction itself) and the
+        block header of many transactions, packing all calls into JSON-RPC batch requests. Block
+        timestamps are read from the block timestamp cache whenever possible, and blocks shared
+        by several transactions are only requested once.
+
+        Args:
+            blockchain: The blockchain where the transactions were executed.
+            transactions: A mapping of transaction hash to block number (hex string).
+
+        Returns:
+            A mapping of transaction hash to a (receipt, block) tuple, in which the block only
+            contains its number and timestamp.
+        """
+        block_timestamps, block_numbers, calls = self.build_transaction_calls(
+            blockchain, transactions
+        )
+
+        responses = self.make_batch_request(blockchain, calls) if calls else []
+
+        return self.parse_transaction_responses(
+            blockchain, transactions, block_timestamps, block_numbers, responses
+        )
+
+    async def process_transactions_async(self, blockchain: str, transactions: dict) -> dict:
+        """Asyncio version of `process_transactions`."""
+        block_timestamps, block_numbers, calls = self.build_transaction_calls(
+            blockchain, transactions
+        )
+
+        responses = await self.make_batch_request_async(blockchain, calls) if calls else []
+
+        return self.parse_transaction_responses(
+            blockchain, transactions, block_timestamps, block_numbers, responses
+        )
+
+    def build_transaction_calls(self, blockchain: str, transactions: dict) -> tuple:
+        """
+        Returns the cached block timestamps, the blocks whose timestamp must be fetched, and the
+        list of calls to fetch for `process_transactions`.
+        """
+        tx_hashes = list(transactions.keys())
+        block_timestamps = block_timestamp_cache.get_many(
+            blockchain, list(dict.fromkeys(transactions.values()))
+        )
+        block_numbers = [
+            block_number
+            for block_number in dict.fromkeys(transactions.values())
+            if block_number not in block_timestamps
+        ]
 
-            if self.requires_transaction_by_hash_rpc_call:
-                response_tx = future_tx.result()
-            else:
-                response_tx = None
+        calls = [("eth_getTransactionReceipt", [tx_hash]) for tx_hash in tx_hashes]
+        if self.requires_transaction_by_hash_rpc_call:
+            calls += [("eth_getTransactionByHash", [tx_hash]) for tx_hash in tx_hashes]
+        # we only need the timestamp of each block, so we do not request the full transactions
+        calls += [("eth_getBlockByNumber", [block_number, False]) for block_number in block_numbers]
 
-            response_receipt = future_receipt.result()
-            response_block = future_block.result()
+        return block_timestamps, block_numbers, calls
 
+    def parse_transaction_responses(
+        self,
+        blockchain: str,
+        transactions: dict,
+        block_timestamps: dict,
+        block_numbers: list,
+        responses: list,
+    ) -> dict:
+        tx_hashes = list(transactions.keys())
+
+        receipts = responses[: len(tx_hashes)]
+        if self.requires_transaction_by_hash_rpc_call:
+            response_txs = responses[len(tx_hashes) : 2 * len(tx_hashes)]
+        else:
+            response_txs = [None] * len(tx_hashes)
+
+        fetched_timestamps = {}
+        for block_number, response_block in zip(
+            block_numbers, responses[len(responses) - len(block_numbers) :]
+        ):
+            if response_block:
+                fetched_timestamps[block_number] = int(response_block["result"]["timestamp"], 16)
+
+        block_timestamp_cache.put_many(blockchain, fetched_timestamps)
+        block_timestamps.update(fetched_timestamps)
+
+        results = {}
+        for tx_hash, response_receipt, response_tx in zip(tx_hashes, receipts, response_txs):
             if response_receipt and response_tx:
                 response_receipt["result"]["value"] = response_tx["result"]["value"]
                 response_receipt["result"]["input"] = response_tx["result"]["input"]
 
-        return response_receipt["result"] if response_receipt else {}, response_block[
-            "result"
-        ] if response_block else {}
+            block_number = transactions[tx_hash]
+
+            results[tx_hash] = (
+                response_receipt["result"] if response_receipt else {},
+                {"number": block_number, "timestamp": hex(block_timestamps[block_number])}
+                if block_number in block_timestamps
+                else {},
+            )
+
+        return results
 
     def get_transaction_receipt(self, blockchain: str, tx_hash: str) -> dict:
         method = "eth_getTransactionReceipt"
@@ -1,28 +1,125 @@
+import concurrent.futures
+import os
+import time
+
 import yaml
 
+from config.constants import (
+    RPC_PROBE_MAX_WORKERS,
+    RPC_PROBE_TIMEOUT,
+    RPCS_BASE_CONFIG_FILE,
+    RPCS_CONFIG_FILE,
+    RPCS_CONFIG_TTL,
+)
 from rpcs.evm_rpc_client import EvmRPCClient
 
-# we keep this global variable to store all the configurations
-final_configs = []
-
 
-def generate_rpc_configs(blockchain: list):
-    print(f"Generating RPC configurations for {blockchain}...")
-    with open("./config/rpcs_base_config.yaml") as f:
+def generate_rpc_configs(
+    blockchains: list,
+    ttl: int = RPCS_CONFIG_TTL,
+    base_config_file: str = RPCS_BASE_CONFIG_FILE,
+    outfile: str = RPCS_CONFIG_FILE,
+):
+    """
+    Writes the RPC configuration of the given blockchains to `outfile`, probing only the
+    blockchains whose configuration was not generated in the last `ttl` seconds (or was generated
+    before the base configuration file last changed, or has no RPC available, e.g., after a
+    transient outage). Configurations of other blockchains already in `outfile` are kept.
+    """
+    with open(base_config_file) as f:
         configs = yaml.safe_load(f)
 
-    test_rpcs(configs, blockchain)
+    cached_configs = load_cached_configs(outfile)
+    base_config_mtime = os.path.getmtime(base_config_file)
+    now = time.time()
+
+    stale_blockchains = [
+        blockchain
+        for blockchain in blockchains
+        if blockchain not in cached_configs
+        or len(cached_configs[blockchain].get("rpcs", [])) == 0
+        or now - cached_configs[blockchain].get("generated_at", 0) >= ttl
+        or cached_configs[blockchain].get("generated_at", 0) < base_config_mtime
+    ]
+
+    if len(stale_blockchains) == 0:
+        print(f"Reusing the RPC configurations in {outfile} for {blockchains}.")
+        return
+
+    print(f"Generating RPC configurations for {stale_blockchains}...")
+
+    for final_config in test_rpcs(configs, stale_blockchains):
+        cached_configs[final_config["name"]] = final_config
+
+    with open(outfile, "w") as f:
+        yaml.dump(
+            {"blockchains": list(cached_configs.values())},
+            f,
+            default_flow_style=False,
+            indent=2,
+            sort_keys=False,
+        )
+        print(f"RPC configurations generated and written to {outfile}.")
+
+
+def load_cached_configs(outfile: str) -> dict:
+    """Returns the configurations previously written to `outfile`, keyed by blockchain."""
+    if not os.path.exists(outfile):
+        return {}
+
+    with open(outfile) as f:
+        configs = yaml.safe_load(f) or {}
+
+    return {config["name"]: config for config in configs.get("blockchains", [])}
+
+
+def probe_rpc(config: dict, rpc: str) -> float:
+    """
+    Requests the logs of the blockchain's test contract and block range from an RPC endpoint.
+    Returns the latency of the request, in seconds.
+
+    Raises:
+        Exception: If the request fails, times out, or no logs are found.
+    """
+    start_time = time.monotonic()
+
+    response = EvmRPCClient.plain_request(
+        rpc,
+        "eth_getLogs",
+        [
+            {
+                "fromBlock": config["start_block"],
+                "toBlock": config["end_block"],
+                "topics": config["topics"],
+                "address": config["contract"],
+            }
+        ],
+        timeout=RPC_PROBE_TIMEOUT,
+    )
+
+    latency = time.monotonic() - start_time
+
+    if "error" in response:
+        raise Exception(f"Error in RPC response: {response['error']}")
+
+    if "result" not in response:
+        raise Exception(f"Invalid RPC response: {response}")
 
+    if len(response["result"]) == 0:
+        raise Exception("Something is going on here... no logs found...")
 
-def test_rpcs(configs, blockchains):
+    return latency
+
+
+def test_rpcs(configs, blockchains) -> list:
     """
     Tests the RPC endpoints for each blockchain configuration provided and removes the ones that are
     not available.
 
-    The function iterates through the list of blockchain configurations, sends a request to each RPC
-    endpoint, and checks if logs are returned. If no logs are found, the RPC endpoint is considered
-    unavailable and is removed from the list. The final configurations with available RPCs are then
-    written to a YAML file.
+    All RPC endpoints of all blockchains are probed concurrently: each one is sent an eth_getLogs
+    request and is considered unavailable if it fails, times out, or returns no logs. The RPCs
+    available are ranked by the latency of their response, which is also recorded so that RPC
+    clients can weight their endpoints from the first request.
 
     Args:
         configs (dict): A dictionary containing blockchain configurations. Each configuration should
@@ -34,68 +131,71 @@ def test_rpcs(configs, blockchains):
             - end_block (str): The ending block number.
             - rpcs (list): The list of RPC endpoints to test.
 
-    Raises:
-        Exception: If no logs are found for a given RPC endpoint.
-
-    Outputs:
-        Writes the final configurations with available RPCs to './config/rpcs_config.yaml'.
+    Returns:
+        list: The final configurations of the blockchains given, with the available RPCs ranked
+        from fastest to slowest, their `latencies`, and the time they were `generated_at` (unless
+        no RPC is available).
     """
-    for config in configs["blockchains"]:
-        if config["name"] not in blockchains:
-            continue
+    final_configs = []
+    probes = {}
 
-        if config["name"] == "solana":
-            final_configs.append(
-                {
-                    "name": config["name"],
-                    "rpcs": config["rpcs"],
-                }
-            )
-            continue
+    configs = [config for config in configs["blockchains"] if config["name"] in blockchains]
 
-        rpcs = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=RPC_PROBE_MAX_WORKERS) as executor:
+        for config in configs:
+            # solana RPCs are not probed, as they do not support eth_getLogs
+            if config["name"] == "solana":
+                continue
 
-        for rpc in config["rpcs"]:
-            try:
-                response = EvmRPCClient.plain_request(
-                    rpc,
-                    "eth_getLogs",
-                    [
-                        {
-                            "fromBlock": config["start_block"],
-                            "toBlock": config["end_block"],
-                            "topics": config["topics"],
-                            "address": config["contract"],
-                        }
-                    ],
-                )
-
-                if "result" not in response:
-                    raise Exception(f"Invalid RPC response: {response}")
-
-                if "error" in response:
-                    raise Exception(f"Error in RPC response: {response['error']}")
-
-                if len(response["result"]) == 0:
-                    raise Exception("Something is going on here... no logs found...")
-
-                rpcs.append(rpc)
+            for rpc in config["rpcs"]:
+                probes[(config["name"], rpc)] = executor.submit(probe_rpc, config, rpc)
 
+        latencies = {}
+        for (name, rpc), probe in probes.items():
+            try:
+                latencies.setdefault(name, {})[rpc] = round(probe.result(), 4)
             except Exception as e:
                 print("Removing RPC: ", rpc, e)
 
-        final_configs.append(
-            {
+    for config in configs:
+        if config["name"] == "solana":
+            final_config = {
                 "name": config["name"],
-                "contract": config["contract"],
-                "topics": config["topics"],
-                "start_block": config["start_block"],
-                "end_block": config["end_block"],
-                "rpcs": rpcs,
+                "rpcs": config["rpcs"],
+                "generated_at": time.time(),
             }
-        )
 
-    outfile = "./config/rpcs_config.yaml"
-    with open(outfile, "w") as f:
-        yaml.dump({"blockchains": final_configs}, f, default_flow_style=False, indent=2)
-        print(f"RPC configurations generated and written to {outfile}.")
+            if "rate_limits" in config:
+                final_config["rate_limits"] = config["rate_limits"]
+
+            final_configs.append(final_config)
+            continue
+
+        rpc_latencies = latencies.get(config["name"], {})
+        rpcs = sorted(rpc_latencies, key=rpc_latencies.get)
+
+        final_config = {
+            "name": config["name"],
+            "contract": config["contract"],
+            "topics": config["topics"],
+            "start_block": config["start_block"],
+            "end_block": config["end_block"],
+            "rpcs": rpcs,
+            "latencies": {rpc: rpc_latencies[rpc] for rpc in rpcs},
+        }
+
+        # a blockchain without RPCs available is probed again on the next run
+        if len(rpcs) > 0:
+            final_config["generated_at"] = time.time()
+
+        if "batch_size" in config:
+            final_config["batch_size"] = config["batch_size"]
+
+        if "rate_limits" in config:
+            final_config["rate_limits"] = {
+                rpc: rate_limit for rpc, rate_limit in config["rate_limits"].items() if rpc in rpcs
+            }
+
+        final_configs.append(final_config)
+
+    return final_configs
@@ -0,0 +1,91 @@
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config.constants import HTTP_GZIP_RESPONSES, HTTP_POOL_SIZE
+
+
+class HttpSessionPool:
+    """
+    Thread-safe pool of keep-alive HTTP sessions, one per endpoint (scheme and host), shared by
+    all RPC clients. Reusing the connections of each session avoids a new TCP and TLS handshake
+    for every request.
+
+    Attributes:
+        pool_size (int): Maximum number of connections kept open to each endpoint.
+        gzip (bool): Whether to ask endpoints for gzip-compressed responses.
+        sessions (dict): Mapping of endpoint to its session.
+        request_counts (dict): Mapping of endpoint to the number of requests sent.
+    """
+
+    def __init__(self, pool_size: int = HTTP_POOL_SIZE, gzip: bool = HTTP_GZIP_RESPONSES):
+        self.pool_size = pool_size
+        self.gzip = gzip
+        self.sessions = {}
+        self.request_counts = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_endpoint(url: str) -> str:
+        """Returns the scheme and host of a URL, leaving out paths that may contain API keys."""
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def get_session(self, url: str) -> requests.Session:
+        endpoint = self.get_endpoint(url)
+
+        with self.lock:
+            if endpoint not in self.sessions:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update(
+                    {
+                        "Connection": "keep-alive",
+                        "Accept-Encoding": "gzip, deflate" if self.gzip else "identity",
+                    }
+                )
+                self.sessions[endpoint] = session
+                self.request_counts[endpoint] = 0
+
+            self.request_counts[endpoint] += 1
+
+            return self.sessions[endpoint]
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.get_session(url).post(url, **kwargs)
+
+    def get_stats(self) -> list:
+        """
+        Returns, for each endpoint, the number of requests sent, the number of connections opened,
+        and the rate of requests that reused an already open connection.
+        """
+        stats = []
+
+        with self.lock:
+            for endpoint, session in self.sessions.items():
+                num_connections = 0
+                for adapter in set(session.adapters.values()):
+                    pools = adapter.poolmanager.pools
+                    num_connections += sum(pools[key].num_connections for key in pools.keys())
+                num_requests = self.request_counts[endpoint]
+
+                stats.append(
+                    {
+                        "endpoint": endpoint,
+                        "requests": num_requests,
+                        "connections": num_connections,
+                        "reuse_rate": (
+                            1 - num_connections / num_requests if num_requests > 0 else 0.0
+                        ),
+                    }
+                )
+
+        return sorted(stats, key=lambda stat: stat["requests"], reverse=True)
+
+
+# we keep a single pool for the whole process, such that connections are reused by all clients
+http_session_pool = HttpSessionPool()
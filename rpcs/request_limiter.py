@@ -0,0 +1,44 @@
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+
+from config.constants import MAX_CONCURRENT_RPC_REQUESTS, REQUEST_LIMITER_POLL_INTERVAL
+
+
+class RequestLimiter:
+    """
+    Caps the number of RPC requests in flight for all blockchains together, such that
+    blockchains extracted concurrently share the network. The requests of each blockchain are
+    already bounded by the workers of its extractor (or, with the asyncio engine, by the
+    semaphores of its endpoints).
+
+    Attributes:
+        max_concurrent_requests (int): Maximum number of requests in flight overall.
+    """
+
+    def __init__(self, max_concurrent_requests: int = MAX_CONCURRENT_RPC_REQUESTS):
+        self.max_concurrent_requests = max_concurrent_requests
+        self.global_semaphore = threading.BoundedSemaphore(max_concurrent_requests)
+
+    @contextmanager
+    def limit(self):
+        with self.global_semaphore:
+            yield
+
+    @asynccontextmanager
+    async def limit_async(self):
+        """
+        Asyncio version of `limit`. The semaphore is shared with worker threads and with the event
+        loops of other blockchains, therefore it is polled rather than waited for, such that the
+        event loop is not blocked.
+        """
+        while not self.global_semaphore.acquire(blocking=False):
+            await asyncio.sleep(REQUEST_LIMITER_POLL_INTERVAL)
+        try:
+            yield
+        finally:
+            self.global_semaphore.release()
+
+
+# we keep a single limiter for the whole process, such that it is shared by all clients
+request_limiter = RequestLimiter()
@@ -1,21 +1,49 @@
+import asyncio
 import time
 from abc import ABC, abstractmethod
-from itertools import cycle
 
-import requests
+import aiohttp
 import yaml
 
 from config.constants import (
+    ASYNC_MAX_REQUESTS_PER_ENDPOINT,
     BRIDGE_NEEDS_TRANSACTION_BY_HASH_RPC_METHOD,
+    DEFAULT_RPC_BATCH_SIZE,
+    HTTP_GZIP_RESPONSES,
     MAX_NUM_THREADS_EXTRACTOR,
+    RPC_BATCH_SIZE_PER_BLOCKCHAIN,
     RPCS_CONFIG_FILE,
 )
-from utils.utils import CustomException, load_solana_api_key, log_error
+from rpcs.endpoint_scheduler import endpoint_scheduler
+from rpcs.http_session_pool import http_session_pool
+from rpcs.request_limiter import request_limiter
+from utils.utils import (
+    CustomException,
+    RPCResultLimitException,
+    load_solana_api_key,
+    log_error,
+)
 
 
 class RPCClient(ABC):
     CLASS_NAME = "RPCClient"
 
+    # (lowercase) fragments of the errors returned by RPC providers when an eth_getLogs request
+    # covers a block range with too many results or too large a response (but not, e.g., one
+    # extending beyond the head of the node, which is not solved by splitting the range)
+    RESULT_LIMIT_ERRORS = (
+        "returned more than",
+        "too many results",
+        "max results",
+        "response size",
+        "response is too big",
+        "max block range",
+        "maximum block range",
+        "range is too",
+        "range too large",
+        "range limit",
+    )
+
     def __init__(self, bridge, config_file: str = RPCS_CONFIG_FILE):
         self.bridge = bridge
         self.blockchains = self.load_config(config_file)
@@ -23,10 +51,29 @@ class RPCClient(ABC):
         self.rpc_sizes = {
             blockchain["name"]: len(blockchain["rpcs"]) for blockchain in self.blockchains
         }
+        self.batch_sizes = {
+            blockchain["name"]: blockchain.get(
+                "batch_size",
+                RPC_BATCH_SIZE_PER_BLOCKCHAIN.get(blockchain["name"], DEFAULT_RPC_BATCH_SIZE),
+            )
+            for blockchain in self.blockchains
+        }
         self.requires_transaction_by_hash_rpc_call = BRIDGE_NEEDS_TRANSACTION_BY_HASH_RPC_METHOD[
             bridge
         ]  # noqa: E501
 
+        for blockchain in self.blockchains:
+            for rpc, rate_limit in blockchain.get("rate_limits", {}).items():
+                endpoint_scheduler.set_rate_limit(rpc, rate_limit)
+
+            # the latencies measured when the RPCs were probed weight the first requests
+            for rpc, latency in blockchain.get("latencies", {}).items():
+                endpoint_scheduler.set_initial_latency(rpc, latency)
+
+        # state of the asyncio engine, created on first use inside the event loop
+        self.async_session = None
+        self.endpoint_semaphores = {}
+
     def max_threads_per_blockchain(self, blockchain_name: str) -> int:
         func_name = "max_threads_per_blockchain"
         for blockchain in self.blockchains:
@@ -45,15 +92,18 @@ class RPCClient(ABC):
             return yaml.safe_load(file)["blockchains"]
 
     def initialize_rpc_mapping(self):
-        """Initialize a round-robin cycle for each blockchain's RPC endpoints."""
+        """Initialize the list of RPC endpoints of each blockchain."""
         rpc_mapping = {}
         for blockchain in self.blockchains:
             blockchain_name = blockchain["name"]
-            rpc_mapping[blockchain_name] = cycle(blockchain["rpcs"])
+            rpc_mapping[blockchain_name] = list(blockchain["rpcs"])
         return rpc_mapping
 
-    def get_next_rpc(self, blockchain_name: str) -> str:
-        """Get the next RPC URL in the round-robin cycle for a blockchain."""
+    def get_next_rpc(self, blockchain_name: str, exclude=()) -> str:
+        """
+        Get the RPC URL to send the next request of a blockchain to, chosen by the endpoint
+        scheduler among the healthy endpoints not in `exclude`.
+        """
         func_name = "get_next_rpc"
         if blockchain_name not in self.rpc_mapping:
             raise CustomException(
@@ -62,15 +112,35 @@ class RPCClient(ABC):
                 f"blockchain {blockchain_name} not found in configuration.",
             )
 
-        next_rpc = next(self.rpc_mapping[blockchain_name])
-        return next_rpc
+        return endpoint_scheduler.select(self.rpc_mapping[blockchain_name], exclude)
 
     def get_random_rpc(self, blockchain) -> str:
         """Get a random RPC URL for Ethereum."""
         return self.get_next_rpc(blockchain)
 
+    def get_batch_size(self, blockchain_name: str) -> int:
+        """Get the maximum number of calls packed into a single batch request for a blockchain."""
+        return max(1, self.batch_sizes.get(blockchain_name, DEFAULT_RPC_BATCH_SIZE))
+
+    @staticmethod
+    def build_headers(blockchain_name: str) -> dict:
+        if blockchain_name == "solana":
+            return {
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+                "Authorization": f"Bearer {load_solana_api_key()}",
+            }
+
+        return {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+
     def make_request(self, rpc_url: str, blockchain_name: str, method: str, params: list) -> dict:
-        """Make an RPC request using the next available endpoint in the round-robin."""
+        """
+        Make an RPC request, starting with the given endpoint and moving on to the endpoints
+        chosen by the endpoint scheduler, which is told the outcome of every attempt.
+        """
         func_name = "make_request"
         num_rpcs = self.rpc_sizes[blockchain_name]
 
@@ -85,29 +155,37 @@ class RPCClient(ABC):
                         "method": method,
                         "params": params,
                     }
+                    headers = self.build_headers(blockchain_name)
+
+                    time.sleep(endpoint_scheduler.reserve(rpc_url))
+                    start_time = time.monotonic()
+                    rate_limited = False
 
-                    if blockchain_name == "solana":
-                        headers = {
-                            "Content-Type": "application/json",
-                            "Accept": "application/json",
-                            "Authorization": f"Bearer {load_solana_api_key()}",
-                        }
-                    else:
-                        headers = {
-                            "Content-Type": "application/json",
-                            "Accept": "application/json",
-                        }
                     try:
-                        response = requests.post(rpc_url, json=payload, headers=headers, timeout=10)
+                        with request_limiter.limit():
+                            response = http_session_pool.post(
+                                rpc_url, json=payload, headers=headers, timeout=10
+                            )
+                        rate_limited = response.status_code == 429
+                        self.check_result_limit(method, response.json())
                         response.raise_for_status()
 
                         if response.json() is None or response.json()["result"] is None:
                             raise Exception()
 
+                        endpoint_scheduler.record_success(rpc_url, time.monotonic() - start_time)
                         return response.json()
+                    except RPCResultLimitException:
+                        # the endpoint is healthy, but retrying the same request would fail
+                        # again, the caller must split it
+                        endpoint_scheduler.record_success(rpc_url, time.monotonic() - start_time)
+                        raise
                     except Exception as e:
+                        endpoint_scheduler.record_failure(
+                            rpc_url, time.monotonic() - start_time, rate_limited
+                        )
                         tried_rpcs[rpc_url] = e
-                        rpc_url = self.get_next_rpc(blockchain_name)
+                        rpc_url = self.get_next_rpc(blockchain_name, exclude=tried_rpcs)
                         # ignore the exception and try the next RPC endpoint
                         pass
 
@@ -125,6 +203,8 @@ class RPCClient(ABC):
                 )
                 backoff = (backoff * 2) if backoff < 30 else 30
 
+        except RPCResultLimitException:
+            raise
         except Exception as e:
             raise CustomException(
                 self.CLASS_NAME,
@@ -135,13 +215,315 @@ class RPCClient(ABC):
                 ),
             ) from e
 
+    def check_result_limit(self, method: str, body) -> None:
+        """
+        Raises RPCResultLimitException if an eth_getLogs request was rejected because the block
+        range requested has too many results.
+        """
+        if method != "eth_getLogs" or not isinstance(body, dict):
+            return
+
+        error = body.get("error")
+        message = str(error).lower() if error else ""
+
+        if any(fragment in message for fragment in self.RESULT_LIMIT_ERRORS):
+            raise RPCResultLimitException(self.CLASS_NAME, "make_request", message)
+
+    def make_batch_request(self, blockchain_name: str, calls: list) -> list:
+        """
+        Make many RPC requests packed into JSON-RPC batch arrays of at most `batch_size` calls.
+
+        Args:
+            blockchain_name: The blockchain to send the requests to.
+            calls: A list of (method, params) tuples.
+
+        Returns:
+            The list of responses, in the same order as `calls`.
+        """
+        batch_size = self.get_batch_size(blockchain_name)
+        responses = []
+
+        for offset in range(0, len(calls), batch_size):
+            responses.extend(
+                self._make_batch_chunk_request(blockchain_name, calls[offset : offset + batch_size])
+            )
+
+        return responses
+
+    @staticmethod
+    def build_batch_payload(calls: list, pending: set) -> list:
+        return [
+            {
+                "id": idx,
+                "jsonrpc": "2.0",
+                "method": calls[idx][0],
+                "params": calls[idx][1],
+            }
+            for idx in sorted(pending)
+        ]
+
+    @staticmethod
+    def collect_batch_results(results, pending: set, responses: list) -> None:
+        """
+        Stores the results of a batch response in `responses` (by call index) and removes them
+        from `pending`. Raises if any call is still pending.
+        """
+        # some providers reply to a batch with a single error object
+        if not isinstance(results, list):
+            raise Exception(results)
+
+        for result in results:
+            idx = result.get("id")
+            if idx in pending and result.get("result") is not None:
+                responses[idx] = result
+                pending.discard(idx)
+
+        if pending:
+            raise Exception(f"{len(pending)} calls in the batch without result")
+
+    def _make_batch_chunk_request(self, blockchain_name: str, calls: list) -> list:
+        """
+        Send a single JSON-RPC batch. Calls that fail (or return an empty result) in one endpoint
+        are retried in other endpoints chosen by the endpoint scheduler, backing off exponentially
+        once all endpoints were tried, as in `make_request`.
+        """
+        func_name = "make_batch_request"
+        num_rpcs = self.rpc_sizes[blockchain_name]
+        responses = [None] * len(calls)
+        pending = set(range(len(calls)))
+
+        try:
+            backoff = 1
+            while True:
+                tried_rpcs = {}
+                while len(tried_rpcs) < num_rpcs:
+                    rpc_url = self.get_next_rpc(blockchain_name, exclude=tried_rpcs)
+                    payload = self.build_batch_payload(calls, pending)
+
+                    time.sleep(endpoint_scheduler.reserve(rpc_url))
+                    start_time = time.monotonic()
+                    rate_limited = False
+
+                    try:
+                        with request_limiter.limit():
+                            response = http_session_pool.post(
+                                rpc_url,
+                                json=payload,
+                                headers=self.build_headers(blockchain_name),
+                                timeout=10,
+                            )
+                        rate_limited = response.status_code == 429
+                        response.raise_for_status()
+
+                        self.collect_batch_results(response.json(), pending, responses)
+                        endpoint_scheduler.record_success(rpc_url, time.monotonic() - start_time)
+                        return responses
+                    except Exception as e:
+                        endpoint_scheduler.record_failure(
+                            rpc_url, time.monotonic() - start_time, rate_limited
+                        )
+                        tried_rpcs[rpc_url] = e
+                        # ignore the exception and try the next RPC endpoint
+                        pass
+
+                time.sleep(backoff)
+                log_error(
+                    self.bridge,
+                    (
+                        f"Failed to make RPC batch request to {blockchain_name}, "
+                        f"{len(pending)} calls pending (e.g., {calls[min(pending)]}). "
+                        f"Tried RPCs: {tried_rpcs}. Retrying with backoff {backoff} seconds."
+                    ),
+                )
+                backoff = (backoff * 2) if backoff < 30 else 30
+
+        except Exception as e:
+            raise CustomException(
+                self.CLASS_NAME,
+                func_name,
+                f"Failed to make RPC batch request to {blockchain_name}. Error: {e}",
+            ) from e
+
+    def get_endpoint_semaphore(self, url: str) -> asyncio.Semaphore:
+        endpoint = http_session_pool.get_endpoint(url)
+
+        if endpoint not in self.endpoint_semaphores:
+            self.endpoint_semaphores[endpoint] = asyncio.Semaphore(ASYNC_MAX_REQUESTS_PER_ENDPOINT)
+
+        return self.endpoint_semaphores[endpoint]
+
+    async def post_async(self, url: str, payload, headers: dict, timeout: int = 10):
+        """
+        Posts a request in the running event loop, bounded by the semaphore of the endpoint and
+        the global cap of requests in flight. Returns the HTTP status and the decoded JSON body.
+        """
+        if self.async_session is None:
+            self.async_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=0, limit_per_host=ASYNC_MAX_REQUESTS_PER_ENDPOINT
+                ),
+                headers={"Accept-Encoding": "gzip, deflate" if HTTP_GZIP_RESPONSES else "identity"},
+            )
+
+        async with self.get_endpoint_semaphore(url), request_limiter.limit_async():
+            async with self.async_session.post(
+                url,
+                json=payload,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as response:
+                try:
+                    return response.status, await response.json(content_type=None)
+                except ValueError:
+                    # e.g., the HTML page of a 429 or 5xx response
+                    return response.status, None
+
+    async def close_async(self) -> None:
+        if self.async_session is not None:
+            await self.async_session.close()
+
+        self.async_session = None
+        self.endpoint_semaphores = {}
+
+    async def make_request_async(self, blockchain_name: str, method: str, params: list) -> dict:
+        """Asyncio version of `make_request`, with the same retry and backoff logic."""
+        func_name = "make_request_async"
+        num_rpcs = self.rpc_sizes[blockchain_name]
+        payload = {"id": 1, "jsonrpc": "2.0", "method": method, "params": params}
+
+        try:
+            backoff = 1
+            while True:
+                tried_rpcs = {}
+                while len(tried_rpcs) < num_rpcs:
+                    rpc_url = self.get_next_rpc(blockchain_name, exclude=tried_rpcs)
+
+                    await asyncio.sleep(endpoint_scheduler.reserve(rpc_url))
+                    start_time = time.monotonic()
+                    rate_limited = False
+
+                    try:
+                        status, body = await self.post_async(
+                            rpc_url, payload, self.build_headers(blockchain_name)
+                        )
+                        rate_limited = status == 429
+                        self.check_result_limit(method, body)
+
+                        if status != 200 or body is None or body.get("result") is None:
+                            raise Exception(f"status {status}: {body}")
+
+                        endpoint_scheduler.record_success(rpc_url, time.monotonic() - start_time)
+                        return body
+                    except RPCResultLimitException:
+                        endpoint_scheduler.record_success(rpc_url, time.monotonic() - start_time)
+                        raise
+                    except Exception as e:
+                        endpoint_scheduler.record_failure(
+                            rpc_url, time.monotonic() - start_time, rate_limited
+                        )
+                        tried_rpcs[rpc_url] = e
+
+                await asyncio.sleep(backoff)
+                log_error(
+                    self.bridge,
+                    (
+                        f"Failed to make RPC request to {blockchain_name}, method {method}, "
+                        f"params {params}. Tried RPCs: {tried_rpcs}. Retrying with backoff "
+                        f"{backoff} seconds."
+                    ),
+                )
+                backoff = (backoff * 2) if backoff < 30 else 30
+
+        except RPCResultLimitException:
+            raise
+        except Exception as e:
+            raise CustomException(
+                self.CLASS_NAME,
+                func_name,
+                (
+                    f"Failed to make RPC request to {blockchain_name}, method {method}, "
+                    f"params {params}. Error: {e}"
+                ),
+            ) from e
+
+    async def make_batch_request_async(self, blockchain_name: str, calls: list) -> list:
+        """Asyncio version of `make_batch_request`; batches are sent concurrently."""
+        batch_size = self.get_batch_size(blockchain_name)
+
+        chunks = await asyncio.gather(
+            *[
+                self._make_batch_chunk_request_async(
+                    blockchain_name, calls[offset : offset + batch_size]
+                )
+                for offset in range(0, len(calls), batch_size)
+            ]
+        )
+
+        return [response for chunk in chunks for response in chunk]
+
+    async def _make_batch_chunk_request_async(self, blockchain_name: str, calls: list) -> list:
+        func_name = "make_batch_request_async"
+        num_rpcs = self.rpc_sizes[blockchain_name]
+        responses = [None] * len(calls)
+        pending = set(range(len(calls)))
+
+        try:
+            backoff = 1
+            while True:
+                tried_rpcs = {}
+                while len(tried_rpcs) < num_rpcs:
+                    rpc_url = self.get_next_rpc(blockchain_name, exclude=tried_rpcs)
+
+                    await asyncio.sleep(endpoint_scheduler.reserve(rpc_url))
+                    start_time = time.monotonic()
+                    rate_limited = False
+
+                    try:
+                        status, body = await self.post_async(
+                            rpc_url,
+                            self.build_batch_payload(calls, pending),
+                            self.build_headers(blockchain_name),
+                        )
+                        rate_limited = status == 429
+
+                        if status != 200:
+                            raise Exception(f"status {status}: {body}")
+
+                        self.collect_batch_results(body, pending, responses)
+                        endpoint_scheduler.record_success(rpc_url, time.monotonic() - start_time)
+                        return responses
+                    except Exception as e:
+                        endpoint_scheduler.record_failure(
+                            rpc_url, time.monotonic() - start_time, rate_limited
+                        )
+                        tried_rpcs[rpc_url] = e
+
+                await asyncio.sleep(backoff)
+                log_error(
+                    self.bridge,
+                    (
+                        f"Failed to make RPC batch request to {blockchain_name}, "
+                        f"{len(pending)} calls pending (e.g., {calls[min(pending)]}). "
+                        f"Tried RPCs: {tried_rpcs}. Retrying with backoff {backoff} seconds."
+                    ),
+                )
+                backoff = (backoff * 2) if backoff < 30 else 30
+
+        except Exception as e:
+            raise CustomException(
+                self.CLASS_NAME,
+                func_name,
+                f"Failed to make RPC batch request to {blockchain_name}. Error: {e}",
+            ) from e
+
     @staticmethod
-    def plain_request(rpc, method, params):
+    def plain_request(rpc, method, params, timeout=None):
         func_name = "plain_request"
-        response = requests.post(
+        response = http_session_pool.post(
             rpc,
             headers={"Content-Type": "application/json", "Accept": "application/json"},
             json={"id": 1, "jsonrpc": "2.0", "method": method, "params": params},
+            timeout=timeout,
         )
 
         if response.status_code != 200:
@@ -1,10 +1,10 @@
-import json
-
-import requests
+from typing import AsyncIterator, Iterator
 
 from config.constants import (
     RPCS_CONFIG_FILE,
 )
+from rpcs.http_session_pool import http_session_pool
+from rpcs.request_limiter import request_limiter
 from rpcs.rpc_client import RPCClient
 from utils.utils import (
     CliColor,
@@ -22,13 +22,18 @@ class SolanaRPCClient(RPCClient):
         super().__init__(bridge, config_file)
         self.SOLANA_DECODER_URL = load_solana_decoder_url()
 
-    def get_all_signatures_for_address(
+    def iter_signatures_for_address(
         self,
         account_address: str,
         start_signature: str,
         end_signature: str,
-    ) -> list:
-        all_signatures = []
+    ) -> Iterator[list]:
+        """
+        Pages through the signatures of the account between the start and end signatures,
+        yielding the signatures of each page (from the newest to the oldest) as soon as it is
+        fetched, such that they can be processed while the next pages are requested.
+        """
+        num_signatures = 0
         lastSignature = end_signature  # the endpoint works by fetching in reverse order
 
         while True:
@@ -39,25 +44,25 @@ class SolanaRPCClient(RPCClient):
                 ]
             )
 
-            all_signatures.extend(fetchedTransactions)
+            num_signatures += len(fetchedTransactions)
 
             log_to_cli(
                 build_log_message_solana(
                     start_signature,
                     end_signature,
                     self.bridge,
-                    f"Fetched {len(all_signatures)} signatures for {account_address}...",
+                    f"Fetched {num_signatures} signatures for {account_address}...",
                 ),
                 CliColor.INFO,
             )
 
-            lastSignature = fetchedTransactions[-1]["signature"]
+            if len(fetchedTransactions) > 0:
+                yield [transaction["signature"] for transaction in fetchedTransactions]
 
             if len(fetchedTransactions) != 1000:
                 break
 
-        with open("fetched_signatures.json", "a") as f:
-            f.write(json.dumps(all_signatures) + "\n")
+            lastSignature = fetchedTransactions[-1]["signature"]
 
         log_to_cli(
             build_log_message_solana(
@@ -66,14 +71,12 @@ class SolanaRPCClient(RPCClient):
                 self.bridge,
                 (
                     f"Retried all signatures for {account_address}..."
-                    f"({len(all_signatures)} signatures fetched)",
+                    f"({num_signatures} signatures fetched)",
                 ),
             ),
             CliColor.SUCCESS,
         )
 
-        return all_signatures
-
     def req_get_signatures_for_address(
         self,
         params: list,
@@ -85,6 +88,54 @@ class SolanaRPCClient(RPCClient):
 
         return response["result"] if response else []
 
+    async def iter_signatures_for_address_async(
+        self,
+        account_address: str,
+        start_signature: str,
+        end_signature: str,
+    ) -> AsyncIterator[list]:
+        """Asyncio version of `iter_signatures_for_address`."""
+        num_signatures = 0
+        lastSignature = end_signature  # the endpoint works by fetching in reverse order
+
+        while True:
+            fetchedTransactions = await self.req_get_signatures_for_address_async(
+                [
+                    account_address,
+                    {"before": lastSignature, "until": start_signature, "limit": 1000},
+                ]
+            )
+
+            num_signatures += len(fetchedTransactions)
+
+            log_to_cli(
+                build_log_message_solana(
+                    start_signature,
+                    end_signature,
+                    self.bridge,
+                    f"Fetched {num_signatures} signatures for {account_address}...",
+                ),
+                CliColor.INFO,
+            )
+
+            if len(fetchedTransactions) > 0:
+                yield [transaction["signature"] for transaction in fetchedTransactions]
+
+            if len(fetchedTransactions) != 1000:
+                break
+
+            lastSignature = fetchedTransactions[-1]["signature"]
+
+    async def req_get_signatures_for_address_async(
+        self,
+        params: list,
+    ) -> list:
+        method = "getSignaturesForAddress"
+
+        response = await self.make_request_async("solana", method, params)
+
+        return response["result"] if response else []
+
     def process_transaction(self, blockchain: str, tx_signature: str) -> dict:
         import concurrent.futures
 
@@ -102,20 +153,44 @@ class SolanaRPCClient(RPCClient):
 
         rpc = self.get_next_rpc("solana")
 
-        response = requests.post(
+        with request_limiter.limit():
+            response = http_session_pool.post(
+                f"{self.SOLANA_DECODER_URL}/parseTransactionByHash",
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept": "application/json",
+                },
+                json={"rpcUrl": rpc, "signature": tx_signature},
+            )
+
+        if response.status_code != 200:
+            raise CustomException(
+                self.CLASS_NAME,
+                func_name,
+                f"RPC request failed with status code {response.status_code}",
+            )
+
+        return response.json()
+
+    async def parseTransactionByHash_async(self, tx_signature: str) -> dict:
+        func_name = "parseTransactionByHash_async"
+
+        rpc = self.get_next_rpc("solana")
+
+        status, body = await self.post_async(
             f"{self.SOLANA_DECODER_URL}/parseTransactionByHash",
-            headers={
+            {"rpcUrl": rpc, "signature": tx_signature},
+            {
                 "Content-Type": "application/json",
                 "Accept": "application/json",
             },
-            json={"rpcUrl": rpc, "signature": tx_signature},
         )
 
-        if response.status_code != 200:
+        if status != 200:
             raise CustomException(
                 self.CLASS_NAME,
                 func_name,
-                f"RPC request failed with status code {response.status_code}",
+                f"RPC request failed with status code {status}",
             )
 
-        return response.json()
+        return body
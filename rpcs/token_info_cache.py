@@ -0,0 +1,154 @@
+import os
+import sqlite3
+import threading
+import time
+from datetime import date
+
+from config.constants import TOKEN_INFO_CACHE_FILE, TOKEN_INFO_NEGATIVE_TTL
+
+
+class TokenInfoCache:
+    """
+    Thread-safe cache of the token metadata (keyed by (blockchain, token address)) and daily
+    token prices (keyed by (symbol, name, day)) fetched from Alchemy, backed by a local SQLite
+    file shared across runs and bridges. Tokens and days Alchemy has no data for are cached as
+    misses (a None value), which expire after `negative_ttl` seconds, such that they are tried
+    again later (e.g., the price of a day that was not over yet).
+
+    Attributes:
+        db_file (str): Path of the SQLite file, or None to keep the cache in memory only.
+        negative_ttl (float): Number of seconds misses are valid for.
+    """
+
+    def __init__(
+        self,
+        db_file: str = TOKEN_INFO_CACHE_FILE,
+        negative_ttl: float = TOKEN_INFO_NEGATIVE_TTL,
+    ):
+        self.db_file = db_file
+        self.negative_ttl = negative_ttl
+        self.lock = threading.Lock()
+        self.connection = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        # the connection is only opened on first use, and always accessed under the lock
+        if self.connection is None:
+            if self.db_file and os.path.dirname(self.db_file):
+                os.makedirs(os.path.dirname(self.db_file), exist_ok=True)
+
+            self.connection = sqlite3.connect(self.db_file or ":memory:", check_same_thread=False)
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS token_metadata ("
+                "blockchain TEXT NOT NULL, "
+                "address TEXT NOT NULL, "
+                "symbol TEXT, "
+                "name TEXT, "
+                "decimals INTEGER, "
+                "found INTEGER NOT NULL, "
+                "fetched_at REAL NOT NULL, "
+                "PRIMARY KEY (blockchain, address))"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS token_prices ("
+                "symbol TEXT NOT NULL, "
+                "name TEXT NOT NULL, "
+                "day TEXT NOT NULL, "
+                "price_usd REAL, "
+                "fetched_at REAL NOT NULL, "
+                "PRIMARY KEY (symbol, name, day))"
+            )
+            self.connection.commit()
+
+        return self.connection
+
+    def get_metadata(self, blockchain: str, address: str):
+        """
+        Returns whether the metadata of a token is cached and, if so, the metadata (a dict with
+        its symbol, name and decimals, or None if Alchemy has no metadata for the token).
+        """
+        with self.lock:
+            row = (
+                self._get_connection()
+                .execute(
+                    "SELECT symbol, name, decimals, found FROM token_metadata "
+                    "WHERE blockchain = ? AND address = ? AND (found = 1 OR fetched_at > ?)",
+                    [blockchain, address, time.time() - self.negative_ttl],
+                )
+                .fetchone()
+            )
+
+        if row is None:
+            return False, None
+
+        symbol, name, decimals, found = row
+        return True, {"symbol": symbol, "name": name, "decimals": decimals} if found else None
+
+    def put_metadata(self, blockchain: str, address: str, metadata: dict = None) -> None:
+        """Stores the metadata of a token, or a miss if `metadata` is None."""
+        metadata = metadata or {}
+
+        with self.lock:
+            connection = self._get_connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO token_metadata "
+                "(blockchain, address, symbol, name, decimals, found, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    blockchain,
+                    address,
+                    metadata.get("symbol"),
+                    metadata.get("name"),
+                    metadata.get("decimals"),
+                    1 if metadata else 0,
+                    time.time(),
+                ],
+            )
+            connection.commit()
+
+    def get_prices(self, symbol: str, name: str, start_day: date, end_day: date) -> dict:
+        """
+        Returns the cached prices of a token between two days (inclusive), keyed by day. Days
+        cached as misses map to None, and days not cached (or whose miss expired) are left out.
+        """
+        with self.lock:
+            rows = (
+                self._get_connection()
+                .execute(
+                    "SELECT day, price_usd FROM token_prices "
+                    "WHERE symbol = ? AND name = ? AND day >= ? AND day <= ? "
+                    "AND (price_usd IS NOT NULL OR fetched_at > ?)",
+                    [
+                        symbol,
+                        name,
+                        start_day.isoformat(),
+                        end_day.isoformat(),
+                        time.time() - self.negative_ttl,
+                    ],
+                )
+                .fetchall()
+            )
+
+        return {date.fromisoformat(day): price_usd for day, price_usd in rows}
+
+    def put_prices(self, symbol: str, name: str, prices: dict) -> None:
+        """Stores the prices of a token, keyed by day, where None caches a miss for the day."""
+        if not prices:
+            return
+
+        now = time.time()
+
+        with self.lock:
+            connection = self._get_connection()
+            connection.executemany(
+                "INSERT OR REPLACE INTO token_prices (symbol, name, day, price_usd, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (symbol, name, day.isoformat(), price_usd, now)
+                    for day, price_usd in prices.items()
+                ],
+            )
+            connection.commit()
+
+
+# we keep a single cache for the whole process, such that it is shared by all generators
+token_info_cache = TokenInfoCache()
@@ -0,0 +1,40 @@
+from extractor.block_range_planner import BlockRangePlanner
+
+CONTRACTS = ["0xAbC", "0xdef"]
+
+
+def test_range_is_halved_on_result_limit_and_grown_when_sparse():
+    planner = BlockRangePlanner(sizes_file=None, initial_size=1000, max_size=4000)
+
+    assert planner.get_range_size("base", CONTRACTS) == 1000
+
+    # a dense range is rejected by the RPC
+    assert planner.on_result_limit("base", CONTRACTS, 1000) == 500
+    assert planner.on_result_limit("base", CONTRACTS, 500) == 250
+
+    # a dense range is accepted, the size is kept
+    assert planner.on_success("base", CONTRACTS, 250, 5000) == 250
+
+    # sparse ranges grow the size up to the maximum
+    assert planner.on_success("base", CONTRACTS, 250, 10) == 500
+    # a range cut short by the end of the segment does not grow the size
+    assert planner.on_success("base", CONTRACTS, 100, 10) == 500
+    for _ in range(5):
+        planner.on_success("base", CONTRACTS, planner.get_range_size("base", CONTRACTS), 0)
+    assert planner.get_range_size("base", CONTRACTS) == 4000
+
+    # sizes are kept per blockchain and contracts
+    assert planner.get_range_size("arbitrum", CONTRACTS) == 1000
+    assert planner.get_range_size("base", CONTRACTS[:1]) == 1000
+
+
+def test_sizes_are_persisted(tmp_path):
+    sizes_file = str(tmp_path / "cache" / "block_range_sizes.json")
+
+    planner = BlockRangePlanner(sizes_file=sizes_file)
+    planner.on_result_limit("ethereum", CONTRACTS, 1000)
+    planner.save()
+
+    # contracts are matched regardless of their order and case
+    planner = BlockRangePlanner(sizes_file=sizes_file)
+    assert planner.get_range_size("ethereum", ["0xDEF", "0xabc"]) == 500
@@ -0,0 +1,159 @@
+from sqlalchemy.dialects import postgresql
+
+from extractor.base_handler import BaseHandler
+from repository.base import BaseRepository
+from repository.cctp.models import CCTPDepositForBurn
+
+
+class MockRepository:
+    def __init__(self, fail_on=None, stored=()):
+        self.fail_on = fail_on
+        self.stored = list(stored)
+        self.created = []
+        self.upserts = []
+
+    def create(self, row):
+        self.created.append(row)
+
+    def upsert_all(self, rows):
+        if self.fail_on in rows:
+            raise Exception("invalid row")
+        self.upserts.append(rows)
+
+        # the keys of the rows that were not stored yet
+        new_keys = [(row["id"],) for row in rows if row not in self.stored]
+        self.stored += rows
+        return new_keys
+
+
+class MockHandler(BaseHandler):
+    def __init__(self):
+        self.repo = MockRepository()
+
+    def handle_events(self, blockchain, start_block, end_block, contract, topics, events):
+        for event in events:
+            self.stage(self.repo, event)
+        return events
+
+    def get_bridge_contracts_and_topics(self, bridge, blockchain):
+        return []
+
+    def bind_db_to_repos(self):
+        pass
+
+    def does_transaction_exist_by_hash(self, transaction_hash):
+        return False
+
+
+def test_rows_are_written_in_bulk_on_exit():
+    handler = MockHandler()
+
+    with handler.bulk_writes():
+        handler.handle_events("ethereum", 0, 1, "0xa", [], [{"id": 1}, {"id": 2}, {"id": 1}])
+        assert handler.repo.upserts == []
+
+    # a single write per repository, without the duplicated row
+    assert handler.repo.upserts == [[{"id": 1}, {"id": 2}]]
+    assert handler.repo.created == []
+
+    # outside bulk writes, rows are created right away
+    handler.handle_events("ethereum", 0, 1, "0xa", [], [{"id": 3}])
+    assert handler.repo.created == [{"id": 3}]
+
+
+def test_duplicated_rows_are_found_by_value():
+    handler = MockHandler()
+
+    with handler.bulk_writes():
+        handler.handle_events(
+            "ethereum",
+            0,
+            1,
+            "0xa",
+            [],
+            # rows with unhashable values, and the same values in another order
+            [{"id": 1, "tokens": ["0xt"]}, {"tokens": ["0xt"], "id": 1}, {"id": 1, "tokens": []}],
+        )
+
+    assert handler.repo.upserts == [[{"id": 1, "tokens": ["0xt"]}, {"id": 1, "tokens": []}]]
+
+
+def test_rows_already_stored_are_not_new():
+    handler = MockHandler()
+    handler.repo = MockRepository(stored=[{"id": 1}])
+
+    # every event is handled (and its transaction checked), without querying its row first
+    with handler.staging() as rows:
+        events = handler.handle_events("ethereum", 0, 1, "0xa", [], [{"id": 1}, {"id": 2}])
+
+    assert events == [{"id": 1}, {"id": 2}]
+    assert handler.write_staged_rows(rows) == 1
+
+
+def test_failed_batch_is_written_row_by_row():
+    handler = MockHandler()
+    handler.repo = MockRepository(fail_on={"id": 2})
+
+    try:
+        with handler.bulk_writes():
+            handler.handle_events("ethereum", 0, 1, "0xa", [], [{"id": 1}, {"id": 2}, {"id": 3}])
+        raise AssertionError("the invalid row should be reported")
+    except Exception as e:
+        assert "Error writing 1 rows" in str(e)
+
+    assert handler.repo.upserts == [[{"id": 1}], [{"id": 3}]]
+
+
+class MockResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+
+class MockSession:
+    def __init__(self):
+        self.executed = []
+
+    def execute(self, statement, rows):
+        self.executed.append((statement, rows))
+        # the row with nonce 1 was already stored
+        return MockResult(
+            [(row["nonce"], row["dst_blockchain"], row["blockchain"]) for row in rows[:1]]
+        )
+
+    def commit(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def test_upsert_all_inserts_on_conflict_do_nothing():
+    session = MockSession()
+    repo = BaseRepository(CCTPDepositForBurn, lambda: session)
+
+    new_keys = repo.upsert_all(
+        [
+            {
+                "blockchain": "ethereum",
+                "transaction_hash": f"0x{i}",
+                "nonce": i,
+                "depositor": "0xd",
+                "burn_token": "0xt",
+                "recipient": "0xr",
+                "dst_blockchain": "base",
+                "amount": 10,
+            }
+            for i in range(2)
+        ]
+    )
+
+    [(statement, rows)] = session.executed
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT DO NOTHING" in sql
+    # the natural key of the rows inserted, rather than their generated id
+    assert "RETURNING cctp_deposit_for_burn.nonce" in sql
+    assert [row["nonce"] for row in rows] == [0, 1]
+    assert new_keys == [(0, "base", "ethereum")]
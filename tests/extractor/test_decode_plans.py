@@ -0,0 +1,164 @@
+import pickle
+
+from eth_abi import encode
+from eth_utils import to_checksum_address
+
+from config.constants import Bridge
+from extractor.decode_pool import DecodePool
+from extractor.decoder import BridgeDecoder
+from utils.utils import CustomException
+
+CONTRACT = "0xbd3fa81b58ba92a82136038b25adec7066af3155"
+
+DEPOSIT_FOR_BURN = "0x2fa9ca894982930190727e75500a97d8dc500233a5065e0f3126c48fbe0343c0"
+
+
+class MockCustomDecoder:
+    def __init__(self):
+        self.logs = []
+
+    def decode_event(self, contract, log):
+        self.logs.append(log)
+        return {"topic": log["topics"][0], "data": b"\x01"}
+
+
+def create_deposit_for_burn_log(nonce):
+    topics = [
+        encode(["uint64"], [nonce]),
+        encode(["address"], ["0x" + "11" * 20]),
+        encode(["address"], ["0x" + "22" * 20]),
+    ]
+    data = encode(
+        ["uint256", "bytes32", "uint32", "bytes32", "bytes32"],
+        [1000, b"\x33" * 32, 3, b"\x44" * 32, b"\x00" * 32],
+    )
+
+    return {
+        "topics": [DEPOSIT_FOR_BURN] + ["0x" + topic.hex() for topic in topics],
+        "data": "0x" + data.hex(),
+        "transactionHash": "0xaa",
+        "blockNumber": "0x1",
+    }
+
+
+def test_logs_are_decoded_with_cached_plans(monkeypatch):
+    decoder = BridgeDecoder(Bridge.CCTP, "http://localhost")
+    loads = []
+    monkeypatch.setattr(
+        decoder, "load_bridge_decoder", lambda bridge: loads.append(bridge) or MockCustomDecoder()
+    )
+
+    for nonce in range(3):
+        event = decoder.decode(CONTRACT, "ethereum", create_deposit_for_burn_log(nonce))
+        assert event["nonce"] == nonce
+
+    assert event["amount"] == 1000
+    assert event["depositor"] == "0x" + "22" * 20
+    assert event["mintRecipient"] == "33" * 32
+    assert event["destinationDomain"] == 3
+
+    # a single plan for the event, which uses the generic decoder
+    assert len(decoder.decode_plans) == 1
+    assert not list(decoder.decode_plans.values())[0].custom
+    assert loads == []
+
+    # events missing from the ABI are handed to the custom decoder, which is only loaded once
+    unknown_log = {"topics": ["0x" + "ff" * 32], "data": "0x"}
+    for _ in range(2):
+        assert decoder.decode(CONTRACT, "ethereum", unknown_log)["data"] == "01"
+
+    assert len(decoder.decode_plans) == 2
+    assert loads == [Bridge.CCTP]
+    assert len(decoder.custom_decoder.logs) == 2
+
+
+def test_logs_are_decoded_in_worker_processes():
+    decoder = BridgeDecoder(Bridge.CCTP, "http://localhost")
+    logs = [create_deposit_for_burn_log(nonce) for nonce in range(5)]
+    logs_by_contract = {CONTRACT: logs, "0xcontract-without-logs": []}
+
+    pool = DecodePool(num_processes=1, batch_size=2)
+    try:
+        decoded = list(pool.decode(decoder, "ethereum", logs_by_contract))
+    finally:
+        pool.shutdown()
+
+    # the same logs as decoded in process, without the contracts that have no logs
+    in_process = list(DecodePool(num_processes=0).decode(decoder, "ethereum", logs_by_contract))
+    assert decoded == in_process
+    assert [contract for contract, _ in decoded] == [CONTRACT]
+    assert [log["nonce"] for log in decoded[0][1]] == [0, 1, 2, 3, 4]
+    assert decoded[0][1][0]["topic"] == DEPOSIT_FOR_BURN
+
+
+def test_custom_exceptions_can_be_pickled():
+    exception = pickle.loads(pickle.dumps(CustomException("Decoder", "decode", "invalid log")))
+
+    assert str(exception) == "(Class: Decoder) decode: invalid log"
+
+
+FORWARDER = "0x337685fdaB40D39bd02028545a4FfA7D287cC3E2"
+
+FORWARDED_ERC20 = "0xbf150db6b4a14b084f7346b4bc300f552ce867afe55be27bce2d6b37e3307cda"
+
+
+def create_forwarded_erc20_log(amount, protocol_data):
+    data = encode(
+        ["address", "uint256", "address", "bytes"],
+        ["0x" + "ab" * 20, amount, "0x" + "cd" * 20, protocol_data],
+    )
+
+    return {
+        "topics": [FORWARDED_ERC20],
+        "data": "0x" + data.hex(),
+        "transactionHash": f"0x{amount:02x}",
+        "blockNumber": "0x1",
+    }
+
+
+def test_batches_are_decoded_as_columns(monkeypatch):
+    decoder = BridgeDecoder(Bridge.MAYAN, "http://localhost")
+    monkeypatch.setattr(decoder, "load_bridge_decoder", lambda bridge: MockCustomDecoder())
+
+    logs = [create_forwarded_erc20_log(amount, bytes([amount]) * amount) for amount in range(4)]
+    # a token with non-empty padding bytes, which fails the generic decoding
+    logs[2]["data"] = "0x" + "ff" * 12 + logs[2]["data"][26:]
+
+    columns = decoder.decode_batch(FORWARDER, "ethereum", logs)[FORWARDED_ERC20]
+
+    # logs decoded at once first, then the one handed to the custom decoder
+    assert columns["token"] == [to_checksum_address("0x" + "ab" * 20)] * 3 + [None]
+    assert columns["amount"] == [0, 1, 3, None]
+    assert columns["mayanProtocol"] == [to_checksum_address("0x" + "cd" * 20)] * 3 + [None]
+    assert columns["protocolData"] == ["", "01", "03" * 3, None]
+    assert columns["data"] == [None, None, None, "01"]
+    assert columns["transaction_hash"] == ["0x00", "0x01", "0x03", "0x02"]
+    assert columns["topic"] == [FORWARDED_ERC20] * 4
+
+    # the same values as decoding the logs one by one
+    for index, log in enumerate(logs[:2] + logs[3:]):
+        decoded_log = decoder.decode(FORWARDER, "ethereum", log)
+        assert {name: values[index] for name, values in columns.items()} == {
+            **decoded_log,
+            "data": None,
+            "transaction_hash": log["transactionHash"],
+            "block_number": "0x1",
+            "contract_address": FORWARDER,
+            "topic": FORWARDED_ERC20,
+        }
+
+
+def test_malformed_logs_are_handed_to_the_custom_decoder(monkeypatch):
+    decoder = BridgeDecoder(Bridge.MAYAN, "http://localhost")
+    monkeypatch.setattr(decoder, "load_bridge_decoder", lambda bridge: MockCustomDecoder())
+
+    logs = [create_forwarded_erc20_log(amount, b"") for amount in range(2)]
+    # data of odd length, which is not valid hex
+    logs[1]["data"] += "0"
+
+    assert decoder.decode(FORWARDER, "ethereum", logs[1])["data"] == "01"
+
+    columns = decoder.decode_batch(FORWARDER, "ethereum", logs)[FORWARDED_ERC20]
+    assert columns["amount"] == [0, None]
+    assert columns["data"] == [None, "01"]
+    assert columns["transaction_hash"] == ["0x00", "0x01"]
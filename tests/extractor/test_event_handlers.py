@@ -0,0 +1,78 @@
+import pytest
+
+from config.constants import Bridge
+from extractor.base_handler import BaseHandler, EventHandler
+from utils.utils import CustomException, load_module
+
+
+def load_handler(bridge_name):
+    module = load_module(f"extractor.{bridge_name}.handler")
+    handler_class = getattr(module, f"{bridge_name.capitalize()}Handler")
+
+    return handler_class(None, [])
+
+
+@pytest.mark.parametrize("bridge_name", [bridge.value for bridge in Bridge])
+def test_configured_topics_have_handlers(bridge_name):
+    handler = load_handler(bridge_name)
+    config = load_module(f"extractor.{bridge_name}.constants").BRIDGE_CONFIG
+
+    for blockchain in config["blockchains"]:
+        # raises if any topic configured for the blockchain has no handler
+        handler.get_bridge_contracts_and_topics(bridge=bridge_name, blockchain=blockchain)
+
+    for topic, event_handler in handler.EVENT_HANDLERS.items():
+        assert callable(getattr(handler, event_handler.method)), topic
+        assert handler.get_event_model(topic).__tablename__.startswith(bridge_name), topic
+
+
+class DispatchHandler(BaseHandler):
+    EVENT_HANDLERS = {
+        "0x1": EventHandler("handle_first", "repo"),
+        "0x2": EventHandler("handle_second", "repo"),
+    }
+
+    def __init__(self):
+        self.bridge = "mock"
+
+    def handle_first(self, blockchain, event):
+        return event
+
+    def handle_second(self, blockchain, event):
+        if event["id"] == 3:
+            raise CustomException("DispatchHandler", "handle_second", "invalid event")
+        return None
+
+    def get_bridge_contracts_and_topics(self, bridge, blockchain):
+        pairs = [{"contracts": ["0xa"], "topics": ["0x1", "0x3"]}]
+        return super().get_bridge_contracts_and_topics(
+            config={"blockchains": {"ethereum": pairs}}, bridge=bridge, blockchain=blockchain
+        )
+
+    def bind_db_to_repos(self):
+        pass
+
+    def does_transaction_exist_by_hash(self, transaction_hash):
+        return False
+
+
+def test_topics_without_handler_are_rejected():
+    with pytest.raises(ValueError, match="0x3"):
+        DispatchHandler().get_bridge_contracts_and_topics(bridge="mock", blockchain="ethereum")
+
+
+def test_events_are_dispatched_by_topic():
+    handler = DispatchHandler()
+    events = [
+        {"topic": "0x1", "id": 1},
+        {"topic": "0x2", "id": 2},
+        {"topic": "0x2", "id": 3},
+        {"topic": "0x1", "id": 4},
+        {"topic": "0x3", "id": 5},
+    ]
+
+    # events of unknown topics, not included by their handler or failing are left out
+    assert handler.handle_events("ethereum", 0, 1, "0xa", ["0x1", "0x2"], events) == [
+        {"topic": "0x1", "id": 1},
+        {"topic": "0x1", "id": 4},
+    ]
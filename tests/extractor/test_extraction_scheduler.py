@@ -0,0 +1,46 @@
+import threading
+
+from config.constants import Bridge
+from extractor.extraction_scheduler import ExtractionScheduler
+
+
+class MockExtractor:
+    def __init__(self):
+        self.post_processed = 0
+
+    def post_processing(self):
+        self.post_processed += 1
+
+
+def test_blockchains_are_extracted_concurrently():
+    scheduler = ExtractionScheduler(Bridge.CCTP)
+    # every job waits for all others to start, which only succeeds if they run concurrently
+    barrier = threading.Barrier(3, timeout=5)
+    extractors = {blockchain: MockExtractor() for blockchain in ["ethereum", "base", "arbitrum"]}
+
+    def job(blockchain):
+        barrier.wait()
+        return extractors[blockchain]
+
+    for blockchain in extractors:
+        scheduler.add_job(blockchain, lambda blockchain=blockchain: job(blockchain))
+
+    scheduler.run()
+
+    assert [extractor.post_processed for extractor in extractors.values()] == [0, 0, 1]
+
+
+def test_post_processing_runs_once_when_a_blockchain_fails():
+    scheduler = ExtractionScheduler(Bridge.CCTP)
+    extractor = MockExtractor()
+
+    def failing_job():
+        raise Exception("RPC unavailable")
+
+    scheduler.add_job("ethereum", lambda: extractor)
+    scheduler.add_job("base", failing_job)
+    scheduler.add_job("arbitrum", lambda: None)
+
+    scheduler.run()
+
+    assert extractor.post_processed == 1
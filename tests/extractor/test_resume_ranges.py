@@ -0,0 +1,243 @@
+import contextlib
+import threading
+from types import SimpleNamespace
+
+from config.constants import Bridge
+from extractor import evm_extractor
+from extractor.base_handler import BaseHandler
+from extractor.evm_extractor import EvmExtractor
+from extractor.extractor import Extractor
+from extractor.solana_extractor import SolanaExtractor
+from extractor.transaction_filter import TransactionFilter
+from repository.base import current_session
+from utils.utils import CustomException
+
+
+class MockCheckpointRepository:
+    def __init__(self, block_ranges=None, signature_ranges=None):
+        self.block_ranges = block_ranges or {}
+        self.signature_ranges = signature_ranges or []
+
+    def get_completed_block_ranges(self, bridge, blockchain, contract):
+        return self.block_ranges.get(contract, [])
+
+    def get_completed_signature_ranges(self, bridge, program_id):
+        return self.signature_ranges
+
+
+def create_extractor(extractor_class, checkpoint_repo, resume=True):
+    # skip the constructor, which connects to the RPCs and loads the bridge handler
+    extractor = extractor_class.__new__(extractor_class)
+    extractor.bridge = Bridge.CCTP
+    extractor.blockchain = "ethereum"
+    extractor.resume = resume
+    extractor.checkpoint_repo = checkpoint_repo
+    return extractor
+
+
+def test_get_missing_ranges():
+    assert Extractor.get_missing_ranges(0, 100, []) == [(0, 100)]
+    assert Extractor.get_missing_ranges(0, 100, [(40, 60), (-10, 9), (55, 70), (95, 200)]) == [
+        (10, 39),
+        (71, 94),
+    ]
+    assert Extractor.get_missing_ranges(0, 100, [(0, 50), (51, 100)]) == []
+
+
+def test_pending_ranges_cover_every_contract():
+    checkpoint_repo = MockCheckpointRepository({"0xa": [(0, 499)], "0xb": [(0, 299), (600, 999)]})
+
+    extractor = create_extractor(EvmExtractor, checkpoint_repo)
+    assert extractor.get_pending_ranges(["0xa", "0xb"], 0, 999) == [(300, 999)]
+
+    extractor = create_extractor(EvmExtractor, checkpoint_repo, resume=False)
+    assert extractor.get_pending_ranges(["0xa", "0xb"], 0, 999) == [(0, 999)]
+
+    # without resume, ranges are divided as before: consecutive segments share their boundary
+    assert extractor.divide_pending_ranges([(0, 999)], 4) == [
+        (0, 250),
+        (250, 500),
+        (500, 750),
+        (750, 999),
+    ]
+    assert extractor.divide_pending_ranges([(10, 10)], 4) == [(10, 10)]
+
+
+def test_signature_ranges_skip_checkpointed_ranges():
+    checkpoint_repo = MockCheckpointRepository(signature_ranges=[("sig2", "sig4"), ("sig9", "x")])
+
+    extractor = create_extractor(SolanaExtractor, checkpoint_repo)
+    range_builder = extractor.create_signature_range_builder("program", 3)
+
+    # signatures are paged from the newest to the oldest, and ranges are cut at completed ones
+    assert range_builder.add([f"sig{i}" for i in range(5)]) == [["sig0", "sig1"]]
+    assert range_builder.add([f"sig{i}" for i in range(5, 10)]) == [
+        ["sig5", "sig6", "sig7"],
+        ["sig8"],
+    ]
+    # the range starting with sig9 ends past the oldest signature, so sig9 is completed
+    assert range_builder.flush() == []
+    assert range_builder.num_signatures == 10
+
+    extractor = create_extractor(SolanaExtractor, checkpoint_repo, resume=False)
+    range_builder = extractor.create_signature_range_builder("program", 3)
+    assert range_builder.add([f"sig{i}" for i in range(5)]) == [["sig0", "sig1", "sig2"]]
+    assert range_builder.flush() == [["sig3", "sig4"]]
+
+
+class MockSolanaRPCClient:
+    def __init__(self, range_processed):
+        self.range_processed = range_processed
+
+    def iter_signatures_for_address(self, account_address, start_signature, end_signature):
+        yield [f"sig{i}" for i in range(150)]
+        # the next page is only fetched once a range of the first one was processed
+        assert self.range_processed.wait(timeout=5)
+        yield [f"sig{i}" for i in range(150, 250)]
+
+
+def test_signatures_are_processed_while_paging(monkeypatch):
+    range_processed = threading.Event()
+    processed = []
+
+    extractor = create_extractor(SolanaExtractor, MockCheckpointRepository(), resume=False)
+    extractor.rpc_client = MockSolanaRPCClient(range_processed)
+    extractor.solana_program_ids = ["program"]
+
+    def work(signatures):
+        processed.append(signatures)
+        range_processed.set()
+
+    monkeypatch.setattr(extractor, "load_transaction_filter", lambda: None)
+    monkeypatch.setattr(extractor, "unit_of_work", contextlib.nullcontext)
+    monkeypatch.setattr(extractor, "checkpoint_signature_range", lambda *args: None)
+    monkeypatch.setattr(extractor, "work", work)
+
+    extractor.extract_data({"program": {"start_signature": "a", "end_signature": "b"}})
+
+    assert sorted(len(signatures) for signatures in processed) == [50, 100, 100]
+    assert sorted(signature for signatures in processed for signature in signatures) == sorted(
+        f"sig{i}" for i in range(250)
+    )
+
+
+def test_no_session_is_held_while_fetching_transactions():
+    extractor = create_extractor(EvmExtractor, MockCheckpointRepository())
+    sessions = {}
+
+    def record(step, result=None):
+        def call(*args):
+            sessions[step] = current_session.get()
+            return result
+
+        return call
+
+    extractor.handle_logs = record("handle_logs", ({"0xtx": 1}, {}))
+    extractor.store_range = record("store_range")
+    extractor.rpc_client = SimpleNamespace(process_transactions=record("rpc", {}))
+
+    extractor.process_logs(["0xcontract"], ["0xtopic"], 0, 10, [{}])
+
+    # the events and transactions of the range are only written once they are all fetched
+    assert sessions["handle_logs"] is None
+    assert sessions["rpc"] is None
+    assert sessions["store_range"] is not None
+
+
+class MockEventRepository:
+    def __init__(self):
+        self.stored = []
+
+    def upsert_all(self, rows):
+        new_rows = [row for row in rows if row not in self.stored]
+        self.stored += new_rows
+        return [(row["log_index"],) for row in new_rows]
+
+
+class MockHandler(BaseHandler):
+    def __init__(self):
+        self.event_repo = MockEventRepository()
+        self.transactions = []
+
+    def handle_events(self, blockchain, start_block, end_block, contract, topics, events):
+        for event in events:
+            self.stage(self.event_repo, {"log_index": event["logIndex"]})
+        return events
+
+    def create_transaction_object(self, blockchain, tx, timestamp):
+        return {"transaction_hash": tx["transactionHash"]}
+
+    def handle_transactions(self, transactions):
+        self.transactions += transactions
+
+    def does_transaction_exist_by_hash(self, transaction_hash):
+        return any(tx["transaction_hash"] == transaction_hash for tx in self.transactions)
+
+    def get_bridge_contracts_and_topics(self, bridge, blockchain):
+        return []
+
+    def bind_db_to_repos(self):
+        pass
+
+
+class MockEvmRPCClient:
+    def __init__(self):
+        self.requests = []
+
+    def process_transactions(self, blockchain, pending_txs):
+        self.requests.append(pending_txs)
+
+        if len(self.requests) == 1:
+            raise CustomException("MockEvmRPCClient", "process_transactions", "timeout")
+
+        return {
+            tx_hash: ({"transactionHash": tx_hash}, {"timestamp": "0x1"}) for tx_hash in pending_txs
+        }
+
+
+def test_transactions_failing_once_are_fetched_again(monkeypatch):
+    extractor = create_extractor(EvmExtractor, MockCheckpointRepository())
+    extractor.handler = MockHandler()
+    extractor.rpc_client = MockEvmRPCClient()
+    extractor.transaction_filter = TransactionFilter()
+    extractor.decoder = None
+    extractor.group_contracts_and_topics([{"contracts": ["0xa"], "topics": ["0xtopic"]}])
+
+    monkeypatch.setattr(extractor, "unit_of_work", contextlib.nullcontext)
+    monkeypatch.setattr(
+        evm_extractor,
+        "decode_pool",
+        SimpleNamespace(
+            decode=lambda decoder, blockchain, logs_by_contract: logs_by_contract.items()
+        ),
+    )
+    monkeypatch.setattr(evm_extractor, "log_to_cli", lambda *args: None)
+    monkeypatch.setattr(
+        extractor, "log_range_error", lambda request_desc: errors.append(request_desc)
+    )
+
+    logs = [
+        {
+            "address": "0xa",
+            "topics": ["0xtopic"],
+            "logIndex": log_index,
+            "transaction_hash": "0xtx",
+            "block_number": 5,
+        }
+        for log_index in range(2)
+    ]
+
+    # the transactions cannot be fetched: the events are stored, but the range is not completed
+    errors = []
+    extractor.process_logs(["0xa"], ["0xtopic"], 0, 10, logs)
+    assert len(errors) == 1
+    assert len(extractor.handler.event_repo.stored) == 2
+    assert extractor.handler.transactions == []
+
+    # when the range is extracted again, the transactions of its stored events are fetched
+    errors = []
+    extractor.process_logs(["0xa"], ["0xtopic"], 0, 10, logs)
+    assert errors == []
+    assert extractor.rpc_client.requests == [{"0xtx": 5}, {"0xtx": 5}]
+    assert extractor.handler.transactions == [{"transaction_hash": "0xtx"}]
+    assert len(extractor.handler.event_repo.stored) == 2
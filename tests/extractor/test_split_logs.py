@@ -0,0 +1,54 @@
+from extractor.evm_extractor import EvmExtractor
+
+DEPOSIT_TOPIC = "0xdeposit"
+FILL_TOPIC = "0xfill"
+
+
+def create_extractor(bridge_blockchain_pairs):
+    # skip the constructor, which connects to the RPCs and loads the bridge handler
+    extractor = EvmExtractor.__new__(EvmExtractor)
+    extractor.group_contracts_and_topics(bridge_blockchain_pairs)
+    return extractor
+
+
+def log(address, topic, log_index):
+    return {"address": address, "topics": [topic], "logIndex": log_index}
+
+
+def test_logs_of_several_contracts_are_split_by_address():
+    extractor = create_extractor(
+        [
+            {"contracts": ["0xAbCd"], "topics": [DEPOSIT_TOPIC]},
+            {"contracts": ["0xEf01", "0x2345"], "topics": [FILL_TOPIC]},
+        ]
+    )
+    logs = [
+        log("0xabcd", DEPOSIT_TOPIC, 0),
+        log("0xEF01", FILL_TOPIC, 1),
+        # a topic not configured for the contract that emitted it
+        log("0xABCD", FILL_TOPIC, 2),
+        log("0xAbCd", DEPOSIT_TOPIC, 3),
+        # a contract of another bridge
+        log("0x9999", DEPOSIT_TOPIC, 4),
+    ]
+
+    logs_by_contract = extractor.split_logs_by_contract(["0xAbCd", "0xEf01", "0x2345"], logs)
+
+    # contracts keep their configured address, and those without logs are kept too
+    assert list(logs_by_contract) == ["0xAbCd", "0xEf01", "0x2345"]
+    assert [log["logIndex"] for log in logs_by_contract["0xAbCd"]] == [0, 3]
+    assert [log["logIndex"] for log in logs_by_contract["0xEf01"]] == [1]
+    assert logs_by_contract["0x2345"] == []
+
+
+def test_logs_of_contracts_not_swept_are_dropped():
+    extractor = create_extractor(
+        [{"contracts": ["0xAbCd", "0xEf01"], "topics": [DEPOSIT_TOPIC, FILL_TOPIC]}]
+    )
+
+    logs_by_contract = extractor.split_logs_by_contract(
+        ["0xEf01"], [log("0xabcd", DEPOSIT_TOPIC, 0), log("0xef01", FILL_TOPIC, 1)]
+    )
+
+    assert list(logs_by_contract) == ["0xEf01"]
+    assert [log["logIndex"] for log in logs_by_contract["0xEf01"]] == [1]
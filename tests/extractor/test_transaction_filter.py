@@ -0,0 +1,37 @@
+from extractor.transaction_filter import BloomFilter, TransactionFilter
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom_filter = BloomFilter(10_000, error_rate=0.01)
+    stored = [f"0x{i:064x}" for i in range(10_000)]
+    for transaction_hash in stored:
+        bloom_filter.add(transaction_hash)
+
+    assert all(transaction_hash in bloom_filter for transaction_hash in stored)
+
+    false_positives = sum(f"0x{i:064x}" in bloom_filter for i in range(10_000, 20_000))
+    assert false_positives < 300
+
+
+def test_db_is_only_asked_on_bloom_filter_hits():
+    lookups = []
+
+    def lookup(transaction_hash):
+        lookups.append(transaction_hash)
+        return transaction_hash == "0xstored"
+
+    transaction_filter = TransactionFilter()
+    transaction_filter.load(1, ["0xstored"])
+
+    assert not transaction_filter.exists("0xnew", lookup)
+    assert lookups == []
+
+    # the hash stored is checked against the DB once, and remembered afterwards
+    assert transaction_filter.exists("0xstored", lookup)
+    assert transaction_filter.exists("0xstored", lookup)
+    assert lookups == ["0xstored"]
+
+    # hashes stored during the run are answered in memory
+    transaction_filter.add(["0xnew"])
+    assert transaction_filter.exists("0xnew", lookup)
+    assert lookups == ["0xstored"]
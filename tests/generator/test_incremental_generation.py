@@ -0,0 +1,158 @@
+from sqlalchemy import literal, select
+from sqlalchemy.dialects import postgresql
+
+from config.constants import Bridge
+from generator.base_generator import BaseGenerator
+from repository.mayan.models import MayanCrossChainTransaction, MayanInitOrder
+
+
+class MockTransactionsRepository:
+    def get_min_timestamp(self):
+        return 1_000
+
+    def get_max_timestamps(self):
+        return {"ethereum": 9_000, "arbitrum": 8_000}
+
+
+class MockCrossChainRepository:
+    def __init__(self):
+        self.emptied = False
+
+    def empty_table(self):
+        self.emptied = True
+
+
+class MockCheckpointRepository:
+    def __init__(self, high_water_marks):
+        self.high_water_marks = {Bridge.CCTP.value: high_water_marks}
+
+    def get_high_water_marks(self, bridge):
+        return dict(self.high_water_marks.get(bridge, {}))
+
+    def set_high_water_marks(self, bridge, high_water_marks):
+        self.high_water_marks[bridge] = high_water_marks
+
+
+class MockGenerator(BaseGenerator):
+    def __init__(self, high_water_marks, fail=False):
+        super().__init__()
+        self.bridge = Bridge.CCTP
+        self.generation_checkpoint_repo = MockCheckpointRepository(high_water_marks)
+        self.fail = fail
+        self.conditions = []
+
+    def bind_db_to_repos(self):
+        self.transactions_repo = MockTransactionsRepository()
+        self.cross_chain_transactions_repo = MockCrossChainRepository()
+
+    def generate_cross_chain_data(self):
+        self.empty_cross_chain_table(self.cross_chain_transactions_repo)
+        self.conditions.append(self.new_events_condition("src_tx", "dst_tx"))
+        self.start_ts = self.get_start_timestamp()
+
+        if not self.fail:
+            self.save_high_water_marks()
+
+    def populate_token_info_tables(self, cctxs, start_ts, end_ts):
+        pass
+
+
+def test_full_generation_rebuilds_tables():
+    generator = MockGenerator({"ethereum": 5_000})
+    generator.generate()
+
+    assert generator.cross_chain_transactions_repo.emptied
+    assert generator.conditions == ["TRUE"]
+    assert generator.start_ts == 1_000 - 86400
+
+    # the marks are those of the transactions when the generation started
+    assert generator.generation_checkpoint_repo.get_high_water_marks("cctp") == {
+        "ethereum": 9_000,
+        "arbitrum": 8_000,
+    }
+
+
+def test_incremental_generation_matches_new_events():
+    generator = MockGenerator({"ethereum": 5_000, "arbitrum": 4_000})
+    generator.generate(since=True)
+
+    assert not generator.cross_chain_transactions_repo.emptied
+    assert generator.conditions == [
+        "(src_tx.timestamp > CASE src_tx.blockchain WHEN 'arbitrum' THEN 4000 "
+        "WHEN 'ethereum' THEN 5000 ELSE -1 END OR "
+        "dst_tx.timestamp > CASE dst_tx.blockchain WHEN 'arbitrum' THEN 4000 "
+        "WHEN 'ethereum' THEN 5000 ELSE -1 END)"
+    ]
+    # prices are only needed from the oldest high-water mark on
+    assert generator.start_ts == 4_000 - 86400
+
+
+def test_incremental_generation_without_previous_generation():
+    generator = MockGenerator({})
+    generator.generate(since=True)
+
+    assert generator.cross_chain_transactions_repo.emptied
+    assert generator.conditions == ["TRUE"]
+
+
+def test_failed_generation_keeps_high_water_marks():
+    generator = MockGenerator({"ethereum": 5_000}, fail=True)
+    generator.generate(since=True)
+
+    assert generator.generation_checkpoint_repo.get_high_water_marks("cctp") == {"ethereum": 5_000}
+
+
+class MockSession:
+    def __init__(self, statements):
+        self.statements = statements
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def execute(self, statement):
+        self.statements.append(statement)
+
+
+class MockMayanCrossChainRepository:
+    model = MayanCrossChainTransaction
+
+    def __init__(self):
+        self.statements = []
+
+    def get_session(self):
+        return MockSession(self.statements)
+
+
+def compile_insert_cctxs(high_water_marks):
+    generator = MockGenerator({})
+    generator.high_water_marks = high_water_marks
+    repo = MockMayanCrossChainRepository()
+
+    query = select(
+        MayanInitOrder.order_hash.label("intent_id"),
+        literal("solana").label("src_blockchain"),
+    )
+    generator.insert_cctxs(repo, query)
+
+    return str(repo.statements[0].compile(dialect=postgresql.dialect()))
+
+
+def test_matches_are_inserted_from_a_select():
+    sql = compile_insert_cctxs(None)
+
+    assert sql.startswith(
+        "INSERT INTO mayan_cross_chain_transactions (intent_id, src_blockchain) SELECT "
+        "mayan_init_order.order_hash AS intent_id"
+    )
+    assert "ON CONFLICT" not in sql
+
+
+def test_incremental_matches_replace_stored_matches():
+    sql = compile_insert_cctxs({"ethereum": 5_000})
+
+    assert sql.endswith(
+        "ON CONFLICT (intent_id) DO UPDATE SET src_blockchain = excluded.src_blockchain"
+    )
@@ -0,0 +1,85 @@
+from datetime import date, datetime
+from types import SimpleNamespace
+
+from generator.common.price_generator import PriceGenerator
+from generator.common.token_info_planner import TokenInfoPlanner
+
+
+class MockTokenMetadataRepository:
+    def __init__(self, stored):
+        self.stored = stored
+        self.writes = []
+
+    def get_all(self):
+        return self.stored
+
+    def create_all(self, rows):
+        self.writes.append(rows)
+
+
+class MockTokenPriceRepository:
+    def __init__(self, coverage):
+        self.coverage = coverage
+        self.writes = []
+
+    def get_price_coverage(self, symbols, start_ts, end_ts):
+        return {key: value for key, value in self.coverage.items() if key[0] in symbols}
+
+    def create_all(self, rows):
+        self.writes.append(rows)
+
+
+def timestamp(day: date) -> int:
+    return int(datetime(day.year, day.month, day.day, 12).timestamp())
+
+
+def test_token_info_is_fetched_once_and_written_in_bulk(monkeypatch):
+    metadata_fetched = []
+    prices_fetched = []
+
+    def fetch_token_metadata(blockchain, contract):
+        metadata_fetched.append((blockchain, contract))
+        return {"symbol": "WETH", "name": "Wrapped Ether", "decimals": 18}
+
+    def fetch_token_prices(bridge, start_ts, end_ts, name, symbol, blockchain, token_address):
+        prices_fetched.append((symbol, start_ts, end_ts, blockchain, token_address))
+        return [
+            {"symbol": symbol, "name": name, "date": day, "price_usd": 1.0}
+            # the price of 2024-01-05 is already stored
+            for day in (date(2024, 1, 5), date(2024, 1, 6))
+        ]
+
+    monkeypatch.setattr(PriceGenerator, "fetch_token_metadata", fetch_token_metadata)
+    monkeypatch.setattr(PriceGenerator, "fetch_token_prices", fetch_token_prices)
+
+    start_ts, end_ts = timestamp(date(2024, 1, 1)), timestamp(date(2024, 1, 10))
+    token_metadata_repo = MockTokenMetadataRepository(
+        [SimpleNamespace(blockchain="ethereum", address="0xusdc", symbol="USDC", name="USD Coin")]
+    )
+    token_price_repo = MockTokenPriceRepository(
+        # USDC is priced for the whole range, WETH only up to 2024-01-05
+        {
+            ("USDC", "USD Coin"): (10, date(2023, 1, 1), date(2024, 1, 10)),
+            ("WETH", "Wrapped Ether"): (5, date(2023, 1, 1), date(2024, 1, 5)),
+        }
+    )
+
+    planner = TokenInfoPlanner("bridge", token_metadata_repo, token_price_repo)
+    planner.add_pair("ethereum", "arbitrum", "0xusdc", "0xweth-arb")
+    planner.add_pair("ethereum", "arbitrum", "0xusdc", "0xweth-arb")
+    planner.add_pair("ethereum", "solana", "0xweth", "So111")
+    planner.add_pair("ethereum", None, "0xusdc", None)
+    planner.run(start_ts, end_ts)
+
+    # stored and Solana tokens are not fetched, and each token is fetched once
+    assert sorted(metadata_fetched) == [("arbitrum", "0xweth-arb"), ("ethereum", "0xweth")]
+    assert len(token_metadata_repo.writes) == 1
+    assert {row["symbol"] for row in token_metadata_repo.writes[0]} == {"WETH"}
+
+    # the prices of WETH are fetched once (by its first token), only for the missing days
+    assert prices_fetched == [
+        ("WETH", timestamp(date(2024, 1, 5)) - 12 * 3600, end_ts, "arbitrum", "0xweth-arb")
+    ]
+    assert token_price_repo.writes == [
+        [{"symbol": "WETH", "name": "Wrapped Ether", "date": date(2024, 1, 6), "price_usd": 1.0}]
+    ]
@@ -0,0 +1,55 @@
+from generator.common.price_generator import PriceGenerator, UsdValue
+
+
+def build_query(usd_values):
+    query = PriceGenerator.build_cctx_usd_values_query("cctxs", ["id"], usd_values)
+    return " ".join(query.split())
+
+
+def test_usd_values_are_calculated_in_a_single_pass():
+    query = build_query(
+        [
+            UsdValue("amount_usd", "amount", "src_blockchain", "src_timestamp", "src_token"),
+            UsdValue("src_fee_usd", "src_fee", "src_blockchain", "src_timestamp"),
+            UsdValue("relayer_fee_usd", "relayer_fee", "src_blockchain", "src_timestamp"),
+        ]
+    )
+
+    assert query.count("UPDATE cctxs cctx") == 1
+    assert "token_price_lookup AS MATERIALIZED" in query
+    assert "native_price_lookup AS MATERIALIZED" in query
+
+    # fees paid in the same native token share the same price
+    assert query.count("LEFT JOIN") == 2
+    assert (
+        "LEFT JOIN token_price_lookup price_0 ON price_0.blockchain = cctx.src_blockchain "
+        "AND price_0.date = CAST(TO_TIMESTAMP(cctx.src_timestamp) AS DATE) "
+        "AND price_0.address = lower(cctx.src_token)"
+    ) in query
+    assert (
+        "COALESCE(price_1.price_usd * cctx.relayer_fee / power(10, price_1.decimals)) "
+        "AS relayer_fee_usd"
+    ) in query
+
+    # only rows missing a USD value are valued, and values already stored are kept
+    assert (
+        "WHERE cctx.amount_usd IS NULL OR cctx.src_fee_usd IS NULL "
+        "OR cctx.relayer_fee_usd IS NULL"
+    ) in query
+    assert "amount_usd = COALESCE(cctx.amount_usd, usd_values.amount_usd)" in query
+    assert query.endswith("FROM usd_values WHERE cctx.id = usd_values.id;")
+
+
+def test_usd_values_fall_back_in_order():
+    query = build_query(
+        [
+            UsdValue("amount_usd", "amount", "dst_blockchain", "dst_timestamp", "dst_token"),
+            UsdValue("amount_usd", "amount", "src_blockchain", "src_timestamp", "src_token"),
+        ]
+    )
+
+    assert "native_price_lookup" not in query
+    assert (
+        "COALESCE(price_0.price_usd * cctx.amount / power(10, price_0.decimals), "
+        "price_1.price_usd * cctx.amount / power(10, price_1.decimals)) AS amount_usd"
+    ) in query
@@ -0,0 +1,82 @@
+from repository.cctp.repository import CCTPBlockchainTransactionRepository
+
+
+class MockCursor:
+    def __init__(self):
+        self.statements = []
+        self.copied = None
+
+    def execute(self, statement):
+        self.statements.append(statement)
+
+    def copy_expert(self, statement, file):
+        self.statements.append(statement)
+        self.copied = file.read()
+
+    def close(self):
+        pass
+
+
+class MockDBAPIConnection:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def cursor(self):
+        return self._cursor
+
+
+class MockConnection:
+    def __init__(self, cursor):
+        self.connection = MockDBAPIConnection(cursor)
+
+
+class MockSession:
+    def __init__(self, cursor):
+        self._connection = MockConnection(cursor)
+
+    def connection(self):
+        return self._connection
+
+    def commit(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def test_copy_all_streams_rows_and_merges_them():
+    cursor = MockCursor()
+    repo = CCTPBlockchainTransactionRepository(lambda: MockSession(cursor))
+
+    transactions = {
+        "0xaa": {
+            "blockchain": "ethereum",
+            "transaction_hash": "0xaa",
+            "block_number": 1,
+            "timestamp": 10,
+            "from_address": "0xf",
+            "to_address": None,
+            "status": 1,
+            "value": 5,
+            "input_data": "0x12\tab\\",
+            "fee": "21000",
+        }
+    }
+
+    repo.copy_all(transactions.values())
+
+    create, copy, merge, truncate = cursor.statements
+    assert create.startswith("CREATE TEMP TABLE IF NOT EXISTS cctp_blockchain_transactions_staging")
+    assert copy.startswith("COPY cctp_blockchain_transactions_staging (blockchain, ")
+    assert merge.endswith("ON CONFLICT (transaction_hash) DO NOTHING")
+    assert truncate == "TRUNCATE cctp_blockchain_transactions_staging"
+    assert cursor.copied == "ethereum\t0xaa\t1\t10\t0xf\t\\N\t1\t5\t0x12\\tab\\\\\t21000\n"
+
+
+def test_copy_all_skips_empty_batches():
+    cursor = MockCursor()
+    repo = CCTPBlockchainTransactionRepository(lambda: MockSession(cursor))
+
+    repo.copy_all([])
+
+    assert cursor.statements == []
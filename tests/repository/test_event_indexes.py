@@ -0,0 +1,22 @@
+import inspect
+
+import pytest
+
+from config.constants import Bridge
+from repository.query_benchmark import get_event_repositories
+
+
+@pytest.mark.parametrize("bridge_name", [bridge.value for bridge in Bridge])
+def test_event_exists_lookups_are_indexed(bridge_name):
+    for name, repository in get_event_repositories(bridge_name).items():
+        params = set(inspect.signature(repository.event_exists).parameters)
+        table = repository.model.__table__
+
+        # the benchmark looks events up again by the columns named after the parameters
+        assert params <= set(table.columns.keys()), name
+
+        # an index (or the primary key) can serve the lookup if it starts with one of its columns
+        leading_columns = [table.primary_key.columns.values()[0].name] + [
+            index.columns.values()[0].name for index in table.indexes
+        ]
+        assert params & set(leading_columns), f"{name}.event_exists is not indexed"
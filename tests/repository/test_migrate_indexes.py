@@ -0,0 +1,57 @@
+import contextlib
+
+import pytest
+
+from repository import database
+from repository.cctp.models import CCTPDepositForBurn
+from utils.utils import CustomException
+
+
+class MockEngine:
+    def __init__(self):
+        self.transactions = 0
+
+    @contextlib.contextmanager
+    def connect(self):
+        yield None
+
+    @contextlib.contextmanager
+    def begin(self):
+        self.transactions += 1
+        yield None
+
+
+@pytest.fixture
+def unique_index(monkeypatch):
+    index = next(index for index in CCTPDepositForBurn.__table__.indexes if index.unique)
+    engine = MockEngine()
+    deleted = []
+
+    monkeypatch.setattr(database, "engine", engine)
+    monkeypatch.setattr(database, "get_indexes_to_migrate", lambda: [(index, False)])
+    monkeypatch.setattr(database, "get_duplicated_keys", lambda connection, index: [("0xa", 3)])
+    monkeypatch.setattr(
+        database, "remove_duplicated_rows", lambda connection, index: deleted.append(index.name)
+    )
+    monkeypatch.setattr(type(index), "create", lambda index, connection: None)
+    monkeypatch.setattr(database, "log_error", lambda bridge, message: None)
+
+    return index, engine, deleted
+
+
+def test_duplicated_rows_abort_the_migration(unique_index):
+    _, engine, deleted = unique_index
+
+    with pytest.raises(CustomException, match="--dedupe"):
+        database.migrate_indexes("cctp")
+
+    # nothing is deleted nor created
+    assert engine.transactions == 0
+    assert deleted == []
+
+
+def test_duplicated_rows_are_deleted_with_dedupe(unique_index):
+    index, engine, deleted = unique_index
+
+    assert database.migrate_indexes("cctp", dedupe=True) == [index.name]
+    assert deleted == [index.name]
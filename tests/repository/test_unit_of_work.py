@@ -0,0 +1,108 @@
+import pytest
+
+from repository.base import BaseRepository, on_commit, unit_of_work
+from repository.cctp.models import CCTPDepositForBurn
+
+
+class MockSavepoint:
+    def __init__(self, session):
+        self.session = session
+
+    def commit(self):
+        self.session.events.append("release")
+
+    def rollback(self):
+        self.session.events.append("rollback to savepoint")
+
+
+class MockSession:
+    def __init__(self):
+        self.events = []
+        self.info = {}
+
+    def begin_nested(self):
+        self.events.append("savepoint")
+        return MockSavepoint(self)
+
+    def commit(self):
+        self.events.append("commit")
+
+    def rollback(self):
+        self.events.append("rollback")
+
+    def close(self):
+        self.events.append("close")
+
+
+class MockSessionFactory:
+    def __init__(self):
+        self.sessions = []
+
+    def __call__(self):
+        self.sessions.append(MockSession())
+        return self.sessions[-1]
+
+
+def query(repo, fail=False):
+    with repo.get_session() as session:
+        session.events.append("query")
+        if fail:
+            raise ValueError("invalid row")
+
+
+def test_queries_share_the_session_of_the_unit_of_work():
+    session_factory = MockSessionFactory()
+    repo = BaseRepository(CCTPDepositForBurn, session_factory)
+    committed = []
+
+    with unit_of_work(session_factory):
+        query(repo)
+        with pytest.raises(ValueError, match="invalid row"):
+            query(repo, fail=True)
+        query(repo)
+        on_commit(committed.append, "0xaa")
+
+        # nested units of work join the outer one
+        with unit_of_work(session_factory):
+            query(repo)
+
+        assert committed == []
+
+    # a single session, where the failing query only undoes its own savepoint
+    assert len(session_factory.sessions) == 1
+    assert session_factory.sessions[0].events == [
+        "savepoint",
+        "query",
+        "release",
+        "savepoint",
+        "query",
+        "rollback to savepoint",
+        "savepoint",
+        "query",
+        "release",
+        "savepoint",
+        "query",
+        "release",
+        "commit",
+        "close",
+    ]
+    assert committed == ["0xaa"]
+
+
+def test_unit_of_work_is_rolled_back_on_error():
+    session_factory = MockSessionFactory()
+    repo = BaseRepository(CCTPDepositForBurn, session_factory)
+    committed = []
+
+    with pytest.raises(ValueError):
+        with unit_of_work(session_factory):
+            query(repo)
+            on_commit(committed.append, "0xaa")
+            raise ValueError("range failed")
+
+    assert session_factory.sessions[0].events[-2:] == ["rollback", "close"]
+    assert committed == []
+
+    # outside a unit of work, callbacks run right away
+    on_commit(committed.append, "0xbb")
+    assert committed == ["0xbb"]
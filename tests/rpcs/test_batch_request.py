@@ -0,0 +1,171 @@
+import asyncio
+
+import pytest
+import yaml
+
+from config.constants import Bridge
+from rpcs.block_timestamp_cache import BlockTimestampCache
+from rpcs.endpoint_scheduler import EndpointScheduler
+from rpcs.evm_rpc_client import EvmRPCClient
+from rpcs.http_session_pool import http_session_pool
+from utils.utils import RPCResultLimitException
+
+
+class MockResponse:
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+@pytest.fixture(autouse=True)
+def endpoint_scheduler(monkeypatch):
+    scheduler = EndpointScheduler()
+    monkeypatch.setattr("rpcs.rpc_client.endpoint_scheduler", scheduler)
+    # always pick the first healthy endpoint, such that requests are deterministic
+    monkeypatch.setattr(
+        "rpcs.endpoint_scheduler.random.choices", lambda population, weights: [population[0]]
+    )
+    return scheduler
+
+
+def create_rpc_client(tmp_path, bridge=Bridge.MAYAN, batch_size=2):
+    config_file = tmp_path / "rpcs_config.yaml"
+    config_file.write_text(
+        yaml.dump(
+            {
+                "blockchains": [
+                    {
+                        "name": "ethereum",
+                        "rpcs": ["http://rpc-1", "http://rpc-2"],
+                        "batch_size": batch_size,
+                    }
+                ]
+            }
+        )
+    )
+
+    return EvmRPCClient(bridge, str(config_file))
+
+
+def test_process_transactions_in_batches(tmp_path, monkeypatch):
+    rpc_client = create_rpc_client(tmp_path)
+
+    batches = []
+
+    def mock_post(rpc_url, json, headers, timeout):
+        batches.append(json)
+        results = []
+        # reply in reverse order, as providers do not guarantee the order of batch responses
+        for call in reversed(json):
+            if call["method"] == "eth_getBlockByNumber":
+                result = {"number": call["params"][0], "timestamp": "0x10"}
+            elif call["method"] == "eth_getTransactionByHash":
+                result = {"hash": call["params"][0], "value": "0x1", "input": "0x"}
+            else:
+                result = {"transactionHash": call["params"][0]}
+            results.append({"id": call["id"], "jsonrpc": "2.0", "result": result})
+        return MockResponse(results)
+
+    monkeypatch.setattr(http_session_pool, "post", mock_post)
+    monkeypatch.setattr(
+        "rpcs.evm_rpc_client.block_timestamp_cache", BlockTimestampCache(db_file=None)
+    )
+
+    results = rpc_client.process_transactions(
+        "ethereum", {"0xaa": "0x1", "0xbb": "0x1", "0xcc": "0x2"}
+    )
+
+    # 3 receipts + 3 transactions + 2 distinct blocks, in batches of 2 calls
+    assert [len(batch) for batch in batches] == [2, 2, 2, 2]
+    # only block headers are requested
+    assert [call["params"] for call in batches[-1]] == [["0x1", False], ["0x2", False]]
+
+    tx, block = results["0xbb"]
+    assert tx["transactionHash"] == "0xbb"
+    assert tx["value"] == "0x1"
+    assert block == {"number": "0x1", "timestamp": "0x10"}
+    assert results["0xcc"][1]["number"] == "0x2"
+
+    # blocks are now cached, so only receipts and transactions are requested
+    batches.clear()
+    rpc_client.process_transactions("ethereum", {"0xdd": "0x2"})
+    assert [call["method"] for call in batches[0]] == [
+        "eth_getTransactionReceipt",
+        "eth_getTransactionByHash",
+    ]
+
+
+def test_batch_request_retries_missing_results(tmp_path, monkeypatch):
+    rpc_client = create_rpc_client(tmp_path, bridge=Bridge.CCTP, batch_size=10)
+
+    batches = []
+
+    def mock_post(rpc_url, json, headers, timeout):
+        batches.append(json)
+        # the first endpoint drops the last call of the batch
+        calls = json[:-1] if rpc_url == "http://rpc-1" else json
+        return MockResponse(
+            [{"id": call["id"], "jsonrpc": "2.0", "result": call["params"][0]} for call in calls]
+        )
+
+    monkeypatch.setattr(http_session_pool, "post", mock_post)
+
+    responses = rpc_client.make_batch_request(
+        "ethereum", [("eth_getTransactionReceipt", [f"0x{i}"]) for i in range(3)]
+    )
+
+    assert [response["result"] for response in responses] == ["0x0", "0x1", "0x2"]
+    assert [len(batch) for batch in batches] == [3, 1]
+
+
+def test_async_batch_request_retries_missing_results(tmp_path, monkeypatch):
+    rpc_client = create_rpc_client(tmp_path, bridge=Bridge.CCTP, batch_size=2)
+
+    batches = []
+
+    async def mock_post_async(rpc_url, payload, headers, timeout=10):
+        batches.append(payload)
+        # the first endpoint drops the last call of the batch
+        calls = payload[:-1] if rpc_url == "http://rpc-1" else payload
+        return 200, [
+            {"id": call["id"], "jsonrpc": "2.0", "result": call["params"][0]} for call in calls
+        ]
+
+    monkeypatch.setattr(rpc_client, "post_async", mock_post_async)
+
+    responses = asyncio.run(
+        rpc_client.make_batch_request_async(
+            "ethereum", [("eth_getTransactionReceipt", [f"0x{i}"]) for i in range(3)]
+        )
+    )
+
+    assert [response["result"] for response in responses] == ["0x0", "0x1", "0x2"]
+    # both chunks are sent at once, and each retries its missing call on the next endpoint
+    assert sorted(len(batch) for batch in batches) == [1, 1, 1, 2]
+
+
+@pytest.mark.parametrize(
+    "message, is_result_limit",
+    [
+        ("query returned more than 10000 results", True),
+        ("exceed maximum block range: 5000", True),
+        ("block range is too wide", True),
+        ("block range extends beyond current head block", False),
+        ("header not found", False),
+    ],
+)
+def test_result_limit_errors(tmp_path, message, is_result_limit):
+    rpc_client = create_rpc_client(tmp_path)
+    body = {"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": message}}
+
+    if is_result_limit:
+        with pytest.raises(RPCResultLimitException):
+            rpc_client.check_result_limit("eth_getLogs", body)
+    else:
+        rpc_client.check_result_limit("eth_getLogs", body)
@@ -0,0 +1,23 @@
+from rpcs.block_timestamp_cache import BlockTimestampCache
+
+
+def test_least_recently_used_blocks_are_evicted():
+    cache = BlockTimestampCache(max_size=2, db_file=None)
+
+    cache.put_many("ethereum", {"0x1": 100, "0x2": 200})
+    # reading block 1 makes block 2 the least recently used
+    assert cache.get_many("ethereum", ["0x1"]) == {"0x1": 100}
+    cache.put_many("ethereum", {3: 300})
+
+    assert cache.get_many("ethereum", ["0x1", "0x2", "0x3"]) == {"0x1": 100, "0x3": 300}
+    assert cache.get_many("arbitrum", ["0x1"]) == {}
+
+
+def test_timestamps_are_persisted(tmp_path):
+    db_file = str(tmp_path / "cache" / "block_timestamps.sqlite")
+
+    BlockTimestampCache(db_file=db_file).put_many("ethereum", {"0x10": 1000, "0x11": 1001})
+
+    cache = BlockTimestampCache(max_size=1, db_file=db_file)
+    assert cache.get_many("ethereum", ["0x10", "0x11", "0x12"]) == {"0x10": 1000, "0x11": 1001}
+    assert cache.get_many("base", ["0x10"]) == {}
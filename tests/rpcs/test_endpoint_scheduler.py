@@ -0,0 +1,51 @@
+import random
+
+from rpcs.endpoint_scheduler import EndpointScheduler
+
+RPCS = ["http://rpc-1", "http://rpc-2", "http://rpc-3"]
+
+
+def test_traffic_follows_latency_and_errors():
+    random.seed(0)
+    scheduler = EndpointScheduler()
+
+    scheduler.record_success("http://rpc-1", 0.1)
+    scheduler.record_success("http://rpc-2", 1.0)
+    scheduler.record_success("http://rpc-3", 0.1)
+    for _ in range(2):
+        scheduler.record_failure("http://rpc-3", 0.1)
+
+    counts = {rpc: 0 for rpc in RPCS}
+    for _ in range(1000):
+        counts[scheduler.select(RPCS)] += 1
+
+    assert counts["http://rpc-1"] > counts["http://rpc-3"] > counts["http://rpc-2"]
+
+
+def test_circuit_breaker_and_exclusion():
+    scheduler = EndpointScheduler(max_failures=2)
+
+    scheduler.record_failure("http://rpc-1", 0.1, rate_limited=True)
+    for _ in range(2):
+        scheduler.record_failure("http://rpc-2", 10.0)
+
+    assert all(scheduler.select(RPCS) == "http://rpc-3" for _ in range(20))
+
+    # with every endpoint left out, the one whose circuit breaker closes first is chosen
+    assert scheduler.select(RPCS, exclude={"http://rpc-3"}) == "http://rpc-1"
+
+    stats = {stat["endpoint"]: stat for stat in scheduler.get_stats()}
+    assert stats["http://rpc-1"]["rate_limited"] == 1
+    assert stats["http://rpc-2"]["open"]
+
+
+def test_rate_limit_spaces_out_requests():
+    scheduler = EndpointScheduler()
+    scheduler.set_rate_limit("http://rpc-1", 10)
+
+    delays = [scheduler.reserve("http://rpc-1") for _ in range(3)]
+
+    assert delays[0] == 0
+    assert 0.09 < delays[1] <= 0.1
+    assert 0.19 < delays[2] <= 0.2
+    assert scheduler.reserve("http://rpc-2") == 0
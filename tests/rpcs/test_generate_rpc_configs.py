@@ -0,0 +1,110 @@
+import os
+import time
+
+import yaml
+
+from rpcs.evm_rpc_client import EvmRPCClient
+from rpcs.generate_rpc_configs import generate_rpc_configs
+
+BASE_CONFIG = {
+    "blockchains": [
+        {
+            "name": name,
+            "contract": "0xcontract",
+            "topics": ["0xtopic"],
+            "start_block": "0x1",
+            "end_block": "0x2",
+            "rpcs": [f"http://{name}-slow", f"http://{name}-down", f"http://{name}-fast"],
+        }
+        for name in ["ethereum", "arbitrum"]
+    ]
+}
+
+
+def mock_plain_request(probed):
+    def plain_request(rpc, method, params, timeout=None):
+        probed.append(rpc)
+        if rpc.endswith("-down"):
+            raise Exception("timed out")
+        time.sleep(0.05 if rpc.endswith("-slow") else 0.0)
+        return {"result": [{"logIndex": "0x0"}]}
+
+    return plain_request
+
+
+def test_probes_in_parallel_ranks_and_reuses(tmp_path, monkeypatch):
+    base_config_file = tmp_path / "rpcs_base_config.yaml"
+    base_config_file.write_text(yaml.dump(BASE_CONFIG))
+    outfile = tmp_path / "rpcs_config.yaml"
+
+    probed = []
+    monkeypatch.setattr(
+        EvmRPCClient,
+        "plain_request",
+        staticmethod(mock_plain_request(probed)),
+    )
+
+    generate_rpc_configs(["ethereum"], base_config_file=str(base_config_file), outfile=str(outfile))
+
+    configs = yaml.safe_load(outfile.read_text())["blockchains"]
+    assert len(probed) == 3
+    assert [config["name"] for config in configs] == ["ethereum"]
+    assert configs[0]["rpcs"] == ["http://ethereum-fast", "http://ethereum-slow"]
+    assert set(configs[0]["latencies"]) == {"http://ethereum-fast", "http://ethereum-slow"}
+
+    # ethereum was probed recently, so only arbitrum is probed, and both are kept
+    probed.clear()
+    generate_rpc_configs(
+        ["ethereum", "arbitrum"], base_config_file=str(base_config_file), outfile=str(outfile)
+    )
+
+    configs = yaml.safe_load(outfile.read_text())["blockchains"]
+    assert sorted(probed) == [
+        "http://arbitrum-down",
+        "http://arbitrum-fast",
+        "http://arbitrum-slow",
+    ]
+    assert [config["name"] for config in configs] == ["ethereum", "arbitrum"]
+
+    # a change to the base configuration invalidates the cache
+    probed.clear()
+    later = time.time() + 10
+    os.utime(base_config_file, (later, later))
+    generate_rpc_configs(["ethereum"], base_config_file=str(base_config_file), outfile=str(outfile))
+    assert len(probed) == 3
+
+    # and so does a TTL of 0
+    probed.clear()
+    generate_rpc_configs(
+        ["arbitrum"], ttl=0, base_config_file=str(base_config_file), outfile=str(outfile)
+    )
+    assert len(probed) == 3
+
+
+def test_blockchains_without_rpcs_are_probed_again(tmp_path, monkeypatch):
+    base_config_file = tmp_path / "rpcs_base_config.yaml"
+    base_config_file.write_text(yaml.dump(BASE_CONFIG))
+    outfile = tmp_path / "rpcs_config.yaml"
+
+    probed = []
+    plain_request = mock_plain_request(probed)
+
+    def outage(rpc, method, params, timeout=None):
+        probed.append(rpc)
+        raise Exception("timed out")
+
+    monkeypatch.setattr(EvmRPCClient, "plain_request", staticmethod(outage))
+    generate_rpc_configs(["ethereum"], base_config_file=str(base_config_file), outfile=str(outfile))
+
+    configs = yaml.safe_load(outfile.read_text())["blockchains"]
+    assert configs[0]["rpcs"] == []
+    assert "generated_at" not in configs[0]
+
+    # once the outage is over, the RPCs are probed again despite the TTL
+    probed.clear()
+    monkeypatch.setattr(EvmRPCClient, "plain_request", staticmethod(plain_request))
+    generate_rpc_configs(["ethereum"], base_config_file=str(base_config_file), outfile=str(outfile))
+
+    configs = yaml.safe_load(outfile.read_text())["blockchains"]
+    assert len(probed) == 3
+    assert configs[0]["rpcs"] == ["http://ethereum-fast", "http://ethereum-slow"]
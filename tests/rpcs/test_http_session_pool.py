@@ -0,0 +1,46 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from rpcs.http_session_pool import HttpSessionPool
+
+
+class RPCRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = json.dumps({"id": 1, "jsonrpc": "2.0", "result": "0x1"}).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_connections_are_reused():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RPCRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        pool = HttpSessionPool(pool_size=2)
+        url = f"http://127.0.0.1:{server.server_address[1]}/some/api/key"
+
+        for _ in range(10):
+            response = pool.post(url, json={"id": 1, "jsonrpc": "2.0", "method": "eth_chainId"})
+            assert response.json()["result"] == "0x1"
+
+        stats = pool.get_stats()
+
+        assert len(stats) == 1
+        assert stats[0]["endpoint"] == f"http://127.0.0.1:{server.server_address[1]}"
+        assert stats[0]["requests"] == 10
+        assert stats[0]["connections"] == 1
+        assert stats[0]["reuse_rate"] == 0.9
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,28 @@
+import asyncio
+
+from rpcs.request_limiter import RequestLimiter
+
+
+def test_worker_threads_and_event_loops_share_the_global_cap():
+    limiter = RequestLimiter(max_concurrent_requests=2)
+    in_flight = []
+
+    async def request(index):
+        async with limiter.limit_async():
+            in_flight.append(index)
+            assert len(in_flight) <= 2
+            await asyncio.sleep(0.01)
+            in_flight.remove(index)
+
+    async def extract():
+        await asyncio.gather(*(request(index) for index in range(5)))
+
+    asyncio.run(extract())
+
+    # while a worker thread has a request in flight, an event loop only gets the other one
+    with limiter.limit():
+        in_flight.append("worker")
+        asyncio.run(extract())
+
+    assert limiter.global_semaphore.acquire(blocking=False)
+    assert limiter.global_semaphore.acquire(blocking=False)
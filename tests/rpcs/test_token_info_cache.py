@@ -0,0 +1,70 @@
+from datetime import date, datetime
+
+from generator.common import price_generator
+from generator.common.price_generator import PriceGenerator
+from rpcs.token_info_cache import TokenInfoCache
+
+
+def test_token_info_is_persisted(tmp_path):
+    db_file = str(tmp_path / "cache" / "token_info.sqlite")
+
+    cache = TokenInfoCache(db_file=db_file)
+    cache.put_metadata("ethereum", "0xweth", {"symbol": "WETH", "name": "Wrapped Ether"})
+    cache.put_metadata("ethereum", "0xunknown")
+    cache.put_prices("WETH", "Wrapped Ether", {date(2024, 1, 1): 2300.0, date(2024, 1, 2): None})
+
+    cache = TokenInfoCache(db_file=db_file)
+    assert cache.get_metadata("ethereum", "0xweth") == (
+        True,
+        {"symbol": "WETH", "name": "Wrapped Ether", "decimals": None},
+    )
+    assert cache.get_metadata("ethereum", "0xunknown") == (True, None)
+    assert cache.get_metadata("base", "0xweth") == (False, None)
+    assert cache.get_prices("WETH", "Wrapped Ether", date(2024, 1, 1), date(2024, 1, 31)) == {
+        date(2024, 1, 1): 2300.0,
+        date(2024, 1, 2): None,
+    }
+
+
+def test_misses_expire():
+    cache = TokenInfoCache(db_file=None, negative_ttl=0)
+
+    cache.put_metadata("ethereum", "0xunknown")
+    cache.put_prices("WETH", "Wrapped Ether", {date(2024, 1, 1): 2300.0, date(2024, 1, 2): None})
+
+    assert cache.get_metadata("ethereum", "0xunknown") == (False, None)
+    assert cache.get_prices("WETH", "Wrapped Ether", date(2024, 1, 1), date(2024, 1, 2)) == {
+        date(2024, 1, 1): 2300.0
+    }
+
+
+def test_cached_days_are_not_fetched_again(monkeypatch):
+    requests = []
+
+    def request_token_prices(bridge, start_ts, end_ts, symbol, blockchain, token_address):
+        requests.append((start_ts, end_ts))
+        return {date(2024, 1, 3): 2400.0}
+
+    cache = TokenInfoCache(db_file=None)
+    cache.put_prices("WETH", "Wrapped Ether", {date(2024, 1, 1): 2300.0, date(2024, 1, 2): None})
+    monkeypatch.setattr(price_generator, "token_info_cache", cache)
+    monkeypatch.setattr(PriceGenerator, "request_token_prices", request_token_prices)
+
+    start_ts = int(datetime(2024, 1, 1, 12).timestamp())
+    end_ts = int(datetime(2024, 1, 4, 12).timestamp())
+
+    def fetch():
+        return PriceGenerator.fetch_token_prices(
+            "bridge", start_ts, end_ts, "Wrapped Ether", "WETH", "ethereum", "0xweth"
+        )
+
+    assert [(row["date"], row["price_usd"]) for row in fetch()] == [
+        (date(2024, 1, 1), 2300.0),
+        (date(2024, 1, 3), 2400.0),
+    ]
+    # only the days from the first to the last missing day are requested
+    assert requests == [(int(datetime(2024, 1, 3).timestamp()), end_ts)]
+
+    # every day is now cached, including 2024-01-04 as a miss
+    fetch()
+    assert len(requests) == 1
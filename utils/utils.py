@@ -202,7 +202,8 @@ def build_log_message_solana(start_sig: str, end_sig: str, bridge: Bridge, messa
 
 
 def build_log_message_generator(bridge: Bridge, message: str = ""):
-    message = f"{datetime.now()} - INFO - {bridge.value} - {message}"
+    # repositories log their errors with the name of their model instead of a bridge
+    message = f"{datetime.now()} - INFO - {getattr(bridge, 'value', bridge)} - {message}"
 
     return message
 
@@ -229,3 +230,17 @@ def load_abi(root_dir: str, bridge: Bridge, blockchain, contract_addr: str):
 class CustomException(Exception):
     def __init__(self, classname: str, func_name: str, message: str):
         super().__init__(f"(Class: {classname}) {func_name}: {message}")
+        self.classname = classname
+        self.func_name = func_name
+        self.message = message
+
+    def __reduce__(self):
+        # exceptions are pickled with their formatted message by default, which does not match the
+        # arguments of __init__ (e.g., when raised in a decoder process)
+        return (self.__class__, (self.classname, self.func_name, self.message))
+
+
+class RPCResultLimitException(CustomException):
+    """Raised when an RPC rejects a request because its response would be too large."""
+
+    pass